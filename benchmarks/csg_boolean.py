@@ -0,0 +1,74 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares Python and NumPy implementations of CSG booleans on two overlapping
+UV spheres with increasing number of faces. Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/csg_boolean.py
+"""
+
+import sys
+from math import sin, cos, pi
+from time import perf_counter
+
+from sverchok.utils.csg_core import CSG
+from sverchok.utils.csg_numpy import NumpyCSG
+
+
+def sphere(center, radius, u_segments, v_segments):
+    verts = [[center[0], center[1], center[2] + radius], [center[0], center[1], center[2] - radius]]
+    for i in range(1, v_segments):
+        theta = pi * i / v_segments
+        for j in range(u_segments):
+            phi = 2 * pi * j / u_segments
+            verts.append([center[0] + radius * sin(theta) * cos(phi),
+                          center[1] + radius * sin(theta) * sin(phi),
+                          center[2] + radius * cos(theta)])
+
+    def index(i, j):
+        return 2 + (i - 1) * u_segments + j % u_segments
+
+    faces = []
+    for j in range(u_segments):
+        faces.append([0, index(1, j), index(1, j + 1)])
+        faces.append([1, index(v_segments - 1, j + 1), index(v_segments - 1, j)])
+    for i in range(1, v_segments - 1):
+        for j in range(u_segments):
+            faces.append([index(i, j), index(i + 1, j), index(i + 1, j + 1), index(i, j + 1)])
+    return verts, faces
+
+
+def subtract(csg_class, mesh_a, mesh_b):
+    if csg_class is CSG:
+        a, b = CSG.Obj_from_pydata(*mesh_a), CSG.Obj_from_pydata(*mesh_b)
+    else:
+        a, b = NumpyCSG.from_pydata(*mesh_a), NumpyCSG.from_pydata(*mesh_b)
+    return a.subtract(b).to_pydata()
+
+
+def measure(func, *args):
+    start = perf_counter()
+    result = func(*args)
+    return perf_counter() - start, result
+
+
+def main():
+    sys.setrecursionlimit(100000)  # the Python implementation is recursive
+    print(f"{'faces':>8} {'python, s':>10} {'numpy, s':>10} {'speedup':>8} {'equal':>6}")
+    for segments in [8, 16, 24, 32]:
+        mesh_a = sphere((0, 0, 0), 1, 2 * segments, segments)
+        mesh_b = sphere((0.5, 0.2, 0.1), 0.8, 2 * segments - 2, segments - 1)
+        faces = len(mesh_a[1]) + len(mesh_b[1])
+        numpy_time, numpy_result = measure(subtract, NumpyCSG, mesh_a, mesh_b)
+        python_time, python_result = measure(subtract, CSG, mesh_a, mesh_b)
+        equal = python_result == numpy_result
+        print(f"{faces:>8} {python_time:>10.3f} {numpy_time:>10.3f} {python_time / numpy_time:>8.1f} {equal!s:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares building of DCEL meshes of 2D grids as arrays and as Python objects,
+time and allocated memory are measured. Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/dcel_arrays.py
+"""
+
+import gc
+import tracemalloc
+from time import perf_counter
+
+from sverchok.utils.geom_2d.dcel_arrays import DCELArrays
+from sverchok.utils.geom_2d.merge_mesh import DCELMesh
+
+
+def grid(number):
+    verts = [(i, j, 0) for j in range(number + 1) for i in range(number + 1)]
+    faces = [[j * (number + 1) + i, j * (number + 1) + i + 1, (j + 1) * (number + 1) + i + 1, (j + 1) * (number + 1) + i]
+             for j in range(number) for i in range(number)]
+    return verts, faces
+
+
+def measure(func, *args):
+    gc.collect()
+    start = perf_counter()
+    result = func(*args)
+    return perf_counter() - start, result
+
+
+def allocated_memory(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return memory / 2 ** 20
+
+
+def build_objects(verts, faces):
+    mesh = DCELMesh()
+    mesh.from_sv_faces(verts, faces)
+    return mesh
+
+
+def main():
+    print(f"{'faces':>7} {'arrays, s':>10} {'arrays, MB':>11} {'objects, s':>11} {'objects, MB':>12} "
+          f"{'export arrays, s':>17} {'export objects, s':>18}")
+    for number in [50, 100, 200]:
+        verts, faces = grid(number)
+        arrays_memory = allocated_memory(DCELArrays.from_sv_faces, verts, faces)
+        objects_memory = allocated_memory(build_objects, verts, faces)
+        # garbage collector is slower with many alive objects so arrays are measured first
+        arrays_time, arrays = measure(DCELArrays.from_sv_faces, verts, faces)
+        export_arrays = measure(arrays.to_sv_mesh)[0]
+        objects_time, mesh = measure(build_objects, verts, faces)
+        export_objects = measure(mesh.to_sv_mesh)[0]
+        print(f"{len(faces):>7} {arrays_time:>10.3f} {arrays_memory:>11.1f} {objects_time:>11.3f} {objects_memory:>12.1f} "
+              f"{export_arrays:>17.3f} {export_objects:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
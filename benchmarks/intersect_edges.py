@@ -0,0 +1,51 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares broadphases of edges intersection on a street like net of random
+short segments with increasing number of edges. Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/intersect_edges.py
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.intersect_edges import intersect_edges_2d_np_big, intersect_edges_3d_np
+
+
+def streets(number):
+    rng = np.random.default_rng(0)
+    starts = rng.random((number, 3)) * 100
+    starts[:, 2] = 0
+    ends = starts + rng.normal(size=(number, 3)) * 3
+    ends[:, 2] = 0
+    verts = np.concatenate([starts, ends]).tolist()
+    edges = [[i, i + number] for i in range(number)]
+    return verts, edges
+
+
+def measure(func, *args, **kwargs):
+    start = perf_counter()
+    result = func(*args, **kwargs)
+    return perf_counter() - start, result
+
+
+def main():
+    print(f"{'function':>26} {'edges':>6} {'none, s':>8} {'sweep, s':>9} {'grid, s':>8} {'equal':>6}")
+    for func in [intersect_edges_2d_np_big, intersect_edges_3d_np]:
+        for number in [1000, 2000, 4000]:
+            verts, edges = streets(number)
+            times, results = zip(*[measure(func, verts, edges, 1e-5, broadphase=broadphase)
+                                   for broadphase in ['NONE', 'SWEEP', 'GRID']])
+            equal = results[0] == results[1] == results[2]
+            print(f"{func.__name__:>26} {number:>6} {times[0]:>8.3f} {times[1]:>9.3f} {times[2]:>8.3f} {equal!s:>6}")
+
+
+if __name__ == "__main__":
+    main()
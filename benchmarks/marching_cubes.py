@@ -0,0 +1,66 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares marching cubes implementations: voxel by voxel Polygoniser, vectorized
+isosurface_np, and optional PyMCubes and SciKit-Image backends, if they are
+installed. Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/marching_cubes.py
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.dependencies import mcubes, skimage
+from sverchok.utils.marching_cubes import isosurface_python, isosurface_np
+
+
+def make_field(samples):
+    rng = np.linspace(-1.0, 1.0, num=samples)
+    xs, ys, zs = np.meshgrid(rng, rng, rng, indexing='ij')
+    return xs**2 + ys**2 + zs**2 + 0.2*np.sin(6*xs)*np.cos(6*ys)
+
+
+def get_implementations():
+    implementations = [("python", isosurface_python), ("numpy", isosurface_np)]
+    if mcubes is not None:
+        implementations.append(("mcubes", mcubes.marching_cubes))
+    if skimage is not None:
+        import skimage.measure
+        def skimage_marching_cubes(data, isolevel):
+            verts, faces, normals, values = skimage.measure.marching_cubes(data, level=isolevel)
+            return verts, faces
+        implementations.append(("skimage", skimage_marching_cubes))
+    return implementations
+
+
+def measure(func, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = func(*args)
+        duration = perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best, result
+
+
+def main():
+    implementations = get_implementations()
+    print(f"{'samples':>8} {'implementation':>15} {'time, s':>9} {'verts':>8} {'faces':>8}")
+    for samples in [20, 50, 100]:
+        data = make_field(samples)
+        for name, func in implementations:
+            if name == "python" and samples > 50:
+                continue
+            duration, (verts, faces) = measure(func, data, 0.5)
+            print(f"{samples:>8} {name:>15} {duration:>9.4f} {len(verts):>8} {len(faces):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares throughput of NURBS basis functions evaluation: recursive
+SvNurbsBasisFunctions (one call per control point) against span based
+span_basis_functions. Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/nurbs_basis.py
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.nurbs_common import SvNurbsBasisFunctions, span_basis_functions
+
+
+def recursive_basis(knotvector, degree, n_cpts, ts, deriv_order):
+    basis = SvNurbsBasisFunctions(knotvector)
+    return np.array([basis.derivative(i, degree, deriv_order)(ts) for i in range(n_cpts)])
+
+
+def span_basis(knotvector, degree, n_cpts, ts, deriv_order):
+    return span_basis_functions(knotvector, degree, ts, deriv_order)
+
+
+def measure(func, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        func(*args)
+        duration = perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best
+
+
+def main():
+    degree = 3
+    print(f"{'control points':>15} {'ts':>8} {'recursive, s':>13} {'span, s':>10} {'speedup':>8}")
+    for n_cpts, n_ts in [(10, 1000), (100, 1000), (300, 5000)]:
+        knotvector = sv_knotvector.generate(degree, n_cpts)
+        ts = np.linspace(knotvector[0], knotvector[-1], num=n_ts)
+        old = measure(recursive_basis, knotvector, degree, n_cpts, ts, 1)
+        new = measure(span_basis, knotvector, degree, n_cpts, ts, 1)
+        print(f"{n_cpts:>15} {n_ts:>8} {old:>13.4f} {new:>10.4f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compares the vectorize decorator walking over nested lists (one call per
+value) against its batched mode (one call for all values). Run it with
+
+    $ blender -b --addons sverchok --python benchmarks/vectorize.py
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.vectorize import vectorize
+
+
+def lerp(*, a: float, b: float, factor: float):
+    return a + (b - a) * factor
+
+
+def measure(func, repeat=3, **kwargs):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        func(**kwargs)
+        duration = perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best
+
+
+def main():
+    walker = vectorize(lerp, match_mode="REPEAT")
+    batched = vectorize(lerp, match_mode="REPEAT", batched=True)
+    print(f"{'objects':>8} {'values':>8} {'walker, s':>10} {'batched, s':>11} {'speedup':>8}")
+    for n_objects, n_values in [(1, 1000), (100, 100), (1000, 100), (10, 10000)]:
+        rng = np.random.default_rng(0)
+        a = list(rng.random((n_objects, n_values)))
+        b = list(rng.random((n_objects, n_values)))
+        factor = [[0.5]]
+        old = measure(walker, a=a, b=b, factor=factor)
+        new = measure(batched, a=a, b=b, factor=factor)
+        print(f"{n_objects:>8} {n_values:>8} {old:>10.4f} {new:>11.4f} {old / new:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,7 @@ core_modules = [
     "tasks",
     "group_update_system",
     "event_system",
+    "lazy_nodes",
 ]
 
 
@@ -49,11 +50,17 @@ def sv_unregister_modules(modules):
 
 def import_nodes():
     from sverchok import nodes
+    from sverchok.core import lazy_nodes
+    if lazy_nodes.is_enabled() and (manifest := lazy_nodes.read_manifest()):
+        return lazy_nodes.import_nodes(manifest)
+
     node_modules = []
     base_name = "sverchok.nodes"
     for category, names in nodes.nodes_dict.items():
         importlib.import_module('.{}'.format(category), base_name)
         import_modules(names, '{}.{}'.format(base_name, category), node_modules)
+    if lazy_nodes.is_enabled():
+        lazy_nodes.write_manifest(node_modules)
     return node_modules
 
 
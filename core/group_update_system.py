@@ -87,14 +87,12 @@ class GroupUpdateTree(us.UpdateTree):
             if not is_opened_tree:
                 self._viewer_nodes = set(self.__viewer_nodes())
 
+            self._node_hashes.clear()
             walker = self._walk()
             # walker = self._debug_color(walker)
             for node, prev_socks in walker:
                 with us.AddStatistic(node, self):
-                    us.prepare_input_data(prev_socks, node.inputs)
-                    if error := node.dependency_error:
-                        raise error
-                    node.process()
+                    self._process(node, prev_socks)
 
             if is_opened_tree:
                 if self._tree.show_time_mode == "Cumulative":
@@ -167,12 +165,14 @@ class GroupUpdateTree(us.UpdateTree):
             viewers = None
             self._outdated_nodes = set()
             self._viewer_nodes = set()
+            self._forget_fingerprints(self._from_nodes)
         # walk triggered nodes and error nodes from previous updates
         else:
             outdated = frozenset(self._outdated_nodes)
             viewers = frozenset(self._viewer_nodes)
             self._outdated_nodes.clear()
             self._viewer_nodes.clear()
+            self._forget_fingerprints(outdated)
 
         for node, other_socks in self._sort_nodes(outdated, viewers):
             # execute node only if all previous nodes are updated
@@ -6,10 +6,12 @@ from sverchok import old_nodes
 from sverchok import data_structure
 import sverchok.core.events as ev
 import sverchok.core.tasks as ts
+from sverchok.core import lazy_nodes
 from sverchok.core.event_system import handle_event
 from sverchok.core.socket_data import clear_all_socket_cache
 from sverchok.ui import bgl_callback_nodeview, bgl_callback_3dview
 from sverchok.utils.handle_blender_data import BlTrees
+from sverchok.utils.nodes_mixins.generating_objects import clear_mesh_buffers
 from sverchok.utils.sv_logging import catch_log_error, TextBufferHandler, sv_logger
 import sverchok.settings as settings
 
@@ -63,6 +65,7 @@ def sv_handler_undo_post(scene):
         sv_clean(scene)
 
     undo_handler_node_count['sv_groups'] = 0
+    clear_mesh_buffers()
 
     handle_event(ev.UndoEvent())
 
@@ -137,6 +140,7 @@ def sv_pre_load(scene):
     4. evaluate trees from main tree handler
     """
     clear_all_socket_cache()
+    clear_mesh_buffers()
     sv_clean(scene)
 
     handle_event(ev.FileEvent())
@@ -160,6 +164,10 @@ def sv_post_load(scene):
     # ensure current nodeview view scale / location parameters reflect users' system settings
     node_tree.SverchCustomTree.update_gl_scale_info(None, "sv_post_load")
 
+    # load modules of nodes used in the file when they are loaded by request
+    with catch_log_error():
+        lazy_nodes.load_tree_nodes()
+
     # register and mark old and dependent nodes
     with catch_log_error():
         if any(not n.is_registered_node_type() for ng in BlTrees().sv_trees for n in ng.nodes):
@@ -0,0 +1,235 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Lazy loading of node modules. Start Blender with `blender -- --sv-lazy-nodes`
+(or with SVERCHOK_LAZY_NODES environment variable) to enable it.
+
+Most of the startup time of Sverchok is importing of node modules together
+with their libraries. In the lazy mode the first startup imports all nodes as
+usually and saves a manifest with the data required by the Add menu and the
+search (labels, icons, docstrings and dependencies of the nodes). Next
+startups read the manifest instead and a node module is imported and
+registered only when its node is added to a tree, imported from JSON or found
+in an opened file. The manifest is rebuilt whenever any file of the nodes
+folder was changed.
+"""
+
+import importlib
+import json
+import os
+import sys
+from hashlib import sha1
+from pathlib import Path
+
+import bpy
+
+import sverchok
+from sverchok.utils.docstring import SvDocstring
+from sverchok.utils.sv_logging import sv_logger
+
+
+MANIFEST_NAME = "nodes_manifest.json"
+
+_not_loaded: dict[str, 'NodeInfo'] = dict()  # bl_idname -> info
+loaded_modules = []  # modules registered by the `load` function
+
+
+class NodeInfo:
+    """Data of a not loaded node. It has attributes of node classes which
+    are used by the Add menu and the search so the menu can show the node
+    without importing it."""
+    def __init__(self, bl_idname, module, bl_label, doc, sv_icon=None, bl_icon=None, sv_dependencies=()):
+        self.bl_idname = bl_idname
+        self.module = module
+        self.bl_label = bl_label
+        self.doc = doc
+        self.sv_icon = sv_icon
+        self.bl_icon = bl_icon
+        self.sv_dependencies = set(sv_dependencies)
+        self._docstring = None
+
+    @classmethod
+    def from_class(cls, node_cls):
+        return cls(node_cls.bl_idname, node_cls.__module__, node_cls.bl_label, node_cls.__doc__,
+                   getattr(node_cls, 'sv_icon', None), getattr(node_cls, 'bl_icon', None),
+                   sorted(getattr(node_cls, 'sv_dependencies', ())))
+
+    def to_dict(self):
+        return {'label': self.bl_label, 'doc': self.doc, 'sv_icon': self.sv_icon,
+                'bl_icon': self.bl_icon, 'sv_dependencies': sorted(self.sv_dependencies)}
+
+    @property
+    def missing_dependency(self) -> bool:
+        """The same as `NodeDependencies.missing_dependency`"""
+        return any(dep not in sys.modules for dep in self.sv_dependencies)
+
+    @property
+    def docstring(self):
+        if self._docstring is None:
+            self._docstring = SvDocstring(self.doc)
+        return self._docstring
+
+    def __repr__(self):
+        return f"<NodeInfo {self.bl_idname} from {self.module}>"
+
+
+def is_enabled() -> bool:
+    return "--sv-lazy-nodes" in sys.argv or bool(os.environ.get("SVERCHOK_LAZY_NODES"))
+
+
+def manifest_path() -> Path:
+    datafiles = Path(bpy.utils.user_resource('DATAFILES', path='sverchok', create=True))
+    return datafiles / MANIFEST_NAME
+
+
+def nodes_key() -> str:
+    """Hash of names and modification times of node files and of the
+    Sverchok version. The manifest is valid only with the same key."""
+    from sverchok import nodes
+    key = sha1(sverchok.VERSION.encode())
+    root = Path(nodes.directory)
+    for path in sorted(root.rglob('*.py')):
+        stat = path.stat()
+        key.update(f"{path.relative_to(root)}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return key.hexdigest()
+
+
+def read_manifest():
+    """Returns {module name: {bl_idname: node data}} or None if the manifest
+    does not exist or is outdated"""
+    path = manifest_path()
+    if not path.exists():
+        return None
+    try:
+        with open(path) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError) as e:
+        sv_logger.warning(f"Can't read nodes manifest: {e}")
+        return None
+    if manifest.get('key') != nodes_key():
+        return None
+    return manifest['modules']
+
+
+def write_manifest(node_modules):
+    """Should be called after all node modules were imported"""
+    modules = dict()
+    for module in node_modules:
+        nodes = dict()
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, bpy.types.Node) \
+                    and obj.__module__ == module.__name__ and 'bl_idname' in vars(obj):
+                nodes[obj.bl_idname] = NodeInfo.from_class(obj).to_dict()
+        modules[module.__name__] = nodes
+    try:
+        with open(manifest_path(), 'w') as file:
+            json.dump({'key': nodes_key(), 'modules': modules}, file, indent=1)
+    except OSError as e:
+        sv_logger.warning(f"Can't save nodes manifest: {e}")
+
+
+def import_nodes(manifest):
+    """Imports only modules without nodes, other modules are remembered to be
+    loaded by request. Returns imported modules."""
+    from sverchok import nodes
+    _not_loaded.clear()
+    base_name = "sverchok.nodes"
+    for category in nodes.nodes_dict:
+        importlib.import_module(f'.{category}', base_name)
+    node_modules = []
+    for module_name, module_nodes in manifest.items():
+        if not module_nodes:
+            node_modules.append(importlib.import_module(module_name))
+        for bl_idname, data in module_nodes.items():
+            _not_loaded[bl_idname] = NodeInfo(
+                bl_idname, module_name, data['label'], data['doc'], data['sv_icon'],
+                data['bl_icon'], data['sv_dependencies'])
+    sv_logger.debug(f"{len(_not_loaded)} nodes will be loaded by request")
+    return node_modules
+
+
+def node_class(bl_idname):
+    """Registered class of the node or its NodeInfo if it was not loaded yet"""
+    return bpy.types.Node.bl_rna_get_subclass_py(bl_idname) or _not_loaded.get(bl_idname)
+
+
+def is_loaded(bl_idname) -> bool:
+    return bl_idname not in _not_loaded
+
+
+def load(bl_idname) -> bool:
+    """Imports and registers module of the node if it was not done yet.
+    Returns True if a module was registered."""
+    info = _not_loaded.get(bl_idname)
+    if info is None:
+        return False
+
+    lazy_modules = {n.module for n in _not_loaded.values()}
+    module = importlib.import_module(info.module)
+    if sverchok.reload_event:
+        module = importlib.reload(module)
+
+    # node modules imported by the module should be registered first
+    # because the module can use their classes
+    dependencies = [m for n, m in list(sys.modules.items())
+                    if n in lazy_modules and n != info.module]
+    for mod in dependencies + [module]:
+        if hasattr(mod, 'register'):
+            mod.register()
+        loaded_modules.append(mod)
+        for name in [i for i, n in _not_loaded.items() if n.module == mod.__name__]:
+            del _not_loaded[name]
+    sv_logger.debug(f'Module "{info.module}" was loaded')
+    return True
+
+
+def new_node(nodes, bl_idname):
+    """Adds a node into given nodes of a tree (tree.nodes), module of the node
+    is loaded first if it was not done yet. Sverchok nodes should be always
+    created via this function, otherwise the tree can get unregistered node"""
+    load(bl_idname)
+    return nodes.new(bl_idname)
+
+
+def load_tree_nodes():
+    """Loads nodes which are used by trees of current file"""
+    if not _not_loaded:
+        return
+    from sverchok.utils.handle_blender_data import BlTrees
+    for tree in BlTrees().sv_trees:
+        for node in tree.nodes:
+            if node.bl_idname in _not_loaded:
+                load(node.bl_idname)
+
+
+def load_all():
+    """Loads all not loaded nodes, e.g. to test them"""
+    while _not_loaded:
+        load(next(iter(_not_loaded)))
+
+
+def _load_tree_nodes_timer():
+    load_tree_nodes()
+    return None  # do not repeat
+
+
+def register():
+    # the add-on can be enabled when a file is already opened, in this case
+    # load_post handler is not called
+    if _not_loaded:
+        bpy.app.timers.register(_load_tree_nodes_timer, first_interval=0)
+
+
+def unregister():
+    for module in reversed(loaded_modules):
+        if hasattr(module, 'unregister'):
+            try:
+                module.unregister()
+            except RuntimeError as e:
+                sv_logger.error(f"Error unregistering module {module.__name__}: {e}")
+    loaded_modules.clear()
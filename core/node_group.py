@@ -18,6 +18,7 @@ from sverchok.data_structure import extend_blender_class
 from mathutils import Vector
 
 from sverchok.core.sockets import socket_type_names
+from sverchok.core import lazy_nodes
 import sverchok.core.events as ev
 import sverchok.core.group_update_system as gus
 from sverchok.core.update_system import ERROR_KEY
@@ -485,7 +486,7 @@ class PlacingNodeOperator:
     def placing_node(context, node_type: str):
         tree = context.space_data.path[-1].node_tree
         bpy.ops.node.select_all(action='DESELECT')
-        group_node = tree.nodes.new(node_type)
+        group_node = lazy_nodes.new_node(tree.nodes, node_type)
         group_node.location = context.space_data.cursor_location
 
     @staticmethod
@@ -653,7 +654,7 @@ class AddGroupTreeFromSelected(bpy.types.Operator):
             initial_nodes = self.filter_selected_nodes(base_tree)
             center = reduce(lambda v1, v2: v1 + v2,
                             [Vector(n.absolute_location) for n in initial_nodes]) / len(initial_nodes)
-            group_node = base_tree.nodes.new(SvGroupTreeNode.bl_idname)
+            group_node = lazy_nodes.new_node(base_tree.nodes, SvGroupTreeNode.bl_idname)
             group_node.select = False
             group_node.group_tree = sub_tree
             group_node.location = center
@@ -18,14 +18,17 @@
 
 """For internal usage of the sockets module"""
 import logging
+import sys
 from collections import UserDict
-from itertools import chain
+from itertools import chain, count
 from traceback import format_list, extract_stack
-from typing import NewType, Optional, Literal
+from typing import NewType, Optional, Literal, Iterable
 
+import numpy as np
 from bpy.types import NodeSocket
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 from sverchok.utils.handle_blender_data import BlTrees
+from sverchok.utils.ragged_array import SvRaggedArray
 
 
 SockId = NewType('SockId', str)
@@ -157,6 +160,101 @@ socket_data_cache: dict[SockId, list] = dict()
 # socket_data_cache = DebugMemory(socket_data_cache)
 
 
+def data_size(data) -> int:
+    """Approximate size of socket data in bytes. Only first items of nested
+    lists are measured, so it is cheap but can be inaccurate for irregular
+    data"""
+    if isinstance(data, (np.ndarray, SvRaggedArray)):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        size = sys.getsizeof(data)
+        if data:
+            size += len(data) * data_size(data[0])
+        return size
+    return sys.getsizeof(data)
+
+
+class CacheManager:
+    """It keeps approximate sizes of the socket data cache entries. Also it
+    can evict entries to fit the cache into a memory budget. Evicted sockets
+    are remembered, so the update system could recalculate their data when
+    they are needed again. Also it gives versions to the data, so the update
+    system could cheaply check whether socket data was changed."""
+
+    def __init__(self):
+        """:_sizes: sizes of socket data in order of writing
+        :_evicted: sockets which data was removed to free memory
+        :_versions: unique numbers of data written into sockets
+        :total_size: approximate size of the whole cache in bytes"""
+        self._sizes: dict[SockId, int] = dict()
+        self._evicted: set[SockId] = set()
+        self._versions: dict[SockId, int] = dict()
+        self._counter = count(1)
+        self.total_size = 0
+
+    def add(self, sock_id: SockId, data):
+        """Should be called when data is written into the cache"""
+        self._remove(sock_id)
+        size = data_size(data)
+        self._sizes[sock_id] = size
+        self.total_size += size
+        self._evicted.discard(sock_id)
+        self._versions[sock_id] = next(self._counter)
+
+    def forget(self, sock_id: SockId):
+        """Should be called when data is deleted from the cache"""
+        self._remove(sock_id)
+        self._evicted.discard(sock_id)
+        self._versions.pop(sock_id, None)
+
+    def version(self, sock_id: SockId) -> int:
+        """Version of the socket data, 0 if there is no data. A new version
+        is given each time data is written into the socket"""
+        return self._versions.get(sock_id, 0)
+
+    def set_version(self, sock_id: SockId, version: int):
+        """Can be used to keep previous version of the socket data if new
+        data is equal to the previous one"""
+        self._versions[sock_id] = version
+
+    def is_evicted(self, sock_id: SockId) -> bool:
+        return sock_id in self._evicted
+
+    def size(self, sock_id: SockId) -> int:
+        """Approximate size of the socket data, 0 if there is no data"""
+        return self._sizes.get(sock_id, 0)
+
+    def evict(self, budget: int, candidates: Iterable[SockId]) -> int:
+        """Deletes data of given sockets from the cache, starting from the
+        least recently written, until the cache fits into the budget (bytes).
+        Returns number of evicted sockets"""
+        candidates = set(candidates)
+        evicted = 0
+        for sock_id in list(self._sizes):
+            if self.total_size <= budget:
+                break
+            if sock_id not in candidates:
+                continue
+            socket_data_cache.pop(sock_id, None)
+            self._remove(sock_id)
+            self._evicted.add(sock_id)
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        self._sizes.clear()
+        self._evicted.clear()
+        self._versions.clear()
+        self.total_size = 0
+
+    def _remove(self, sock_id: SockId):
+        if (size := self._sizes.pop(sock_id, None)) is not None:
+            self.total_size -= size
+
+
+cache_manager = CacheManager()
+
+
 def sv_deep_copy(lst):
     """return deep copied data of list/tuple structure"""
     # faster than builtin deep copy for us.
@@ -170,32 +268,221 @@ def sv_deep_copy(lst):
     return lst
 
 
+_copied_bytes = 0
+
+
+def get_copied_bytes() -> int:
+    """Returns approximate number of bytes copied by the socket data cache
+    since last reset"""
+    return _copied_bytes
+
+
+def reset_copied_bytes():
+    """Should be called before a tree update to count copied bytes per update"""
+    global _copied_bytes
+    _copied_bytes = 0
+
+
+def _count_copy(lst: list):
+    global _copied_bytes
+    _copied_bytes += sys.getsizeof(lst)
+
+
+class SvCowList(list):
+    """Copy-on-write replacement of `sv_deep_copy`. Only the top level of the
+    data is copied on creation. Nested lists stay shared with the socket cache
+    until they are accessed via indexing, iteration, popping or sorting with a
+    key function, then they are copied (only one level) and the copy replaces
+    the shared list. Lists which are put into the list by a node are its own
+    and are never copied. Tuples and other objects are not copied, the same as
+    with `sv_deep_copy`.
+    It is still a list so nodes can mutate it in any way without damaging the
+    cache. Functions which read internal list storage directly (for example
+    `np.array`) see shared lists, but they don't mutate them.
+    Nesting of Sverchok data is the same within a level, so whether nested
+    lists have lists inside is checked once per level."""
+
+    __slots__ = ('_own', '_nested')
+
+    def __init__(self, lst=()):
+        # the list constructor would copy nested lists of another SvCowList
+        super().__init__(list.copy(lst) if isinstance(lst, SvCowList) else lst)
+        _count_copy(self)
+        self._own: dict[int, list] = dict()  # id -> already copied nested lists
+        self._nested: Optional[bool] = None  # nested lists have lists inside
+
+    def _copy(self, item: list) -> list:
+        if self._nested is None and item:
+            self._nested = any(isinstance(i, list) for i in item)
+        if self._nested:
+            return SvCowList(item)
+        item = item[:]
+        _count_copy(item)
+        return item
+
+    def _own_item(self, index, item):
+        if isinstance(item, list) and self._own.get(id(item)) is not item:
+            item = self._copy(item)
+            list.__setitem__(self, index, item)
+            self._own[id(item)] = item
+        return item
+
+    def copy(self):
+        return SvCowList(self)
+
+    def __add__(self, other):
+        return SvCowList(list.__add__(self, list(other)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SvCowList(list.__getitem__(self, index))
+        return self._own_item(index, list.__getitem__(self, index))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._own_item(i, list.__getitem__(self, i))
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self._own_item(i, list.__getitem__(self, i))
+
+    def _add_own(self, items):
+        for item in items:
+            if isinstance(item, list):
+                self._own[id(item)] = item
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self._add_own(value)
+        else:
+            self._add_own([value])
+        list.__setitem__(self, index, value)
+
+    def append(self, item):
+        self._add_own([item])
+        list.append(self, item)
+
+    def insert(self, index, item):
+        self._add_own([item])
+        list.insert(self, index, item)
+
+    def extend(self, items):
+        items = list(items)
+        self._add_own(items)
+        list.extend(self, items)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def sort(self, *, key=None, reverse=False):
+        if key is not None:
+            # the key function gets items and could change them
+            for i in range(len(self)):
+                self._own_item(i, list.__getitem__(self, i))
+        list.sort(self, key=key, reverse=reverse)
+
+    def pop(self, index=-1):
+        item = list.pop(self, index)
+        if isinstance(item, list) and self._own.pop(id(item), None) is not item:
+            item = self._copy(item)
+        return item
+
+    def copy(self):
+        return SvCowList(self)
+
+    def __add__(self, other):
+        return SvCowList(list.__add__(self, other))
+
+    def __mul__(self, n):
+        return SvCowList(list.__mul__(self, n))
+
+    __rmul__ = __mul__
+
+
+def sv_cow_copy(data):
+    """Returns data which can be safely mutated, nested lists are copied
+    lazily, see `SvCowList`"""
+    if isinstance(data, list):
+        return SvCowList(data)
+    if isinstance(data, tuple):
+        return sv_deep_copy(data)
+    return data
+
+
 def sv_forget_socket(socket):
     """deletes socket data from cache"""
     try:
         del socket_data_cache[socket.socket_id]
     except KeyError:
         pass
+    cache_manager.forget(socket.socket_id)
 
 
 def sv_set_socket(socket, data):
     """sets socket data for socket"""
     socket_data_cache[socket.socket_id] = data
+    cache_manager.add(socket.socket_id, data)
 
 
 def sv_get_socket(socket, deepcopy=True):
     """gets socket data from socket,
-    if deep copy is True a deep copy is make_dep_dict,
+    if deep copy is True a copy-on-write copy is made (see `SvCowList`),
     to increase performance if the node doesn't mutate input
     set to False and increase performance substanstilly
     """
     data = socket_data_cache.get(socket.socket_id)
     if data is not None:
-        return sv_deep_copy(data) if deepcopy else data
+        return sv_cow_copy(data) if deepcopy else data
     else:
         raise SvNoDataError(socket)
 
 
+def is_socket_evicted(socket) -> bool:
+    """Returns True if socket data was removed from the cache to free memory
+    and should be recalculated"""
+    return cache_manager.is_evicted(socket.socket_id)
+
+
+def socket_data_size(socket) -> int:
+    """Returns approximate size of socket data in bytes"""
+    return cache_manager.size(socket.socket_id)
+
+
+def data_equal(data1, data2) -> bool:
+    """Compares socket data. Unlike == it does not fail on arrays and it
+    takes into account shapes of arrays"""
+    if data1 is data2:
+        return True
+    if isinstance(data1, np.ndarray) or isinstance(data2, np.ndarray):
+        return (isinstance(data1, np.ndarray) and isinstance(data2, np.ndarray)
+                and data1.shape == data2.shape and np.array_equal(data1, data2))
+    if isinstance(data1, SvRaggedArray) or isinstance(data2, SvRaggedArray):
+        return (isinstance(data1, SvRaggedArray) and isinstance(data2, SvRaggedArray)
+                and len(data1) == len(data2) and all(data_equal(d1, d2) for d1, d2 in zip(data1, data2)))
+    if isinstance(data1, (list, tuple)):
+        if not isinstance(data2, (list, tuple)) or len(data1) != len(data2):
+            return False
+        if not _has_arrays(data1) and not _has_arrays(data2):
+            try:
+                return bool(data1 == data2)
+            except (ValueError, TypeError):
+                pass  # there are arrays deeper in the data
+        return all(data_equal(d1, d2) for d1, d2 in zip(data1, data2))
+    try:
+        return bool(data1 == data2)
+    except (ValueError, TypeError):
+        return False
+
+
+def _has_arrays(data) -> bool:
+    """Checks only first items of nested lists"""
+    while isinstance(data, (list, tuple)) and data:
+        data = data[0]
+    return isinstance(data, np.ndarray)
+
+
 def get_output_socket_data(node, output_socket_name):
     """
     This method is intended to usage in internal tests mainly.
@@ -215,6 +502,7 @@ def clear_all_socket_cache():
     Reset socket cache for all node-trees.
     """
     socket_data_cache.clear()
+    cache_manager.clear()
 
 
 def unregister():
@@ -27,6 +27,7 @@ from bpy.props import StringProperty, BoolProperty, FloatVectorProperty, IntProp
 from bpy.types import NodeTree, NodeSocket
 
 from sverchok.core.socket_conversions import ConversionPolicies
+from sverchok.core import lazy_nodes
 from sverchok.core.socket_data import sv_get_socket, sv_set_socket, sv_forget_socket
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 
@@ -34,7 +35,8 @@ from sverchok.data_structure import (
     enum_item_4,
     get_other_socket, replace_socket,
     SIMPLE_DATA_TYPES,
-    flatten_data, graft_data, map_at_level, wrap_data, unwrap_data)
+    flatten_data, graft_data, map_at_level, wrap_data, unwrap_data,
+    flatten_array_data, graft_array_data)
 
 from sverchok.settings import get_param
 
@@ -709,10 +711,10 @@ class SvVerticesSocket(SocketDomain, NodeSocket, SvSocketCommon):
     expanded: BoolProperty(default=False)  # for minimizing showing socket property
 
     def do_simplify(self, data):
-        return flatten_data(data, 2)
+        return flatten_array_data(data, 2)
 
     def do_flat_topology(self, data):
-        return flatten_data(data, 3)
+        return flatten_array_data(data, 3)
 
     @property
     def default_property(self):
@@ -740,7 +742,7 @@ class SvVerticesSocket(SocketDomain, NodeSocket, SvSocketCommon):
             row.template_component_menu(prop_origin, prop_name, name=self.label or self.name)
 
     def do_graft(self, data):
-        return graft_data(data, item_level=1)
+        return graft_array_data(data, item_level=1)
 
     def draw_group_property(self, layout, text, interface_socket):
         if not interface_socket.hide_value:
@@ -853,7 +855,7 @@ class SvColorSocket(SocketDomain, NodeSocket, SvSocketCommon):
             layout.label(text=text)
 
     def do_flat_topology(self, data):
-        return flatten_data(data, 3)
+        return flatten_array_data(data, 3)
 
 class SvDummySocket(NodeSocket, SvSocketCommon):
     '''Dummy Socket for sockets awaiting assignment of type'''
@@ -987,16 +989,16 @@ class SvStringsSocket(SocketDomain, NodeSocket, SvSocketCommon):
             layout.prop(self, 'use_wrap')
 
     def do_flat_topology(self, data):
-        return flatten_data(data, 3)
+        return flatten_array_data(data, 3)
 
     def do_flatten(self, data):
-        return flatten_data(data, 1)
+        return flatten_array_data(data, 1)
 
     def do_simplify(self, data):
-        return flatten_data(data, 2)
+        return flatten_array_data(data, 2)
 
     def do_graft(self, data):
-        return graft_data(data, item_level=0, data_types = STANDARD_TYPES)
+        return graft_array_data(data, item_level=0, data_types = STANDARD_TYPES)
 
     def do_graft_2(self, data):
         def to_zero_base(lst):
@@ -1316,7 +1318,7 @@ class SvLinkNewNodeInput(bpy.types.Operator):
     def execute(self, context):
         tree, node, socket = context.node.id_data, context.node, context.socket
 
-        new_node = tree.nodes.new(socket.quick_link_to_node)
+        new_node = lazy_nodes.new_node(tree.nodes, socket.quick_link_to_node)
         links_number = len([s for s in node.inputs if s.is_linked])
         new_node.location = (node.location[0] - 200, node.location[1] - 100 * links_number)
         tree.links.new(new_node.outputs[0], socket)
@@ -1438,7 +1440,7 @@ class SvInputLinkMenuOp(bpy.types.Operator):
             return False
 
         if self.option == '__SV_PARAM_CREATE__':
-            new_node = tree.nodes.new(socket.get_link_parameter_node())
+            new_node = lazy_nodes.new_node(tree.nodes, socket.get_link_parameter_node())
             new_node.label = socket.label or socket.name
             socket.setup_parameter_node(new_node)
             links_number = len([s for s in node.inputs if s.is_linked])
@@ -1453,15 +1455,15 @@ class SvInputLinkMenuOp(bpy.types.Operator):
 
         elif self.option == '__SV_WIFI_CREATE__':
             label = socket.label or socket.name
-            param_node = tree.nodes.new(socket.get_link_parameter_node())
+            param_node = lazy_nodes.new_node(tree.nodes, socket.get_link_parameter_node())
             param_node.label = label
 
-            wifi_in_node = tree.nodes.new('WifiInNode')
+            wifi_in_node = lazy_nodes.new_node(tree.nodes, 'WifiInNode')
             wifi_in_node.label = f"WiFi In - {label}"
             wifi_in_node.gen_var_name()
             wifi_var = wifi_in_node.var_name
 
-            wifi_out_node = tree.nodes.new('WifiOutNode')
+            wifi_out_node = lazy_nodes.new_node(tree.nodes, 'WifiOutNode')
             wifi_out_node.label = f"WiFi Out - {label}"
             wifi_out_node.var_name = wifi_var
 
@@ -1494,7 +1496,7 @@ class SvInputLinkMenuOp(bpy.types.Operator):
                         break
 
             if not found_existing:
-                new_node = tree.nodes.new('WifiOutNode')
+                new_node = lazy_nodes.new_node(tree.nodes, 'WifiOutNode')
                 new_node.var_name = wifi_var
                 new_node.set_var_name()
                 links_number = len([s for s in node.inputs if s.is_linked])
@@ -1,18 +1,27 @@
+import pickle
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from functools import lru_cache
 from graphlib import TopologicalSorter
 from itertools import chain
+from threading import get_ident
 from time import perf_counter
-from typing import TYPE_CHECKING, Optional, Generator, Iterable
+from typing import TYPE_CHECKING, Callable, Optional, Generator, Iterable
 
 from bpy.types import Node, NodeSocket, NodeTree, NodeLink
+import sverchok
 import sverchok.core.events as ev
 import sverchok.core.tasks as ts
+from sverchok.core.socket_data import (
+    get_copied_bytes, reset_copied_bytes, cache_manager, is_socket_evicted,
+    socket_data_size, socket_data_cache, data_equal)
 from sverchok.core.sv_custom_exceptions import CancelError, SvNoDataError
 from sverchok.core.socket_conversions import conversions
-from sverchok.utils.profile import profile
-from sverchok.utils.sv_logging import node_error_logger
+from sverchok.settings import get_param
+from sverchok.utils.data_cache import NodeResultCache, get_node_result_cache, hash_data, hash_properties
+from sverchok.utils.profile import profile, get_node_profile
+from sverchok.utils.sv_logging import node_error_logger, sv_logger
 from sverchok.utils.tree_walk import bfs_walk
 
 if TYPE_CHECKING:
@@ -22,6 +31,7 @@ if TYPE_CHECKING:
 UPDATE_KEY = "US_is_updated"
 ERROR_KEY = "US_error"
 TIME_KEY = "US_time"
+COPY_KEY = "US_copied_bytes"
 
 
 def control_center(event):
@@ -95,6 +105,7 @@ class SearchTree:
     _to_socks: dict[NodeSocket, set[NodeSocket]]
     _links: set[tuple[NodeSocket, NodeSocket]]
     _sock_node: dict[NodeSocket, Node]
+    _fingerprints: dict[str, tuple[int, ...]] = dict()  # node_id: input versions of pure nodes
 
     def __init__(self, tree: NodeTree):
         self._tree = tree
@@ -106,6 +117,7 @@ class SearchTree:
         self._to_socks = defaultdict(set)  # only connected
         self._links = set()  # from to socket
         self._sock_node = dict()
+        self._node_hashes: dict['SvNode', Optional[bytes]] = dict()  # upstream hashes of current update pass
 
         for link in (li for li in tree.links if not li.is_muted):
             self._from_nodes[link.to_node].add(link.from_node)
@@ -182,11 +194,183 @@ class SearchTree:
         sockets have different types, calls process method of the given node
         records nodes statistics
         If suppress is True an error during node execution will be suppressed"""
+        self._node_hashes.clear()
         with AddStatistic(node, suppress):
-            prepare_input_data(self.previous_sockets(node), node.inputs)
-            if error := node.dependency_error:
-                raise error
-            node.process()
+            self._process(node, self.previous_sockets(node))
+
+    def _process(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]]):
+        """Moves data into input sockets of the node and calls its process
+        method. Pure nodes are skipped if data of their inputs was not changed
+        since their previous call, see `UpdateNodes.is_pure`. Results of
+        nodes with `UpdateNodes.is_disk_cached` are loaded from the disk cache
+        when it's enabled for the tree"""
+        if (state := self._prepare_process(node, prev_socks)) is None:
+            return
+        node.process()
+        self._finish_process(node, prev_socks, *state)
+
+    def _prepare_process(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]])\
+            -> Optional[tuple[dict, Optional[str]]]:
+        """Moves data into input sockets of the node. Returns None if the node
+        does not need to be processed because it's memoized or its results
+        were loaded from the disk cache. Otherwise it returns arguments for the
+        `_finish_process` method which should be called after the node was
+        processed."""
+        self.restore_evicted(prev_socks)
+        if self._is_memoized(node, prev_socks):
+            return None
+        old_outputs = self._output_versions(node)
+        prepare_input_data(prev_socks, node.inputs)
+        if error := node.dependency_error:
+            raise error
+        result_key = self._result_key(node, prev_socks)
+        if self._load_result(node, result_key):
+            self._memoize(node, prev_socks, old_outputs)
+            return None
+        return old_outputs, result_key
+
+    def _finish_process(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]],
+                        old_outputs: dict, result_key: Optional[str]):
+        """Saves results of the processed node into the disk cache and
+        memoizes them"""
+        self._save_result(node, result_key)
+        self._memoize(node, prev_socks, old_outputs)
+
+    def _result_key(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]]) -> Optional[str]:
+        """Key of output data of the node in the disk cache. It's a hash of
+        node type, properties, and input data. If input data can't be hashed
+        (fields for example) the hash of upstream nodes and their properties is
+        used instead. Returns None if the node should not be cached"""
+        if not (getattr(node, 'is_disk_cached', False) and getattr(self._tree, 'sv_disk_cache', False)):
+            return None
+        key = NodeResultCache.new_key()
+        key.update(sverchok.VERSION.encode())  # the result can be changed by new version of the node
+        try:
+            if not self._hash_node(key, node, prev_socks, use_data=True):
+                return None
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            sv_logger.debug(f"Key of {node.name} result can't be calculated: {e}")
+            return None
+        key.update(str([s.identifier for s in node.outputs if s.is_linked]).encode())
+        key.update(f'draft={getattr(self._tree, "sv_draft", False)}'.encode())
+        return key.hexdigest()
+
+    def _hash_node(self, key, node: 'SvNode', prev_socks: list[Optional[NodeSocket]], use_data=False) -> bool:
+        """Updates the key with everything output of the node depends on.
+        If use_data is False input data is taken into account via hashing
+        upstream nodes. Returns False for nodes which depends on scene"""
+        if getattr(node, 'is_scene_dependent', False) or getattr(node, 'is_animation_dependent', False):
+            return False
+        key.update(node.bl_idname.encode())
+        hash_properties(key, node)
+        for in_sock, from_sock in zip(node.inputs, prev_socks):
+            key.update(in_sock.identifier.encode())
+            if from_sock is None:
+                hash_data(key, in_sock.sv_get(default=None, deepcopy=False))
+                continue
+            if use_data:
+                try:
+                    hash_data(key, in_sock.sv_get(default=None, deepcopy=False))
+                    continue
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    pass
+            key.update(from_sock.identifier.encode())
+            if not self._hash_upstream(key, from_sock.node):
+                return False
+        return True
+
+    def _hash_upstream(self, key, node: 'SvNode') -> bool:
+        """Updates the key with hash of the node and its upstream nodes. The
+        hash is calculated once per update pass, so nodes shared by several
+        branches are not hashed again"""
+        if node not in self._node_hashes:
+            node_key = NodeResultCache.new_key()
+            is_hashed = self._hash_node(node_key, node, self.previous_sockets(node))
+            self._node_hashes[node] = node_key.digest() if is_hashed else None
+        if (digest := self._node_hashes[node]) is None:
+            return False
+        key.update(digest)
+        return True
+
+    @staticmethod
+    def _load_result(node: 'SvNode', result_key: Optional[str]) -> bool:
+        """Puts output data of the node from the disk cache, returns False if
+        there is no data with the key"""
+        if result_key is None:
+            return False
+        data = get_node_result_cache().load(result_key)
+        if data is None or any(s.identifier not in data for s in node.outputs if s.is_linked):
+            return False
+        for sock in node.outputs:
+            if sock.identifier in data:
+                sock.sv_set(data[sock.identifier])
+        return True
+
+    @staticmethod
+    def _save_result(node: 'SvNode', result_key: Optional[str]):
+        if result_key is None:
+            return
+        data = {s.identifier: socket_data_cache[s.socket_id] for s in node.outputs
+                if s.socket_id in socket_data_cache}
+        get_node_result_cache().save(result_key, data)
+
+    @staticmethod
+    def _input_fingerprint(prev_socks: list[Optional[NodeSocket]]) -> tuple[int, ...]:
+        """Versions of data of connected output sockets. Data of disconnected
+        sockets depends on node properties which changes are tracked by the
+        outdated nodes"""
+        return tuple(s and cache_manager.version(s.socket_id) for s in prev_socks)
+
+    def _is_memoized(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]]) -> bool:
+        """Returns True if the node is pure, its input data was not changed
+        since the previous call and its output data is still in the cache"""
+        if not getattr(node, 'is_pure', False):
+            return False
+        fingerprint = self._fingerprints.get(node.node_id)
+        if fingerprint is None or fingerprint != self._input_fingerprint(prev_socks):
+            return False
+        return all(s.socket_id in socket_data_cache for s in node.outputs if s.is_linked)
+
+    @staticmethod
+    def _output_versions(node: 'SvNode') -> Optional[list[tuple[NodeSocket, object, int]]]:
+        """Returns data and versions of output sockets of pure nodes which
+        should be passed to the `_memoize` method after node processing"""
+        if not getattr(node, 'is_pure', False):
+            return None
+        SearchTree._fingerprints.pop(node.node_id, None)
+        return [(s, socket_data_cache.get(s.socket_id), cache_manager.version(s.socket_id))
+                for s in node.outputs]
+
+    def _memoize(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]],
+                 old_outputs: Optional[list[tuple[NodeSocket, object, int]]]):
+        """Remembers fingerprint of input data of a pure node after its
+        successful processing. If new output data is equal to the previous one
+        the previous version of the data is kept, so next pure nodes would be
+        skipped too"""
+        if old_outputs is None:
+            return
+        for sock, old_data, old_version in old_outputs:
+            if old_data is None:
+                continue
+            new_data = socket_data_cache.get(sock.socket_id)
+            if new_data is not None and data_equal(old_data, new_data):
+                cache_manager.set_version(sock.socket_id, old_version)
+        self._fingerprints[node.node_id] = self._input_fingerprint(prev_socks)
+
+    @classmethod
+    def _forget_fingerprints(cls, nodes: Iterable['SvNode']):
+        """Should be called for nodes which properties were changed"""
+        for node in nodes:
+            if getattr(node, 'is_pure', False):
+                cls._fingerprints.pop(node.node_id, None)
+
+    def restore_evicted(self, sockets: Iterable[Optional[NodeSocket]]):
+        """Recalculates nodes which output data was evicted from the socket
+        data cache to fit into the memory budget. The given sockets are output
+        sockets, they can be None"""
+        for sock in sockets:
+            if sock is not None and is_socket_evicted(sock):
+                self.update_node(self._sock_node[sock])
 
     def _remove_reroutes(self):
         for r in self._tree.nodes:
@@ -455,19 +639,28 @@ class UpdateTree(SearchTree):
         # print(f"UPDATE NODES {event.type=}, {event.tree.name=}")
         up_tree = cls.get(tree, refresh_tree=True)
         if update_nodes:
+            reset_copied_bytes()
+            up_tree._node_hashes.clear()
+        if update_nodes and getattr(tree, 'sv_parallel', False):
+            try:
+                yield from up_tree._parallel_update()
+            except CancelError:
+                pass
+        elif update_nodes:
             walker = up_tree._walk()
             # walker = up_tree._debug_color(walker)
             try:
                 for node, prev_socks in walker:
                     with AddStatistic(node):
                         yield node
-                        prepare_input_data(prev_socks, node.inputs)
-                        if error := node.dependency_error:
-                            raise error
-                        node.process()
+                        up_tree._process(node, prev_socks)
             except CancelError:
                 pass
 
+        if update_nodes:
+            tree[COPY_KEY] = get_copied_bytes()
+            up_tree._evict_socket_data()
+
         if update_interface:
             if up_tree._tree.show_time_mode == "Cumulative":
                 times = up_tree._calc_cam_update_time()
@@ -479,6 +672,7 @@ class UpdateTree(SearchTree):
     def reset_tree(cls, tree: NodeTree = None):
         """Remove tree data or data of all trees from the cache"""
         if tree is not None and tree.tree_id in cls._tree_catch:
+            cls._forget_fingerprints(cls._tree_catch[tree.tree_id]._from_nodes)
             del cls._tree_catch[tree.tree_id]
 
             # reset nested trees too
@@ -486,6 +680,7 @@ class UpdateTree(SearchTree):
                 UpdateTree.reset_tree(group.node_tree)
         else:
             cls._tree_catch.clear()
+            cls._fingerprints.clear()
 
     def copy(self, new_tree: NodeTree) -> 'UpdateTree':
         """They copy will be with new topology if original tree was changed
@@ -552,32 +747,115 @@ class UpdateTree(SearchTree):
                     sc_nodes.add(node)
         return sc_nodes
 
-    def _walk(self) -> tuple[Node, list[NodeSocket]]:
-        """Yields nodes in order of their proper execution. It starts yielding
-        from outdated nodes. It keeps the outdated_nodes storage in proper
-        state. It checks after yielding the error status of the node. If the
-        node has error it goes into outdated_nodes. It uses cached walker, so
-        it works more efficient when outdated nodes are the same between the
-        method calls."""
-
+    def _take_outdated(self) -> Optional[frozenset['SvNode']]:
+        """Returns nodes from which walking should start, None means that all
+        nodes of the tree should be walked. The outdated_nodes storage gets
+        empty to collect nodes with errors of the walk."""
         # walk all nodes in the tree
         if self._outdated_nodes is None:
             outdated = None
             self._outdated_nodes = set()
+            self._forget_fingerprints(self._from_nodes)
         # walk triggered nodes and error nodes from previous updates
         else:
             outdated = frozenset(self._outdated_nodes)
             self._outdated_nodes.clear()
+            self._forget_fingerprints(outdated)
+        return outdated
+
+    def _is_upstream_updated(self, other_socks: list[NodeSocket]) -> bool:
+        """Node should be executed only if all previous nodes are updated"""
+        return all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock)))
 
-        for node, other_socks in self._sort_nodes(outdated):
-            # execute node only if all previous nodes are updated
-            if all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
+    def _walk(self) -> tuple[Node, list[NodeSocket]]:
+        """Yields nodes in order of their proper execution. It starts yielding
+        from outdated nodes. It keeps the outdated_nodes storage in proper
+        state. It checks after yielding the error status of the node. If the
+        node has error it goes into outdated_nodes. It uses cached walker, so
+        it works more efficient when outdated nodes are the same between the
+        method calls."""
+        for node, other_socks in self._sort_nodes(self._take_outdated()):
+            if self._is_upstream_updated(other_socks):
                 yield node, other_socks
                 if node.get(ERROR_KEY, False):
                     self._outdated_nodes.add(node)
             else:
                 node[UPDATE_KEY] = False
 
+    def _walk_levels(self) -> Generator[list[tuple[Node, list[NodeSocket]]], None, None]:
+        """The same as the `_walk` method but it yields levels of nodes. A
+        level is a group of nodes which do not depend on each other, so they
+        can be evaluated in any order or concurrently. Nodes of a level depend
+        only on nodes of previous levels."""
+        node_levels: dict[SvNode, int] = dict()
+        levels: list[list[tuple[SvNode, list[NodeSocket]]]] = []
+        for node, other_socks in self._sort_nodes(self._take_outdated()):
+            level = max((node_levels[n] + 1 for n in self._from_nodes[node]
+                         if n in node_levels), default=0)
+            node_levels[node] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append((node, other_socks))
+
+        for level in levels:
+            to_update = []
+            for node, other_socks in level:
+                if self._is_upstream_updated(other_socks):
+                    to_update.append((node, other_socks))
+                else:
+                    node[UPDATE_KEY] = False
+            yield to_update
+            for node, _ in to_update:
+                if node.get(ERROR_KEY, False):
+                    self._outdated_nodes.add(node)
+
+    def _parallel_update(self) -> Generator['SvNode', None, None]:
+        """Updates outdated nodes level by level. Jobs of thread safe nodes of
+        a level are executed in a thread pool, other nodes are executed in the
+        main thread. Jobs get data which was read by the main thread in
+        advance and return their results to the main thread, so only the main
+        thread touches Blender data. Statistics are also handled by the main
+        thread."""
+        for level in self._walk_levels():
+            concurrent = [(n, s) for n, s in level if getattr(n, 'is_thread_safe', False)]
+            if len(concurrent) < 2:
+                concurrent = []  # there is no sense to use the pool
+            concurrent_nodes = {n for n, _ in concurrent}
+            main = [(n, s) for n, s in level if n not in concurrent_nodes]
+
+            for node, prev_socks in main:
+                with AddStatistic(node):
+                    yield node
+                    self._process(node, prev_socks)
+
+            if not concurrent:
+                continue
+            yield concurrent[0][0]
+            jobs = []
+            for node, prev_socks in concurrent:
+                with AddStatistic(node):
+                    if (state := self._prepare_process(node, prev_socks)) is None:
+                        continue
+                    if (job := node.prepare_job()) is None:
+                        self._finish_process(node, prev_socks, *state)
+                        continue
+                    future = get_executor().submit(_run_job, job)
+                    jobs.append((node, prev_socks, state, future))
+            for node, prev_socks, state, future in jobs:
+                error, outputs, start, update_time, thread_id = future.result()
+                if error is None:
+                    try:
+                        node.set_job_outputs(outputs)
+                    except Exception as e:
+                        error = e
+                AddStatistic.save(node, error, update_time)
+                if error is None:
+                    self._finish_process(node, prev_socks, *state)
+                if node_profile := get_node_profile():
+                    node_profile.add(node, start, update_time,
+                                     output_bytes=_sockets_size(node.outputs),
+                                     error=error, count_call=False, thread_id=thread_id)
+
     def __sort_nodes(self,
                      from_nodes: frozenset['SvNode'] = None,
                      to_nodes: frozenset['SvNode'] = None)\
@@ -614,6 +892,25 @@ class UpdateTree(SearchTree):
                 nodes.append((node, [self._from_sock.get(s) for s in node.inputs]))
         return nodes
 
+    def _evict_socket_data(self, budget: Optional[int] = None):
+        """Frees memory of the socket data cache if it exceeds the budget
+        (bytes), by default it's given in preferences. Only data of output
+        sockets is evicted, it will be recalculated on demand. Data read by
+        viewers (nodes without linked outputs) is kept"""
+        if budget is None:
+            budget = get_param('socket_cache_budget', 0) * 2**20
+        if not budget or cache_manager.total_size <= budget:
+            return
+        viewers = {n for n, next_nodes in self._to_nodes.items() if not next_nodes}
+        candidates = set()
+        for node in self._from_nodes:
+            if node in viewers:
+                continue
+            for sock in node.outputs:
+                if all(self._sock_node[s] not in viewers for s in self._to_socks.get(sock, [])):
+                    candidates.add(sock.socket_id)
+        cache_manager.evict(budget, candidates)
+
     def _update_difference(self, old: 'UpdateTree') -> set['SvNode']:
         """Returns nodes which should be updated according to changes in the
         tree topology
@@ -689,19 +986,20 @@ class AddStatistic:
         self._node = node
         self._start = perf_counter()
         self._supress = supress
+        self._profile = get_node_profile()
+        if self._profile is not None:
+            self._profile.start(node)
 
     def __enter__(self):
         return None
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is None:
-            self._node[UPDATE_KEY] = True
-            self._node[ERROR_KEY] = None
-            self._node[TIME_KEY] = perf_counter() - self._start
-        else:
-            node_error_logger.error(exc_val, exc_info=True)
-            self._node[UPDATE_KEY] = False
-            self._node[ERROR_KEY] = repr(exc_val)
+        update_time = perf_counter() - self._start
+        self.save(self._node, exc_val, update_time)
+        if self._profile is not None:
+            self._profile.stop(self._node, self._start, update_time,
+                               _sockets_size(self._node.inputs),
+                               _sockets_size(self._node.outputs), exc_val)
 
         if self._supress and exc_type is not None:
             if issubclass(exc_type, CancelError):
@@ -709,11 +1007,56 @@ class AddStatistic:
             return issubclass(exc_type, Exception)
 
 
+    @staticmethod
+    def save(node: 'SvNode', error: Optional[Exception] = None, update_time: float = 0.):
+        """Saves update status, error and update time of the node. It can be
+        used directly if the node was executed outside the context manager,
+        for example in another thread"""
+        if error is None:
+            node[UPDATE_KEY] = True
+            node[ERROR_KEY] = None
+            node[TIME_KEY] = update_time
+        else:
+            node_error_logger.error(error, exc_info=error)
+            node[UPDATE_KEY] = False
+            node[ERROR_KEY] = repr(error)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Thread pool for jobs of thread safe nodes. It's created once and is
+    used by all trees until the add-on is unregistered"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="sv_update")
+    return _executor
+
+
+def _run_job(job: Callable[[], dict]) -> tuple[Optional[Exception], Optional[dict], float, float, int]:
+    """Executes job of a thread safe node. It's intended to be called in a
+    worker thread, so it only returns the error or output data of the job,
+    start and duration of the execution and ID of the thread"""
+    start = perf_counter()
+    try:
+        outputs = job()
+    except Exception as e:
+        return e, None, start, perf_counter() - start, get_ident()
+    return None, outputs, start, perf_counter() - start, get_ident()
+
+
+def _sockets_size(sockets: Iterable[NodeSocket]) -> int:
+    return sum(socket_data_size(s) for s in sockets)
+
+
 def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                        input_socks: list[NodeSocket]):
     """Reads data from given outputs socket make it conversion if necessary and
     put data into input given socket"""
     # this can be a socket method
+    if node_profile := get_node_profile():
+        start = perf_counter()
     for ps, ns in zip(prev_socks, input_socks):
         if ps is None:
             continue
@@ -729,6 +1072,8 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                 data = implicit_conversion.convert(ns, ps, data)
 
             ns.sv_set(data)
+    if node_profile:
+        node_profile.add_copy_time(perf_counter() - start)
 
 
 def update_ui(tree: NodeTree, times: Iterable[float] = None):
@@ -738,3 +1083,10 @@ def update_ui(tree: NodeTree, times: Iterable[float] = None):
     errors = (n.get(ERROR_KEY, None) for n in tree.nodes)
     times = times or (n.get(TIME_KEY, 0) for n in tree.nodes)
     tree.update_ui(errors, times)
+
+
+def unregister():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
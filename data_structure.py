@@ -37,6 +37,7 @@ from numpy import (
     float64,
     int32, int64)
 from sverchok.utils.sv_logging import sv_logger
+from sverchok.utils.ragged_array import SvRaggedArray
 import numpy as np
 
 
@@ -125,6 +126,7 @@ def match_long_repeat(lsts):
     longest list matching [[1,2,3,4,5], [10,11]] -> [[1,2,3,4,5], [10,11,11,11,11]]
     
     lists passed into this function are not modified, it produces non-deep copies and extends those.
+    Ragged arrays are matched as lists of their objects which are views of the array buffers.
     """
     max_l = 0
     tmp = []
@@ -493,12 +495,16 @@ def levelsOflist(lst):
 
 def levels_of_list_or_np(lst):
     """calc list nesting only in countainment level integer"""
+    if isinstance(lst, SvRaggedArray):
+        return lst.nesting_level
     level = 1
     for n in lst:
         if isinstance(n, (list, tuple)):
             level += levels_of_list_or_np(n)
         elif isinstance(n, (ndarray)):
             level += len(n.shape)
+        elif isinstance(n, SvRaggedArray):
+            level += n.nesting_level
 
         return level
     return 0
@@ -531,6 +537,11 @@ def get_data_nesting_level(data, data_types=SIMPLE_DATA_TYPES, search_first_data
         """ Needed only for better error reporting. """
         if isinstance(data, data_types):
             return (0, 0)
+        elif isinstance(data, SvRaggedArray):
+            # items of the deepest lists are arrays
+            if ndarray in data_types:
+                return (data.depth, 0)
+            return (data.nesting_level, 0)
         elif isinstance(data, (list, tuple, ndarray)):
             if len(data) == 0:
                 return (1, -1)
@@ -578,10 +589,7 @@ def ensure_nesting_level(data, target_level, data_types=SIMPLE_DATA_TYPES, input
             raise TypeError("ensure_nesting_level: input data already has nesting level of {}. Required level was {}.".format(current_level, target_level))
         else:
             raise TypeError("Input data in socket {} already has nesting level of {}. Required level was {}.".format(input_name, current_level, target_level))
-    result = data
-    for i in range(target_level - current_level):
-        result = [result]
-    return result
+    return wrap_data(data, target_level - current_level)
 
 def ensure_min_nesting(data, target_level, data_types=SIMPLE_DATA_TYPES, input_name=None):
     """
@@ -605,10 +613,7 @@ def ensure_min_nesting(data, target_level, data_types=SIMPLE_DATA_TYPES, input_n
     current_level = get_data_nesting_level(data, data_types)
     if current_level >= target_level:
         return data
-    result = data
-    for i in range(target_level - current_level):
-        result = [result]
-    return result
+    return wrap_data(data, target_level - current_level)
 
 def flatten_data(data, target_level=1, data_types=SIMPLE_DATA_TYPES):
     """
@@ -616,6 +621,8 @@ def flatten_data(data, target_level=1, data_types=SIMPLE_DATA_TYPES):
     Raises an exception if nesting level is already less than `target_level`.
     Refer to data_structure_tests.py for examples.
     """
+    if isinstance(data, SvRaggedArray):
+        return data.flatten(target_level)
     current_level = get_data_nesting_level(data, data_types)
     if current_level < target_level:
         raise TypeError(f"Can't flatten data to level {target_level}: data already have level {current_level}")
@@ -635,6 +642,9 @@ def graft_data(data, item_level=1, wrap_level=1, data_types=SIMPLE_DATA_TYPES):
     (however deep this number is nested) into pair of [].
     Refer to data_structure_tests.py for examples.
     """
+    if isinstance(data, SvRaggedArray):
+        return data.graft(item_level, wrap_level)
+
     def wrap(item):
         for i in range(wrap_level):
             item = [item]
@@ -650,7 +660,87 @@ def graft_data(data, item_level=1, wrap_level=1, data_types=SIMPLE_DATA_TYPES):
 
     return helper(data)
 
+def get_array_data_depth(data):
+    """
+    If data is a numeric array or (nested) lists of numeric arrays of the same
+    number of dimensions returns number of list levels above the arrays,
+    otherwise returns None.
+
+    get_array_data_depth(np.zeros((10, 3))) == 0
+    get_array_data_depth([[np.zeros(10)], [np.zeros(5)]]) == 2
+    get_array_data_depth([np.zeros(10), [1, 2]]) == None
+    """
+    first_item = data
+    while isinstance(first_item, (list, tuple)) and first_item:
+        first_item = first_item[0]
+    if not isinstance(first_item, ndarray):
+        return None
+    depth = 0
+    items = [data]
+    while items and all(isinstance(i, (list, tuple)) for i in items):
+        items = list(chain.from_iterable(items))
+        depth += 1
+    if not items or not all(isinstance(i, ndarray) and i.dtype.kind in 'biuf' for i in items):
+        return None
+    if any(i.ndim != items[0].ndim for i in items):
+        return None
+    return depth
+
+def _array_data_ndim(data, depth):
+    for _ in range(depth):
+        data = data[0]
+    return data.ndim
+
+def flatten_array_data(data, target_level=1, data_types=SIMPLE_DATA_TYPES):
+    """
+    The same as `flatten_data`, but when data is made of numeric arrays (see
+    `get_array_data_depth`) the arrays are reshaped and concatenated instead
+    of building lists of their items. An array which is flattened alone is
+    returned as a view.
+    """
+    depth = get_array_data_depth(data)
+    if depth is None:
+        return flatten_data(data, target_level, data_types)
+    data_ndim = _array_data_ndim(data, depth)
+    if depth + data_ndim < target_level:
+        raise TypeError(f"Can't flatten data to level {target_level}: data already have level {depth + data_ndim}")
+
+    def helper(data, depth):
+        if depth + data_ndim == target_level:
+            return data
+        if depth == 0:
+            return data.reshape((-1,) + data.shape[data.ndim - target_level + 1:])
+        parts = [helper(item, depth - 1) for item in data]
+        # arrays of different shapes are joined like lists of their items
+        if parts and all(isinstance(p, ndarray) and p.shape[1:] == parts[0].shape[1:] for p in parts):
+            return parts[0] if len(parts) == 1 else np_concatenate(parts)
+        return list(chain.from_iterable(parts))
+
+    return helper(data, depth)
+
+def graft_array_data(data, item_level=1, wrap_level=1, data_types=SIMPLE_DATA_TYPES):
+    """
+    The same as `graft_data`, but items of numeric arrays (see
+    `get_array_data_depth`) are wrapped by adding axes to views of the arrays.
+    """
+    depth = get_array_data_depth(data)
+    data_ndim = None if depth is None else _array_data_ndim(data, depth)
+    if depth is None or item_level > depth + data_ndim:
+        return graft_data(data, item_level, wrap_level, data_types)
+
+    def helper(data, depth):
+        if depth == 0 and item_level < data.ndim:
+            axis = data.ndim - item_level
+            return data.reshape(data.shape[:axis] + (1,) * wrap_level + data.shape[axis:])
+        if depth + data_ndim == item_level:
+            return wrap_data(data, wrap_level)
+        return [helper(item, depth - 1) for item in data]
+
+    return helper(data, depth)
+
 def wrap_data(data, wrap_level=1):
+    if isinstance(data, SvRaggedArray):
+        return data.wrap(wrap_level)
     for i in range(wrap_level):
         data = [data]
     return data
@@ -659,7 +749,7 @@ def unwrap_data(data, unwrap_level=1, socket=None):
     socket_msg = "" if socket is None else f" in socket {socket.label or socket.name}"
 
     def unwrap(lst, level):
-        if not isinstance(lst, (list, tuple, ndarray)):
+        if not isinstance(lst, (list, tuple, ndarray, SvRaggedArray)):
             raise Exception(f"Cannot unwrap data: Data at level {level} is an atomic object, not a list {socket_msg}")
         n = len(lst)
         if n == 0:
@@ -31,7 +31,7 @@ import time
 from contextlib import contextmanager
 from itertools import chain, cycle
 from pathlib import Path
-from typing import Iterable, final, Optional
+from typing import Any, Callable, Iterable, final, Optional
 
 import bpy
 from bpy.props import StringProperty, BoolProperty, EnumProperty
@@ -41,6 +41,7 @@ import sverchok
 from sverchok.core.sv_custom_exceptions import SvNoDataError, DependencyError
 import sverchok.core.events as ev
 from sverchok.core.event_system import handle_event
+from sverchok.core import lazy_nodes
 from sverchok.data_structure import classproperty, post_load_call
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
 from sverchok.utils.docstring import SvDocstring
@@ -224,6 +225,26 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
       - etc.
     """
 
+    sv_parallel: BoolProperty(
+        name="Parallel",
+        description="Evaluate independent thread safe nodes concurrently",
+        options=set(),
+        default=False)
+    """If enabled the tree is evaluated level by level, where a level is a
+    group of nodes which do not depend on each other. Jobs of nodes of a level
+    which have `UpdateNodes.is_thread_safe` enabled are evaluated together in a
+    thread pool, other nodes are evaluated in the main thread as usual."""
+
+    sv_disk_cache: BoolProperty(
+        name="Disk cache",
+        description="Keep results of expensive nodes on disk and reuse them after reopening the file",
+        options=set(),
+        default=False)
+    """If enabled results of nodes with `UpdateNodes.is_disk_cached` are
+    saved on disk. A node is not executed when there is a result which was
+    produced with the same properties and input data, the result is loaded
+    instead. The cache directory is set in Sverchok preferences."""
+
     def update(self):
         """This method is called if collection of nodes or links of the tree was changed"""
         handle_event(ev.TreeEvent(self))
@@ -335,6 +356,29 @@ class UpdateNodes:
     
     ![image](https://user-images.githubusercontent.com/28003269/193507101-60a28c3f-50a1-4117-a66f-25b0b4e07e13.png)"""
 
+    is_thread_safe = False
+    """Enable this if the node implements the `UpdateNodes.prepare_job`
+    method. When `SverchCustomTree.sv_parallel` mode of a tree is enabled jobs
+    of such nodes can be executed in a thread pool. Heavy calculations of the
+    job should be made by libraries which release GIL (NumPy, SciPy) otherwise
+    there is no benefit from concurrent execution."""
+
+    is_pure = False
+    """Enable this if output of the node depends only on its input data and
+    properties. Such node is not processed again if data of its inputs was not
+    changed since its previous execution (when it is updated because some node
+    upstream was changed). Also if the node produces the same output data as
+    before, next pure nodes will not be processed either. Nodes which read data
+    from the scene, depend on frame or random state should not enable this."""
+
+    is_disk_cached = False
+    """Enable this for expensive nodes which output depends only on their input
+    data and properties. When `SverchCustomTree.sv_disk_cache` is on, results
+    of such nodes are saved on disk and loaded instead of executing the nodes
+    if their properties and input data are the same. Loading the result should
+    be much faster than calculating it, so it does not make sense for cheap
+    nodes."""
+
     def sv_init(self, context):
         """
         This method will be called during node creation
@@ -391,6 +435,34 @@ class UpdateNodes:
         with catch_log_error():
             self.sv_init(context)
 
+    def prepare_job(self) -> Optional[Callable[[], dict[str, Any]]]:
+        """Thread safe nodes should implement this method and use it in their
+        process method, see `UpdateNodes.is_thread_safe`. It is always called
+        in the main thread and should read input data and properties of the
+        node. It returns a function without arguments which makes all
+        calculations and returns data of output sockets by their names, or
+        None if there is nothing to calculate. The function can be called in
+        another thread, so it must not touch any Blender data (properties,
+        sockets, objects).
+
+        ```py
+        def prepare_job(self):
+            verts = self.inputs['Verts'].sv_get(deepcopy=False)
+            factor = self.factor
+            return lambda: {'Verts': [np.asarray(v) * factor for v in verts]}
+
+        def process(self):
+            if job := self.prepare_job():
+                self.set_job_outputs(job())
+        ```"""
+        raise NotImplementedError
+
+    def set_job_outputs(self, outputs: dict[str, Any]):
+        """Puts results of the job returned by `UpdateNodes.prepare_job` into
+        output sockets. It's called in the main thread"""
+        for name, data in outputs.items():
+            self.outputs[name].sv_set(data)
+
     def sv_new_input(self, socket_type, name, **attrib_dict):
         """Alias of creating and setting socket properties. Example:
 
@@ -825,7 +897,7 @@ class SverchCustomTreeNode(UpdateNodes, NodeUtils, NodeDependencies, NodeDocumen
         """
         if hasattr(self, "replacement_nodes"):
             for bl_idname, inputs_mapping, outputs_mapping in self.replacement_nodes:
-                node_class = bpy.types.Node.bl_rna_get_subclass_py(bl_idname)
+                node_class = lazy_nodes.node_class(bl_idname)
                 if node_class:
                     text = "Replace with {}".format(node_class.bl_label)
                     op = layout.operator("node.sv_replace_node", text=text)
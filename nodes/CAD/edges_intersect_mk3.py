@@ -47,6 +47,10 @@ class SvIntersectEdgesNodeMK3(
                      ("Blender", "Blender", "This mode is using internal Blender function", 2),
                      ("Np", "Np", "A brute force algorithm written in NumPy", 3)]
 
+    broadphase_items = [("NONE", "None", "Test all pairs of edges", 0),
+                        ("SWEEP", "Sweep and prune", "Test only edges which bounding boxes overlap, the boxes are found by sorting them along an axis", 1),
+                        ("GRID", "Uniform grid", "Test only edges which bounding boxes overlap, the boxes are found by putting them into cells of a grid", 2)]
+
     mode: bpy.props.EnumProperty(items=modeItems, default="3D", update=updateNode)
     rm_switch: bpy.props.BoolProperty(update=updateNode, description="Merges points that are closer than the defined distance")
     rm_doubles: bpy.props.FloatProperty(min=0.0, default=0.0001, step=0.1, update=updateNode, description="Finds groups of vertices closer than dist and merges them together, using the weld verts bmop")
@@ -60,6 +64,10 @@ class SvIntersectEdgesNodeMK3(
         name='Big data limit',
         description='Number of incoming edges where the node will switch to a slower-but-safer implementation of the algorithm',
         min=0, default=8000)
+    broadphase: bpy.props.EnumProperty(
+        name='Broadphase',
+        description='Method to find pairs of edges which can intersect. It does not change the result, only the speed',
+        items=broadphase_items, default="SWEEP", update=updateNode)
 
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Verts_in')
@@ -91,6 +99,8 @@ class SvIntersectEdgesNodeMK3(
             layout.prop(self, 'big_data_limit')
         else:
             layout.prop(self, 'epsilon')
+        if self.mode == "3D" or self.mode == "2D" and self.alg_mode_2d in ['Alg_1', 'Np']:
+            layout.prop(self, 'broadphase')
 
     def process(self):
 
@@ -108,15 +118,18 @@ class SvIntersectEdgesNodeMK3(
         verts_out, edges_out = [], []
         for vs, eds in zip(verts_in, edges_in):
             if self.mode == "3D":
-                v_out, ed_out = intersect_edges_3d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
+                v_out, ed_out = intersect_edges_3d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching,
+                                                      broadphase=self.broadphase)
 
             elif self.alg_mode_2d == "Alg_1":
-                v_out, ed_out = intersect_edges_2d(copy(vs), eds, 1 / 10 ** self.epsilon)
+                v_out, ed_out = intersect_edges_2d(copy(vs), eds, 1 / 10 ** self.epsilon, broadphase=self.broadphase)
             elif self.alg_mode_2d == "Np":
                 if len(eds) > self.big_data_limit:
-                    v_out, ed_out = intersect_edges_2d_np_big(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
+                    v_out, ed_out = intersect_edges_2d_np_big(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching,
+                                                              broadphase=self.broadphase)
                 else:
-                    v_out, ed_out = intersect_edges_2d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
+                    v_out, ed_out = intersect_edges_2d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching,
+                                                          broadphase=self.broadphase)
             elif self.alg_mode_2d == "Sweep_line":
                 v_out, ed_out = intersect_sv_edges(vs, eds, self.epsilon)
             else:
@@ -41,7 +41,7 @@ def edges_length(meshes, need_total=False, need_cumsum=False, need_cumsum1=False
 
     for vertices, edges in zip(*meshes):
         np_verts = np.array(vertices)
-        if type(edges[0]) in (list, tuple):
+        if isinstance(edges[0], (list, tuple)):
             np_edges = np.array(edges)
         else:
             np_edges = edges[:len(vertices)-1, :]
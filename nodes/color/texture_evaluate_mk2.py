@@ -59,7 +59,7 @@ def meshes_texture_evaluate(params, constant, matching_f):
     extract_func = color_channels[color_channel][1]
     for props in zip(*params):
         verts, texture = props
-        if  not type(texture) == list:
+        if  not isinstance(texture, list):
             texture = [texture]
         m_texture = local_match([texture])[0]
         result.append([texture_evaluate(v_prop, mapper_func, extract_func) for v_prop in zip(verts, m_texture)])
@@ -6,7 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, sv_compile_numpy, safe_eval_compiled
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
         to_cylindrical, to_spherical,
@@ -95,7 +95,8 @@ class SvScalarFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         return function
 
     def make_function_vector(self, variables):
-        compiled = sv_compile(self.formula)
+        names = self.get_coordinate_variables().union(variables.keys())
+        compiled = sv_compile_numpy(self.formula, names)
 
         def cartesian(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
@@ -6,7 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, sv_compile_numpy, safe_eval_compiled
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -129,9 +129,10 @@ class SvVectorFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         return function
 
     def make_function_vector(self, variables):
-        compiled1 = sv_compile(self.formula1)
-        compiled2 = sv_compile(self.formula2)
-        compiled3 = sv_compile(self.formula3)
+        names = self.get_coordinate_variables().union(variables.keys())
+        compiled1 = sv_compile_numpy(self.formula1, names)
+        compiled2 = sv_compile_numpy(self.formula2, names)
+        compiled3 = sv_compile_numpy(self.formula3, names)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -97,6 +97,7 @@ class MaskListNode(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'List Mask (Out)'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_MASK_OUT'
+    is_pure = True
 
     Level: IntProperty(
         name='Level', description='List level to mask (see help)',
@@ -58,7 +58,7 @@ class SvMaskToIndexNode(SverchCustomTreeNode, bpy.types.Node):
 
 
     def true_indices(self, mask):
-        if type(mask[0]) in [list, tuple, np.ndarray]:
+        if isinstance(mask[0], (list, tuple, np.ndarray)):
             return [self.true_indices(m) for m in mask]
         else:
             if type(mask) == np.ndarray:
@@ -66,7 +66,7 @@ class SvMaskToIndexNode(SverchCustomTreeNode, bpy.types.Node):
             return [i for i, m in enumerate(mask) if m]
 
     def false_indices(self, mask):
-        if type(mask[0]) in [list, tuple, np.ndarray]:
+        if isinstance(mask[0], (list, tuple, np.ndarray)):
             return [self.false_indices(m) for m in mask]
         else:
             if type(mask) == np.ndarray:
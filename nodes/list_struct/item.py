@@ -83,7 +83,7 @@ class SvListItemNode(SverchCustomTreeNode, bpy.types.Node):
 
     def get_items(self, data, indexes):
         '''extract the indexes from the list'''
-        if type(data) in [list, tuple]:
+        if isinstance(data, (list, tuple)):
             return [data[index] for index in indexes if -len(data) <= index < len(data)]
         if type(data) == str:
             return ''.join([data[index] for index in indexes if -len(data) <= index < len(data)])
@@ -99,10 +99,10 @@ class SvListItemNode(SverchCustomTreeNode, bpy.types.Node):
             mask[indexes] = False
             return data[mask]
         is_tuple = False
-        if type(data) == tuple:
+        if isinstance(data, tuple):
             data = list(data)
             is_tuple = True
-        if type(data) == list:
+        if isinstance(data, list):
             out_data = data.copy()
             m_indexes = indexes.copy()
             for idx, index in enumerate(indexes):
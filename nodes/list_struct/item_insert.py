@@ -101,7 +101,7 @@ class SvListItemInsertNode(SverchCustomTreeNode, bpy.types.Node):
 
 
     def set_items(self, data, new_items, indexes):
-        if type(data) in [list, tuple]:
+        if isinstance(data, (list, tuple)):
             data_out = data.copy() if isinstance(data, list) else list(data)
             params = list_match_func[self.list_match_local]([indexes, new_items])
             if self.replace:
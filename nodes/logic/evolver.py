@@ -7,9 +7,15 @@
 
 
 import ast
+import json
+import os
 import random
+import shutil
+import subprocess
+import sys
+import tempfile
 import time
-from collections import namedtuple
+from collections import namedtuple, deque
 from typing import NamedTuple, Union
 import numpy as np
 
@@ -29,6 +35,8 @@ from sverchok.utils.listutils import (
     listinput_setF
     )
 from sverchok.utils.handle_blender_data import keep_enum_reference
+from sverchok.utils.sv_json_export import JSONExporter
+from sverchok.utils.sv_json_import import JSONImporter
 
 
 def check_memory_prop(tx):
@@ -358,25 +366,8 @@ class DNA:
                 agent_gene = gene.init_val
                 self.genes.append(agent_gene)
 
-    def evaluate_fitness(self, tree, node, s_tree: UpdateTree, exec_order):
-        try:
-            tree.sv_process = False
-            for gen_data, agent_gene in zip(self.genes_def, self.genes):
-                gen_data.set_node_with_gene(tree, agent_gene)
-
-            tree.sv_process = True
-            for node in exec_order:
-                try:
-                    s_tree.update_node(node, suppress=False)
-                except Exception:
-                    raise
-
-            agent_fitness = node.inputs[0].sv_get(deepcopy=False)[0]
-            if isinstance(agent_fitness, list):
-                agent_fitness = agent_fitness[0]
-            self.fitness = agent_fitness
-        finally:
-            tree.sv_process = True
+    def evaluate_fitness(self, evaluator: 'FitnessEvaluator'):
+        self.fitness = evaluator.evaluate(self.genes)
 
     def cross_over(self, other_ancestor, mutation_threshold):
 
@@ -402,6 +393,183 @@ class DNA:
 
         return new_agent
 
+def genes_key(genes):
+    """Hashable copy of genes of an agent"""
+    if isinstance(genes, (list, tuple)):
+        return tuple(genes_key(g) for g in genes)
+    return genes
+
+
+def _json_default(obj):
+    """Converts NumPy numbers in genes and fitness"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"{type(obj).__name__} can't be passed to an Evolver worker")
+
+
+class FitnessEvaluator:
+    """
+    Writes genes of agents into the tree and gets their fitness. Only nodes
+    which depend on changed genes (comparing with the previous agent) and
+    which the fitness depends on are updated. Fitness of genomes which were
+    already evaluated is taken from the memory.
+    """
+    def __init__(self, tree, evolver_node, genes_def, memoize=True):
+        self.tree = tree
+        self.node = evolver_node
+        self.genes_def = genes_def
+        self.memory = dict() if memoize else None
+        self.evaluations = 0
+        self._s_tree = UpdateTree.get(tree)
+        self._fitness_nodes = self._s_tree.nodes_to([evolver_node])
+        self._orders = dict()  # names of changed genes: nodes to update
+        self._applied = None  # keys of genes which are written into the tree
+
+    def known_fitness(self, key):
+        if self.memory is None:
+            return None
+        return self.memory.get(key)
+
+    def remember(self, key, fitness):
+        if self.memory is not None:
+            self.memory[key] = fitness
+
+    def evaluate(self, genes):
+        key = genes_key(genes)
+        fitness = self.known_fitness(key)
+        if fitness is not None:
+            return fitness
+        changed = self._write_genes(genes, key)
+        for node in self._nodes_to_update(changed):
+            self._s_tree.update_node(node, suppress=False)
+        fitness = self.node.inputs[0].sv_get(deepcopy=False)[0]
+        if isinstance(fitness, list):
+            fitness = fitness[0]
+        self.evaluations += 1
+        self.remember(key, fitness)
+        return fitness
+
+    def update_other_nodes(self):
+        """Updates nodes which depend on genes but were skipped during
+        evaluation because the fitness does not depend on them"""
+        gene_nodes = [self.tree.nodes[g.name] for g in self.genes_def]
+        other_nodes = self._s_tree.nodes_from(gene_nodes) - self._fitness_nodes
+        for node in self._s_tree.sort_nodes(other_nodes):
+            self._s_tree.update_node(node)
+
+    def _write_genes(self, genes, key):
+        changed = [i for i, gene_key in enumerate(key)
+                   if self._applied is None or self._applied[i] != gene_key]
+        try:
+            self.tree.sv_process = False
+            for i in changed:
+                self.genes_def[i].set_node_with_gene(self.tree, genes[i])
+        finally:
+            self.tree.sv_process = True
+        self._applied = key
+        return frozenset(self.genes_def[i].name for i in changed)
+
+    def _nodes_to_update(self, changed_names):
+        if changed_names not in self._orders:
+            gene_nodes = [self.tree.nodes[name] for name in changed_names]
+            nodes = self._s_tree.nodes_from(gene_nodes) & self._fitness_nodes
+            self._orders[changed_names] = self._s_tree.sort_nodes(nodes)
+        return self._orders[changed_names]
+
+
+WORKER_PREFIX = "SV_EVOLVER_FITNESS "
+
+
+class EvolverWorkers:
+    """
+    Pool of background Blender processes which evaluate fitness of agents in
+    copies of the tree, see `run_worker`. The tree is passed as JSON, scene
+    data is taken from the saved blend file. Each worker gets next genes only
+    after it has returned fitness of previous ones, so the processes are
+    never blocked by full pipes.
+    """
+    def __init__(self, tree, evolver_node, genes_def, workers_n):
+        self._directory = tempfile.mkdtemp(prefix='sv_evolver_')
+        tree_path = os.path.join(self._directory, 'tree.json')
+        with open(tree_path, 'w') as file:
+            json.dump(JSONExporter.get_tree_structure(tree), file)
+        command = [bpy.app.binary_path, '-b']
+        if bpy.data.filepath:
+            command.append(bpy.data.filepath)
+        command += ['--addons', 'sverchok',
+                    '--python-expr', 'from sverchok.nodes.logic.evolver import run_worker; run_worker()',
+                    '--', tree_path, evolver_node.name, genes_to_string(genes_def)]
+        # all nodes are registered in the workers because the tree can use any of them
+        env = dict(os.environ, SVERCHOK_LAZY_NODES='')
+        self._processes = [subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env)
+                           for _ in range(workers_n)]
+
+    def evaluate(self, genomes: list) -> list:
+        """Returns fitness of given genes of agents in the same order"""
+        fitness = [None] * len(genomes)
+        to_send = iter(enumerate(genomes))
+        running = deque()  # worker and index of genes it evaluates
+        for process, (i, genes) in zip(self._processes, to_send):
+            self._send(process, genes)
+            running.append((process, i))
+        while running:
+            process, i = running.popleft()
+            fitness[i] = self._read_result(process)
+            if (next_genes := next(to_send, None)) is not None:
+                self._send(process, next_genes[1])
+                running.append((process, next_genes[0]))
+        return fitness
+
+    @staticmethod
+    def _send(process, genes):
+        process.stdin.write(json.dumps(genes, default=_json_default) + '\n')
+        process.stdin.flush()
+
+    @staticmethod
+    def _read_result(process):
+        for line in process.stdout:
+            if line.startswith(WORKER_PREFIX):
+                result = json.loads(line[len(WORKER_PREFIX):])
+                if isinstance(result, dict):
+                    raise RuntimeError(f"Evolver worker error: {result['error']}")
+                return result
+        raise RuntimeError(f"Evolver worker was stopped with code {process.wait()}")
+
+    def close(self):
+        for process in self._processes:
+            process.stdin.close()
+        for process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+def run_worker():
+    """
+    Entry point of a background Blender process of `EvolverWorkers`.
+    It reads genes of agents as JSON lines from stdin and writes their
+    fitness to stdout, one line per agent.
+    """
+    tree_path, node_name, genes_names = sys.argv[sys.argv.index('--') + 1:]
+    tree = bpy.data.node_groups.new('SvEvolverWorker', 'SverchCustomTreeType')
+    JSONImporter.init_from_path(tree_path).import_into_tree(tree, print_log=False)
+    evolver_node = tree.nodes[node_name]
+    s_tree = UpdateTree.get(tree)
+    for node in s_tree.sort_nodes(s_tree.nodes_to([evolver_node])):
+        s_tree.update_node(node)
+    evaluator = FitnessEvaluator(tree, evolver_node, build_genes_from_name(genes_names, tree))
+
+    for line in sys.stdin:
+        try:
+            result = evaluator.evaluate(json.loads(line))
+        except Exception as e:
+            result = {'error': repr(e)}
+        sys.stdout.write(WORKER_PREFIX + json.dumps(result, default=_json_default) + '\n')
+        sys.stdout.flush()
+
+
 class Population:
 
     def __init__(self, genotype_frame, node, tree):
@@ -412,9 +580,10 @@ class Population:
         self.population_g: list[DNA] = []
         self.init_population(node.population_n)
 
-        self._tree = UpdateTree.get(tree)
-        exec_order = self._tree.nodes_from([tree.nodes[g.name] for g in self.genes])
-        self.exec_order = self._tree.sort_nodes(exec_order)
+        self.evaluator = FitnessEvaluator(tree, node, self.genes, node.memoize_fitness)
+        self.workers = None
+        if node.workers:
+            self.workers = EvolverWorkers(tree, node, self.genes, node.workers)
 
     def init_population(self, population_n):
 
@@ -437,11 +606,23 @@ class Population:
                 self.population_g.append(DNA(self.genes))
 
     def evaluate_fitness_g(self):
-        try:
+        if self.workers is None:
             for agent in self.population_g:
-                agent.evaluate_fitness(self.tree, self.node, self._tree, self.exec_order)
-        finally:
-            self.tree.sv_process = True
+                agent.evaluate_fitness(self.evaluator)
+            return
+
+        new_genomes = dict()
+        for agent in self.population_g:
+            key = genes_key(agent.genes)
+            if self.evaluator.known_fitness(key) is None:
+                new_genomes.setdefault(key, agent.genes)
+        new_fitness = dict(zip(new_genomes, self.workers.evaluate(list(new_genomes.values()))))
+        self.evaluator.evaluations += len(new_fitness)
+        for agent in self.population_g:
+            key = genes_key(agent.genes)
+            agent.fitness = new_fitness[key] if key in new_fitness else self.evaluator.known_fitness(key)
+        for key, fitness in new_fitness.items():
+            self.evaluator.remember(key, fitness)
 
     def population_genes(self):
         return [agent.genes for agent in self.population_g]
@@ -494,6 +675,15 @@ class Population:
         evolver_mem[node_id]["fitness"] = fitness_all[-1]
 
     def evolve(self):
+        try:
+            self._evolve()
+        finally:
+            if self.workers is not None:
+                self.workers.close()
+            else:
+                self.evaluator.update_other_nodes()
+
+    def _evolve(self):
         population_all = []
         fitness_all = []
         info = "Evolver Runned"
@@ -533,7 +723,7 @@ class Population:
             fitness_all.append(self.population_fitness())
 
         self.store_data(population_all, fitness_all)
-        self.node.info_label = info
+        self.node.info_label = f"{info} ({self.evaluator.evaluations} evaluations)"
 
 
 class SvEvolverRun(bpy.types.Operator, SvGenericNodeLocator):
@@ -683,6 +873,20 @@ class SvEvolverNode(SverchCustomTreeNode, bpy.types.Node):
         name='Max Seconds', description='Maximum execution Time',
         update=props_changed)
 
+    memoize_fitness: BoolProperty(
+        name="Memoize Fitness",
+        description="Evaluate agents with the same genes only once, the fitness should depend only on the genes",
+        default=True,
+        update=props_changed)
+
+    workers: IntProperty(
+        default=0,
+        min=0,
+        name='Workers',
+        description='Number of background Blender processes evaluating agents, 0 - evaluate in the current tree.'
+                    ' The processes take scene data from the saved blend file',
+        update=props_changed)
+
     info_label: StringProperty(default="Not Executed")
 
     memory: StringProperty(default="")
@@ -724,6 +928,11 @@ class SvEvolverNode(SverchCustomTreeNode, bpy.types.Node):
             self.wrapper_tracked_ui_draw_op(layout, "node.evolver_set_fittest", icon='RNA_ADD', text="Set Fittest")
             layout.prop(self, "output_all")
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "memoize_fitness")
+        layout.prop(self, "workers")
+
     def has_been_runned(self):
         if self.node_id in evolver_mem and 'genes' in evolver_mem[self.node_id]:
             return True
@@ -18,6 +18,7 @@
 
 import bpy
 from bpy.props import IntProperty, EnumProperty, BoolProperty
+from sverchok.core import lazy_nodes
 from sverchok.core.update_system import UpdateTree, SearchTree
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, enum_item_4, numpy_list_match_modes
@@ -34,7 +35,7 @@ class SvCreateLoopOut(bpy.types.Operator):
 
         node = context.node
         tree = node.id_data
-        new_node = tree.nodes.new('SvLoopOutNode')
+        new_node = lazy_nodes.new_node(tree.nodes, 'SvLoopOutNode')
         new_node.parent = None
         new_node.location = (node.location.x + node.width + 400, node.location.y)
         tree.links.new(node.outputs[0], new_node.inputs[0])
@@ -93,6 +94,12 @@ class SvLoopInNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
         name='Print progress in console', description='Maximum allowed iterations',
         default=False)
 
+    hoist_invariant: BoolProperty(
+        name='Hoist Invariant Nodes',
+        description='Update nodes which do not depend on the current item or iteration only once'
+                    ' (the nodes should give the same result for the same input)',
+        default=False, update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Iterations'].hide_safe = self.mode == "For_Each"
         if self.mode == "For_Each":
@@ -137,6 +144,7 @@ class SvLoopInNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
         else:
             layout.prop(self, "list_match")
         layout.prop(self, 'print_to_console')
+        layout.prop(self, 'hoist_invariant')
         socket_labels = layout.box()
         socket_labels.label(text="Socket Labels")
         for socket in self.inputs[1:]:
@@ -16,9 +16,13 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from itertools import chain
+from time import perf_counter
+
 import bpy
 from bpy.props import EnumProperty
 from sverchok.core.update_system import UpdateTree
+from sverchok.utils.profile import get_node_profile
 
 from sverchok.node_tree import SverchCustomTreeNode
 
@@ -27,6 +31,7 @@ from sverchok.data_structure import list_match_func, enum_item_4
 from sverchok.utils.nodes_mixins.loop_nodes import LoopNode
 
 socket_labels = {'Range': 'Break', 'For_Each': 'Skip'}
+ITERATION_TIMES_KEY = "US_iteration_times"
 
 class SvUpdateLoopOutSocketLabels(bpy.types.Operator):
     '''Update Loop Out socket Labels'''
@@ -69,6 +74,14 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             for socket in self.inputs[2:]:
                 socket_labels_box.prop(socket, "label", text=socket.name)
             socket_labels_box.operator("node.update_loop_out_socket_labels", icon='CON_FOLLOWPATH', text="Update Socket Labels")
+        times = self.get(ITERATION_TIMES_KEY)
+        if times:
+            times = list(times)
+            slowest = max(range(len(times)), key=times.__getitem__)
+            stats_box = layout.box()
+            stats_box.label(text=f"Iterations: {len(times)}")
+            stats_box.label(text=f"Average: {sum(times) / len(times) * 1e3:.2f} ms")
+            stats_box.label(text=f"Slowest: {times[slowest] * 1e3:.2f} ms (#{slowest})")
 
     def change_mode(self, loop_in_node):
         if loop_in_node.mode == 'For_Each':
@@ -109,8 +122,31 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             raise RuntimeError(f'{loop_in_names} {is_are} not connected to Loop'
                                f' out node inside the main loop')
 
+    @staticmethod
+    def iteration_nodes(tree, loop_in_node, sort_loop_nodes):
+        """Nodes which should be updated on each iteration after the first
+        one. If hoisting is enabled in the Loop In node the nodes which do not
+        depend on the current item (iteration) are skipped, they keep data of
+        the first iteration"""
+        nodes = sort_loop_nodes[1:-1]
+        if not loop_in_node.hoist_invariant:
+            return nodes
+        item_nodes = set()
+        for socket in chain(loop_in_node.outputs[1:2], loop_in_node.outputs[3:]):
+            item_nodes.update(tree.nodes_from_socket(socket))
+        variant_nodes = tree.nodes_from(item_nodes)
+        return [n for n in nodes if n in variant_nodes]
+
+    def save_iteration_time(self, times, start):
+        """Appends duration of an iteration to the node statistics"""
+        duration = perf_counter() - start
+        times.append(duration)
+        if profile := get_node_profile():
+            profile.add_event(self, f"{self.name} #{len(times) - 1}", start, duration)
+
     def process(self):
         loop_in_node = self.loop_in_node
+        self.pop(ITERATION_TIMES_KEY, None)
 
         if not self.inputs[0].is_linked:
             return
@@ -146,6 +182,9 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             do_print = loop_in_node.print_to_console
             idx = 0
             out_data = [[] for inp in self.inputs[2:]]
+            iteration_nodes = self.iteration_nodes(tree, loop_in_node, sort_loop_nodes)
+            times = []
+            start = perf_counter()
 
             # the nodes should be cleared out from last loop data
             for node in sort_loop_nodes[:-1]:
@@ -157,18 +196,20 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
                         out.append(inp.sv_get()[0])
                     else:
                         out.append([])
+            self.save_iteration_time(times, start)
 
             for item_params in zip(*params):
                 if idx == 0:
                     idx += 1
                     continue
+                start = perf_counter()
                 for j, data in enumerate(item_params):
                     loop_in_node.outputs[j+3].sv_set([data])
                 loop_in_node.outputs['Loop Number'].sv_set([[idx]])
                 idx += 1
                 if do_print:
                     print(f"Looping Object Number {idx}")
-                for node in sort_loop_nodes[1:-1]:
+                for node in iteration_nodes:
                     try:
                         tree.update_node(node, suppress=False)
                     except Exception:
@@ -180,9 +221,11 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
                             out.append(inp.sv_get()[0])
                         else:
                             out.append([])
+                self.save_iteration_time(times, start)
 
             for inp, outp in zip(out_data, self.outputs):
                 outp.sv_set(inp)
+            self[ITERATION_TIMES_KEY] = times
 
             from_out_nodes = tree.nodes_from([self])
             side_loop_nodes = from_nodes - from_out_nodes - loop_nodes
@@ -210,14 +253,19 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             sort_loop_nodes = tree.sort_nodes(loop_nodes)
             break_socket = tree.previous_sockets(self)[1]
             do_print = loop_in_node.print_to_console
+            iteration_nodes = self.iteration_nodes(tree, loop_in_node, sort_loop_nodes)
+            times = []
+            start = perf_counter()
 
             # the nodes should be cleared out from last loop data
             for node in sort_loop_nodes[:-1]:
                 tree.update_node(node)
+            self.save_iteration_time(times, start)
 
             for i in range(iterations-1):
                 if break_socket and break_socket.sv_get(default=[[False]])[0][0]:
                     break
+                start = perf_counter()
                 for j, socket in enumerate(tree.previous_sockets(self)[2:]):
                     if socket is None:
                         continue
@@ -226,11 +274,13 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
                 loop_in_node.outputs['Loop Number'].sv_set([[i+1]])
                 if do_print:
                     print(f"Looping iteration Number {i+1}")
-                for node in sort_loop_nodes[1:-1]:
+                for node in iteration_nodes:
                     try:
                         tree.update_node(node, suppress=False)
                     except Exception:
                         raise Exception(f"Iteration number: {i+1}")
+                self.save_iteration_time(times, start)
+            self[ITERATION_TIMES_KEY] = times
 
             for inp, outp in zip(tree.previous_sockets(self)[2:], self.outputs):
                 if inp is None:
@@ -275,16 +275,16 @@ class SvNeuroElman1LNode(SverchCustomTreeNode, bpy.types.Node):
 
             input_data = self.inputs['data'].sv_get()
 
-            if type(input_etalon[0]) not in [list, tuple]:
+            if not isinstance(input_etalon[0], (list, tuple)):
                 input_etalon = [input_etalon]
-            if type(input_data[0]) not in [list, tuple]:
+            if not isinstance(input_data[0], (list, tuple)):
                 input_data = [input_data]
 
             for idx, data in enumerate(input_data):
                 let = len(input_etalon) - 1
                 eta = input_etalon[min(idx, let)]
                 data2 = [1.0] + data
-                if type(eta) not in [list, tuple]:
+                if not isinstance(eta, (list, tuple)):
                     eta = [eta]
 
                 result.append(self.elman.neuro(data2, eta, self.maximum, is_learning, props))
@@ -226,7 +226,7 @@ class SvBevelCurveNode(ModifierNode, SverchCustomTreeNode, bpy.types.Node):
             vertices = [Vector((0,0,0)), Vector((0,0,1))]
             return LinearSpline(vertices, metric = self.metric, is_cyclic = self.is_cyclic)
         
-        elif type(data[0]) in (list, tuple) and len(data[0]) == 2:
+        elif isinstance(data[0], (list, tuple)) and len(data[0]) == 2:
             vertices = [Vector((twist, 0, t)) for t, twist in data]
             return self.build_spline(vertices, self.twist_mode, is_cyclic=self.is_cyclic, metric = self.metric)
         
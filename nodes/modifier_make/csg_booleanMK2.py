@@ -22,30 +22,24 @@ from bpy.props import EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_cycle as mlr
 from sverchok.utils.csg_core import CSG
+from sverchok.utils.csg_numpy import NumpyCSG
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
 
-def Boolean(VA, PA, VB, PB, operation):
-    a = CSG.Obj_from_pydata(VA, PA)
-    b = CSG.Obj_from_pydata(VB, PB)
-    faces = []
-    vertices = []
+def Boolean(VA, PA, VB, PB, operation, implementation='NUMPY'):
+    if implementation == 'NUMPY':
+        a = NumpyCSG.from_pydata(VA, PA)
+        b = NumpyCSG.from_pydata(VB, PB)
+    else:
+        a = CSG.Obj_from_pydata(VA, PA)
+        b = CSG.Obj_from_pydata(VB, PB)
     if operation == 'DIFF':
-        polygons = a.subtract(b).toPolygons()
+        result = a.subtract(b)
     elif operation == 'JOIN':
-        polygons = a.union(b).toPolygons()
+        result = a.union(b)
     elif operation == 'ITX':
-        polygons = a.intersect(b).toPolygons()
-    for polygon in polygons:
-        indices = []
-        for v in polygon.vertices:
-            pos = [v.pos.x, v.pos.y, v.pos.z]
-            if pos not in vertices:
-                vertices.append(pos)
-            index = vertices.index(pos)
-            indices.append(index)
-        faces.append(indices)
-    return [vertices, faces]
+        result = a.intersect(b)
+    return list(result.to_pydata())
 
 
 class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
@@ -66,6 +60,16 @@ class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node
         default="ITX",
         update=updateNode)
 
+    implementation: EnumProperty(
+        name="Implementation",
+        items=[
+            ("NUMPY", "NumPy", "BSP trees in NumPy arrays, much faster on meshes with many faces", 0),
+            ("PYTHON", "Python", "Original implementation, a Python object per polygon and vertex", 1)
+        ],
+        description="Both implementations give the same result",
+        default="NUMPY",
+        update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Verts A'].hide_safe = self.nest_objs
         self.inputs['Polys A'].hide_safe = self.nest_objs
@@ -115,29 +119,34 @@ class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node
         if self.nest_objs:
             col.prop(self, "out_last", toggle=True)
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "implementation")
+
     def process(self):
         OutV, OutP = self.outputs
         if not OutV.is_linked:
             return
         VertA, PolA, VertB, PolB, VertN, PolN = self.inputs
         SMode = self.selected_mode
+        impl = self.implementation
         out = []
         recursionlimit = sys.getrecursionlimit()
         sys.setrecursionlimit(10000)
         if not self.nest_objs:
             for v1, p1, v2, p2 in zip(*mlr([VertA.sv_get(), PolA.sv_get(), VertB.sv_get(), PolB.sv_get()])):
-                out.append(Boolean(v1, p1, v2, p2, SMode))
+                out.append(Boolean(v1, p1, v2, p2, SMode, impl))
         else:
             vnest, pnest = VertN.sv_get(), PolN.sv_get()
-            First = Boolean(vnest[0], pnest[0], vnest[1], pnest[1], SMode)
+            First = Boolean(vnest[0], pnest[0], vnest[1], pnest[1], SMode, impl)
             if not self.out_last:
                 out.append(First)
                 for i in range(2, len(vnest)):
-                    out.append(Boolean(First[0], First[1], vnest[i], pnest[i], SMode))
+                    out.append(Boolean(First[0], First[1], vnest[i], pnest[i], SMode, impl))
                     First = out[-1]
             else:
                 for i in range(2, len(vnest)):
-                    First = Boolean(First[0], First[1], vnest[i], pnest[i], SMode)
+                    First = Boolean(First[0], First[1], vnest[i], pnest[i], SMode, impl)
                 out.append(First)
         sys.setrecursionlimit(recursionlimit)
         OutV.sv_set([i[0] for i in out])
@@ -24,8 +24,9 @@ import time
 import re
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, match_long_repeat
+from sverchok.data_structure import updateNode
 from sverchok.utils.sv_easing_functions import *
+from sverchok.utils.vectorize import vectorize
 
 DEBUG=False
 
@@ -53,6 +54,11 @@ easingItems = [
     ("EASE_IN_OUT", "Ease In-Out", "", "IPO_EASE_IN_OUT", 2)]
 
 
+def mix_numbers(*, value1: float, value2: float, factor: float, interpolate) -> float:
+    t = interpolate(factor)
+    return value1*(1-t) + value2*t
+
+
 class SvMixNumbersNode(SverchCustomTreeNode, bpy.types.Node):
     '''Mix Numbers. [def]
     Integer / [Float]
@@ -238,18 +244,14 @@ class SvMixNumbersNode(SverchCustomTreeNode, bpy.types.Node):
         input_value2 = self.inputs["v2"].sv_get()[0]
         input_factor = self.inputs["f"].sv_get()[0]
 
-        parameters = match_long_repeat([input_value1, input_value2, input_factor])
-
         interpolate = self.getInterpolator()
 
-        values=[]
-        for v1, v2, f in zip(*parameters):
-            t = interpolate(f)
-            v = v1*(1-t) + v2*t
-
-            values.append(v)
+        # only the linear interpolator can handle arrays
+        mix = vectorize(mix_numbers, match_mode="REPEAT", batched=self.interpolation == "LINEAR")
+        values = mix(value1=[input_value1], value2=[input_value2], factor=[input_factor],
+                     interpolate=interpolate)
 
-        self.outputs['Value'].sv_set([values])
+        self.outputs['Value'].sv_set(values)
 
 
 def register():
@@ -63,6 +63,7 @@ class SvMapRangeNode(SverchCustomTreeNode, bpy.types.Node):
     bl_idname = 'SvMapRangeNode'
     bl_label = 'Map Range'
     bl_icon = 'MOD_OFFSET'
+    is_pure = True
 
     def update_sockets(self, context):
         if not self.inputs["Old Min"].is_linked:
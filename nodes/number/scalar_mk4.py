@@ -145,6 +145,7 @@ class SvScalarMathNodeMK4(SverchCustomTreeNode, bpy.types.Node):
     bl_idname = 'SvScalarMathNodeMK4'
     bl_label = 'Scalar Math'
     sv_icon = 'SV_SCALAR_MATH'
+    is_pure = True
 
     def mode_change(self, context):
         self.update_sockets()
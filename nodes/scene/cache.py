@@ -16,13 +16,16 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-from ast import literal_eval
+import os
 
 import bpy
 from bpy.props import BoolProperty, StringProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, changable_sockets
+from sverchok.utils.data_cache import FrameCache
+
+OLD_OP = "node.sverchok_generic_callback_old"
 
 
 class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
@@ -36,6 +39,24 @@ class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
     
     cache_amount: IntProperty(default=1, min=0)
     cache_offset: IntProperty(default=1, min=0)
+
+    max_memory: IntProperty(
+        name="Max Memory (MB)", default=1024, min=0, update=updateNode,
+        description="Frames which were not used recently are removed from memory when the cache exceeds "
+                    "this size, 0 means unlimited")
+
+    use_disk: BoolProperty(
+        name="Spill To Disk", default=False, update=updateNode,
+        description="Save frames removed from memory into the cache directory instead of forgetting them")
+
+    cache_directory: StringProperty(
+        name="Directory", default="//sv_cache", subtype='DIR_PATH', update=updateNode,
+        description="Where frames are saved, relative paths are relative to the blend file")
+
+    prefetch_frames: IntProperty(
+        name="Prefetch", default=2, min=0, update=updateNode,
+        description="Number of neighbouring frames loaded from disk in advance")
+
     node_dict = {}
     
     def sv_init(self, context):
@@ -46,21 +67,56 @@ class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
     def sv_draw_buttons(self, context, layout):
         layout.prop(self, "cache_offset")
 
+    def sv_draw_buttons_ext(self, context, layout):
+        self.sv_draw_buttons(context, layout)
+        layout.prop(self, "max_memory")
+        layout.prop(self, "use_disk")
+        if self.use_disk:
+            layout.prop(self, "cache_directory")
+            layout.prop(self, "prefetch_frames")
+        op = layout.operator(OLD_OP, text="Clear Cache")
+        op.fn_name = "clear_cache"
+
     def sv_update(self):
         changable_sockets(self, "Data", ["Data"])
-        
+
+    def get_directory(self):
+        if not self.use_disk:
+            return None
+        if self.cache_directory.startswith('//') and not bpy.data.filepath:
+            root = bpy.app.tempdir  # the blend file is not saved yet
+            return os.path.join(root, self.cache_directory[2:], self.node_id)
+        return os.path.join(bpy.path.abspath(self.cache_directory), self.node_id)
+
+    def get_cache(self) -> FrameCache:
+        directory = self.get_directory()
+        cache = self.node_dict.get(self.node_id)
+        if cache is None:
+            cache = FrameCache(directory=directory)
+            self.node_dict[self.node_id] = cache
+        elif cache.directory != directory:
+            cache.set_directory(directory)  # keep the frames which were saved already
+        cache.max_size = self.max_memory * 2**20
+        return cache
+
+    def clear_cache(self):
+        cache = self.node_dict.pop(self.node_id, None)
+        if cache is not None:
+            cache.clear()
+
     def process(self):
-        n_id = self.node_id
-        data = self.node_dict.get(n_id)
-        if not data:
-            self.node_dict[n_id] = {}
-            data = self.node_dict.get(n_id)
-            
+        cache = self.get_cache()
+
         frame_current = bpy.context.scene.frame_current
         out_frame = frame_current - self.cache_offset
-        data[frame_current] = self.inputs[0].sv_get()
-        out_data = data.get(out_frame, [])
+        cache.put(frame_current, self.inputs[0].sv_get())
+        out_data = cache.get(out_frame, [])
         self.outputs[0].sv_set(out_data)
+        if self.use_disk and self.prefetch_frames:
+            cache.prefetch(range(out_frame - self.prefetch_frames, out_frame + self.prefetch_frames + 1))
+
+    def sv_free(self):
+        self.clear_cache()
 
 def register():
     bpy.utils.register_class(SvCacheNode)
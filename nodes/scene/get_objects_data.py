@@ -19,7 +19,8 @@ from sverchok.utils.nodes_mixins.show_3d_properties import Show3DProperties
 from sverchok.ui.sv_icons import custom_icon
 from sverchok.utils.blender_mesh import (
     read_verts, read_edges, read_verts_normal,
-    read_face_normal, read_face_center, read_face_area, read_materials_idx)
+    read_face_normal, read_face_center, read_face_area, read_materials_idx,
+    read_polygons, read_attribute, read_vertex_creases, transform_points, transform_directions)
 import numpy as np
 
 
@@ -81,6 +82,37 @@ class SvOB3CallbackMK2(bpy.types.Operator, SvGenericNodeLocator):
 def get_vertgroups(mesh):
     return [k for k,v in enumerate(mesh.vertices) if v.groups.values()]
 
+def join_mesh_data(data, offsets=None):
+    """Joins data of several objects into one array or list. If offsets are
+    given they are added to the data, it is used for joining indices."""
+    if data and all(isinstance(d, np.ndarray) for d in data) \
+            and len({d.shape[1:] for d in data}) == 1:
+        if offsets is not None:
+            data = [d + offset for d, offset in zip(data, offsets)]
+        return np.concatenate(data)
+    if offsets is None:
+        offsets = [0] * len(data)
+    joined = []
+    for d, offset in zip(data, offsets):
+        d = d.tolist() if isinstance(d, np.ndarray) else d
+        if offset:
+            d = [[i + offset for i in item] for item in d]
+        joined.extend(d)
+    return joined
+
+def to_output(data, output_numpy):
+    """Converts data of an object into the type of the output socket.
+    Data which can't be an array (polygons with different number of sides)
+    stays a list."""
+    if not output_numpy:
+        return data.tolist() if isinstance(data, np.ndarray) else data
+    if isinstance(data, np.ndarray):
+        return data
+    try:
+        return np.array(data)
+    except ValueError:
+        return data
+
 numpy_socket_names = ['vertices', 'edges', 'vertex_normals', 'material_idx', 'polygon_areas', 'polygon_centers', 'polygon_normals']
 
 
@@ -656,46 +688,61 @@ class SvGetObjectsDataMK3(Show3DProperties, SverchCustomTreeNode, bpy.types.Node
                         obj_data = obj.to_mesh()
                     
                     T, R, S = mtrx.decompose()
+                    rotation = R.to_matrix()
+                    vertices = obj_data.vertices
+                    edges = obj_data.edges
+                    polygons = obj_data.polygons
 
+                    # all data is read by foreach_get into arrays,
+                    # the arrays are converted into lists at the end if necessary
                     if o_vertices:
-                        verts            = [ ((mtrx @ v.co) if self.apply_matrix else v.co)[:] for v in obj_data.vertices]  # v.co is a Vector()
+                        verts            = read_verts(obj_data, output_numpy=True)
+                        if self.apply_matrix:
+                            verts = transform_points(verts, mtrx)
                     if o_edges:
-                        edgs             = [[ e.vertices[0], e.vertices[1] ] for e in obj_data.edges]
+                        edgs             = read_edges(obj_data, output_numpy=True)
                     if o_polygons:
-                        pols             = [list(p.vertices) for p in obj_data.polygons]
+                        pols             = read_polygons(obj_data, output_numpy=True)
                     if o_vertices_select:
-                        vertices_select1 = [v.select for v in obj_data.vertices]
+                        vertices_select1 = read_attribute(obj_data, vertices, None, 'select', dtype=bool)
                     if o_vertices_crease:
-                        creases = obj_data.vertex_creases[0]
-                        vertices_crease1 = [creases.data[i].value for i, v in enumerate(obj_data.vertices)]
+                        vertices_crease1 = read_vertex_creases(obj_data)
                     if o_vertices_bevel_weight:
-                        vertices_bevel_weight1 = [v.bevel_weight for v in obj_data.vertices]
+                        vertices_bevel_weight1 = read_attribute(obj_data, vertices, 'bevel_weight_vert', 'bevel_weight')
                     if o_edges_select:
-                        edges_select1 = [e.select for e in obj_data.edges]
+                        edges_select1 = read_attribute(obj_data, edges, None, 'select', dtype=bool)
                     if o_edges_seams:
-                        edges_seams1 = [e.use_seam for e in obj_data.edges]
+                        edges_seams1 = read_attribute(obj_data, edges, None, 'use_seam', dtype=bool)
                     if o_edges_sharps:
-                        edges_sharps1 = [e.use_edge_sharp for e in obj_data.edges]
+                        edges_sharps1 = read_attribute(obj_data, edges, None, 'use_edge_sharp', dtype=bool)
                     if o_edges_crease:
-                        edges_crease1 = [e.crease for e in obj_data.edges]
+                        edges_crease1 = read_attribute(obj_data, edges, 'crease_edge', 'crease')
                     if o_edges_bevel_weight:
-                        edges_bevel_weight1 = [e.bevel_weight for e in obj_data.edges]
+                        edges_bevel_weight1 = read_attribute(obj_data, edges, 'bevel_weight_edge', 'bevel_weight')
                     if o_polygon_selects:
-                        polygon_selects1 = [p.select for p in obj_data.polygons]
+                        polygon_selects1 = read_attribute(obj_data, polygons, None, 'select', dtype=bool)
                     if o_polygon_smooth:
-                        polygon_smooth1 = [p.use_smooth for p in obj_data.polygons]
+                        polygon_smooth1 = read_attribute(obj_data, polygons, None, 'use_smooth', dtype=bool)
                     if self.vergroups:
                         vert_groups      = get_vertgroups(obj_data)
                     if o_vertex_normals:
-                        vertex_normals   = [ ((   R @ v.co) if self.apply_matrix else v.normal)[:] for v in obj_data.vertices ] # v.normal is a Vector(). Update. Blender 3.6.3 crash in no wrap Vector(v.normal). I think this is after line "obj.to_mesh_clear()"
+                        if self.apply_matrix:
+                            # rotated vertices instead of normals, it's kept for backward compatibility
+                            vertex_normals = transform_directions(read_verts(obj_data, output_numpy=True), rotation)
+                        else:
+                            vertex_normals = read_verts_normal(obj_data, output_numpy=True)
                     if o_material_idx:
-                        material_indexes = read_materials_idx(obj_data, out_np[3])
+                        material_indexes = read_materials_idx(obj_data, output_numpy=True)
                     if o_polygon_areas:
-                        polygons_areas   = [ polygon.area for polygon in obj_data.polygons]
+                        polygons_areas   = read_face_area(obj_data, output_numpy=True)
                     if o_polygon_centers:
-                        polygon_centers  = [ ((mtrx @ polygon.center) if self.apply_matrix else polygon.center)[:] for polygon in obj_data.polygons]
+                        polygon_centers  = read_face_center(obj_data, output_numpy=True)
+                        if self.apply_matrix:
+                            polygon_centers = transform_points(polygon_centers, mtrx)
                     if o_polygon_normals:
-                        polygon_normals  = [ ((   R @ polygon.normal) if self.apply_matrix else polygon.normal)[:] for polygon in obj_data.polygons]
+                        polygon_normals  = read_face_normal(obj_data, output_numpy=True)
+                        if self.apply_matrix:
+                            polygon_normals = transform_directions(polygon_normals, rotation)
 
                 obj.to_mesh_clear()
                 
@@ -749,74 +796,40 @@ class SvGetObjectsDataMK3(Show3DProperties, SverchCustomTreeNode, bpy.types.Node
                 l_matrices.append(mtrx)
 
         if self.mesh_join:
-            # l_vertices, l_edges, l_polygons, l_vertex_normals, l_material_idx, l_polygon_areas, l_polygon_centers, l_polygon_normals, l_matrices
-            offset = 0
-            _vertices, _edges, _polygons, _vertices_select, _vertices_crease, _vertices_bevel_weight, _edges_select, _edges_seams, _edges_sharps, _edges_crease, _edges_bevel_weight, _polygon_selects, _polygon_smooth, _vertex_normals, _polygon_areas, _polygon_centers, _polygon_normals, _vg = [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], []
-            for idx, vertices in enumerate(l_vertices):
-                _vertices.extend(vertices)
-                if l_edges:
-                    _edges.extend( [[i + offset for i in o] for o in l_edges[idx] ] ) # edges
-                if l_polygons:
-                    _polygons.extend( [[i + offset for i in o] for o in l_polygons[idx] ] ) # polygons
-                #_l_vertex_normals.extend( [tuple(i + offset for i in o) for o in ps[idx] ] ) # vers_out_grouped. Skip in mesh_join
-                if l_vertices_select:
-                    _vertices_select.extend( l_vertices_select[idx] )
-                if l_vertices_crease:
-                    _vertices_crease.extend( l_vertices_crease[idx] )
-                if l_vertices_bevel_weight:
-                    _vertices_bevel_weight.extend( l_vertices_bevel_weight[idx] )
-                if l_edges_select:
-                    _edges_select.extend( l_edges_select[idx] )
-                if l_edges_seams:
-                    _edges_seams.extend( l_edges_seams[idx] )
-                if l_edges_sharps:
-                    _edges_sharps.extend( l_edges_sharps[idx] )
-                if l_edges_crease:
-                    _edges_crease.extend( l_edges_crease[idx] )
-                if l_edges_bevel_weight:
-                    _edges_bevel_weight.extend( l_edges_bevel_weight[idx] )
-                if l_polygon_selects:
-                    _polygon_selects.extend( l_polygon_selects[idx] )
-                if l_polygon_smooth:
-                    _polygon_smooth.extend( l_polygon_smooth[idx] )
-                if l_vertex_normals:
-                    _vertex_normals.extend( l_vertex_normals[idx] ) # vertex normals
-                # _l_material_idx - materia index. Do not change
-                # if l_material_idx and len(l_material_idx)>idx:
-                #     _l_material_idx.extend( l_material_idx[idx] ) # Skip in mesh_join
-                if l_polygon_areas:
-                    _polygon_areas.extend( l_polygon_areas[idx] ) # polygon area
-                if l_polygon_centers:
-                    _polygon_centers.extend( l_polygon_centers[idx] ) # polygon center
-                if l_polygon_normals:
-                    _polygon_normals.extend( l_polygon_normals[idx] ) # polygon normal
-                # if l_matrices: Do not change
-                #     _ms.append( l_matrices[idx] ) # matrices. Skip in mesh_join
-                if vers_out_grouped:
-                    _vg.extend( [ i + offset for i in vers_out_grouped[idx] ] ) # vertex groups
-                
-                offset += len(vertices)
-            
-            l_vertices, l_edges, l_polygons, l_vertices_select, l_vertices_crease, l_vertices_bevel_weight, l_edges_select, l_edges_seams, l_edges_sharps, l_edges_crease, l_edges_bevel_weight, l_polygon_selects, l_polygon_smooth, l_vertex_normals, l_polygon_areas, l_polygon_centers, l_polygon_normals, vers_out_grouped = [_vertices], [_edges], [_polygons], [_vertices_select], [_vertices_crease], [_vertices_bevel_weight], [_edges_select], [_edges_seams], [_edges_sharps], [_edges_crease], [_edges_bevel_weight], [_polygon_selects], [_polygon_smooth], [_vertex_normals], [_polygon_areas], [_polygon_centers], [_polygon_normals], [_vg]
-
-        if o_vertices and (out_np[0]):
-            l_vertices = [np.array(vert) for vert in l_vertices]
-        if o_edges and (out_np[1]):
-            l_edges = [np.array(edge) for edge in l_edges]
-        # if o_polygons and (out_np[2]):
-        #     l_polygons = [np.array(pol)  for pol  in l_polygons]
-        # if self.vergroups:
-        #     vers_out_grouped = [np.array(group)  for group  in vers_out_grouped]
-        if o_vertex_normals and (out_np[2]):
-            l_vertex_normals = [np.array(vert_normal)     for vert_normal     in l_vertex_normals]
-        if o_material_idx and (out_np[3]):
-            l_material_idx = [np.array(material_index)  for material_index  in l_material_idx]
-        if o_polygon_areas and (out_np[4]):
-            l_polygon_areas = [np.array(polygon_areas)   for polygon_areas   in l_polygon_areas]
-        if o_polygon_centers and (out_np[5]):
-            l_polygon_centers = [np.array(polygon_centers) for polygon_centers in l_polygon_centers]
-        if o_polygon_normals and (out_np[6]):
-            l_polygon_normals = [np.array(polygon_normals) for polygon_normals in l_polygon_normals]
+            n_objects = len(l_vertices)
+            offsets = np.cumsum([0] + [len(vertices) for vertices in l_vertices])[:-1]
+            join = lambda data: [join_mesh_data(data[:n_objects])]
+            join_indices = lambda data: [join_mesh_data(data[:n_objects], offsets)]
+            # material indexes and matrices are not joined
+            l_vertices = join(l_vertices)
+            l_edges, l_polygons = join_indices(l_edges), join_indices(l_polygons)
+            l_vertices_select, l_vertices_crease, l_vertices_bevel_weight = join(l_vertices_select), join(l_vertices_crease), join(l_vertices_bevel_weight)
+            l_edges_select, l_edges_seams, l_edges_sharps = join(l_edges_select), join(l_edges_seams), join(l_edges_sharps)
+            l_edges_crease, l_edges_bevel_weight = join(l_edges_crease), join(l_edges_bevel_weight)
+            l_polygon_selects, l_polygon_smooth = join(l_polygon_selects), join(l_polygon_smooth)
+            l_vertex_normals, l_polygon_areas = join(l_vertex_normals), join(l_polygon_areas)
+            l_polygon_centers, l_polygon_normals = join(l_polygon_centers), join(l_polygon_normals)
+            vers_out_grouped = [to_output(join_mesh_data([np.array(vg, dtype=np.int64) for vg in vers_out_grouped[:n_objects]], offsets), False)]
+
+        np_all = self.output_np_all
+        l_vertices = [to_output(data, out_np[0]) for data in l_vertices]
+        l_edges = [to_output(data, out_np[1]) for data in l_edges]
+        l_polygons = [to_output(data, np_all) for data in l_polygons]
+        l_vertices_select = [to_output(data, np_all) for data in l_vertices_select]
+        l_vertices_crease = [to_output(data, np_all) for data in l_vertices_crease]
+        l_vertices_bevel_weight = [to_output(data, np_all) for data in l_vertices_bevel_weight]
+        l_edges_select = [to_output(data, np_all) for data in l_edges_select]
+        l_edges_crease = [to_output(data, np_all) for data in l_edges_crease]
+        l_edges_seams = [to_output(data, np_all) for data in l_edges_seams]
+        l_edges_sharps = [to_output(data, np_all) for data in l_edges_sharps]
+        l_edges_bevel_weight = [to_output(data, np_all) for data in l_edges_bevel_weight]
+        l_polygon_selects = [to_output(data, np_all) for data in l_polygon_selects]
+        l_polygon_smooth = [to_output(data, np_all) for data in l_polygon_smooth]
+        l_vertex_normals = [to_output(data, out_np[2]) for data in l_vertex_normals]
+        l_material_idx = [to_output(data, out_np[3]) for data in l_material_idx]
+        l_polygon_areas = [to_output(data, out_np[4]) for data in l_polygon_areas]
+        l_polygon_centers = [to_output(data, out_np[5]) for data in l_polygon_centers]
+        l_polygon_normals = [to_output(data, out_np[6]) for data in l_polygon_normals]
 
         for i, i2 in zip(self.outputs, [l_vertices, l_edges, l_polygons, l_vertices_select, l_vertices_crease, l_vertices_bevel_weight, l_edges_select, l_edges_crease, l_edges_seams, l_edges_sharps, l_edges_bevel_weight, l_polygon_selects, l_polygon_smooth, l_vertex_normals, l_material_idx, l_polygon_areas, l_polygon_centers, l_polygon_normals, l_matrices]):
             if i.is_linked:
@@ -18,6 +18,7 @@ import json
 import io
 
 from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_node_utils import sync_pointer_and_stored_name
 from sverchok.data_structure import updateNode, match_long_repeat
 from sverchok.utils.script_importhelper import safe_names
@@ -132,12 +133,12 @@ def selected_masks_adding(node):
     tree = bpy.context.space_data.edit_tree
     links = tree.links
 
-    mo = tree.nodes.new('MaskListNode')
-    mv = tree.nodes.new('SvMoveNodeMK2')
-    rf = tree.nodes.new('SvGenNumberRange')
-    vi = tree.nodes.new('GenVectorsNode')
-    mi = tree.nodes.new('SvMaskJoinNode')
-    vd = tree.nodes.new('ViewerNode2')
+    mo = lazy_nodes.new_node(tree.nodes, 'MaskListNode')
+    mv = lazy_nodes.new_node(tree.nodes, 'SvMoveNodeMK2')
+    rf = lazy_nodes.new_node(tree.nodes, 'SvGenNumberRange')
+    vi = lazy_nodes.new_node(tree.nodes, 'GenVectorsNode')
+    mi = lazy_nodes.new_node(tree.nodes, 'SvMaskJoinNode')
+    vd = lazy_nodes.new_node(tree.nodes, 'ViewerNode2')
     mo.location = loc+Vector((300,0))
     mv.location = loc+Vector((550,0))
     vi.location = loc+Vector((350,-225))
@@ -24,6 +24,7 @@ from bpy.props import BoolProperty, StringProperty, EnumProperty, FloatProperty,
 from mathutils import Vector
 
 from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_node_utils import sync_pointer_and_stored_name
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 from sverchok.data_structure import updateNode, match_long_repeat
@@ -326,7 +327,7 @@ class SvPrifilizerMk3(bpy.types.Operator):
         tree = bpy.context.space_data.edit_tree
         links = tree.links
 
-        vi = tree.nodes.new("SvIDXViewer28")
+        vi = lazy_nodes.new_node(tree.nodes, "SvIDXViewer28")
 
         vi.location = loc+Vector((200,-100))
         vi.draw_bg = True
@@ -342,7 +343,7 @@ class SvPrifilizerMk3(bpy.types.Operator):
         tree = bpy.context.space_data.edit_tree
         links = tree.links
 
-        nu = tree.nodes.new('SvNumberNode')
+        nu = lazy_nodes.new_node(tree.nodes, 'SvNumberNode')
         nu.location = loc+Vector((-200,-150))
 
         links.new(nu.outputs[0], node.inputs[0])   #number
@@ -355,7 +356,7 @@ class SvPrifilizerMk3(bpy.types.Operator):
         tree = bpy.context.space_data.edit_tree
         links = tree.links
 
-        vd = tree.nodes.new("SvViewerDrawMk4")
+        vd = lazy_nodes.new_node(tree.nodes, "SvViewerDrawMk4")
 
         vd.location = loc+Vector((200,225))
 
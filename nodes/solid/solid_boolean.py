@@ -27,6 +27,7 @@ class SvSolidBooleanNode(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'Solid Boolean'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_SOLID_BOOLEAN'
+    is_disk_cached = True
     sv_category = "Solid Operators"
     sv_dependencies = {'FreeCAD'}
 
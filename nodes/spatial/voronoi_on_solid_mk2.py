@@ -40,6 +40,7 @@ class SvVoronoiOnSolidNodeMK2(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'Voronoi on Solid'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
+    is_disk_cached = True
     sv_dependencies = {'scipy', 'FreeCAD'}
 
     modes = [
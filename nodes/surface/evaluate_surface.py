@@ -183,18 +183,6 @@ class SvEvalSurfaceNode(SverchCustomTreeNode, bpy.types.Node):
             verts = np.apply_along_axis(lambda v : np_matrix @ v, 1, verts)
         return verts
 
-    def make_grid_input(self, surface, samples_u, samples_v):
-        u_min = surface.get_u_min()
-        u_max = surface.get_u_max()
-        v_min = surface.get_v_min()
-        v_max = surface.get_v_max()
-        us = np.linspace(u_min, u_max, num=samples_u)
-        vs = np.linspace(v_min, v_max, num=samples_v)
-        us, vs = np.meshgrid(us, vs)
-        us = us.flatten()
-        vs = vs.flatten()
-        return us, vs
-
     def make_edges_and_faces(self, samples_u, samples_v, get_edges, get_faces):
 
         _list_edges = []
@@ -264,7 +252,9 @@ class SvEvalSurfaceNode(SverchCustomTreeNode, bpy.types.Node):
             for surface, target_us, target_vs, target_verts, samples_u, samples_v in objects:
 
                 if self.eval_mode == 'GRID':
-                    target_us, target_vs = self.make_grid_input(surface, samples_u, samples_v)
+                    us = np.linspace(surface.get_u_min(), surface.get_u_max(), num=samples_u)
+                    vs = np.linspace(surface.get_v_min(), surface.get_v_max(), num=samples_v)
+                    new_verts = surface.evaluate_grid(us, vs).reshape((-1, 3))
                     new_edges, new_faces = self.make_edges_and_faces(samples_u, samples_v, self.outputs['Edges'].is_linked, self.outputs['Faces'].is_linked)
                 else:
                     if self.input_mode == 'VERTICES':
@@ -283,7 +273,7 @@ class SvEvalSurfaceNode(SverchCustomTreeNode, bpy.types.Node):
                         target_us, target_vs = self._wrap(surface, target_us, target_vs)
                     new_edges = []
                     new_faces = []
-                new_verts = surface.evaluate_array(target_us, target_vs)
+                    new_verts = surface.evaluate_array(target_us, target_vs)
 
                 new_verts = self.build_output(surface, new_verts)
                 if not self.output_numpy:
@@ -6,6 +6,7 @@ from bpy.props import FloatProperty, EnumProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.core.sockets import setup_new_node_location
+from sverchok.core import lazy_nodes
 from sverchok.data_structure import updateNode, match_long_repeat
 from sverchok.utils.marching_cubes import isosurface_np
 from sverchok.dependencies import mcubes, skimage
@@ -30,6 +31,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'Marching Cubes'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_EX_MCUBES'
+    is_disk_cached = True
 
     iso_value : FloatProperty(
             name = "Value",
@@ -115,7 +117,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
         modes.append(("skimage", "SciKit-Image", "SciKit-Image", 0))
     if mcubes is not None:
         modes.append(("mcubes", "PyMCubes", "PyMCubes", 1))
-    modes.append(('python', "Pure Python", "Pure Python implementation", 2))
+    modes.append(('python', "Pure Python", "Built-in NumPy implementation, does not require additional libraries", 2))
 
     implementation : EnumProperty(
             name = "Implementation",
@@ -129,7 +131,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
 
         @classmethod
         def on_selected(cls, tree, node, socket, item, context):
-            new_node = tree.nodes.new('SvBoxNodeMk2')
+            new_node = lazy_nodes.new_node(tree.nodes, 'SvBoxNodeMk2')
             new_node.label = "Bounds"
             tree.links.new(new_node.outputs[0], node.inputs['Bounds'])
             setup_new_node_location(new_node, node)
@@ -251,7 +253,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
             else: # python
                 new_verts, new_faces = isosurface_np(func_values, value)
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
-                new_verts = new_verts.tolist()
+                new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
                 new_normals = []
 
             prev_field = field
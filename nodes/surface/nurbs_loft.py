@@ -20,6 +20,7 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'NURBS Loft'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_SURFACE_FROM_CURVES'
+    is_thread_safe = True
 
     u_knots_modes = [
             ('UNIFY', "Unify", "Unify knot vectors of curves by inserting knots into curves where needed", 0),
@@ -72,42 +73,54 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvCurveSocket', "UnifiedCurves")
         self.outputs.new('SvCurveSocket', "VCurves")
 
-    def process(self):
+    def prepare_job(self):
         if not any(socket.is_linked for socket in self.outputs):
-            return
+            return None
 
         curves_s = self.inputs['Curves'].sv_get()
         degrees_s = self.inputs['DegreeV'].sv_get()
+        knots_u = self.u_knots_mode
+        metric = self.metric
+        implementation = self.nurbs_implementation
+
+        def job():
+            return loft(curves_s, degrees_s, knots_u, metric, implementation)
+        return job
+
+    def process(self):
+        if job := self.prepare_job():
+            self.set_job_outputs(job())
+
+
+def loft(curves_s, degrees_s, knots_u, metric, implementation):
+    curves_s = ensure_nesting_level(curves_s, 3, data_types=(SvCurve,))
+    degrees_s = ensure_nesting_level(degrees_s, 2)
+
+    surface_out = []
+    curves_out = []
+    v_curves_out = []
+    for curves_i, degrees in zip_long_repeat(curves_s, degrees_s):
+        new_surfaces = []
+        new_curves = []
+        new_v_curves = []
+        for curves, degree_v in zip_long_repeat(curves_i, degrees):
+            curves = [SvNurbsCurve.to_nurbs(c) for c in curves]
+            if any(c is None for c in curves):
+                raise Exception("Some of curves are not NURBS!")
+            unified_curves, v_curves, new_surface = simple_loft(curves,
+                                degree_v = degree_v,
+                                knots_u = knots_u,
+                                metric = metric,
+                                implementation = implementation)
+            new_surfaces.append(new_surface)
+            new_curves.extend(unified_curves)
+            new_v_curves.extend(v_curves)
+        surface_out.append(new_surfaces)
+        curves_out.append(new_curves)
+        v_curves_out.append(new_v_curves)
+
+    return {'Surface': surface_out, 'UnifiedCurves': curves_out, 'VCurves': v_curves_out}
 
-        curves_s = ensure_nesting_level(curves_s, 3, data_types=(SvCurve,))
-        degrees_s = ensure_nesting_level(degrees_s, 2)
-
-        surface_out = []
-        curves_out = []
-        v_curves_out = []
-        for curves_i, degrees in zip_long_repeat(curves_s, degrees_s):
-            new_surfaces = []
-            new_curves = []
-            new_v_curves = []
-            for curves, degree_v in zip_long_repeat(curves_i, degrees):
-                curves = [SvNurbsCurve.to_nurbs(c) for c in curves]
-                if any(c is None for c in curves):
-                    raise Exception("Some of curves are not NURBS!")
-                unified_curves, v_curves, new_surface = simple_loft(curves, 
-                                    degree_v = degree_v,
-                                    knots_u = self.u_knots_mode,
-                                    metric = self.metric,
-                                    implementation = self.nurbs_implementation)
-                new_surfaces.append(new_surface)
-                new_curves.extend(unified_curves)
-                new_v_curves.extend(v_curves)
-            surface_out.append(new_surfaces)
-            curves_out.append(new_curves)
-            v_curves_out.append(new_v_curves)
-
-        self.outputs['Surface'].sv_set(surface_out)
-        self.outputs['UnifiedCurves'].sv_set(curves_out)
-        self.outputs['VCurves'].sv_set(v_curves_out)
 
 def register():
     bpy.utils.register_class(SvNurbsLoftNode)
@@ -135,7 +135,7 @@ def noise_displace(params, constant, matching_f):
     local_match = iter_list_match_func[match_mode]
     for props in zip(*params):
         verts, pols, seed_val, scale_out, matrix = props
-        if type(matrix) == list:
+        if isinstance(matrix, list):
             matrix = [m.inverted() for m in matrix]
         else:
             matrix = [matrix.inverted()]
@@ -159,7 +159,7 @@ def noise_displace_numpy(params, constant, matching_f):
     for props in zip(*params):
         verts, pols, seed_val, scale_out, matrix = props
         np_scale = local_match(np.array(scale_out), len(verts))
-        if type(matrix) == list:
+        if isinstance(matrix, list):
             matrix = matrix[0].inverted()
         else:
             matrix = matrix.inverted()
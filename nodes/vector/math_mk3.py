@@ -111,6 +111,7 @@ class SvVectorMathNodeMK3(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'Vector Math'
     bl_icon = 'THREE_DOTS'
     sv_icon = 'SV_VECTOR_MATH'
+    is_pure = True
 
     def mode_change(self, context):
         self.update_sockets()
@@ -6,7 +6,9 @@
 # License-Filename: LICENSE
 
 
-from itertools import cycle
+from itertools import cycle, chain
+
+import numpy as np
 
 from mathutils import Vector, Matrix
 from mathutils.geometry import tessellate_polygon as tessellate
@@ -101,27 +103,45 @@ default_fragment_shader = '''
 def ensure_triangles(coords, indices, handle_concave_quads):
     """
     this fully tesselates the incoming topology into tris,
-    not optimized for meshes that don't contain ngons
+    triangles and quads are split with numpy in one go, only ngons
+    (and quads, if handle_concave_quads is set) are tessellated one by one.
+    Returns an (n, 3) array of triangles and an array with the index of
+    the polygon each of the triangles belongs to
     """
-    new_indices = []
-    face_index = []
-    concat = new_indices.append
-    concat2 = new_indices.extend
-    for idf, idxset in enumerate(indices):
-        num_verts = len(idxset)
-        if num_verts == 3:
-            concat(tuple(idxset))
-            face_index.append(idf)
-        elif num_verts == 4 and not handle_concave_quads:
-            # a b c d  ->  [a, b, c], [a, c, d]
-            concat2([(idxset[0], idxset[1], idxset[2]), (idxset[0], idxset[2], idxset[3])])
-            face_index.extend([idf, idf])
-        else:
-            subcoords = [Vector(coords[idx]) for idx in idxset]
-            for pol in tessellate([subcoords]):
-                concat([idxset[i] for i in pol])
-                face_index.append(idf)
-    return new_indices, face_index
+    if isinstance(indices, np.ndarray) and indices.ndim == 2:
+        sides = np.full(len(indices), indices.shape[1], dtype=np.int64)
+        flat = indices.ravel().astype(np.int64)
+    else:
+        sides = np.fromiter(map(len, indices), dtype=np.int64, count=len(indices))
+        flat = np.fromiter(chain.from_iterable(indices), dtype=np.int64, count=int(sides.sum()))
+    starts = np.cumsum(sides) - sides
+
+    new_indices = [np.empty((0, 3), dtype=np.int64)]
+    face_index = [np.empty(0, dtype=np.int64)]
+
+    tris = np.flatnonzero(sides == 3)
+    new_indices.append(flat[starts[tris, np.newaxis] + np.arange(3)])
+    face_index.append(tris)
+
+    if handle_concave_quads:
+        ngons = np.flatnonzero(sides > 3)
+    else:
+        # a b c d  ->  [a, b, c], [a, c, d]
+        quads = np.flatnonzero(sides == 4)
+        corners = flat[starts[quads, np.newaxis] + np.arange(4)]
+        new_indices.extend([corners[:, [0, 1, 2]], corners[:, [0, 2, 3]]])
+        face_index.extend([quads, quads])
+        ngons = np.flatnonzero(sides > 4)
+
+    for idf in ngons.tolist():
+        idxset = flat[starts[idf]:starts[idf] + sides[idf]]
+        subcoords = [Vector(coords[idx]) for idx in idxset]
+        pols = tessellate([subcoords])
+        if pols:
+            new_indices.append(idxset[np.array(pols)])
+            face_index.append(np.full(len(pols), idf, dtype=np.int64))
+
+    return np.concatenate(new_indices), np.concatenate(face_index)
 
 
 def fill_points_colors(vectors_color, data, color_per_point, random_colors):
@@ -210,7 +230,7 @@ def view_3d_geom(context, args):
             shader.uniform_float("u_resolution", config.u_resolution)
             shader.uniform_float("u_dashSize", config.u_dash_size)
             shader.uniform_float("u_gapSize", config.u_gap_size)
-            shader.uniform_float("m_color", geom.e_vertex_colors[0])
+            shader.uniform_float("m_color", geom.e_vertex_colors[0].tolist())
             batch.draw(shader)
         else:
             if config.uniform_edges:
@@ -226,7 +246,7 @@ def view_3d_geom(context, args):
         drawing.reset_line_width()
 
     if config.draw_verts:
-        if geom.v_vertices and (len(geom.v_vertices[0])==3):
+        if len(geom.v_vertices):
             drawing.set_point_size(config.point_size)
             if config.uniform_verts:
                 v_batch = batch_for_shader(config.v_shader, 'POINTS', {"pos": geom.v_vertices})
@@ -242,122 +262,85 @@ def view_3d_geom(context, args):
     drawing.disable_blendmode()
 
 
+def shade_colors(colors, light_factor):
+    '''multiplies the RGB components of the colors by the light factor, alpha is kept'''
+    colors = np.broadcast_to(colors, light_factor.shape + (4,)).astype(np.float32)
+    colors[..., :3] *= light_factor[..., np.newaxis]
+    return colors
+
+
 def splitted_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset):
     '''geometry of the splitted polygons (splitted to assign colors)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        color = cols[idx % cols_len]
-        # vertex_colors.extend([cols[idx % cols_len] for c in pol])
-        vertex_colors_extend([color, color, color])
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    total_p_verts = polygon_indices.size
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    color = cols[original_idx % len(cols)]
+    vertex_colors = np.repeat(color, 3, axis=0)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign colors* normals)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        factor = light_factor[idx]
-
-        col = cols[idx % cols_len]
-        col_pol = [col[0] * factor, col[1] * factor, col[2] * factor, col[3]]
-
-        vertex_colors_extend([col_pol, col_pol, col_pol])
-        pol_offset = idx_offset + total_p_verts
-
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    total_p_verts = polygon_indices.size
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    col_pol = shade_colors(cols[original_idx % len(cols)], light_factor[original_idx])
+    vertex_colors = np.repeat(col_pol, 3, axis=0)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_facet_polygons_geom_v_cols(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign vertex_colors * face_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        factor = light_factor[idx]
-        colors = []
-
-        for c in pol:
-            col = cols[c % cols_len]
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors_extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    total_p_verts = polygon_indices.size
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    factors = np.repeat(light_factor[original_idx], 3)
+    vertex_colors = shade_colors(cols[polygon_indices.ravel() % len(cols)], factors)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign face_colors * vertex_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        colors = []
-        col = cols[idx % cols_len]
-        for c in pol:
-
-            factor = light_factor[c]
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors_extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
-
+    total_p_verts = polygon_indices.size
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    col = cols[original_idx % len(cols)]
+    vertex_colors = shade_colors(col[:, np.newaxis, :], light_factor[polygon_indices]).reshape(-1, 4)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
-
 def face_light_factor(vecs, polygons, light):
-    return (np_dot(pols_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5).tolist()
+    return np_dot(pols_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5
 
 def vert_light_factor(vecs, polygons, light):
-    return (np_dot(np_vertex_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5).tolist()
+    return np_dot(np_vertex_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5
+
+def as_colors(colors):
+    '''one color or a list of colors as a float32 array of RGBA rows'''
+    return np.asarray(colors, dtype=np.float32).reshape(-1, 4)
+
+def concatenate_chunks(chunks, width, dtype):
+    '''joins the per object arrays into one contiguous array to pass to the batch'''
+    if not len(chunks):
+        return np.empty((0, width), dtype=dtype)
+    if isinstance(chunks, np.ndarray):
+        return chunks.astype(dtype, copy=False)
+    return np.concatenate([np.asarray(c, dtype=dtype).reshape(-1, width) for c in chunks])
 
 def polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices, v_path, p_cols, idx_p_offset, points_colors):
     '''generates polygons geometry'''
 
-    if (config.color_per_polygon and not config.polygon_use_vertex_color) or config.shade_mode == 'facet':
-        if config.all_triangles:
-            polygon_indices = polygons
-            original_idx = list(range(len(polygons)))
-        else:
-            polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
+    if config.all_triangles:
+        polygon_indices = np.asarray(polygons, dtype=np.int64).reshape(-1, 3)
+        original_idx = np.arange(len(polygon_indices))
+    else:
+        polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
 
+    if (config.color_per_polygon and not config.polygon_use_vertex_color) or config.shade_mode == 'facet':
 
         if config.shade_mode == 'facet':
             light_factor = face_light_factor(vecs, polygons, config.vector_light)
@@ -365,70 +348,54 @@ def polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices
             if config.polygon_use_vertex_color:
                 p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom_v_cols(polygon_indices, original_idx, v_path, points_colors, idx_p_offset[0], light_factor)
             else:
-                p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], light_factor)
+                p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, as_colors(p_cols), idx_p_offset[0], light_factor)
 
         elif config.shade_mode == 'smooth':
 
             light_factor = vert_light_factor(vecs, polygons, config.vector_light)
-            p_v, v_c, idx, total_p_verts = splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], light_factor)
+            p_v, v_c, idx, total_p_verts = splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, as_colors(p_cols), idx_p_offset[0], light_factor)
 
         else:
-            p_v, v_c, idx, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0])
+            p_v, v_c, idx, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, as_colors(p_cols), idx_p_offset[0])
 
-        p_vertices.extend(p_v)
-        p_vertex_colors.extend(v_c)
-        p_indices.extend(idx)
+        p_vertices.append(p_v)
+        p_vertex_colors.append(v_c)
+        p_indices.append(idx)
     else:
-        if config.all_triangles:
-            polygon_indices = polygons
-            original_idx = list(range(len(polygons)))
-        else:
-            polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
-        p_vertices.extend(v_path)
+        p_vertices.append(v_path)
 
         if config.shade_mode == 'smooth':
 
             light_factor = vert_light_factor(vecs, polygons, config.vector_light)
-            colors = []
             if config.polygon_use_vertex_color:
-                for l_factor, col in zip(light_factor, points_colors):
-                    colors.append([col[0]*l_factor, col[1]*l_factor, col[2]*l_factor, col[3]])
+                cols = points_colors[:len(light_factor)]
+                p_vertex_colors.append(shade_colors(cols, light_factor[:len(cols)]))
             else:
-                col = p_cols
-                for l_factor in light_factor:
-                    # factor = normal_v.dot(config.vector_light)*0.5+0.5
-                    colors.append([col[0]*l_factor, col[1]*l_factor, col[2]*l_factor, col[3]])
-            p_vertex_colors.extend(colors)
+                p_vertex_colors.append(shade_colors(as_colors(p_cols), light_factor))
         else:
             if not config.uniform_pols:
-                p_vertex_colors.extend([p_cols for v in v_path])
-        if idx_p_offset[0]:
-            p_indices.extend([[c + idx_p_offset[0] for c in p] for p in polygon_indices])
-        else:
-            p_indices.extend(polygon_indices)
+                p_vertex_colors.append(np.repeat(as_colors(p_cols), len(v_path), axis=0))
+        p_indices.append(polygon_indices + idx_p_offset[0])
         total_p_verts = len(vecs)
     idx_p_offset[0] += total_p_verts
 
 
 def edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset):
     '''generates edges geometry'''
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
     if config.color_per_edge and not config.edges_use_vertex_color:
-        start_idx = len(e_vertices)
-        for (idx0, idx1), col in zip(edges, cycle(e_col)):
-            e_vertices.extend([v_path[idx0], v_path[idx1]])
-            e_vertex_colors.extend([col, col])
-            e_indices.append([start_idx, start_idx+1])
-            start_idx +=2
+        cols = as_colors(e_col)
+        e_vertices.append(v_path[edges].reshape(-1, 3))
+        e_vertex_colors.append(np.repeat(cols[np.arange(len(edges)) % len(cols)], 2, axis=0))
+        start_idx = idx_e_offset[0]
+        e_indices.append(np.arange(start_idx, start_idx + edges.size).reshape(-1, 2))
+        idx_e_offset[0] += edges.size
 
     else:
-        e_vertices.extend(v_path)
+        e_vertices.append(v_path)
         if not config.edges_use_vertex_color or not config.uniform_edges:
-            e_vertex_colors.extend([e_col for v in v_path])
-        if idx_e_offset[0]:
-            offset = idx_e_offset[0]
-            e_indices.extend([[c + offset for c in e] for e in edges])
-        else:
-            e_indices.extend(edges)
+            e_vertex_colors.append(np.repeat(as_colors(e_col), len(v_path), axis=0))
+        e_indices.append(edges + idx_e_offset[0])
 
         idx_e_offset[0] += len(v_path)
 
@@ -479,16 +446,16 @@ def generate_mesh_geom(config, vecs_in):
         use_matrix = False
 
     if (config.draw_verts and not config.uniform_verts) or (config.draw_edges and config.edges_use_vertex_color) or (config.draw_polys and config.polygon_use_vertex_color):
-        points_color = fill_points_colors(config.vector_color, vecs_in, config.color_per_point, config.random_colors)
+        points_color = as_colors(fill_points_colors(config.vector_color, vecs_in, config.color_per_point, config.random_colors))
     else:
-        points_color = []
+        points_color = np.empty((0, 4), dtype=np.float32)
 
     for vecs, mat, polygons, edges, p_cols, e_col in zip(vecs_in, mats_in, cycle(polygons_s), cycle(edges_s), cycle(pol_color), cycle(edge_color)):
+        v_path = np.asarray(vecs, dtype=np.float64).reshape(-1, 3)
         if use_matrix:
-            v_path = [(mat @ Vector(v))[:] for v in vecs]
-        else:
-            v_path = vecs
-        v_vertices.extend(v_path)
+            mat = np.array(mat)
+            v_path = v_path @ mat[:3, :3].T + mat[:3, 3]
+        v_vertices.append(v_path)
         if config.draw_edges:
             edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset)
         if config.draw_polys:
@@ -499,7 +466,8 @@ def generate_mesh_geom(config, vecs_in):
             config.v_shader = gpu.shader.from_builtin(shading_3d.UNIFORM_COLOR)
         else:
             config.v_shader = gpu.shader.from_builtin(shading_3d.SMOOTH_COLOR)
-        geom.v_vertices, geom.points_color = v_vertices, points_color
+        geom.v_vertices = concatenate_chunks(v_vertices, 3, np.float32)
+        geom.points_color = points_color
 
     if config.draw_edges:
         if config.edges_use_vertex_color and e_vertices:
@@ -508,8 +476,9 @@ def generate_mesh_geom(config, vecs_in):
             config.e_shader = gpu.shader.from_builtin(shading_3d.UNIFORM_COLOR)
         else:
             config.e_shader = gpu.shader.from_builtin(shading_3d.SMOOTH_COLOR)
-        geom.e_vertices, geom.e_vertex_colors, geom.e_indices = e_vertices, e_vertex_colors, e_indices
-
+        geom.e_vertices = concatenate_chunks(e_vertices, 3, np.float32)
+        geom.e_vertex_colors = concatenate_chunks(e_vertex_colors, 4, np.float32)
+        geom.e_indices = concatenate_chunks(e_indices, 2, np.int32)
 
     if config.draw_polys and config.shade_mode != 'fragment':
         if config.uniform_pols:
@@ -518,7 +487,9 @@ def generate_mesh_geom(config, vecs_in):
             if config.polygon_use_vertex_color and config.shade_mode not in ['facet', 'smooth']:
                 p_vertex_colors = points_color
             config.p_shader = gpu.shader.from_builtin(shading_3d.SMOOTH_COLOR)
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
+        geom.p_vertices = concatenate_chunks(p_vertices, 3, np.float32)
+        geom.p_vertex_colors = concatenate_chunks(p_vertex_colors, 4, np.float32)
+        geom.p_indices = concatenate_chunks(p_indices, 3, np.int32)
 
     elif config.shade_mode == 'fragment' and config.draw_polys:
 
@@ -536,7 +507,9 @@ def generate_mesh_geom(config, vecs_in):
             config.p_shader = gpu.types.GPUShader(config.node.custom_vertex_shader, config.node.custom_fragment_shader)
         else:
             config.p_shader = gpu.types.GPUShader(default_vertex_shader, default_fragment_shader, geocode=default_geometry_shader)
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
+        geom.p_vertices = concatenate_chunks(p_vertices, 3, np.float32)
+        geom.p_vertex_colors = concatenate_chunks(p_vertex_colors, 4, np.float32)
+        geom.p_indices = concatenate_chunks(p_indices, 3, np.int32)
 
     return geom
 
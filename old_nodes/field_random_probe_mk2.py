@@ -11,6 +11,7 @@ import bpy
 from bpy.props import FloatProperty, BoolProperty, IntProperty
 
 from sverchok.core.sockets import setup_new_node_location
+from sverchok.core import lazy_nodes
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
 from sverchok.core.sv_custom_exceptions import SvNoDataError
@@ -77,7 +78,7 @@ class SvFieldRandomProbeMk2Node(SverchCustomTreeNode, bpy.types.Node):
 
         @classmethod
         def on_selected(cls, tree, node, socket, item, context):
-            new_node = tree.nodes.new('SvBoxNodeMk2')
+            new_node = lazy_nodes.new_node(tree.nodes, 'SvBoxNodeMk2')
             new_node.label = "Bounds"
             tree.links.new(new_node.outputs[0], node.inputs['Bounds'])
             setup_new_node_location(new_node, node)
@@ -32,6 +32,7 @@ from mathutils import Vector
 from mathutils.geometry import interpolate_bezier
 
 from sverchok.utils.sv_curve_utils import Arc
+from sverchok.core import lazy_nodes
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import fullList, updateNode, dataCorrect
 
@@ -470,7 +471,7 @@ def index_viewer_adding(node):
     tree = bpy.context.space_data.edit_tree
     links = tree.links
 
-    vi = tree.nodes.new('IndexViewerNode')
+    vi = lazy_nodes.new_node(tree.nodes, 'IndexViewerNode')
     vi.location = loc+Vector((200,-100))
     vi.draw_bg = True
 
@@ -485,7 +486,7 @@ def float_add_if_selected(node):
     tree = bpy.context.space_data.edit_tree
     links = tree.links
 
-    nu = tree.nodes.new('SvNumberNode')
+    nu = lazy_nodes.new_node(tree.nodes, 'SvNumberNode')
     nu.location = loc+Vector((-200,-150))
 
     links.new(nu.outputs[0], node.inputs[0])   #number
@@ -498,7 +499,7 @@ def viewedraw_adding(node):
     tree = bpy.context.space_data.edit_tree
     links = tree.links
 
-    vd = tree.nodes.new('ViewerNode2')
+    vd = lazy_nodes.new_node(tree.nodes, 'ViewerNode2')
     vd.location = loc+Vector((200,225))
 
     links.new(node.outputs[0], vd.inputs[0])   #verts
@@ -243,7 +243,8 @@ class SverchokPreferences(AddonPreferences):
     profiling_sections = [
         ("NONE", "Disable", "Disable profiling", 0),
         ("MANUAL", "Marked methods only", "Profile only methods that are marked with @profile decorator", 1),
-        ("UPDATE", "Node tree update", "Profile whole node tree update process", 2)
+        ("UPDATE", "Node tree update", "Profile whole node tree update process", 2),
+        ("NODES", "Node statistics", "Collect time, number of calls and data sizes of each node", 3)
     ]
 
     profile_mode: EnumProperty(name = "Profiling mode",
@@ -251,6 +252,21 @@ class SverchokPreferences(AddonPreferences):
             default = "NONE",
             description = "Performance profiling mode")
 
+    socket_cache_budget: IntProperty(name = "Socket data budget (MB)",
+            description = "Maximum memory of socket data cache, outputs which are not read by viewers "
+                          "will be freed and recalculated when needed. 0 means unlimited",
+            default = 0, min = 0)
+
+    node_cache_directory: StringProperty(name = "Node results cache",
+            description = "Where results of expensive nodes are saved when disk cache of a tree is enabled. "
+                          "If empty, the Sverchok folder in Blender user data directory is used",
+            default = "", subtype = 'DIR_PATH')
+
+    node_cache_budget: IntProperty(name = "Node results cache size (MB)",
+            description = "Least recently used results are deleted when the disk cache exceeds the size. "
+                          "0 means unlimited",
+            default = 2048, min = 0)
+
     developer_mode: BoolProperty(name = "Developer mode",
             description = "Show some additional panels or features useful for Sverchok developers only",
             default = False)
@@ -498,6 +514,14 @@ class SverchokPreferences(AddonPreferences):
         col2box.label(text="Debug:")
         col2box.prop(self, "developer_mode")
 
+        perf_box = col2.box()
+        perf_box.label(text="Performance:")
+        perf_box.prop(self, "socket_cache_budget")
+        perf_box.prop(self, "node_cache_directory")
+        row = perf_box.row()
+        row.prop(self, "node_cache_budget")
+        row.operator("node.sv_clear_node_result_cache", text="", icon='TRASH')
+
         log_box = col2.box()
         log_box.label(text="Logging:")
         log_box.prop(self, "log_level")
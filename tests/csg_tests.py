@@ -0,0 +1,62 @@
+from math import sin, cos, pi
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.csg_core import CSG
+from sverchok.utils.csg_numpy import NumpyCSG
+
+
+def box(center, size):
+    verts = [[center[0] + x * size, center[1] + y * size, center[2] + z * size]
+             for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    return verts, faces
+
+
+def sphere(center, radius, u_segments, v_segments):
+    verts = [[center[0], center[1], center[2] + radius], [center[0], center[1], center[2] - radius]]
+    for i in range(1, v_segments):
+        theta = pi * i / v_segments
+        for j in range(u_segments):
+            phi = 2 * pi * j / u_segments
+            verts.append([center[0] + radius * sin(theta) * cos(phi),
+                          center[1] + radius * sin(theta) * sin(phi),
+                          center[2] + radius * cos(theta)])
+
+    def index(i, j):
+        return 2 + (i - 1) * u_segments + j % u_segments
+
+    faces = []
+    for j in range(u_segments):
+        faces.append([0, index(1, j), index(1, j + 1)])
+        faces.append([1, index(v_segments - 1, j + 1), index(v_segments - 1, j)])
+    for i in range(1, v_segments - 1):
+        for j in range(u_segments):
+            faces.append([index(i, j), index(i + 1, j), index(i + 1, j + 1), index(i, j + 1)])
+    return verts, faces
+
+
+class NumpyCSGTests(SverchokTestCase):
+    def assert_same_as_python(self, mesh_a, mesh_b):
+        for operation in ['union', 'subtract', 'intersect']:
+            with self.subTest(operation=operation):
+                a, b = CSG.Obj_from_pydata(*mesh_a), CSG.Obj_from_pydata(*mesh_b)
+                expected = getattr(a, operation)(b).to_pydata()
+                a, b = NumpyCSG.from_pydata(*mesh_a), NumpyCSG.from_pydata(*mesh_b)
+                result = getattr(a, operation)(b).to_pydata()
+                self.assertEqual(result, expected)
+
+    def test_boxes(self):
+        self.assert_same_as_python(box((0, 0, 0), 1), box((0.5, 0.3, 0.2), 1))
+
+    def test_sphere_and_box(self):
+        self.assert_same_as_python(sphere((0, 0, 0), 1, 12, 8), box((0.6, 0.2, 0.1), 0.7))
+
+    def test_spheres(self):
+        self.assert_same_as_python(sphere((0, 0, 0), 1, 16, 10), sphere((0.5, 0.2, 0.1), 0.8, 14, 9))
+
+    def test_separate_solids(self):
+        a, b = NumpyCSG.from_pydata(*box((0, 0, 0), 1)), NumpyCSG.from_pydata(*box((5, 0, 0), 1))
+        verts, faces = a.intersect(b).to_pydata()
+        self.assertEqual((verts, faces), ([], []))
+        verts, faces = a.union(b).to_pydata()
+        self.assertEqual((len(verts), len(faces)), (16, 12))
@@ -0,0 +1,114 @@
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.data_cache import FrameCache, NodeResultCache, save_data, load_data, hash_data
+
+
+class DataCacheTests(SverchokTestCase):
+    def test_save_load(self):
+        data = [[(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)], np.arange(6).reshape(2, 3), [[0, 1, 2], [2, 3]], 'text']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.npz')
+            save_data(path, data)
+            loaded = load_data(path)
+        self.assertEqual(loaded[0], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assert_numpy_arrays_equal(loaded[1], data[1])
+        self.assertEqual(loaded[2:], data[2:])
+
+    def test_memory_limit(self):
+        cache = FrameCache(max_size=3000)
+        for frame in range(10):
+            cache.put(frame, [np.full(100, frame, dtype=float)])
+        self.assertLessEqual(cache.total_size, 3000)
+        self.assertIsNone(cache.get(0))
+        self.assert_numpy_arrays_equal(cache.get(9)[0], np.full(100, 9, dtype=float))
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FrameCache(max_size=3000, directory=directory)
+            for frame in range(10):
+                cache.put(frame, [np.full(100, frame, dtype=float)])
+            self.assertEqual(len(cache), 10)
+            cache.prefetch([1, 2])
+            for frame in range(10):
+                self.assert_numpy_arrays_equal(cache.get(frame)[0], np.full(100, frame, dtype=float))
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_prefetched_frames_are_kept(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FrameCache(max_size=3000, directory=directory)
+            for frame in range(10):
+                cache.put(frame, [np.full(100, frame, dtype=float)])
+            cache.prefetch([0, 1])
+            cache.wait()
+            cache.put(10, [np.full(100, 10, dtype=float)])
+            for name in os.listdir(directory):  # the frames can be taken only from memory now
+                os.remove(os.path.join(directory, name))
+            for frame in [0, 1]:
+                self.assert_numpy_arrays_equal(cache.get(frame)[0], np.full(100, frame, dtype=float))
+            self.assertLessEqual(cache.total_size, 3000)
+
+    def test_set_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            old_directory = os.path.join(directory, 'old')
+            new_directory = os.path.join(directory, 'new')
+            cache = FrameCache(max_size=3000, directory=old_directory)
+            for frame in range(10):
+                cache.put(frame, [np.full(100, frame, dtype=float)])
+            cache.set_directory(new_directory)
+            self.assertEqual(os.listdir(old_directory), [])
+            self.assertEqual(len(cache), 10)
+            for frame in range(10):
+                self.assert_numpy_arrays_equal(cache.get(frame)[0], np.full(100, frame, dtype=float))
+
+            cache.max_size = 0
+            cache.set_directory(None)
+            self.assertEqual(os.listdir(new_directory), [])
+            for frame in range(10):
+                self.assert_numpy_arrays_equal(cache.get(frame)[0], np.full(100, frame, dtype=float))
+
+    def test_clear_stops_prefetch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FrameCache(max_size=1000, directory=directory)
+            for frame in range(3):
+                cache.put(frame, [np.full(100, frame, dtype=float)])
+            cache.prefetch([0])
+            self.assertIsNotNone(cache._executor)
+            executor = cache._executor
+            cache.clear()
+            self.assertIsNone(cache._executor)
+            self.assertTrue(executor._shutdown)
+
+
+class NodeResultCacheTests(SverchokTestCase):
+    def test_save_load(self):
+        data = {'Vertices': [np.zeros((3, 3))], 'Faces': [[[0, 1, 2]]]}
+        with tempfile.TemporaryDirectory() as directory:
+            cache = NodeResultCache(directory)
+            self.assertIsNone(cache.load('key'))
+            self.assertTrue(cache.save('key', data))
+            loaded = cache.load('key')
+        self.assertEqual(list(loaded), ['Vertices', 'Faces'])
+        self.assert_numpy_arrays_equal(loaded['Vertices'][0], data['Vertices'][0])
+        self.assertEqual(loaded['Faces'], data['Faces'])
+
+    def test_size_limit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = NodeResultCache(directory, max_size=1)
+            cache.save('first', {'Data': [np.random.random(100)]})
+            cache.save('second', {'Data': [np.random.random(100)]})
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_hash_data(self):
+        def key(data):
+            hasher = NodeResultCache.new_key()
+            hash_data(hasher, data)
+            return hasher.hexdigest()
+        self.assertEqual(key([[(1, 2), (3, 4)]]), key([[[1, 2], [3, 4]]]))
+        self.assertNotEqual(key([[1, 2, 3]]), key([[1, 2, 4]]))
+        self.assertNotEqual(key([[1, 2, 3]]), key([[1.0, 2.0, 3.0]]))
+        self.assertNotEqual(key([[0, 1, 2], [3, 4]]), key([[0, 1], [2, 3, 4]]))
@@ -1,5 +1,8 @@
+import numpy as np
+
 from sverchok.utils.testing import *
 from sverchok.data_structure import *
+from sverchok.utils.ragged_array import SvRaggedArray
 
 
 class DataStructureTests(SverchokTestCase):
@@ -220,6 +223,37 @@ class DataStructureTests(SverchokTestCase):
         expected = [[[1], [2]], [[3]]]
         self.assert_sverchok_data_equal(result, expected)
 
+    def test_flatten_array_data(self):
+        vertices = np.arange(12.0).reshape(4, 3)
+        data = [[vertices], [vertices[:1], vertices[1:]]]
+        result = flatten_array_data(data, 2)
+        self.assert_numpy_arrays_equal(result, np.concatenate([vertices, vertices]))
+        result = flatten_array_data([vertices], 1)
+        self.assert_numpy_arrays_equal(result, np.arange(12.0))
+        self.assertTrue(np.shares_memory(result, vertices))
+        self.assertEqual(flatten_array_data([[1, 2], [3]], 1), [1, 2, 3])
+
+    def test_flatten_array_data_of_different_shapes(self):
+        row4, row3 = np.array([[0, 1, 2, 3]]), np.array([[0, 1, 2]])
+        cases = [([row4, row3], 2), ([[row4], [row3, row4]], 2), ([[row4], [row3]], 3), ([row4, row3], 1)]
+        for data, target_level in cases:
+            with self.subTest(data=data, target_level=target_level):
+                expected = flatten_data([[a.tolist() for a in item] if isinstance(item, list) else item.tolist()
+                                         for item in data], target_level)
+                result = flatten_array_data(data, target_level)
+                self.assertEqual([np.asarray(i).tolist() for i in result], expected)
+
+    def test_graft_array_data(self):
+        vertices = np.arange(12.0).reshape(4, 3)
+        for item_level in range(4):
+            with self.subTest(item_level=item_level):
+                expected = graft_data([vertices.tolist()], item_level, 2)
+                result = graft_array_data([vertices], item_level, 2)
+                self.assertEqual(np.array(result).tolist(), expected)
+        result = graft_array_data([vertices], item_level=1)
+        self.assertEqual(result[0].shape, (4, 1, 3))
+        self.assertTrue(np.shares_memory(result[0], vertices))
+
 class CalcMaskTests(SverchokTestCase):
     def test_calc_mask_1(self):
         subset = [1]
@@ -368,3 +402,50 @@ class MapRecursiveTests(SverchokTestCase):
         result = unzip_dict_recursive(data)
         expected = {'A': [[1], [3], [5]], 'B': [[2], [4], [6]]}
         self.assert_dicts_equal(result, expected)
+
+class RaggedArrayTests(SverchokTestCase):
+    verts = [[[0, 0, 0], [1, 0, 0]], [[0, 1, 0]], [[2, 2, 2], [3, 3, 3], [4, 4, 4]]]
+    nested = [[[1, 2], [3]], [[4]], [[5, 6, 7], [], [8]]]
+
+    @staticmethod
+    def to_list(data):
+        return data.to_list() if isinstance(data, SvRaggedArray) else data.tolist()
+
+    def test_from_list(self):
+        data = SvRaggedArray.from_list(self.nested, depth=2)
+        self.assert_numpy_arrays_equal(data.values, np.arange(1, 9))
+        self.assertEqual(data.to_list(), self.nested)
+        self.assertEqual(self.to_list(data[-1]), self.nested[-1])
+        self.assertEqual(data[1:].to_list(), self.nested[1:])
+        self.assertEqual(data[2].copy().to_list(), self.nested[2])
+
+    def test_nesting_level(self):
+        data = SvRaggedArray.from_list(self.verts)
+        self.assertEqual(get_data_nesting_level(data), 3)
+        self.assertEqual(levels_of_list_or_np(data), 3)
+        self.assertEqual(ensure_nesting_level(data, 4).to_list(), [self.verts])
+
+    def test_flatten(self):
+        for depth, data in [(1, self.verts), (2, self.nested)]:
+            ragged = SvRaggedArray.from_list(data, depth=depth)
+            for level in range(1, 4):
+                with self.subTest(data=data, level=level):
+                    self.assertEqual(self.to_list(flatten_data(ragged, level)), flatten_data(data, level))
+
+    def test_graft(self):
+        for depth, data in [(1, self.verts), (2, self.nested)]:
+            ragged = SvRaggedArray.from_list(data, depth=depth)
+            for level in range(4):
+                with self.subTest(data=data, level=level):
+                    self.assertEqual(graft_data(ragged, level, 2).to_list(), graft_data(data, level, 2))
+
+    def test_wrap_unwrap(self):
+        data = SvRaggedArray.from_list(self.nested, depth=2)
+        self.assertEqual(wrap_data(data, 2).to_list(), [[self.nested]])
+        self.assertEqual(unwrap_data(wrap_data(data, 2), 2).to_list(), self.nested)
+
+    def test_match_long_repeat(self):
+        data = SvRaggedArray.from_list(self.verts)
+        verts, numbers = match_long_repeat([data, [1]])
+        self.assertEqual([v.tolist() for v in verts], self.verts)
+        self.assertEqual(numbers, [1, 1, 1])
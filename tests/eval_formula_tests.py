@@ -0,0 +1,38 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import (
+        sv_compile_numpy, safe_eval_compiled, FormulaVectorizeError)
+
+
+class NumpyFormulaTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.xs = np.linspace(-2.0, 2.0, num=9)
+        self.ys = np.linspace(1.0, 3.0, num=9)
+
+    def evaluate(self, formula):
+        compiled = sv_compile_numpy(formula, {'x', 'y'})
+        return safe_eval_compiled(compiled, dict(x=self.xs, y=self.ys), allowed_names=safe_names_np)
+
+    def test_condition(self):
+        result = self.evaluate("x if x > 0 else -y")
+        expected = np.where(self.xs > 0, self.xs, -self.ys)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_chained_compare(self):
+        result = self.evaluate("1 if 0 < x < 1.5 else 0")
+        expected = np.where((self.xs > 0) & (self.xs < 1.5), 1, 0)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_max(self):
+        result = self.evaluate("max(x, y, 1.5) + abs(x)")
+        expected = np.maximum(np.maximum(self.xs, self.ys), 1.5) + np.abs(self.xs)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_not_vectorizable(self):
+        with self.assertRaises(FormulaVectorizeError):
+            sv_compile_numpy("len(x)", {'x'})
+        with self.assertRaises(FormulaVectorizeError):
+            sv_compile_numpy("[a for a in x]", {'x'})
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.update_system import UpdateTree
+from sverchok.nodes.logic.evolver import FitnessEvaluator, NumberGene
+
+
+class FitnessEvaluatorTest(SverchokTestCase):
+    def build_tree(self, tree):
+        """Fitness is sum of A and B genes, the Side node depends on B gene
+        but the fitness does not depend on it"""
+        tree.sv_process = False
+        gene_a = tree.nodes.new('SvNumberNode')
+        gene_a.name = 'A'
+        gene_b = tree.nodes.new('SvNumberNode')
+        gene_b.name = 'B'
+        add = tree.nodes.new('SvScalarMathNodeMK4')
+        add.name = 'Add'
+        add.current_op = 'ADD'
+        side = tree.nodes.new('SvScalarMathNodeMK4')
+        side.name = 'Side'
+        evolver = tree.nodes.new('SvEvolverNode')
+        tree.links.new(gene_a.outputs[0], add.inputs['x'])
+        tree.links.new(gene_b.outputs[0], add.inputs['y'])
+        tree.links.new(gene_b.outputs[0], side.inputs['x'])
+        tree.links.new(add.outputs[0], evolver.inputs['Fitness'])
+        UpdateTree.reset_tree(tree)
+        genes = [NumberGene.init_from_node(gene_a), NumberGene.init_from_node(gene_b)]
+        return evolver, genes
+
+    def test_memoize(self):
+        for memoize, evaluations in [(True, 2), (False, 3)]:
+            with self.subTest(memoize=memoize), self.temporary_node_tree("EvolverTree") as tree:
+                evolver, genes = self.build_tree(tree)
+                evaluator = FitnessEvaluator(tree, evolver, genes, memoize)
+                self.assertEqual(evaluator.evaluate([1.0, 2.0]), 3.0)
+                self.assertEqual(evaluator.evaluate([3.0, 2.0]), 5.0)
+                self.assertEqual(evaluator.evaluate([1.0, 2.0]), 3.0)
+                self.assertEqual(evaluator.evaluations, evaluations)
+
+    def test_update_only_changed_genes(self):
+        with self.temporary_node_tree("EvolverTree") as tree:
+            evolver, genes = self.build_tree(tree)
+            evaluator = FitnessEvaluator(tree, evolver, genes)
+            s_tree = UpdateTree.get(tree)
+            with patch.object(s_tree, 'update_node', wraps=s_tree.update_node) as update_node:
+                self.assertEqual(evaluator.evaluate([1.0, 2.0]), 3.0)
+                updated = {call.args[0].name for call in update_node.call_args_list}
+                self.assertEqual(updated, {'A', 'B', 'Add', evolver.name})
+
+                update_node.reset_mock()
+                self.assertEqual(evaluator.evaluate([4.0, 2.0]), 6.0)
+                updated = [call.args[0].name for call in update_node.call_args_list]
+                self.assertEqual(updated, ['A', 'Add', evolver.name])
+
+                update_node.reset_mock()
+                evaluator.update_other_nodes()
+                updated = [call.args[0].name for call in update_node.call_args_list]
+                self.assertEqual(updated, ['Side'])
@@ -1,8 +1,10 @@
 from sverchok.utils.testing import SverchokTestCase
-from sverchok.utils.geom_2d.make_monotone import monotone_sv_face_with_holes
-from sverchok.utils.geom_2d.intersections import intersect_sv_edges
-from sverchok.utils.geom_2d.merge_mesh import edges_to_faces, merge_mesh_light, crop_mesh, crop_edges, merge_mesh
+from sverchok.utils.geom_2d.make_monotone import monotone_sv_face_with_holes, monotone_faces_with_holes
+from sverchok.utils.geom_2d.intersections import intersect_sv_edges, find_intersections
+from sverchok.utils.geom_2d.merge_mesh import edges_to_faces, merge_mesh_light, crop_mesh, crop_edges, merge_mesh, \
+    DCELMesh
 from sverchok.utils.geom_2d.dissolve_mesh import dissolve_faces
+from sverchok.utils.geom_2d.dcel_arrays import DCELArrays, UNBOUNDED
 
 
 class MakeMonotoneTest(SverchokTestCase):
@@ -293,3 +295,51 @@ class DissolveFaces2DTest(SverchokTestCase):
         self.assert_sverchok_data_equal(expected_faces, result_faces)
         self.assert_sverchok_data_equal(expected_face_mask, result_face_mask)
         self.assert_sverchok_data_equal(expected_index_mask, result_index_mask)
+
+
+class DCELArraysTest(SverchokTestCase):
+
+    def test_faces_to_arrays(self):
+        sv_points = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0]]
+        sv_faces = [[0, 1, 4, 3], [4, 5, 2, 1]]  # second face is in cw order
+
+        arrays = DCELArrays.from_sv_faces(sv_points, sv_faces)
+        self.assert_sverchok_data_equal(arrays.twin[arrays.twin].tolist(), list(range(len(arrays.twin))))
+        self.assert_sverchok_data_equal(arrays.next[arrays.last].tolist(), list(range(len(arrays.next))))
+        self.assert_sverchok_data_equal(arrays.origin[arrays.next].tolist(), arrays.origin[arrays.twin].tolist())
+        self.assert_sverchok_data_equal(arrays.face.tolist(), [0, 0, 0, 0, 1, 1, 1, 1] + [UNBOUNDED] * 6)
+        self.assert_sverchok_data_equal(arrays.unbounded_inners.tolist(), [8])
+
+        result_points, result_edges, result_faces = arrays.to_sv_mesh()
+        self.assert_sverchok_data_equal(result_points, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]])
+        self.assert_sverchok_data_equal(result_edges, [[0, 1], [1, 2], [2, 3], [3, 0], [1, 4], [4, 5], [5, 2]])
+        self.assert_sverchok_data_equal(result_faces, [[0, 1, 2, 3], [1, 4, 5, 2]])
+
+    def test_edges_to_arrays(self):
+        sv_points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [-1, 0, 0], [0, -1, 0]]
+        sv_edges = [[0, 1], [0, 2], [0, 3], [0, 4], [2, 2]]  # last edge has zero length
+
+        arrays = DCELArrays.from_sv_edges(sv_points, sv_edges)
+        self.assert_sverchok_data_equal(arrays.origin.tolist(), [0, 1, 0, 2, 0, 3, 0, 4])
+        self.assert_sverchok_data_equal(arrays.slop.tolist(), [2, 4, 3, 1, 4, 2, 1, 3])
+        # half edges from the center are linked in ccw order
+        self.assert_sverchok_data_equal(arrays.twin[arrays.last[[0, 2, 4, 6]]].tolist(), [2, 4, 6, 0])
+
+        result_points, result_edges = arrays.to_sv_mesh(faces=False)
+        self.assert_sverchok_data_equal(result_points, sv_points)
+        self.assert_sverchok_data_equal(result_edges, [[0, 1], [0, 2], [0, 3], [0, 4]])
+
+    def test_merge_mesh_from_arrays(self):
+        sv_points = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [1, 1, 0], [3, 1, 0], [3, 3, 0], [1, 3, 0]]
+        sv_faces = [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+        mesh = DCELArrays.from_sv_faces(sv_points, sv_faces).to_dcel_mesh(DCELMesh())
+        find_intersections(mesh, 1e-5, face_overlapping=True)
+        mesh.generate_faces_from_hedges()
+        monotone_faces_with_holes(mesh)
+        result_points, result_faces = DCELArrays.from_dcel_mesh(mesh).to_sv_mesh(edges=False)
+
+        expected_points = sv_points + [[1, 2, 0], [2, 1, 0]]
+        expected_faces = [[0, 1, 9, 4, 8, 3], [2, 8, 4, 9], [5, 6, 7, 8, 2, 9]]
+        self.assert_sverchok_data_equal(expected_points, result_points, precision=5)
+        self.assert_sverchok_data_equal(expected_faces, result_faces)
@@ -0,0 +1,51 @@
+import bpy
+from mathutils import Matrix, Vector
+
+from sverchok.utils.testing import *
+
+
+class GetObjectsDataTest(NodeProcessTestCase):
+    node_bl_idname = "SvGetObjectsDataMK3"
+    connect_output_sockets = ["vertices", "edges", "polygons", "vertex_normals",
+                              "polygon_centers", "polygon_normals"]
+
+    def setUp(self):
+        super().setUp()
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0.5), (0, 1, 0), (2, 0, 1), (2, 1, 0)]
+        faces = [(0, 1, 2, 3), (1, 4, 5, 2), (2, 5, 3)]
+        self.mesh = bpy.data.meshes.new("sv_test_get_objects_data")
+        self.mesh.from_pydata(verts, [], faces)
+        self.mesh.update()
+        self.object = bpy.data.objects.new("sv_test_get_objects_data", self.mesh)
+        self.object.matrix_world = (Matrix.Translation((1, 2, 3))
+                                    @ Matrix.Rotation(0.5, 4, Vector((1, 1, 0)))
+                                    @ Matrix.Scale(2, 4))
+        self.node.object_names.add().name = self.object.name
+
+    def tearDown(self):
+        bpy.data.objects.remove(self.object)
+        bpy.data.meshes.remove(self.mesh)
+        super().tearDown()
+
+    def read_per_element(self, apply_matrix):
+        """It's how the node read mesh data before foreach_get was used"""
+        mtrx = self.object.matrix_world
+        T, R, S = mtrx.decompose()
+        mesh = self.mesh
+        return {
+            "vertices": [((mtrx @ v.co) if apply_matrix else v.co)[:] for v in mesh.vertices],
+            "edges": [[e.vertices[0], e.vertices[1]] for e in mesh.edges],
+            "polygons": [list(p.vertices) for p in mesh.polygons],
+            "vertex_normals": [((R @ v.co) if apply_matrix else v.normal)[:] for v in mesh.vertices],
+            "polygon_centers": [((mtrx @ p.center) if apply_matrix else p.center)[:] for p in mesh.polygons],
+            "polygon_normals": [((R @ p.normal) if apply_matrix else p.normal)[:] for p in mesh.polygons],
+        }
+
+    def test_read_mesh(self):
+        for apply_matrix in [False, True]:
+            with self.subTest(apply_matrix=apply_matrix):
+                self.node.apply_matrix = apply_matrix
+                self.node.process()
+                for name, expected in self.read_per_element(apply_matrix).items():
+                    self.assert_sverchok_data_equal(self.get_output_data(name), [expected], precision=5,
+                                                    message=name)
@@ -1,4 +1,11 @@
+from math import sin, cos, pi
+
+import numpy as np
+
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import (
+    edge_candidate_pairs, intersect_edges_2d, intersect_edges_2d_np, intersect_edges_2d_np_big,
+    intersect_edges_3d_np)
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
@@ -19,3 +26,54 @@ class IntersectEdgesTest2(ReferenceTreeTestCase):
         # self.assert_sverchok_data_equals_file(result_verts, "intersecting_planes_result_verts.txt", precision=8)
         # #self.store_reference_sverchok_data("intersecting_planes_result_faces.txt", result_edges)
         # self.assert_sverchok_data_equals_file(result_edges, "intersecting_planes_result_faces.txt", precision=8)
+
+
+def random_segments(number, flat=True):
+    rng = np.random.default_rng(0)
+    starts = rng.random((number, 3)) * 100
+    ends = starts + rng.normal(size=(number, 3)) * 3
+    if flat:
+        starts[:, 2] = ends[:, 2] = 0
+    else:
+        ends[:, 2] = starts[:, 2]
+    verts = np.concatenate([starts, ends]).tolist()
+    edges = [[i, i + number] for i in range(number)]
+    return verts, edges
+
+
+def star_segments(number):
+    verts = [[cos(pi * i / number) * (-1) ** k, sin(pi * i / number) * (-1) ** k, 0]
+             for k in range(2) for i in range(number)]
+    edges = [[i, i + number] for i in range(number)]
+    return verts, edges
+
+
+class EdgesBroadphaseTest(SverchokTestCase):
+    def test_candidate_pairs(self):
+        verts = [[0, 0, 0], [1, 1, 0], [1, 0, 0], [0, 1, 0], [2, 2, 0], [3, 3, 0], [1, 1, 5], [2, 2, 5]]
+        edges = [[0, 1], [2, 3], [4, 5], [1, 4], [6, 7]]
+        for broadphase in ['SWEEP', 'GRID']:
+            with self.subTest(broadphase=broadphase):
+                pairs = edge_candidate_pairs(verts, edges, broadphase=broadphase)
+                self.assertEqual(pairs.tolist(), [[0, 1], [0, 3], [1, 3], [2, 3]])
+                pairs = edge_candidate_pairs(verts, edges, dims=2, broadphase=broadphase)
+                self.assertEqual(pairs.tolist(), [[0, 1], [0, 3], [0, 4], [1, 3], [1, 4], [2, 3], [2, 4], [3, 4]])
+
+    def test_same_as_brute_force(self):
+        functions = [intersect_edges_2d_np, intersect_edges_2d_np_big, intersect_edges_3d_np]
+        meshes = [random_segments(300), random_segments(300, flat=False), star_segments(50)]
+        for function in functions:
+            for verts, edges in meshes:
+                for only_touching in [True, False]:
+                    expected = function(verts, edges, 1e-5, only_touching=only_touching)
+                    for broadphase in ['SWEEP', 'GRID']:
+                        with self.subTest(function=function.__name__, broadphase=broadphase):
+                            result = function(verts, edges, 1e-5, only_touching=only_touching, broadphase=broadphase)
+                            self.assertEqual(result, expected)
+
+    def test_same_as_brute_force_alg_1(self):
+        verts, edges = random_segments(200)
+        expected = intersect_edges_2d(list(verts), edges, 1e-5)
+        for broadphase in ['SWEEP', 'GRID']:
+            with self.subTest(broadphase=broadphase):
+                self.assertEqual(intersect_edges_2d(list(verts), edges, 1e-5, broadphase=broadphase), expected)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.kdtree import SvKdTree, SvBlenderKdTree, SvBruteforceKdTree
+
+
+class KdTreeBatchTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(42)
+        self.points = rng.random((200, 3))
+        self.needles = rng.random((50, 3))
+
+    def test_bruteforce_query_array(self):
+        kdt = SvBruteforceKdTree(self.points, power=1)
+        locs, idxs, distances = kdt.query_array(self.needles, count=3)
+        self.assertEqual(locs.shape, (50, 3, 3))
+        for needle, needle_idxs in zip(self.needles, idxs):
+            _, expected_idxs, _ = kdt.query(needle, count=3)
+            self.assert_numpy_arrays_equal(needle_idxs, expected_idxs)
+
+    def test_blender_query_array(self):
+        expected = SvBruteforceKdTree(self.points)
+        kdt = SvBlenderKdTree(self.points)
+        _, expected_idxs, expected_distances = expected.query_array(self.needles)
+        _, idxs, distances = kdt.query_array(self.needles)
+        self.assert_numpy_arrays_equal(idxs, expected_idxs)
+        self.assert_numpy_arrays_equal(distances, expected_distances, precision=8)
+
+    def test_query_range_array(self):
+        expected = SvBruteforceKdTree(self.points)
+        kdt = SvKdTree.new(SvKdTree.best_available_implementation(), self.points)
+        for found, expected_found in zip(kdt.query_range_array(self.needles, 0.2),
+                                         expected.query_range_array(self.needles, 0.2)):
+            self.assert_numpy_arrays_equal(np.sort(found), expected_found)
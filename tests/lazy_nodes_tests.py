@@ -0,0 +1,98 @@
+import json
+import sys
+import tempfile
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import bpy
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core import lazy_nodes
+from sverchok.node_tree import SverchCustomTreeNode
+
+MODULE_NAME = "sv_lazy_nodes_test_module"
+
+
+def make_node_module():
+    """Module with a node which is not registered, like a node module which
+    was not imported in the lazy mode"""
+    class SvLazyTestNode(SverchCustomTreeNode, bpy.types.Node):
+        """
+        Triggers: lazy
+        Tooltip: Node of lazy loading test
+        """
+        bl_idname = 'SvLazyTestNode'
+        bl_label = 'Lazy Test'
+        sv_icon = 'SV_LAZY_TEST'
+
+        def sv_init(self, context):
+            self.outputs.new('SvStringsSocket', "Data")
+
+    SvLazyTestNode.__module__ = MODULE_NAME
+    module = types.ModuleType(MODULE_NAME)
+    module.SvLazyTestNode = SvLazyTestNode
+    module.register = lambda: bpy.utils.register_class(SvLazyTestNode)
+    module.unregister = lambda: bpy.utils.unregister_class(SvLazyTestNode)
+    return module
+
+
+class LazyNodesTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.module = make_node_module()
+        path = Path(self.directory.name) / lazy_nodes.MANIFEST_NAME
+        patches = [patch.object(lazy_nodes, 'manifest_path', lambda: path),
+                   patch.dict(sys.modules, {MODULE_NAME: self.module}),
+                   patch.dict(lazy_nodes._not_loaded),
+                   patch.object(lazy_nodes, 'loaded_modules', [])]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def test_write_read_manifest(self):
+        lazy_nodes.write_manifest([self.module])
+        manifest = lazy_nodes.read_manifest()
+        self.assertEqual(list(manifest), [MODULE_NAME])
+        node_data = manifest[MODULE_NAME]['SvLazyTestNode']
+        self.assertEqual(node_data['label'], 'Lazy Test')
+        self.assertEqual(node_data['sv_icon'], 'SV_LAZY_TEST')
+        self.assertIn('Node of lazy loading test', node_data['doc'])
+
+    def test_stale_manifest(self):
+        lazy_nodes.write_manifest([self.module])
+        with patch.object(lazy_nodes, 'nodes_key', lambda: 'another key'):
+            self.assertIsNone(lazy_nodes.read_manifest())
+
+    def test_broken_manifest(self):
+        lazy_nodes.manifest_path().write_text('{"key": ')
+        self.assertIsNone(lazy_nodes.read_manifest())
+
+    def test_missing_manifest(self):
+        self.assertIsNone(lazy_nodes.read_manifest())
+
+    def test_load_on_demand(self):
+        lazy_nodes.write_manifest([self.module])
+        with open(lazy_nodes.manifest_path()) as file:
+            modules = json.load(file)['modules']
+        lazy_nodes.import_nodes(modules)
+
+        self.assertFalse(lazy_nodes.is_loaded('SvLazyTestNode'))
+        self.assertIsNone(bpy.types.Node.bl_rna_get_subclass_py('SvLazyTestNode'))
+        node_info = lazy_nodes.node_class('SvLazyTestNode')
+        self.assertEqual(node_info.bl_label, 'Lazy Test')
+        self.assertEqual(node_info.module, MODULE_NAME)
+
+        with self.temporary_node_tree("LazyNodesTree") as tree:
+            try:
+                node = lazy_nodes.new_node(tree.nodes, 'SvLazyTestNode')
+                self.assertEqual(node.bl_idname, 'SvLazyTestNode')
+                self.assertEqual([s.name for s in node.outputs], ["Data"])
+                self.assertTrue(lazy_nodes.is_loaded('SvLazyTestNode'))
+                self.assertEqual(lazy_nodes.loaded_modules, [self.module])
+                self.assertIs(lazy_nodes.node_class('SvLazyTestNode'), self.module.SvLazyTestNode)
+            finally:
+                tree.nodes.clear()
+                lazy_nodes.unregister()
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import get_output_socket_data
+from sverchok.core.update_system import UpdateTree, ERROR_KEY
+from sverchok.nodes.list_struct.reverse import ListReverseNode
+from sverchok.nodes.logic.loop_out import ITERATION_TIMES_KEY
+
+
+class LoopHoistingTest(SverchokTestCase):
+    iterations = 3
+
+    def test_hoist_invariant(self):
+        result, invariant_calls, _ = self.evaluate_loop(hoist_invariant=False)
+        hoisted_result, hoisted_invariant_calls, times = self.evaluate_loop(hoist_invariant=True)
+
+        self.assert_sverchok_data_equal(result, [[9, 10, 11]])
+        self.assert_sverchok_data_equal(hoisted_result, result)
+        # the invariant node is updated only on the first iteration
+        self.assertEqual(hoisted_invariant_calls, invariant_calls - (self.iterations - 1))
+        self.assertEqual(len(times), self.iterations)
+        self.assertTrue(all(t >= 0 for t in times))
+
+    def evaluate_loop(self, hoist_invariant):
+        """Loop which adds total number of loops (invariant branch) to the
+        numbers on each iteration (variant branch). Returns output of the loop,
+        number of updates of the invariant node and iteration times"""
+        with self.temporary_node_tree("LoopTree") as tree, \
+                patch.object(ListReverseNode, 'process', autospec=True,
+                             side_effect=ListReverseNode.process) as process:
+            tree.sv_process = False
+            numbers = tree.nodes.new('SvGenNumberRange')
+            numbers.start_float = 0
+            numbers.stop_float = 3
+            numbers.step_float = 1
+            loop_in = tree.nodes.new('SvLoopInNode')
+            loop_in.iterations = self.iterations
+            loop_in.hoist_invariant = hoist_invariant
+            invariant = tree.nodes.new('ListReverseNode')
+            variant = tree.nodes.new('SvScalarMathNodeMK4')
+            variant.current_op = 'ADD'
+            loop_out = tree.nodes.new('SvLoopOutNode')
+            note = tree.nodes.new('NoteNode')
+
+            tree.links.new(numbers.outputs['Range'], loop_in.inputs['Data 0'])
+            tree.links.new(loop_in.outputs['Loop Out'], loop_out.inputs['Loop In'])
+            loop_in.sv_update()  # creates data sockets of the loop nodes
+            tree.links.new(loop_in.outputs['Total Loops'], invariant.inputs['data'])
+            tree.links.new(loop_in.outputs[3], variant.inputs['x'])
+            tree.links.new(invariant.outputs['data'], variant.inputs['y'])
+            tree.links.new(variant.outputs['Out'], loop_out.inputs[2])
+            tree.links.new(loop_out.outputs[0], note.inputs[0])
+
+            UpdateTree.reset_tree(tree)
+            for _ in UpdateTree.main_update(tree, update_interface=False):
+                pass
+            self.assertEqual([n.name for n in tree.nodes if n.get(ERROR_KEY)], [])
+            invariant_calls = sum(1 for call in process.call_args_list if call.args[0] == invariant)
+            return get_output_socket_data(loop_out, loop_out.outputs[0].name), invariant_calls, \
+                list(loop_out.get(ITERATION_TIMES_KEY, []))
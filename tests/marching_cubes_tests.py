@@ -0,0 +1,27 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_python, isosurface_np
+
+
+class MarchingCubesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.linspace(-1.0, 1.0, num=12)
+        xs, ys, zs = np.meshgrid(rng, rng, rng, indexing='ij')
+        self.data = xs**2 + ys**2 + zs**2
+
+    @staticmethod
+    def triangles(verts, faces):
+        return set(tuple(tuple(np.round(verts[i], 6)) for i in face) for face in faces)
+
+    def test_same_as_python(self):
+        expected_verts, expected_faces = isosurface_python(self.data, 0.5)
+        verts, faces = isosurface_np(self.data, 0.5)
+        self.assertEqual(len(verts), len(expected_verts))
+        self.assertEqual(self.triangles(verts, faces), self.triangles(expected_verts, expected_faces))
+
+    def test_empty(self):
+        verts, faces = isosurface_np(self.data, 10.0)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(len(faces), 0)
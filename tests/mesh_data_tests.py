@@ -0,0 +1,60 @@
+import numpy as np
+
+import bpy
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.nodes_mixins import generating_objects
+from sverchok.utils.nodes_mixins.generating_objects import MeshTopology
+
+
+class MeshTopologyTests(SverchokTestCase):
+    def test_fingerprint_of_lists_and_arrays(self):
+        faces = [[0, 1, 2, 3], [3, 2, 4, 5]]
+        edges = [[0, 5]]
+        topology = MeshTopology(6, edges, faces)
+        self.assertEqual(topology.fingerprint, MeshTopology(6, np.array(edges), np.array(faces)).fingerprint)
+        self.assert_numpy_arrays_equal(topology.loop_starts, np.array([0, 4]))
+
+    def test_fingerprint_changes(self):
+        topology = MeshTopology(5, [], [[0, 1, 2], [2, 3, 4]])
+        self.assertNotEqual(topology.fingerprint, MeshTopology(6, [], [[0, 1, 2], [2, 3, 4]]).fingerprint)
+        self.assertNotEqual(topology.fingerprint, MeshTopology(5, [], [[0, 1, 2], [2, 4, 3]]).fingerprint)
+        self.assertNotEqual(topology.fingerprint, MeshTopology(5, [], [[0, 1, 2, 2, 3, 4]]).fingerprint)
+
+    def test_write(self):
+        mesh = bpy.data.meshes.new("sv_test_mesh_topology")
+        try:
+            topology = MeshTopology(5, [], [[0, 1, 2, 3], [1, 4, 2]])
+            topology.write(mesh)
+            mesh.update(calc_edges=True)
+            self.assertTrue(topology.is_written_to(mesh))
+            self.assertEqual([list(p.vertices) for p in mesh.polygons], [[0, 1, 2, 3], [1, 4, 2]])
+            self.assertEqual(len(mesh.edges), 6)
+        finally:
+            bpy.data.meshes.remove(mesh)
+
+
+class MeshBuffersTests(SverchokTestCase):
+    def test_buffers(self):
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+        faces = [[0, 1, 2, 3]]
+        with self.temporary_node_tree("MeshBuffersTree") as tree:
+            node = tree.nodes.new('SvMeshViewer')
+            mesh_data = node.mesh_data.add()
+            try:
+                mesh_data.regenerate_mesh("sv_test_mesh_buffers", verts, faces=faces)
+                key = mesh_data.mesh.as_pointer()
+                buffers = generating_objects._mesh_buffers[key]
+                mesh_data.regenerate_mesh("sv_test_mesh_buffers", verts, faces=faces)
+                self.assertIs(generating_objects._mesh_buffers[key], buffers)
+
+                # the same pointer with another name is considered as another mesh
+                mesh_data.mesh.name = "sv_test_mesh_buffers_renamed"
+                mesh_data.regenerate_mesh("sv_test_mesh_buffers", verts, faces=faces)
+                self.assertIsNot(generating_objects._mesh_buffers[key], buffers)
+                self.assertEqual([list(p.vertices) for p in mesh_data.mesh.polygons], faces)
+
+                generating_objects.clear_mesh_buffers()
+                self.assertNotIn(key, generating_objects._mesh_buffers)
+            finally:
+                mesh_data.remove_data()
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.profile import NodeProfile
+
+
+class NodeProfileTests(SverchokTestCase):
+    def make_node(self, name):
+        return SimpleNamespace(name=name, bl_idname="SvTestNode", id_data=SimpleNamespace(name="Tree"))
+
+    def test_statistics(self):
+        profile = NodeProfile()
+        fast, slow = self.make_node("Fast"), self.make_node("Slow")
+        for i in range(3):
+            profile.start(slow)
+            profile.add_copy_time(0.5)
+            profile.stop(slow, i, 2.0, 10, 20)
+        profile.start(fast)
+        profile.stop(fast, 0, 1.0, 0, 5)
+
+        nodes = profile.sorted_nodes()
+        self.assertEqual([n['node'] for n in nodes], ["Slow", "Fast"])
+        self.assertEqual(nodes[0]['calls'], 3)
+        self.assertEqual(nodes[0]['time'], 6.0)
+        self.assertEqual(nodes[0]['copy_time'], 1.5)
+        self.assertEqual(nodes[0]['output_bytes'], 20)
+        self.assertEqual(len(profile.to_chrome_trace()['traceEvents']), 4)
+
+    def test_continued_call(self):
+        profile = NodeProfile()
+        node = self.make_node("Node")
+        profile.start(node)
+        profile.stop(node, 0, 1.0)
+        profile.add(node, 1, 2.0, count_call=False, thread_id=1)
+        stats = profile.sorted_nodes()[0]
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['time'], 3.0)
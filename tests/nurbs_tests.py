@@ -6,7 +6,7 @@ from mathutils import Matrix
 
 from sverchok.utils.testing import SverchokTestCase, requires
 from sverchok.utils.geom import circle_by_three_points
-from sverchok.utils.nurbs_common import SvNurbsMaths, elevate_bezier_degree, from_homogenous
+from sverchok.utils.nurbs_common import SvNurbsMaths, elevate_bezier_degree, from_homogenous, span_basis_functions
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.primitives import SvCircle
 from sverchok.utils.curve.nurbs import SvGeomdlCurve, SvNativeNurbsCurve, SvNurbsBasisFunctions, SvNurbsCurve
@@ -61,6 +61,20 @@ class NurbsCurveTests(SverchokTestCase):
 
         self.assert_numpy_arrays_equal(expected, d2s, precision=8)
 
+    def test_span_basis_functions(self):
+        "Test span based basis functions against recursive ones"
+        knotvector = [0, 0, 0, 0, 0.3, 0.5, 0.5, 0.8, 1, 1, 1, 1]
+        n_cpts = len(knotvector) - self.degree - 1
+        ts = np.linspace(-0.1, 1.0, num=50)
+        idxs, values = span_basis_functions(knotvector, self.degree, ts, n_derivs=2)
+        functions = SvNurbsBasisFunctions(knotvector)
+        for k in range(3):
+            dense = np.zeros((n_cpts, len(ts)))
+            for j in range(self.degree+1):
+                np.add.at(dense, (idxs[:,j], np.arange(len(ts))), values[k][:,j])
+            expected = np.array([functions.derivative(i, self.degree, k)(ts) for i in range(n_cpts)])
+            self.assert_numpy_arrays_equal(dense, expected, precision=6)
+
     #@unittest.skip
     @requires(geomdl)
     def test_curve_eval(self):
@@ -235,6 +249,16 @@ class NurbsSurfaceTests(SverchokTestCase):
         vs2 = native_surface.evaluate_array(self.us, self.vs)
         self.assert_numpy_arrays_equal(vs1, vs2, precision=8)
 
+    def test_eval_grid(self):
+        weights = [[1,1,1,1], [1,2,3,1], [1,3,4,1], [1,4,5,1], [1,1,1,1]]
+        native_surface = SvNativeNurbsSurface(self.degree_u, self.degree_v, self.knotvector_u, self.knotvector_v, self.control_points, weights)
+        us = np.linspace(0.0, 1.0, num=3)
+        vs = np.linspace(0.0, 1.0, num=4)
+        vs1 = native_surface.evaluate_array(self.us, self.vs)
+        vs2 = native_surface.evaluate_grid(us, vs)
+        self.assertEqual(vs2.shape, (4, 3, 3))
+        self.assert_numpy_arrays_equal(vs1, vs2.reshape((-1, 3)), precision=8)
+
     @requires(geomdl)
     #@unittest.skip
     def test_eval_2(self):
@@ -0,0 +1,57 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
+
+
+def check_min_distance_one_by_one(candidates, min_r, points):
+    points = list(points)
+    good = []
+    for candidate in candidates:
+        ok = (np.linalg.norm(np.array(points) - candidate, axis=1) >= min_r).all()
+        if ok:
+            points.append(candidate)
+        good.append(ok)
+    return np.array(good)
+
+
+def check_min_radius_one_by_one(candidates, min_rs, points, radiuses):
+    points, radiuses = list(points), list(radiuses)
+    good = []
+    for candidate, min_r in zip(candidates, min_rs):
+        ok = (np.array(radiuses) + min_r < np.linalg.norm(np.array(points) - candidate, axis=1)).all()
+        if ok:
+            points.append(candidate)
+            radiuses.append(min_r)
+        good.append(ok)
+    return np.array(good)
+
+
+class PoissonDiskGridTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(42)
+        self.points = rng.random((300, 3)) * 10
+        self.candidates = rng.random((200, 3)) * 10
+
+    def test_min_distance(self):
+        grid = SvPoissonDiskGrid(0.7)
+        grid.add(self.points)
+        good = grid.check_min_distance(self.candidates, 0.7)
+        expected = check_min_distance_one_by_one(self.candidates, 0.7, self.points)
+        self.assert_numpy_arrays_equal(good, expected)
+
+    def test_min_radius(self):
+        rng = np.random.default_rng(0)
+        radiuses = rng.random(300) * 0.3
+        min_rs = rng.random(200) * 0.5
+        grid = SvPoissonDiskGrid()
+        grid.add(self.points, radiuses)
+        good = grid.check_min_radius(self.candidates, min_rs)
+        expected = check_min_radius_one_by_one(self.candidates, min_rs, self.points, radiuses)
+        self.assert_numpy_arrays_equal(good, expected)
+
+    def test_empty_grid(self):
+        grid = SvPoissonDiskGrid()
+        good = grid.check_min_distance([[0, 0, 0], [0.5, 0, 0], [2, 0, 0], [1.1, 0, 0]], 1.0)
+        self.assertEqual(good.tolist(), [True, False, True, False])
@@ -0,0 +1,142 @@
+from copy import deepcopy
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import CacheManager, SvCowList, data_equal
+from sverchok.utils.listutils import preobrazovatel
+
+
+class DataEqualTests(SverchokTestCase):
+    def test_lists(self):
+        self.assertTrue(data_equal([[(1, 2, 3)], [(4, 5, 6)]], [[(1, 2, 3)], [(4, 5, 6)]]))
+        self.assertFalse(data_equal([[1, 2, 3]], [[1, 2, 4]]))
+        self.assertFalse(data_equal([[1, 2, 3]], [[1, 2]]))
+
+    def test_arrays(self):
+        self.assertTrue(data_equal([np.array([1., 2.])], [np.array([1., 2.])]))
+        self.assertFalse(data_equal([np.array([1., 2.])], [np.array([1., 3.])]))
+        self.assertFalse(data_equal([np.array([1.])], [np.array([[1.]])]))
+        self.assertFalse(data_equal([[1.]], [np.array([1.])]))
+
+    def test_arrays_deep_inside(self):
+        self.assertTrue(data_equal([[1], [np.array([1, 2])]], [[1], [np.array([1, 2])]]))
+        self.assertFalse(data_equal([[1], [np.array([1, 2])]], [[1], [np.array([1, 3])]]))
+
+
+class CacheVersionTests(SverchokTestCase):
+    def test_versions(self):
+        manager = CacheManager()
+        self.assertEqual(manager.version("a"), 0)
+        manager.add("a", [1])
+        first = manager.version("a")
+        manager.add("a", [1])
+        self.assertNotEqual(manager.version("a"), first)
+        manager.set_version("a", first)
+        self.assertEqual(manager.version("a"), first)
+        manager.forget("a")
+        self.assertEqual(manager.version("a"), 0)
+
+
+class CacheEvictionTests(SverchokTestCase):
+    def test_evict(self):
+        manager = CacheManager()
+        for sock_id in "abc":
+            manager.add(sock_id, [0] * 100)
+        size = manager.size("a")
+        self.assertEqual(manager.total_size, 3 * size)
+
+        # least recently written candidates are evicted first
+        self.assertEqual(manager.evict(size, ["b", "c"]), 2)
+        self.assertEqual(manager.total_size, size)
+        self.assertFalse(manager.is_evicted("a"))
+        self.assertTrue(manager.is_evicted("b"))
+        self.assertTrue(manager.is_evicted("c"))
+
+        manager.add("b", [0] * 100)
+        self.assertFalse(manager.is_evicted("b"))
+        self.assertEqual(manager.evict(3 * size, ["a", "b"]), 0)
+
+
+class SvCowListTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.data = [[[0, 1], [2, 3]], [[4, 5]], [6, [7, 8]]]
+        self.original = deepcopy(self.data)
+
+    def assert_unchanged(self):
+        self.assertEqual(self.data, self.original)
+
+    def test_append(self):
+        cow = SvCowList(self.data)
+        cow.append([9])
+        cow[0].append([9])
+        cow[1][0].append(9)
+        cow[2][1].append(9)
+        self.assert_unchanged()
+        self.assertEqual(cow, [[[0, 1], [2, 3], [9]], [[4, 5, 9]], [6, [7, 8, 9]], [9]])
+
+    def test_setitem(self):
+        cow = SvCowList(self.data)
+        cow[0][1][0] = 9
+        cow[1][0][:] = [9]
+        cow[2][1][1] = 9
+        cow[2][0] = 9
+        self.assert_unchanged()
+        self.assertEqual(cow, [[[0, 1], [9, 3]], [[9]], [9, [7, 9]]])
+
+    def test_setitem_keeps_own_lists(self):
+        cow = SvCowList(self.data)
+        item = [9]
+        cow[0] = item
+        cow[0].append(10)
+        cow[1:2] = [item]
+        self.assertIs(cow[1], item)
+        self.assertEqual(item, [9, 10])
+        self.assert_unchanged()
+
+    def test_sort(self):
+        cow = SvCowList(self.data[:2])
+
+        def key(item):
+            item.append([9])
+            return len(item)
+
+        cow.sort(key=key)
+        self.assert_unchanged()
+        self.assertEqual(cow, [[[4, 5], [9]], [[0, 1], [2, 3], [9]]])
+
+    def test_extend(self):
+        cow = SvCowList(self.data)
+        cow.extend(SvCowList(self.data))
+        cow += SvCowList(self.data)
+        for item in cow[3:]:
+            item.append(9)
+        for item in cow:
+            item[-1].append(10)
+        self.assert_unchanged()
+
+    def test_nested(self):
+        cow = SvCowList(self.data)
+        for item in cow:
+            for sub_item in item:
+                if isinstance(sub_item, list):
+                    sub_item.reverse()
+        cow[0].pop()[0] = 9
+        self.assert_unchanged()
+        self.assertEqual(cow, [[[1, 0]], [[5, 4]], [6, [8, 7]]])
+
+    def test_copy(self):
+        cow = SvCowList(self.data)
+        for copy in [cow.copy(), cow + [], cow[:]]:
+            copy[0][0].append(9)
+        self.assert_unchanged()
+
+    def test_list_utils(self):
+        # list utils should treat the data as usual lists
+        for levels in [[1, 2], [2], [1, 2, 3]]:
+            with self.subTest(levels=levels):
+                expected = preobrazovatel(deepcopy(self.data), levels)
+                self.assertTrue(expected)
+                self.assertEqual(preobrazovatel(SvCowList(self.data), levels), expected)
+                self.assert_unchanged()
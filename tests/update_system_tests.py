@@ -1,7 +1,12 @@
+import tempfile
 from typing import Iterable
+from unittest.mock import patch
 
 from sverchok.utils.testing import SverchokTestCase
-from sverchok.core.update_system import SearchTree
+from sverchok.core.socket_data import get_output_socket_data, is_socket_evicted
+from sverchok.core.update_system import SearchTree, UpdateTree, ERROR_KEY
+from sverchok.nodes.list_struct.reverse import ListReverseNode
+from sverchok.utils.data_cache import NodeResultCache
 
 
 class TreeCleaningTest(SverchokTestCase):
@@ -76,6 +81,113 @@ class TreeCleaningTest(SverchokTestCase):
         self.assertSetEqual(f_ns, t_ns, msg=msg)
 
 
+class ParallelUpdateTest(SverchokTestCase):
+    def test_parallel_update(self):
+        sequential = self.evaluate_tree(parallel=False)
+        parallel = self.evaluate_tree(parallel=True)
+        self.assert_sverchok_data_equal(parallel, sequential)
+
+    def evaluate_tree(self, parallel):
+        """Two independent branches with thread safe loft nodes on the same
+        level, returns vertices of the surfaces"""
+        with self.temporary_node_tree("ParallelTree") as tree:
+            tree.sv_process = False
+            tree.sv_parallel = parallel
+            evaluators = []
+            for stop in [4, 5]:
+                radiuses = tree.nodes.new('SvGenNumberRange')
+                radiuses.start_float = 1
+                radiuses.stop_float = stop
+                circle = tree.nodes.new('SvCircleCurveMk2Node')
+                loft = tree.nodes.new('SvNurbsLoftNode')
+                loft.degree_v = 2
+                evaluate = tree.nodes.new('SvExEvalSurfaceNode')
+                note = tree.nodes.new('NoteNode')
+                tree.links.new(radiuses.outputs[0], circle.inputs['Radius'])
+                tree.links.new(circle.outputs['Curve'], loft.inputs['Curves'])
+                tree.links.new(loft.outputs['Surface'], evaluate.inputs['Surface'])
+                tree.links.new(evaluate.outputs['Vertices'], note.inputs[0])
+                evaluators.append(evaluate)
+
+            UpdateTree.reset_tree(tree)
+            for _ in UpdateTree.main_update(tree, update_interface=False):
+                pass
+            self.assertEqual([n.name for n in tree.nodes if n.get(ERROR_KEY)], [])
+            return [get_output_socket_data(n, 'Vertices') for n in evaluators]
+
+
+class SocketDataEvictionTest(SverchokTestCase):
+    def test_evict_and_restore(self):
+        with self.temporary_node_tree("EvictionTree") as tree:
+            tree.sv_process = False
+            numbers = tree.nodes.new('SvGenNumberRange')
+            reverse = tree.nodes.new('ListReverseNode')
+            note = tree.nodes.new('NoteNode')
+            tree.links.new(numbers.outputs['Range'], reverse.inputs['data'])
+            tree.links.new(reverse.outputs['data'], note.inputs[0])
+
+            UpdateTree.reset_tree(tree)
+            for _ in UpdateTree.main_update(tree, update_interface=False):
+                pass
+            expected = get_output_socket_data(numbers, 'Range')
+
+            up_tree = UpdateTree.get(tree)
+            up_tree._evict_socket_data(budget=1)
+            self.assertTrue(is_socket_evicted(numbers.outputs['Range']))
+            # read by the viewer
+            self.assertFalse(is_socket_evicted(reverse.outputs['data']))
+            # only output data is evicted
+            self.assertFalse(is_socket_evicted(reverse.inputs['data']))
+            self.assertFalse(is_socket_evicted(note.inputs[0]))
+
+            up_tree.update_node(reverse)
+            self.assertFalse(is_socket_evicted(numbers.outputs['Range']))
+            self.assertEqual(get_output_socket_data(numbers, 'Range'), expected)
+
+
+class DiskCacheTest(SverchokTestCase):
+    def test_load_results(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                patch('sverchok.core.update_system.get_node_result_cache', lambda: NodeResultCache(directory)), \
+                patch.object(ListReverseNode, 'is_disk_cached', True), \
+                patch.object(ListReverseNode, 'process', autospec=True,
+                             side_effect=ListReverseNode.process) as process, \
+                self.temporary_node_tree("DiskCacheTree") as tree:
+            tree.sv_process = False
+            tree.sv_disk_cache = True
+            numbers = tree.nodes.new('SvGenNumberRange')
+            reverse = tree.nodes.new('ListReverseNode')
+            note = tree.nodes.new('NoteNode')
+            tree.links.new(numbers.outputs['Range'], reverse.inputs['data'])
+            tree.links.new(reverse.outputs['data'], note.inputs[0])
+
+            def update():
+                process.reset_mock()
+                UpdateTree.reset_tree(tree)
+                for _ in UpdateTree.main_update(tree, update_interface=False):
+                    pass
+                self.assertEqual([n.name for n in tree.nodes if n.get(ERROR_KEY)], [])
+                return get_output_socket_data(reverse, 'data')
+
+            expected = update()
+            self.assertEqual(process.call_count, 1)
+
+            with self.subTest("repeated update"):
+                self.assertEqual(update(), expected)
+                process.assert_not_called()
+
+            with self.subTest("changed upstream value"):
+                numbers.stop_float = 20
+                changed = update()
+                self.assertNotEqual(changed, expected)
+                self.assertEqual(process.call_count, 1)
+
+            with self.subTest("changed property"):
+                reverse.level = 1
+                self.assertNotEqual(update(), changed)
+                self.assertEqual(process.call_count, 1)
+
+
 def _to_names(nodes: Iterable) -> Iterable[str]:
     for n in nodes:
         yield n.name
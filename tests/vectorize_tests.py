@@ -1,8 +1,13 @@
 from typing import Tuple, List
 
+import numpy as np
+
 from sverchok.utils.testing import SverchokTestCase
 
+from sverchok.data_structure import match_long_repeat
+from sverchok.utils.sv_easing_functions import LinearInterpolation, QuadraticEaseIn
 from sverchok.utils.vectorize import DataWalker, walk_data, vectorize
+from sverchok.nodes.number.mix_numbers import mix_numbers
 
 
 class VectorizeTest(SverchokTestCase):
@@ -87,6 +92,48 @@ class VectorizeTest(SverchokTestCase):
         vector1 = vectorize(vector, match_mode='REPEAT')
         self.assertEqual(vector1(length=lengths), [[0, 1, 2, 3], [[[0, 1, 2]], [0]], [0, 1, 2, 3, 4]])
 
+    def test_batched_decorator(self):
+
+        def scale(*, verts: List[float], factor: float) -> Tuple[list, list]:
+            verts = np.asarray(verts)
+            return verts * factor[:, np.newaxis], verts.sum(axis=1)
+
+        verts = [np.array([1., 2., 3.]), np.array([4., 5., 6.])]
+        factors = [[2.]]
+        scale1 = vectorize(scale, match_mode='REPEAT', batched=True)
+        scaled, sums = scale1(verts=verts, factor=factors)
+        self.assertEqual([[v.tolist() for v in obj] for obj in scaled], [[[2., 4., 6.]], [[8., 10., 12.]]])
+        self.assertEqual([[float(v) for v in obj] for obj in sums], [[6.], [15.]])
+
+        def add(*, a: float, b: float, mode='SUM'):
+            return a + b
+
+        # lengths can't be broadcast so it falls back to calling per value
+        add1 = vectorize(add, match_mode='REPEAT', batched=True)
+        self.assertEqual(add1(a=[[1, 2], [3, 4, 5]], b=[1, [2, 3], 4], mode='SUM'), [[2, 3], [5, 7, 8], [7, 8, 9]])
+        self.assertEqual([v.tolist() for v in add1(a=[[1, 2, 3]], b=[[1], [2]])], [[2, 3, 4], [3, 4, 5]])
+
+    def test_batched_mix_numbers(self):
+        def old_mix(value1, value2, factor, interpolate):
+            """How the Mix Numbers node mixed values before it used vectorize"""
+            values = []
+            for v1, v2, f in zip(*match_long_repeat([value1, value2, factor])):
+                t = interpolate(f)
+                values.append(v1*(1-t) + v2*t)
+            return [values]
+
+        cases = [([0.0], [1.0], [0.5]),
+                 ([1.0, 2.0, 3.0], [10.0], [0.1, 0.2, 0.3]),
+                 ([1, 2, 3], [10, 20], [0.25]),  # lengths can't be broadcast
+                 (np.array([1.0, 2.0, 3.0]), [10.0], [0.75])]
+        for interpolate in [LinearInterpolation, QuadraticEaseIn]:
+            mix = vectorize(mix_numbers, match_mode="REPEAT", batched=interpolate is LinearInterpolation)
+            for value1, value2, factor in cases:
+                with self.subTest(interpolate=interpolate.__name__, value1=value1, value2=value2):
+                    result = mix(value1=[value1], value2=[value2], factor=[factor], interpolate=interpolate)
+                    expected = old_mix(value1, value2, factor, interpolate)
+                    self.assertEqual([np.asarray(obj).tolist() for obj in result], expected)
+
 
 if __name__ == '__main__':
     import unittest
@@ -0,0 +1,134 @@
+import numpy as np
+from mathutils import Vector
+from mathutils.geometry import tessellate_polygon
+
+from sverchok.utils.testing import *
+from sverchok.nodes.viz.viewer_draw_mk4 import (
+    ensure_triangles, shade_colors, as_colors, concatenate_chunks, splitted_polygons_geom,
+    splitted_facet_polygons_geom, splitted_facet_polygons_geom_v_cols, splitted_smooth_polygons_geom)
+
+
+def list_ensure_triangles(coords, indices, handle_concave_quads):
+    """It's how the triangles were generated before numpy was used"""
+    new_indices = []
+    face_index = []
+    for idf, idxset in enumerate(indices):
+        if len(idxset) == 3:
+            new_indices.append(tuple(idxset))
+            face_index.append(idf)
+        elif len(idxset) == 4 and not handle_concave_quads:
+            new_indices.extend([(idxset[0], idxset[1], idxset[2]), (idxset[0], idxset[2], idxset[3])])
+            face_index.extend([idf, idf])
+        else:
+            for pol in tessellate_polygon([[Vector(coords[idx]) for idx in idxset]]):
+                new_indices.append(tuple(idxset[i] for i in pol))
+                face_index.append(idf)
+    return new_indices, face_index
+
+
+def list_splitted_geom(polygon_indices, original_idx, v_path, cols, idx_offset, color_factors):
+    """Previous list based implementation of all splitted_*_geom functions,
+    color_factors(idx, pol) returns color and light factor of each vertex of a triangle"""
+    p_vertices, vertex_colors, indices = [], [], []
+    total_p_verts = 0
+    for pol, idx in zip(polygon_indices, original_idx):
+        p_vertices.extend([v_path[c] for c in pol])
+        for col, factor in color_factors(idx, pol):
+            vertex_colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
+        pol_offset = idx_offset + total_p_verts
+        indices.append([pol_offset, pol_offset + 1, pol_offset + 2])
+        total_p_verts += 3
+    return p_vertices, vertex_colors, indices, total_p_verts
+
+
+class ViewerDrawGeometryTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.verts = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0), (1, 1, 0), (2, 1, 0),
+                      (0, 2, 0), (1, 2, 0), (2, 2, 0), (1.5, 2.5, 0)]
+        self.polygons = [[0, 1, 4], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 9, 7], [0, 4, 3]]
+        self.cols = [[1, 0, 0, 1], [0, 1, 0, 0.5], [0.2, 0.4, 0.6, 1]]
+        self.face_factors = [0.1, 0.3, 0.5, 0.7, 0.9]
+        self.vert_factors = [0.05 * i + 0.2 for i in range(len(self.verts))]
+
+    def sorted_triangles(self, triangles, face_index):
+        return sorted((int(idx), tuple(int(i) for i in tri)) for tri, idx in zip(triangles, face_index))
+
+    def test_ensure_triangles(self):
+        for handle_concave_quads in [False, True]:
+            with self.subTest(handle_concave_quads=handle_concave_quads):
+                tris, face_index = ensure_triangles(self.verts, self.polygons, handle_concave_quads)
+                expected = list_ensure_triangles(self.verts, self.polygons, handle_concave_quads)
+                self.assertEqual(tris.shape, (len(expected[0]), 3))
+                self.assertEqual(self.sorted_triangles(tris, face_index), self.sorted_triangles(*expected))
+
+    def test_ensure_triangles_array(self):
+        quads = np.array([[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6]])
+        tris, face_index = ensure_triangles(self.verts, quads, False)
+        expected = list_ensure_triangles(self.verts, quads.tolist(), False)
+        self.assertEqual(self.sorted_triangles(tris, face_index), self.sorted_triangles(*expected))
+
+    def test_ensure_triangles_empty(self):
+        tris, face_index = ensure_triangles(self.verts, [], False)
+        self.assertEqual(tris.shape, (0, 3))
+        self.assertEqual(len(face_index), 0)
+
+    def test_shade_colors(self):
+        factors = np.array([0.5, 1.0, 0.25])
+        result = shade_colors(np.array([0.2, 0.4, 0.8, 0.5], dtype=np.float32), factors)
+        expected = [[0.2 * f, 0.4 * f, 0.8 * f, 0.5] for f in factors]
+        self.assert_numpy_arrays_equal(result, np.array(expected), precision=6)
+
+    def test_shade_colors_keeps_input(self):
+        colors = as_colors(self.cols)
+        shade_colors(colors, np.full(len(colors), 0.5))
+        self.assert_numpy_arrays_equal(colors, np.array(self.cols, dtype=np.float32))
+
+    def assert_geom_equal(self, result, expected):
+        for res, exp, name in zip(result, expected, ["vertices", "colors", "indices", "total"]):
+            if name == "total":
+                self.assertEqual(res, exp)
+            else:
+                self.assert_numpy_arrays_equal(np.asarray(res), np.array(exp, dtype=np.float64).reshape(np.shape(res)),
+                                               precision=6)
+
+    def test_splitted_geom(self):
+        tris, face_index = ensure_triangles(self.verts, self.polygons, False)
+        v_path = np.array(self.verts)
+        cols = as_colors(self.cols)
+        cols_len = len(self.cols)
+        face_factors = np.array(self.face_factors)
+        vert_factors = np.array(self.vert_factors)
+        idx_offset = 7
+        cases = [
+            ("polygons", splitted_polygons_geom, None,
+             lambda idx, pol: [(self.cols[idx % cols_len], 1)] * 3),
+            ("facet", splitted_facet_polygons_geom, face_factors,
+             lambda idx, pol: [(self.cols[idx % cols_len], self.face_factors[idx])] * 3),
+            ("facet vertex colors", splitted_facet_polygons_geom_v_cols, face_factors,
+             lambda idx, pol: [(self.cols[c % cols_len], self.face_factors[idx]) for c in pol]),
+            ("smooth", splitted_smooth_polygons_geom, vert_factors,
+             lambda idx, pol: [(self.cols[idx % cols_len], self.vert_factors[c]) for c in pol]),
+        ]
+        for name, func, light_factor, color_factors in cases:
+            with self.subTest(name):
+                args = (tris, face_index, v_path, cols, idx_offset)
+                result = func(*args) if light_factor is None else func(*args, light_factor)
+                expected = list_splitted_geom(tris.tolist(), face_index.tolist(), self.verts,
+                                              self.cols, idx_offset, color_factors)
+                self.assert_geom_equal(result, expected)
+
+    def test_concatenate_chunks(self):
+        chunks = [[[0, 0, 0], [1, 0, 0]], np.array([[2, 0, 0]]), [(3, 0, 0), (4, 0, 0)]]
+        result = concatenate_chunks(chunks, 3, np.float32)
+        expected = [v for chunk in chunks for v in np.asarray(chunk).tolist()]
+        self.assertEqual(result.dtype, np.float32)
+        self.assert_numpy_arrays_equal(result, np.array(expected, dtype=np.float32))
+
+    def test_concatenate_chunks_flat(self):
+        result = concatenate_chunks([[0, 1, 2], [3, 4, 5, 6, 7, 8]], 3, np.int32)
+        self.assert_numpy_arrays_equal(result, np.arange(9, dtype=np.int32).reshape(-1, 3))
+
+    def test_concatenate_empty_chunks(self):
+        result = concatenate_chunks([], 4, np.float32)
+        self.assertEqual(result.shape, (0, 4))
@@ -31,6 +31,7 @@ from sverchok.utils.development import get_branch
 from sverchok.ui.nodes_replacement import set_inputs_mapping, set_outputs_mapping
 from sverchok.ui.presets import get_presets, SverchPresetReplaceOperator, SvSaveSelected, node_supports_presets
 from sverchok.settings import PYPATH
+from sverchok.core import lazy_nodes
 
 
 def displaying_sverchok_nodes(context):
@@ -270,7 +271,7 @@ def idname_draw(self, context):
         box = col.box()
         box.label(text="Replace with:")
         for new_bl_idname, inputs_mapping, outputs_mapping in node.replacement_nodes:
-            node_class = bpy.types.Node.bl_rna_get_subclass_py(new_bl_idname)
+            node_class = lazy_nodes.node_class(new_bl_idname)
             text = node_class.bl_label
             op = box.operator("node.sv_replace_node", text=text)
             op.old_node_name = node.name
@@ -19,6 +19,7 @@
 
 import bpy
 
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_logging import sv_logger
 
 
@@ -95,7 +96,7 @@ class SvReplaceNode(bpy.types.Operator):
         tree = context.space_data.edit_tree
 
         old_node = tree.nodes[self.old_node_name]
-        new_node = tree.nodes.new(self.new_bl_idname)
+        new_node = lazy_nodes.new_node(tree.nodes, self.new_bl_idname)
         # Copy UI properties
         ui_props = ['location', 'height', 'width', 'label', 'hide']
         for prop_name in ui_props:
@@ -8,6 +8,7 @@
 
 import bpy
 import sverchok.ui.nodeview_space_menu as sm
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_node_utils import frame_adjust
 from sverchok.ui.presets import node_supports_presets, apply_default_preset
 from sverchok.core.sockets import SvCurveSocket, SvSurfaceSocket, SvStringsSocket, SvSolidSocket
@@ -137,7 +138,7 @@ def view_node(tree):
 
     for node in output_map[0]:
         bl_idname_new_node, offset = node
-        new_node = nodes.new(bl_idname_new_node)
+        new_node = lazy_nodes.new_node(nodes, bl_idname_new_node)
         new_node = apply_default_preset(new_node)
         offset_node_location(node_list[-1], new_node, offset)
         frame_adjust(node_list[-1], new_node)
@@ -172,7 +173,7 @@ def add_connection(tree, bl_idname_new_node, offset):
     if isinstance(bl_idname_new_node, str):
         # single new node..
 
-        new_node = nodes.new(bl_idname_new_node)
+        new_node = lazy_nodes.new_node(nodes, bl_idname_new_node)
         offset_node_location(existing_node, new_node, offset)
         frame_adjust(existing_node, new_node)
         new_node = apply_default_preset(new_node)
@@ -27,6 +27,7 @@ import bl_operators
 import bpy
 from bpy.props import StringProperty
 
+from sverchok.core import lazy_nodes
 from sverchok.ui.sv_icons import node_icon, icon, get_icon_switch
 from sverchok.ui import presets
 from sverchok.ui.presets import apply_default_preset
@@ -167,7 +168,7 @@ class AddNode(MenuItem):
         """This and other properties of the class can't be accessed during
         module initialization and registration"""
         if self._label is None:
-            node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+            node_cls = lazy_nodes.node_class(self.bl_idname)
             if self.bl_idname == 'NodeReroute':
                 self._label = "Reroute"
             # todo check labels of dependent classes after their refactoring
@@ -180,7 +181,7 @@ class AddNode(MenuItem):
     @property
     def icon_prop(self):
         if self._icon_prop is None:
-            node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+            node_cls = lazy_nodes.node_class(self.bl_idname)
             if node_cls is None:
                 self._icon_prop = {'icon': 'ERROR'}
             elif self.bl_idname == 'NodeReroute':
@@ -194,7 +195,7 @@ class AddNode(MenuItem):
         return self._icon_prop
 
     def draw(self, layout):
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_cls = lazy_nodes.node_class(self.bl_idname)
         icon_prop = self.icon_prop if get_icon_switch() else {}
 
         if node_cls is None:
@@ -215,7 +216,7 @@ class AddNode(MenuItem):
 
     def draw_icon(self, layout):
         """Only icon will be drawn"""
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_cls = lazy_nodes.node_class(self.bl_idname)
         icon_prop = self.icon_prop or {'icon': 'OUTLINER_OB_EMPTY'}
 
         if node_cls is None:
@@ -243,7 +244,7 @@ class AddNode(MenuItem):
         if all(w in label for w in words):
             return True
 
-        node_class = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_class = lazy_nodes.node_class(self.bl_idname)
         if not node_class or not hasattr(node_class, 'docstring'):
             return False
         shorthand = node_class.docstring.get_shorthand()
@@ -515,7 +516,7 @@ class AddNodeOp(bl_operators.node.NodeAddOperator):
         node_type = properties["type"]
         extra = properties.get("extra_description", "")
         tooltip = extra + ("\n" if extra else "")
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(node_type)
+        node_cls = lazy_nodes.node_class(node_type)
         if node_cls is None:
             return f'"{node_type}" node is not found'
         tooltip += node_cls.docstring.get_tooltip()
@@ -536,6 +537,7 @@ class SvNodeAddOperator(AddNodeOp, bpy.types.Operator):
         if bpy.app.version >= (3, 6):
             self.deselect_nodes(context)
 
+        lazy_nodes.load(self.type)
         node = self.create_node(context, self.type)
         apply_default_preset(node)
         return {'FINISHED'}
@@ -35,6 +35,7 @@ from sverchok.utils import sv_IO_panel_tools
 from sverchok.utils.sv_json_import import JSONImporter
 from sverchok.utils.sv_json_export import JSONExporter
 from sverchok.utils.profile import profile
+from sverchok.core import lazy_nodes
 import sverchok
 
 # To be moved somewhere under core/
@@ -110,7 +111,7 @@ def get_category_items(self, context, include_empty=False):
         empty_node_category_items = []
         for idx, (category, is_empty) in enumerate(get_category_names(mark_empty=True)):
             # actually category is mixture of categories and node.bl_idname(s)
-            node_class = bpy.types.Node.bl_rna_get_subclass_py(category)
+            node_class = lazy_nodes.node_class(category)
             if node_class and hasattr(node_class, 'bl_label'):
                 title = "/Node/ {}".format(node_class.bl_label)
                 if is_empty:
@@ -966,7 +967,7 @@ class SV_PT_UserPresetsPanel(bpy.types.Panel):
             selected_nodes = [node for node in ntree.nodes if node.select]
             can_save_preset = len(selected_nodes) > 0
             # op.category is either category or node bl_idname
-            category_node_class = bpy.types.Node.bl_rna_get_subclass_py(op.category)
+            category_node_class = lazy_nodes.node_class(op.category)
             if category_node_class is not None:
                 if len(selected_nodes) == 1:
                     selected_node = selected_nodes[0]
@@ -48,7 +48,10 @@ class SvProfileDump(bpy.types.Operator):
                              default=True)
 
     def execute(self, context):
-        prof.dump_stats(sort=self.sort, strip_dirs=self.strip_dirs)
+        if prof.have_node_stats():
+            prof.dump_node_stats()
+        else:
+            prof.dump_stats(sort=self.sort, strip_dirs=self.strip_dirs)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -73,6 +76,31 @@ class SvProfileSave(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
 
+class SvProfileExportNodes(bpy.types.Operator):
+    """Save per node profiling statistics to JSON file"""
+    bl_idname = "node.sverchok_profile_export_nodes"
+    bl_label = "Save per node profiling statistics"
+    bl_options = {'INTERNAL'}
+
+    formats = [
+        ("JSON", "Statistics", "Time, number of calls and data sizes of each node, slowest nodes first", 0),
+        ("CHROME", "Chrome trace", "Time line of node calls, can be opened in chrome://tracing or Perfetto", 1),
+    ]
+
+    format: EnumProperty(name="Format", items=formats, default="JSON")
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filename_ext = ".json"
+
+    def execute(self, context):
+        prof.save_node_stats(self.filepath, self.format)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
 class SvProfileReset(bpy.types.Operator):
     """Reset profiling statistics"""
     bl_idname = "node.sverchok_profile_reset"
@@ -85,7 +113,7 @@ class SvProfileReset(bpy.types.Operator):
         return {'FINISHED'}
 
 
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileExportNodes, SvProfileReset]
 
 
 def register():
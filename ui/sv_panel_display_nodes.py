@@ -19,6 +19,7 @@
 import bpy
 from bpy.props import IntProperty, EnumProperty, PointerProperty
 
+from sverchok.core import lazy_nodes
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.settings import get_dpi_factor
 from sverchok.utils.sv_logging import sv_logger
@@ -166,7 +167,7 @@ def add_spawned_node(context, name):
     tree = context.space_data.edit_tree
 
     try:
-        node = tree.nodes.new(name)
+        node = lazy_nodes.new_node(tree.nodes, name)
         _spawned_nodes["main"].append(node)
     except:
         print("EXCEPTION: failed to spawn node with name: ", name)
@@ -410,7 +411,7 @@ class SvDisplayNodePanelProperties(bpy.types.PropertyGroup):
             return
 
         for i, name in enumerate(node_names):
-            cls = bpy.types.Node.bl_rna_get_subclass_py(name)
+            cls = lazy_nodes.node_class(name)
             if cls is None:
                 sv_logger.debug(f'Class of the "{name}" node was not found')
                 continue
@@ -445,7 +446,7 @@ class SvDisplayNodePanelProperties(bpy.types.PropertyGroup):
         self.total_num_nodes = len(node_names)
         other_node_names = []
         for name in node_names:
-            cls = bpy.types.Node.bl_rna_get_subclass_py(name)
+            cls = lazy_nodes.node_class(name)
             if cls is not None and cls.missing_dependency:
                 continue
             other_node_names.append(name)
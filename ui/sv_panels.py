@@ -19,9 +19,11 @@
 import bpy
 
 import sverchok
+from sverchok.core.update_system import COPY_KEY
 from sverchok.utils import profile
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.utils.context_managers import sv_preferences
+from sverchok.utils.data_cache import get_node_result_cache
 from sverchok.utils.handle_blender_data import BlTrees
 from sverchok.utils.sv_update_utils import SvPrintCommits, SverchokUpdateAddon, SverchokCheckForUpgradesSHA
 
@@ -70,6 +72,8 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         col.prop(ng, 'sv_scene_update', text="Scene", icon='SCENE_DATA')
         col.prop(ng, 'sv_process', text="Live update", toggle=True)
         col.prop(ng, "sv_draft", text="Draft mode", toggle=True)
+        col.prop(ng, "sv_parallel", text="Parallel", toggle=True)
+        col.prop(ng, "sv_disk_cache", text="Disk cache", toggle=True)
 
 
 class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
@@ -88,6 +92,8 @@ class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
         row = self.layout.row()
         row.use_property_split = True
         row.prop(tree, 'show_time_mode', text="Update time", expand=True)
+        copied = tree.get(COPY_KEY, 0)
+        self.layout.label(text=f"Copied socket data: {copied / 2**20:.2f} MB")
 
 
 class SV_PT_ExtrTreeUserInterfaceOptions(SverchokPanels, bpy.types.Panel):
@@ -142,7 +148,10 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save = col.column()
         col_save.active = profile.have_gathered_stats()
         col_save.operator("node.sverchok_profile_dump", text="Dump data", icon="TEXT")
-        col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
+        if profile.have_node_stats():
+            col_save.operator("node.sverchok_profile_export_nodes", text="Save data", icon="FILE_TICK")
+        else:
+            col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
 
@@ -312,6 +321,17 @@ class SvSwitchToLayout(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class SvClearNodeResultCache(bpy.types.Operator):
+    """Delete all node results saved in the disk cache"""
+    bl_idname = "node.sv_clear_node_result_cache"
+    bl_label = "Clear node results cache"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        get_node_result_cache().clear()
+        return {'FINISHED'}
+
+
 def node_show_tree_mode(self, context):
     if not displaying_sverchok_nodes(context):
         return
@@ -342,7 +362,8 @@ sv_tools_classes = [
     SverchokBakeAll,
     SverchokUpdateCurrent,
     SverchokUpdateContext,
-    SvSwitchToLayout
+    SvSwitchToLayout,
+    SvClearNodeResultCache,
 ]
 
 
@@ -19,6 +19,7 @@
 
 import bpy
 from bpy.types import Operator
+from sverchok.core import lazy_nodes
 from sverchok.ui.nodeview_rclick_menu import get_output_sockets_map
 from sverchok.utils.sv_node_utils import frame_adjust
 from sverchok.ui.presets import apply_default_preset
@@ -39,7 +40,7 @@ def add_temporal_viewer_draw(nodes, links, existing_node, cut_links):
                     links.remove(link)
 
     except KeyError:
-        new_node = nodes.new(bl_idname_new_node)
+        new_node = lazy_nodes.new_node(nodes, bl_idname_new_node)
         new_node = apply_default_preset(new_node)
         new_node.name = 'Temporal Viewer'
         new_node.label = 'Temporal Viewer'
@@ -73,7 +74,7 @@ def add_temporal_viewer_node(nodes, links, existing_node, output_kind, new_node_
     try:
         new_node = nodes[new_node_name]
     except KeyError:
-        new_node = nodes.new(new_node_bl_idname)
+        new_node = lazy_nodes.new_node(nodes, new_node_bl_idname)
         new_node = apply_default_preset(new_node)
         new_node.name = new_node_name
         new_node.label = new_node_name
@@ -95,7 +96,7 @@ def add_temporal_stethoscope(nodes, links, existing_node):
         new_node = nodes['Temporal Stethoscope']
 
     except KeyError:
-        new_node = nodes.new(bl_idname_new_node)
+        new_node = lazy_nodes.new_node(nodes, bl_idname_new_node)
         new_node = apply_default_preset(new_node)
         new_node.name = 'Temporal Stethoscope'
         new_node.label = 'Temporal Stethoscope'
@@ -6,6 +6,7 @@
 # License-Filename: LICENSE
 
 import bpy
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_logging import get_logger
 from sverchok.settings import get_params
 
@@ -80,7 +81,7 @@ class SvSNLiteAddFromTextEditor(bpy.types.Operator):
                         n.load()
                         return {'CANCELLED'}
 
-            snlite = ng.nodes.new('SvScriptNodeLite')
+            snlite = lazy_nodes.new_node(ng.nodes, 'SvScriptNodeLite')
             
             # middle of view, translated to nodetree location
             dpi_fac = get_params({'render_location_xy_multiplier': 1.0}, direct=True)[0]
@@ -66,3 +66,66 @@ def read_materials_idx(blender_mesh, output_numpy=False):
     if output_numpy:
         return material_index
     return material_index.tolist()
+
+def read_polygons(blender_mesh, output_numpy=False):
+    """
+    Read polygons via loops of the mesh, without accessing each polygon from Python.
+    If all polygons have the same number of sides and output_numpy is True,
+    np.array of shape (n, sides) is returned; otherwise list of lists.
+    """
+    n_polygons = len(blender_mesh.polygons)
+    loop_starts = np.zeros(n_polygons, dtype=np.int32)
+    loop_totals = np.zeros(n_polygons, dtype=np.int32)
+    blender_mesh.polygons.foreach_get("loop_start", loop_starts)
+    blender_mesh.polygons.foreach_get("loop_total", loop_totals)
+    vertex_indices = np.zeros(len(blender_mesh.loops), dtype=np.int32)
+    blender_mesh.loops.foreach_get("vertex_index", vertex_indices)
+
+    if n_polygons and (loop_totals == loop_totals[0]).all():
+        sides = loop_totals[0]
+        # loops of regular meshes go in order of polygons
+        if (loop_starts == np.arange(n_polygons) * sides).all():
+            polygons = vertex_indices[:n_polygons * sides].reshape((n_polygons, sides))
+        else:
+            polygons = vertex_indices[loop_starts[:, np.newaxis] + np.arange(sides)]
+        return polygons if output_numpy else polygons.tolist()
+
+    vertex_indices = vertex_indices.tolist()
+    return [vertex_indices[s: s + t] for s, t in zip(loop_starts.tolist(), loop_totals.tolist())]
+
+def read_attribute(blender_mesh, elements, attribute_name, rna_name=None, dtype=np.float64):
+    """
+    Read values of a mesh elements (vertices, edges, polygons) attribute
+    into an array. attribute_name is a name of a generic mesh attribute
+    (Blender 4+), it can be None; rna_name is a property of mesh elements,
+    it is used if the attribute is not found.
+    If the mesh does not have the data, zeros are returned.
+    """
+    values = np.zeros(len(elements), dtype=dtype)
+    attribute = attribute_name and blender_mesh.attributes.get(attribute_name)
+    if attribute:
+        attribute.data.foreach_get("value", values)
+    elif rna_name is not None and len(elements) and hasattr(elements[0], rna_name):
+        elements.foreach_get(rna_name, values)
+    return values
+
+def read_vertex_creases(blender_mesh):
+    """
+    Vertex creases are kept in a crease layer in Blender 3 and in
+    an attribute in Blender 4.
+    """
+    layers = getattr(blender_mesh, 'vertex_creases', None)
+    if blender_mesh.attributes.get('crease_vert') is None and layers:
+        values = np.zeros(len(blender_mesh.vertices), dtype=np.float64)
+        layers[0].data.foreach_get("value", values)
+        return values
+    return read_attribute(blender_mesh, blender_mesh.vertices, 'crease_vert')
+
+def transform_points(points, matrix):
+    """Apply 4x4 matrix (mathutils.Matrix or np.array) to np.array of shape (n, 3)"""
+    matrix = np.array(matrix)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+def transform_directions(directions, matrix):
+    """Apply 3x3 matrix (mathutils.Matrix or np.array) to np.array of shape (n, 3)"""
+    return directions @ np.array(matrix).T
@@ -25,6 +25,24 @@ class CSG(object):
     def toPolygons(self):
         return self.polygons
 
+    def to_pydata(self):
+        """
+        Vertices and faces of the polygons, vertices with equal coordinates
+        are merged
+        """
+        faces = []
+        vertices = []
+        for polygon in self.polygons:
+            indices = []
+            for v in polygon.vertices:
+                pos = [v.pos.x, v.pos.y, v.pos.z]
+                if pos not in vertices:
+                    vertices.append(pos)
+                index = vertices.index(pos)
+                indices.append(index)
+            faces.append(indices)
+        return vertices, faces
+
     def union(self, csg):
         a = CSGNode(self.clone().polygons)
         b = CSGNode(csg.clone().polygons)
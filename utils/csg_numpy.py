@@ -0,0 +1,426 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+NumPy implementation of the BSP booleans of `utils.csg_core`. The algorithm
+and the arithmetic are the same, so the results are equal to the results of
+`CSG` class, but polygons are kept in arrays of vertex indexes and
+instead of calling `splitPolygon` for each pair of a BSP node and a polygon
+all polygons which are on the same depth of a BSP tree are classified and
+split at once. The number of NumPy calls depends on depth of BSP trees and
+does not depend on number of polygons.
+"""
+
+import numpy as np
+
+from sverchok.utils.csg_geom import CSGPlane
+
+
+COPLANAR = 0
+FRONT = 1
+BACK = 2
+SPANNING = 3
+
+
+def _dot(a, b):
+    # the same order of operations as in CSGVector.dot
+    return a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1] + a[:, 2] * b[:, 2]
+
+
+def _fragments_of(polygons):
+    """Empty fragments of given polygons"""
+    return _Polygons.empty(polygons.loops.shape[1]), np.empty(0, dtype=np.int64)
+
+
+class _Vertices:
+    """Growable array of vertex coordinates"""
+    def __init__(self, co):
+        self.co = np.array(co, dtype=np.float64).reshape(-1, 3)
+        self.size = len(self.co)
+
+    def add(self, points):
+        new_size = self.size + len(points)
+        if new_size > len(self.co):
+            co = np.empty((max(new_size, 2 * len(self.co)), 3))
+            co[:self.size] = self.co[:self.size]
+            self.co = co
+        self.co[self.size: new_size] = points
+        ids = np.arange(self.size, new_size)
+        self.size = new_size
+        return ids
+
+
+class _Polygons:
+    """Convex polygons as rows of vertex indexes padded with -1, number of
+    vertices of the polygons and their planes"""
+    __slots__ = ('loops', 'lengths', 'normals', 'ws')
+
+    def __init__(self, loops, lengths, normals, ws):
+        self.loops = loops
+        self.lengths = lengths
+        self.normals = normals
+        self.ws = ws
+
+    @classmethod
+    def from_loops(cls, co, loops, lengths):
+        """The same as CSGPlane.fromPoints for the first three vertices of
+        each polygon"""
+        a, b, c = co[loops[:, 0]], co[loops[:, 1]], co[loops[:, 2]]
+        u, v = b - a, c - a
+        normals = np.empty_like(u)
+        normals[:, 0] = u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1]
+        normals[:, 1] = u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2]
+        normals[:, 2] = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+        norms = np.sqrt(_dot(normals, normals))
+        if (norms == 0).any():
+            raise ZeroDivisionError("float division by zero")
+        normals /= norms[:, np.newaxis]
+        return cls(loops, lengths, normals, _dot(normals, a))
+
+    @classmethod
+    def empty(cls, width=3):
+        return cls(np.empty((0, width), dtype=np.int64), np.empty(0, dtype=np.int64),
+                   np.empty((0, 3)), np.empty(0))
+
+    @classmethod
+    def concatenate(cls, polygons):
+        polygons = [p for p in polygons if len(p)]
+        if not polygons:
+            return cls.empty()
+        if len(polygons) == 1:
+            return polygons[0]
+        width = max(p.loops.shape[1] for p in polygons)
+        loops = [np.pad(p.loops, ((0, 0), (0, width - p.loops.shape[1])), constant_values=-1)
+                 if p.loops.shape[1] < width else p.loops for p in polygons]
+        return cls(np.concatenate(loops), np.concatenate([p.lengths for p in polygons]),
+                   np.concatenate([p.normals for p in polygons]), np.concatenate([p.ws for p in polygons]))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def take(self, indexes):
+        return _Polygons(self.loops[indexes], self.lengths[indexes], self.normals[indexes], self.ws[indexes])
+
+    def flipped(self):
+        """The same as CSGPolygon.flip"""
+        columns = self.lengths[:, np.newaxis] - 1 - np.arange(self.loops.shape[1])
+        loops = np.take_along_axis(self.loops, columns % self.loops.shape[1], axis=1)
+        loops[columns < 0] = -1
+        return _Polygons(loops, self.lengths, -self.normals, -self.ws)
+
+    def to_list(self):
+        return [row[:n] for row, n in zip(self.loops.tolist(), self.lengths.tolist())]
+
+
+def _split_polygons(vertices, polygons, normals, ws):
+    """
+    Vectorized CSGPlane.splitPolygon. Each polygon is classified against its
+    own plane from `normals` and `ws`. Returns types of the polygons, mask of
+    polygons which are facing the same direction as their planes and front and
+    back fragments of spanning polygons together with indexes of polygons they
+    were split from.
+    """
+    loops, lengths = polygons.loops, polygons.lengths
+    valid = np.arange(loops.shape[1]) < lengths[:, np.newaxis]
+    positions = vertices.co[loops]
+    dots = (normals[:, np.newaxis, 0] * positions[..., 0] + normals[:, np.newaxis, 1] * positions[..., 1]
+            + normals[:, np.newaxis, 2] * positions[..., 2])
+    distances = dots - ws[:, np.newaxis]
+    types = np.zeros(loops.shape, dtype=np.int8)
+    types[distances < -CSGPlane.EPSILON] = BACK
+    types[distances > CSGPlane.EPSILON] = FRONT
+    types[~valid] = COPLANAR
+    polygon_types = np.bitwise_or.reduce(types, axis=1)
+    facing = _dot(normals, polygons.normals) > 0
+
+    spanning = np.flatnonzero(polygon_types == SPANNING)
+    if not len(spanning):
+        return polygon_types, facing, _fragments_of(polygons), _fragments_of(polygons)
+
+    # next vertex of each vertex of the spanning polygons
+    loops, lengths, valid = loops[spanning], lengths[spanning], valid[spanning]
+    positions, dots, types = positions[spanning], dots[spanning], types[spanning]
+    normals, ws = normals[spanning], ws[spanning]
+    rows = np.arange(len(spanning))[:, np.newaxis]
+    next_columns = np.arange(1, loops.shape[1] + 1)[np.newaxis, :].repeat(len(spanning), axis=0)
+    next_columns[next_columns >= lengths[:, np.newaxis]] = 0
+    next_types = types[rows, next_columns]
+
+    # new vertices on the edges which cross the plane
+    crossing = ((types | next_types) == SPANNING) & valid
+    crossing_rows = np.nonzero(crossing)[0]
+    pos_i = positions[crossing]
+    direction = positions[rows, next_columns][crossing] - pos_i
+    t = (ws[crossing_rows] - dots[crossing]) / _dot(normals[crossing_rows], direction)
+    new_ids = np.full(loops.shape, -1, dtype=np.int64)
+    new_ids[crossing] = vertices.add(pos_i + direction * t[:, np.newaxis])
+
+    def fragments(other_side):
+        # a vertex goes to the fragment if it's not on the other side, then
+        # goes the new vertex of the edge if the edge crosses the plane
+        has_vertex = (types != other_side) & valid
+        counts = has_vertex.astype(np.int64) + crossing
+        columns = np.cumsum(counts, axis=1) - counts
+        frag_lengths = counts.sum(axis=1)
+        frag_loops = np.full((len(spanning), frag_lengths.max()), -1, dtype=np.int64)
+        frag_loops[np.nonzero(has_vertex)[0], columns[has_vertex]] = loops[has_vertex]
+        frag_loops[crossing_rows, (columns + has_vertex)[crossing]] = new_ids[crossing]
+        is_polygon = frag_lengths >= 3
+        if not is_polygon.any():
+            return _fragments_of(polygons)
+        return (_Polygons.from_loops(vertices.co, frag_loops[is_polygon], frag_lengths[is_polygon]),
+                spanning[is_polygon])
+
+    return polygon_types, facing, fragments(BACK), fragments(FRONT)
+
+
+def _merge(polygons, indexes, fragments):
+    """Polygons with given indexes together with fragments in order of
+    polygons they were split from"""
+    fragment_polygons, sources = fragments
+    if not len(sources):
+        return polygons.take(indexes), indexes
+    merged = _Polygons.concatenate([polygons.take(indexes), fragment_polygons])
+    sources = np.concatenate([indexes, sources])
+    order = np.argsort(sources, kind='stable')
+    return merged.take(order), sources[order]
+
+
+class BSPTree:
+    """
+    Array version of CSGNode. Node 0 is the root, planes and children of
+    nodes are kept in arrays, -1 means there is no child. Polygons of all
+    nodes are kept together with array of their node indexes.
+    """
+    def __init__(self, vertices, polygons=None):
+        self.vertices = vertices
+        self.size = 0
+        self.normals = np.empty((16, 3))
+        self.ws = np.empty(16)
+        self.has_plane = np.zeros(16, dtype=bool)
+        self.front = np.full(16, -1, dtype=np.int64)
+        self.back = np.full(16, -1, dtype=np.int64)
+        self._add_nodes(1)
+        self._chunks = []  # (polygons, their nodes)
+        if polygons is not None and len(polygons):
+            self.build(polygons)
+
+    def _add_nodes(self, number):
+        new_size = self.size + number
+        if new_size > len(self.ws):
+            capacity = max(new_size, 2 * len(self.ws))
+            grow = capacity - len(self.ws)
+            self.normals = np.concatenate([self.normals, np.empty((grow, 3))])
+            self.ws = np.concatenate([self.ws, np.empty(grow)])
+            self.has_plane = np.concatenate([self.has_plane, np.zeros(grow, dtype=bool)])
+            self.front = np.concatenate([self.front, np.full(grow, -1, dtype=np.int64)])
+            self.back = np.concatenate([self.back, np.full(grow, -1, dtype=np.int64)])
+        ids = np.arange(self.size, new_size)
+        self.size = new_size
+        return ids
+
+    def _children(self, side, nodes):
+        """Children of the nodes on given side ('front' or 'back'),
+        missing children are created"""
+        children = getattr(self, side)[nodes]
+        missing = children < 0
+        if missing.any():
+            parents = np.unique(nodes[missing])
+            ids = self._add_nodes(len(parents))
+            getattr(self, side)[parents] = ids
+            children = getattr(self, side)[nodes]
+        return children
+
+    def _polygons(self):
+        """All polygons and their nodes, polygons of each node are in order
+        of their addition"""
+        if len(self._chunks) != 1:
+            polygons = _Polygons.concatenate([c[0] for c in self._chunks])
+            nodes = np.concatenate([c[1] for c in self._chunks]) if self._chunks else np.empty(0, dtype=np.int64)
+            self._chunks = [(polygons, nodes)]
+        return self._chunks[0]
+
+    def _preorder(self):
+        """Position of each node in the order of `allPolygons`"""
+        rank = np.empty(self.size, dtype=np.int64)
+        front, back = self.front.tolist(), self.back.tolist()
+        stack = [0]
+        position = 0
+        while stack:
+            node = stack.pop()
+            rank[node] = position
+            position += 1
+            if back[node] >= 0:
+                stack.append(back[node])
+            if front[node] >= 0:
+                stack.append(front[node])
+        return rank
+
+    def invert(self):
+        """The same as CSGNode.invert"""
+        polygons, nodes = self._polygons()
+        self._chunks = [(polygons.flipped(), nodes)]
+        self.normals[:self.size] *= -1
+        self.ws[:self.size] *= -1
+        self.front, self.back = self.back, self.front
+
+    def all_polygons(self):
+        """The same as CSGNode.allPolygons"""
+        polygons, nodes = self._polygons()
+        return polygons.take(np.argsort(self._preorder()[nodes], kind='stable'))
+
+    def clip_polygons(self, polygons, owners):
+        """
+        The same as CSGNode.clipPolygons for several lists of polygons at
+        once. `owners` keeps to which list each polygon belongs. Returns kept
+        polygons and their owners, ordered by owners.
+        """
+        if not self.has_plane[0] or not len(polygons):
+            return polygons, owners
+        rank = self._preorder()
+        order_keys = np.arange(len(polygons))
+        nodes = np.zeros(len(polygons), dtype=np.int64)
+        kept = []
+        while len(polygons):
+            types, facing, front_fragments, back_fragments = _split_polygons(
+                self.vertices, polygons, self.normals[nodes], self.ws[nodes])
+            coplanar = types == COPLANAR
+            front_indexes = np.flatnonzero((types == FRONT) | (coplanar & facing))
+            back_indexes = np.flatnonzero((types == BACK) | (coplanar & ~facing))
+            front, front_sources = _merge(polygons, front_indexes, front_fragments)
+            back, back_sources = _merge(polygons, back_indexes, back_fragments)
+
+            # polygons in front of nodes without front children are kept,
+            # polygons behind nodes without back children are removed
+            front_nodes = nodes[front_sources]
+            front_children = self.front[front_nodes]
+            stop = front_children < 0
+            kept.append((front.take(np.flatnonzero(stop)), owners[front_sources[stop]],
+                         rank[front_nodes[stop]], order_keys[front_sources[stop]]))
+            back_children = self.back[nodes[back_sources]]
+            go_front, go_back = np.flatnonzero(~stop), np.flatnonzero(back_children >= 0)
+            polygons = _Polygons.concatenate([front.take(go_front), back.take(go_back)])
+            sources = np.concatenate([front_sources[go_front], back_sources[go_back]])
+            nodes = np.concatenate([front_children[go_front], back_children[go_back]])
+            owners, order_keys = owners[sources], order_keys[sources]
+
+        polygons = _Polygons.concatenate([k[0] for k in kept])
+        owners, ranks, order_keys = (np.concatenate([k[i] for k in kept]) for i in range(1, 4))
+        order = np.lexsort((order_keys, ranks, owners))
+        return polygons.take(order), owners[order]
+
+    def clip_to(self, bsp):
+        """The same as CSGNode.clipTo"""
+        polygons, nodes = self._polygons()
+        self._chunks = [bsp.clip_polygons(polygons, nodes)]
+
+    def build(self, polygons):
+        """The same as CSGNode.build"""
+        if not len(polygons):
+            return
+        nodes = np.zeros(len(polygons), dtype=np.int64)
+        # polygons of each node are kept in order of their lists in CSGNode
+        while len(polygons):
+            unique_nodes, first = np.unique(nodes, return_index=True)
+            new = ~self.has_plane[unique_nodes]
+            if new.any():
+                new_nodes, first = unique_nodes[new], first[new]
+                self.normals[new_nodes] = polygons.normals[first]
+                self.ws[new_nodes] = polygons.ws[first]
+                self.has_plane[new_nodes] = True
+
+            types, _, front_fragments, back_fragments = _split_polygons(
+                self.vertices, polygons, self.normals[nodes], self.ws[nodes])
+            coplanar = np.flatnonzero(types == COPLANAR)
+            self._chunks.append((polygons.take(coplanar), nodes[coplanar]))
+            front, front_sources = _merge(polygons, np.flatnonzero(types == FRONT), front_fragments)
+            back, back_sources = _merge(polygons, np.flatnonzero(types == BACK), back_fragments)
+            front_nodes = self._children('front', nodes[front_sources])
+            back_nodes = self._children('back', nodes[back_sources])
+            polygons = _Polygons.concatenate([front, back])
+            nodes = np.concatenate([front_nodes, back_nodes])
+
+
+class NumpyCSG:
+    """
+    The same as CSG class but with NumPy arrays
+
+    NumpyCSG.from_pydata(verts_a, faces_a).subtract(NumpyCSG.from_pydata(verts_b, faces_b)).to_pydata()
+    """
+    def __init__(self, vertices, polygons):
+        self.vertices = vertices
+        self.polygons = polygons
+
+    @classmethod
+    def from_pydata(cls, verts, faces):
+        """Faces should have at least three vertices"""
+        vertices = _Vertices(verts)
+        if not len(faces):
+            return cls(vertices, _Polygons.empty())
+        lengths = np.fromiter((len(f) for f in faces), dtype=np.int64, count=len(faces))
+        loops = np.full((len(faces), lengths.max()), -1, dtype=np.int64)
+        loops[np.arange(lengths.max()) < lengths[:, np.newaxis]] = np.fromiter(
+            (i for f in faces for i in f), dtype=np.int64, count=lengths.sum())
+        return cls(vertices, _Polygons.from_loops(vertices.co, loops, lengths))
+
+    def _combine(self, csg):
+        """BSP trees of both solids with common vertices"""
+        vertices = _Vertices(self.vertices.co[:self.vertices.size])
+        offset = vertices.add(csg.vertices.co[:csg.vertices.size])[:1]
+        polygons = csg.polygons
+        loops = np.where(polygons.loops < 0, -1, polygons.loops + (offset[0] if len(offset) else 0))
+        other = _Polygons(loops, polygons.lengths, polygons.normals, polygons.ws)
+        return BSPTree(vertices, self.polygons), BSPTree(vertices, other)
+
+    def union(self, csg):
+        a, b = self._combine(csg)
+        a.clip_to(b)
+        b.clip_to(a)
+        b.invert()
+        b.clip_to(a)
+        b.invert()
+        a.build(b.all_polygons())
+        return NumpyCSG(a.vertices, a.all_polygons())
+
+    def subtract(self, csg):
+        a, b = self._combine(csg)
+        a.invert()
+        a.clip_to(b)
+        b.clip_to(a)
+        b.invert()
+        b.clip_to(a)
+        b.invert()
+        a.build(b.all_polygons())
+        a.invert()
+        return NumpyCSG(a.vertices, a.all_polygons())
+
+    def intersect(self, csg):
+        a, b = self._combine(csg)
+        a.invert()
+        b.clip_to(a)
+        b.invert()
+        a.clip_to(b)
+        b.clip_to(a)
+        a.build(b.all_polygons())
+        a.invert()
+        return NumpyCSG(a.vertices, a.all_polygons())
+
+    def to_pydata(self):
+        """Vertices and faces where vertices with equal coordinates are merged
+        and ordered by their first appearance in the faces"""
+        if not len(self.polygons):
+            return [], []
+        loops, lengths = self.polygons.loops, self.polygons.lengths
+        positions = self.vertices.co[loops[np.arange(loops.shape[1]) < lengths[:, np.newaxis]]]
+        unique, first, inverse = np.unique(positions, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        new_index = np.empty(len(order), dtype=np.int64)
+        new_index[order] = np.arange(len(order))
+        indexes = new_index[inverse.reshape(-1)].tolist()
+        starts = np.cumsum(lengths).tolist()
+        faces = [indexes[s - n: s] for s, n in zip(starts, lengths.tolist())]
+        return positions[first[order]].tolist(), faces
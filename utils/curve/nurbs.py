@@ -22,6 +22,7 @@ from sverchok.utils.curve.nurbs_algorithms import unify_two_curves
 from sverchok.utils.curve.nurbs_solver_applications import interpolate_nurbs_curve
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths,SvNurbsBasisFunctions,
+        span_basis_functions,
         nurbs_divide, elevate_bezier_degree, reduce_bezier_degree,
         from_homogenous,
         CantInsertKnotException, CantRemoveKnotException,
@@ -1187,30 +1188,18 @@ class SvNativeNurbsCurve(SvNurbsCurve):
             return numerator / denominator
 
     def fraction(self, deriv_order, ts):
-        n = len(ts)
-        p = self.degree
-        k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
+        # only p+1 basis functions are non-zero at each t
+        idxs, ns = span_basis_functions(self.knotvector, self.degree, ts, deriv_order) # (n, p+1)
+        coeffs = ns[deriv_order] * self.weights[idxs] # (n, p+1)
+        numerator = coeffs[:,:,np.newaxis] * self.control_points[idxs] # (n, p+1, 3)
         numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
+        denominator = coeffs.sum(axis=1) # (n,)
 
         return numerator, denominator[np.newaxis].T
 
     def fraction_single(self, deriv_order, t):
-        p = self.degree
-        k = len(self.control_points)
-        ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
-        coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
-        numerator = numerator.sum(axis=0) # (3,)
-        denominator = coeffs.sum(axis=0) # ()
-
-        return numerator, denominator
+        numerator, denominator = self.fraction(deriv_order, np.array([t]))
+        return numerator[0], denominator[0,0]
 
     def evaluate_array(self, ts):
         if self.is_bezier() and not self.is_rational():
@@ -0,0 +1,441 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Caches of socket data which can keep data in memory and on disk.
+Data is stored on disk in compressed .npz files, numeric objects are stored
+as arrays, mathutils objects as arrays of their values, solids as BREP
+strings, other objects are pickled.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import RLock
+from typing import Iterable, Optional
+
+import numpy as np
+
+from sverchok.core.socket_data import data_size
+from sverchok.utils.sv_logging import sv_logger
+
+ARRAY, LIST, PICKLE, BREP = 'array', 'list', 'pickle', 'brep'
+MATHUTILS = 'mathutils.'
+
+
+def _is_plain_list(obj) -> bool:
+    """Checks first items of nested lists, whether they contain only Python numbers"""
+    while isinstance(obj, (list, tuple)):
+        if not obj:
+            return True
+        obj = obj[0]
+    return isinstance(obj, (int, float))
+
+
+def _pack_object(obj) -> tuple[str, np.ndarray]:
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in 'biuf':
+        return ARRAY, obj
+    if isinstance(obj, (list, tuple)) and _is_plain_list(obj):
+        try:
+            array = np.array(obj)
+        except ValueError:  # ragged list
+            array = None
+        if array is not None and array.dtype.kind in 'biuf':
+            return LIST, array
+    if type(obj).__module__ == 'mathutils':
+        return MATHUTILS + type(obj).__name__, np.array(obj, dtype=np.float64)
+    if hasattr(obj, 'exportBrepToString'):  # FreeCAD shape
+        return BREP, np.frombuffer(obj.exportBrepToString().encode(), dtype=np.uint8)
+    return PICKLE, np.frombuffer(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+
+
+def _unpack_object(kind: str, array: np.ndarray):
+    if kind == ARRAY:
+        return array
+    if kind == LIST:
+        return array.tolist()
+    if kind.startswith(MATHUTILS):
+        import mathutils
+        return getattr(mathutils, kind[len(MATHUTILS):])(array.tolist())
+    if kind == BREP:
+        import Part
+        shape = Part.Shape()
+        shape.importBrepFromString(array.tobytes().decode())
+        return shape
+    return pickle.loads(array.tobytes())
+
+
+def _pack_list(data: list, prefix: str, arrays: dict) -> np.ndarray:
+    kinds = []
+    for i, obj in enumerate(data):
+        kind, array = _pack_object(obj)
+        kinds.append(kind)
+        arrays[f'{prefix}_{i}'] = array
+    return np.array(kinds, dtype=str)
+
+
+def _unpack_list(file, prefix: str, kinds: np.ndarray) -> list:
+    return [_unpack_object(kind, file[f'{prefix}_{i}']) for i, kind in enumerate(kinds.tolist())]
+
+
+def _save_arrays(path: str, arrays: dict):
+    # write into temporary file first so another process would never read half written file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def save_data(path: str, data: list):
+    """Saves socket data (list of objects) into compressed .npz file.
+    Raises pickle.PicklingError, TypeError or AttributeError if some of the
+    objects can't be pickled"""
+    arrays = dict()
+    arrays['kinds'] = _pack_list(data, 'obj', arrays)
+    _save_arrays(path, arrays)
+
+
+def load_data(path: str) -> list:
+    """Loads socket data saved by the save_data function"""
+    with np.load(path, allow_pickle=False) as file:
+        return _unpack_list(file, 'obj', file['kinds'])
+
+
+def save_sockets_data(path: str, data: dict[str, list]):
+    """Saves data of several sockets into one compressed .npz file, keys are
+    usually socket identifiers. Raises the same errors as save_data"""
+    arrays = dict()
+    arrays['names'] = np.array(list(data), dtype=str)
+    for i, socket_data in enumerate(data.values()):
+        arrays[f'kinds_{i}'] = _pack_list(socket_data, f'obj_{i}', arrays)
+    _save_arrays(path, arrays)
+
+
+def load_sockets_data(path: str) -> dict[str, list]:
+    """Loads data saved by the save_sockets_data function"""
+    with np.load(path, allow_pickle=False) as file:
+        return {name: _unpack_list(file, f'obj_{i}', file[f'kinds_{i}'])
+                for i, name in enumerate(file['names'].tolist())}
+
+
+def hash_data(hasher, data):
+    """Updates the hasher (see hashlib) with content of socket data. Raises
+    pickle.PicklingError, TypeError or AttributeError if the data contains
+    objects which can't be pickled"""
+    if isinstance(data, np.ndarray) and data.dtype.kind in 'biufc':
+        hasher.update(f'a{data.dtype}{data.shape}'.encode())
+        hasher.update(np.ascontiguousarray(data))
+    elif isinstance(data, (list, tuple, np.ndarray)):
+        if isinstance(data, (list, tuple)) and _is_plain_list(data):
+            try:
+                array = np.array(data)
+            except ValueError:  # ragged list
+                array = None
+            if array is not None and array.dtype.kind in 'biuf':
+                hasher.update(f'l{array.dtype}{array.shape}'.encode())
+                hasher.update(array)
+                return
+        hasher.update(f'[{len(data)}'.encode())
+        for item in data:
+            hash_data(hasher, item)
+    elif data is None or isinstance(data, (bool, int, float, str)):
+        hasher.update(f'{type(data).__name__}{data!r};'.encode())
+    else:
+        kind, array = _pack_object(data)
+        hasher.update(kind.encode())
+        hasher.update(array)
+
+
+def hash_properties(hasher, node):
+    """Updates the hasher with values of properties defined by the node
+    class, properties which are not saved into file are skipped"""
+    for prop in node.bl_rna.properties:
+        if not prop.is_runtime or prop.is_skip_save or prop.is_readonly or prop.type == 'COLLECTION':
+            continue
+        value = getattr(node, prop.identifier)
+        if prop.type == 'POINTER':
+            value = getattr(value, 'name_full', None)  # only data blocks can be identified
+        elif getattr(prop, 'is_array', False):
+            value = tuple(value)
+        elif isinstance(value, set):  # enum flag
+            value = tuple(sorted(value))
+        hasher.update(f'{prop.identifier}={value!r};'.encode())
+
+
+class FrameCache:
+    """Keeps socket data of animation frames. The least recently used frames
+    are removed from memory when the cache exceeds its memory budget. If a
+    directory is given removed frames are saved there and can be loaded back
+    on request, also frames neighbouring to requested one can be loaded in
+    background in advance. Frames of the last prefetch window are removed
+    from memory only if other frames are not enough to fit into the budget"""
+
+    def __init__(self, max_size: int = 0, directory: Optional[str] = None):
+        """:max_size: memory budget in bytes, 0 means unlimited
+        :directory: where to save frames removed from memory, if None they are lost"""
+        self.max_size = max_size
+        self.directory = directory
+        self.total_size = 0
+        self._frames: OrderedDict[int, list] = OrderedDict()
+        self._sizes: dict[int, int] = dict()
+        self._on_disk: set[int] = set()
+        self._loading: dict[int, Future] = dict()
+        self._window: set[int] = set()
+        self._lock = RLock()
+        self._executor = None
+
+    def __contains__(self, frame: int) -> bool:
+        with self._lock:
+            return frame in self._frames or frame in self._on_disk
+
+    def __len__(self):
+        with self._lock:
+            return len(self._frames.keys() | self._on_disk)
+
+    def put(self, frame: int, data: list):
+        """Data of the frame is replaced, data should not be changed afterwards"""
+        with self._lock:
+            self._discard(frame)
+            self._remember(frame, data)
+            self._evict(keep=frame)
+
+    def get(self, frame: int, default=None):
+        """Data of the frame, it's loaded from disk if it was removed from memory"""
+        with self._lock:
+            future = self._loading.get(frame)
+        if future is not None:
+            future.result()
+        with self._lock:
+            if frame in self._frames:
+                self._frames.move_to_end(frame)
+                return self._frames[frame]
+            if frame not in self._on_disk:
+                return default
+        data = self._load(frame)
+        if data is None:
+            return default
+        with self._lock:
+            if frame not in self._frames and frame in self._on_disk:
+                self._remember(frame, data)
+                self._evict(keep=frame)
+        return data
+
+    def prefetch(self, frames: Iterable[int]):
+        """Starts loading of the frames which are saved on disk in background"""
+        with self._lock:
+            self._window = set(frames)
+            to_load = [f for f in self._window if f in self._on_disk and f not in self._frames and f not in self._loading]
+            if not to_load:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sv_frame_cache')
+            for frame in to_load:
+                self._loading[frame] = self._executor.submit(self._prefetch, frame)
+
+    def wait(self):
+        """Blocks until all frames requested by prefetch are loaded"""
+        with self._lock:
+            futures = list(self._loading.values())
+        for future in futures:
+            future.result()
+
+    def set_directory(self, directory: Optional[str]):
+        """Moves frames saved on disk into another directory, if the new
+        directory is None they are loaded back into memory"""
+        self.wait()
+        with self._lock:
+            if directory == self.directory:
+                return
+            for frame in sorted(self._on_disk):
+                if directory is None:
+                    data = self._frames[frame] if frame in self._frames else self._load(frame)
+                    self._discard(frame)
+                    if data is not None:
+                        self._remember(frame, data)
+                    continue
+                try:
+                    os.makedirs(directory, exist_ok=True)
+                    shutil.move(self._path(frame), os.path.join(directory, f"{frame}.npz"))
+                except OSError as e:
+                    sv_logger.warning(f"Frame {frame} can't be moved into the cache directory: {e}")
+                    self._discard(frame)
+            self.directory = directory
+            self._evict(keep=None)
+
+    def clear(self):
+        """Removes all frames from memory and from disk, stops background loading"""
+        self.wait()
+        with self._lock:
+            for frame in list(self._frames.keys() | self._on_disk):
+                self._discard(frame)
+            self._window.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _prefetch(self, frame: int):
+        try:
+            data = self._load(frame)
+            with self._lock:
+                if data is not None and frame not in self._frames and frame in self._on_disk:
+                    self._remember(frame, data)
+                    self._evict(keep=frame)
+        finally:
+            with self._lock:
+                self._loading.pop(frame, None)
+
+    def _remember(self, frame: int, data: list):
+        size = data_size(data)
+        self._frames[frame] = data
+        self._sizes[frame] = size
+        self.total_size += size
+
+    def _forget(self, frame: int):
+        self._frames.pop(frame)
+        self.total_size -= self._sizes.pop(frame)
+
+    def _discard(self, frame: int):
+        if frame in self._frames:
+            self._forget(frame)
+        if frame in self._on_disk:
+            self._on_disk.discard(frame)
+            try:
+                os.remove(self._path(frame))
+            except OSError:
+                pass
+
+    def _evict(self, keep: Optional[int]):
+        if not self.max_size:
+            return
+        # frames of the prefetch window are expected to be requested soon
+        candidates = sorted(self._frames, key=lambda f: f in self._window)
+        for frame in candidates:
+            if self.total_size <= self.max_size:
+                break
+            if frame == keep:
+                continue
+            if self.directory is not None and frame not in self._on_disk:
+                try:
+                    save_data(self._path(frame), self._frames[frame])
+                    self._on_disk.add(frame)
+                except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+                    sv_logger.warning(f"Frame {frame} can't be saved into the cache directory: {e}")
+            self._forget(frame)
+
+    def _load(self, frame: int) -> Optional[list]:
+        try:
+            return load_data(self._path(frame))
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError) as e:
+            sv_logger.warning(f"Frame {frame} can't be loaded from the cache directory: {e}")
+            with self._lock:
+                self._on_disk.discard(frame)
+            return None
+
+    def _path(self, frame: int) -> str:
+        return os.path.join(self.directory, f"{frame}.npz")
+
+
+class NodeResultCache:
+    """Persistent storage of output data of nodes. The data is saved into a
+    directory, one compressed .npz file per key, so it survives reopening of
+    Blender. Key of a result should be a hash of everything the result
+    depends on. If the directory exceeds its size limit the least recently
+    used files are deleted"""
+
+    def __init__(self, directory: str, max_size: int = 0):
+        """:directory: where to keep results
+        :max_size: size limit of the directory in bytes, 0 means unlimited"""
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def new_key():
+        """Hasher which should be updated with everything the result depends on,
+        its hexdigest is the key"""
+        return hashlib.blake2b(digest_size=20)
+
+    def load(self, key: str) -> Optional[dict[str, list]]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            data = load_sockets_data(path)
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError, ImportError) as e:
+            sv_logger.warning(f"Cached result {path} can't be loaded: {e}")
+            return None
+        try:
+            os.utime(path)  # it's used to find least recently used results
+        except OSError:
+            pass
+        return data
+
+    def save(self, key: str, data: dict[str, list]) -> bool:
+        """Returns False if the data can't be serialized or saved"""
+        try:
+            save_sockets_data(self._path(key), data)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            sv_logger.debug(f"Result can't be cached: {e}")
+            return False
+        except OSError as e:
+            sv_logger.warning(f"Result can't be saved into {self.directory}: {e}")
+            return False
+        self.prune()
+        return True
+
+    def prune(self):
+        """Deletes least recently used results until the directory fits into the size limit"""
+        if not self.max_size:
+            return
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.npz'):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.npz'):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+
+def get_node_result_cache() -> NodeResultCache:
+    """Result cache in the directory given in Sverchok preferences"""
+    import bpy
+    from sverchok.settings import get_param
+    directory = get_param('node_cache_directory', '')
+    if directory:
+        directory = bpy.path.abspath(directory)
+    else:
+        directory = os.path.join(bpy.utils.user_resource('DATAFILES'), 'sverchok', 'node_cache')
+    return NodeResultCache(directory, get_param('node_cache_budget', 0) * 2**20)
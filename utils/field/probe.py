@@ -8,33 +8,11 @@
 import numpy as np
 
 from sverchok.utils.sv_logging import sv_logger
-from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
 
 BATCH_SIZE = 100
 MAX_ITERATIONS = 1000
 
-def _check_min_distance(v_new, vs_old, min_r):
-    if not vs_old:
-        return True
-    kdt = SvKdTree.new(SvKdTree.BLENDER, vs_old)
-    nearest, idx, dist = kdt.query(v_new)
-    if dist is None:
-        return True
-    ok = (dist >= min_r)
-    #if not ok:
-    #    print(f"V {v_new} => {nearest}, {dist} >= {min_r}")
-    return ok
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
-
 def field_random_probe(field, bbox, count,
         threshold=0, proportional=False, field_min=None, field_max=None,
         min_r=0, min_r_field=None,
@@ -77,6 +55,7 @@ def field_random_probe(field, bbox, count,
     done = 0
     generated_verts = []
     generated_radiuses = []
+    grid = SvPoissonDiskGrid(min_r if min_r != 0 else None)
     iterations = 0
     while done < count:
         iterations += 1
@@ -112,16 +91,12 @@ def field_random_probe(field, bbox, count,
                             np.zeros((len(candidates),)),
                             min_rs
                         )
-            good_verts = []
-            for candidate, min_r in zip(candidates, min_rs):
-                if _check_min_radius(candidate, generated_verts + good_verts, generated_radiuses + good_radiuses, min_r):
-                    good_verts.append(candidate)
-                    good_radiuses.append(min_r)
+            good_idxs = grid.check_min_radius(candidates, min_rs)
+            good_verts = list(candidates[good_idxs])
+            good_radiuses = list(min_rs[good_idxs])
         else: # min_r != 0
-            good_verts = []
-            for candidate in candidates:
-                if _check_min_distance(candidate, generated_verts + good_verts, min_r):
-                    good_verts.append(candidate)
+            good_idxs = grid.check_min_distance(candidates, min_r)
+            good_verts = list(candidates[good_idxs])
             good_radiuses = [1 for c in good_verts]
 
         if predicate is not None:
@@ -129,6 +104,8 @@ def field_random_probe(field, bbox, count,
             good_verts = [p[0] for p in pairs]
             good_radiuses = [p[1] for p in pairs]
 
+        if min_r != 0 or min_r_field is not None:
+            grid.add(good_verts, good_radiuses)
         generated_verts.extend(good_verts)
         generated_radiuses.extend(good_radiuses)
         done += len(good_verts)
@@ -331,7 +331,6 @@ class SvKdtVectorField(SvVectorField):
             vectors = - vectors
         if self.falloff is not None:
             norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-            lens = self.falloff(norms)
             nonzero = (norms > 0)[:,0]
             lens = self.falloff(norms)
             vectors[nonzero] = vectors[nonzero] / norms[nonzero]
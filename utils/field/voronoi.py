@@ -48,14 +48,11 @@ class SvVoronoiFieldData(object):
             return delta, delta * v1
 
     def query_array(self, points):
-        if self.implementation == SvKdTree.SCIPY or self.metric == 'DISTANCE':
-            locs, idxs, distances = self.kdtree.query_array(points, count=2)
-            distances1 = distances[:,0]
-            distances2 = distances[:,1]
-            v1s = locs[:,0] - points
-            v1s /= np.linalg.norm(v1s, axis=1, keepdims=True)
-            deltas = np.abs(distances1 - distances2)
-            return deltas, deltas[np.newaxis].T * v1s
-        else:
-            return np.vectorize(self.query, signature='(3)->(),(3)')(points)
+        locs, idxs, distances = self.kdtree.query_array(points, count=2)
+        distances1 = distances[:,0]
+        distances2 = distances[:,1]
+        v1s = locs[:,0] - points
+        v1s /= np.linalg.norm(v1s, axis=1, keepdims=True)
+        deltas = np.abs(distances1 - distances2)
+        return deltas, deltas[np.newaxis].T * v1s
 
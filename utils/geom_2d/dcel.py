@@ -5,10 +5,11 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
-from itertools import cycle, chain
+from itertools import chain
 from typing import List, Union, Set
 
 from .lin_alg import almost_equal, is_more, dot_product, is_ccw_polygon, cross_product
+from .dcel_arrays import DCELArrays
 
 from .dcel_debugger import Debugger
 
@@ -269,34 +270,11 @@ class DCELMesh:
         generate_dcel_mesh(self, verts, faces, face_selection, face_flag, face_data, False)
 
     def from_sv_edges(self, verts, edges):
-        # Probably it is worth take in account such cases as: edge with 0 length at least
+        # Edges with 0 length are ignored
         # Interesting that this method makes next attribute of end of an edge linked to a twin
-        edges = [edge for edge in edges if
-                 not all([almost_equal(co1, co2, self.accuracy) for co1, co2 in zip(verts[edge[0]], verts[edge[1]])])]
-
         points = [self.Point(self, co) for co in verts]
         self.points.extend(points)
-        coincidence_hedges = [[] for _ in range(len(points))]  # hedges coincident to points
-
-        # Generate hedges
-        for edge in edges:
-            hedge1 = self.HalfEdge(self, points[edge[0]])
-            hedge2 = self.HalfEdge(self, points[edge[1]])
-            self.points[edge[0]].hedge = hedge1  # this should be overrode several times but looks okay
-            self.points[edge[1]].hedge = hedge2
-            hedge1.twin = hedge2
-            hedge2.twin = hedge1
-            coincidence_hedges[edge[0]].append(hedge1)
-            coincidence_hedges[edge[1]].append(hedge2)
-            self.hedges.extend([hedge1, hedge2])
-
-        # Link hedges around all points
-        for hedges in coincidence_hedges:
-            hedges.sort(key=lambda hedge: hedge.slop)
-            for i in range(len(hedges)):
-                i_next = (i + 1) % len(hedges)
-                hedges[i].last = hedges[i_next].twin
-                hedges[i_next].twin.next = hedges[i]
+        DCELArrays.from_sv_edges(verts, edges, self.accuracy).to_dcel_mesh(self, points)
 
     def generate_faces_from_hedges(self):
         # Generate face list from half edge list
@@ -615,84 +593,10 @@ def generate_dcel_mesh(mesh, verts, faces, face_selection=None, face_flag=None,
                          "length of input faces({})".format(bad_key, length, len(faces)))
     if new_mesh:
         mesh = type(mesh)(mesh.accuracy)  # can bring trouble with isinstance, not sure
-    half_edges_list = dict()
-    len_added_points = len(mesh.points)
-    mesh.points.extend([mesh.Point(mesh, co) for co in verts])
-
-    # Generate outer faces and there hedges
-    # face_data_iter is tricky iterator for distributing custom properties among faces, example:
-    # d = {'a': [1, 2], 'b': [3, 4]}
-    # >>> for names, values in zip(cycle([d.keys()]), zip(*d.values())):
-    # ...     print('Next Face')
-    # ...     for n, v in zip(names, values):
-    # ...         print(n, v)
-    # ...
-    # Next Face  # a 1  # b 3  # Next Face  # a 2  # b 4
-    face_data_iter = zip(cycle([face_data.keys()]), zip(*face_data.values())) if face_data else cycle([None])
-    for face, fm, ff, fd in zip(faces, face_selection or cycle([False]), face_flag or cycle([None]), face_data_iter):
-        face = face if is_ccw_polygon([verts[i] for i in face]) else face[::-1]
-        f = mesh.Face(mesh)
-        f.select = bool(fm)
-        if ff:
-            f.flags.add(ff)
-        if fd:
-            for property_name, value in zip(*fd):
-                f.sv_data[property_name] = value
-        loop = []
-        for i in range(len(face)):
-            origin_i = face[i]
-            next_i = face[(i + 1) % len(face)]
-            half_edge = mesh.HalfEdge(mesh, mesh.points[origin_i + len_added_points], f)
-            mesh.points[origin_i + len_added_points].hedge = half_edge  # this should be overrode several times
-            loop.append(half_edge)
-            half_edges_list[(origin_i, next_i)] = half_edge
-        for i in range(len(face)):
-            loop[i].last = loop[(i - 1) % len(face)]
-            loop[i].next = loop[(i + 1) % len(face)]
-        f.outer = loop[0]
-        mesh.faces.append(f)
-    mesh.hedges.extend(list(half_edges_list.values()))
-
-    # to twin hedges and create hedges of unbounded face
-    outer_half_edges = dict()
-    for key in half_edges_list:
-        half_edge = half_edges_list[key]
-        if key[::-1] in half_edges_list:
-            half_edge.twin = half_edges_list[key[::-1]]
-            half_edges_list[key[::-1]].twin = half_edge
-        else:
-            outer_edge = mesh.HalfEdge(mesh, mesh.points[key[1] + len_added_points])
-            outer_edge.face = mesh.unbounded
-            half_edge.twin = outer_edge
-            outer_edge.twin = half_edge
-            if key[::-1] in outer_half_edges:
-                raise Exception("It looks like input mesh has adjacent faces with only one common point"
-                                "Handle such meshes does not implemented yet.")
-            outer_half_edges[key[::-1]] = outer_edge
-    mesh.hedges.extend(list(outer_half_edges.values()))
-
-    # link hedges of unbounded face in loops
-    for key in outer_half_edges:
-        outer_edge = outer_half_edges[key]
-        next_edge = outer_edge.twin
-        count = 0
-        while next_edge:
-            next_edge = next_edge.last.twin
-            if next_edge.face.is_unbounded:
-                break
-            count += 1
-            if count > len(half_edges_list):
-                raise RecursionError("The hedge ({}) can't find next neighbour".format(outer_edge))
-        outer_edge.next = next_edge
-        next_edge.last = outer_edge
-
-    # link unbounded face to loops of edges of unbounded face
-    used = set()
-    for outer_hedge in outer_half_edges.values():
-        if outer_hedge in used:
-            continue
-        mesh.unbounded.inners.append(outer_hedge)
-        [used.add(hedge) for hedge in outer_hedge.loop_hedges]
+    points = [mesh.Point(mesh, co) for co in verts]
+    mesh.points.extend(points)
+    # Links between elements are found by arrays and only after that objects of the mesh are created
+    DCELArrays.from_sv_faces(verts, faces, face_selection, face_flag, face_data).to_dcel_mesh(mesh, points)
     return mesh
 
 
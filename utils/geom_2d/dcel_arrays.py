@@ -0,0 +1,490 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Structure of arrays variant of Doubly-Connected Edge List data structure (see dcel module).
+
+Points, half edges and faces are rows of NumPy arrays and links between them are indexes of the rows.
+Such mesh is built from Sverchok data and converted back without walking around Python objects
+and takes much less memory than DCELMesh.
+Algorithms which work with objects of DCELMesh (intersections, merging, make monotone) can get
+their mesh from the arrays with `to_dcel_mesh` method and put the result back with `from_dcel_mesh` method.
+"""
+
+from itertools import chain, compress
+
+import numpy as np
+
+
+NO_LINK = -1  # half edge does not have a link to a half edge or point does not have a half edge
+UNBOUNDED = -1  # face index of half edges of boundless super face
+NO_FACE = -2  # face index of half edges which are not assigned to any face
+
+
+class DCELArrays:
+    accuracy = 1e-5
+
+    def __init__(self, points=None):
+        self.points = np.empty((0, 3)) if points is None else points  # coordinates
+        self.point_hedge = np.full(len(self.points), NO_LINK, dtype=np.int32)  # one of hedges started in a point
+
+        # half edges
+        self.origin = np.empty(0, dtype=np.int32)  # index of origin point
+        self.twin = np.empty(0, dtype=np.int32)
+        self.next = np.empty(0, dtype=np.int32)
+        self.last = np.empty(0, dtype=np.int32)
+        self.face = np.empty(0, dtype=np.int32)  # index of face, UNBOUNDED or NO_FACE
+        self.listed = np.empty(0, dtype=bool)  # False for hedges which are not in hedges list of DCELMesh
+        self.slop = None  # calculated slops of half edges, NaN if it was not calculated
+        self.hedge_flags = dict()  # {flag: mask of half edges}
+
+        # faces
+        self.outer = np.empty(0, dtype=np.int32)  # hedge of boundary loop
+        self.select = np.empty(0, dtype=bool)
+        self.face_flags = dict()  # {flag: mask of faces}
+        self.face_data = dict()  # {name of data: [value of face 1, value of face 2, ...]}
+        self.inners = np.empty(0, dtype=np.int32)  # hedges of hole loops
+        self.inners_face = np.empty(0, dtype=np.int32)  # faces of hole loops, UNBOUNDED for boundless face
+
+    @property
+    def unbounded_inners(self):
+        return self.inners[self.inners_face == UNBOUNDED]
+
+    @classmethod
+    def from_sv_faces(cls, verts, faces, face_selection=None, face_flag=None, face_data=None):
+        """
+        Does the same as generate_dcel_mesh function of dcel module, the order of half edges and
+        all links between elements are the same as in DCELMesh generated by the function
+        :param verts: list of SV points
+        :param faces: list of SV faces
+        :param face_selection: list of bool values per face
+        :param face_flag: list of flags per face, faces with None values do not get any flag
+        :param face_data: {name of data: [value 1, val2, .., value n]} - number of values equal to number of faces
+        :return: DCELArrays
+        """
+        mesh = cls(_as_points(verts))
+        n_points = len(mesh.points)
+        sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        if np.any(sizes == 0):
+            raise ValueError("Faces should have at least one point")
+        flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=sizes.sum())
+        starts = np.cumsum(sizes) - sizes
+        face_index = np.repeat(np.arange(len(faces)), sizes)
+        local = np.arange(len(flat)) - starts[face_index]
+        face_sizes = sizes[face_index]
+
+        # hedges are created in order of loops of faces turned in ccw order
+        ccw = is_ccw_polygons(mesh.points, flat, starts, sizes)
+        origin = flat[starts[face_index] + np.where(ccw[face_index], local, face_sizes - 1 - local)]
+        next_created = starts[face_index] + (local + 1) % face_sizes
+        last_created = starts[face_index] + (local - 1) % face_sizes
+        dest = origin[next_created]
+
+        # hedges are kept in dictionary by (origin, destination) keys
+        # so only last hedge with a key is used and the order of keys is the order of their first appearance
+        # others hedges are kept only in loops of their faces, they are put to the end of the arrays
+        keys = origin * n_points + dest
+        unique_keys, first = np.unique(keys, return_index=True)
+        last_reversed = np.unique(keys[::-1], return_index=True)[1]
+        last_occurrence = len(keys) - 1 - last_reversed
+        listed = last_occurrence[np.argsort(first)]
+        is_listed = np.zeros(len(keys), dtype=bool)
+        is_listed[listed] = True
+        hidden = np.flatnonzero(~is_listed)
+
+        twin_keys = dest[listed] * n_points + origin[listed]
+        twin_positions = np.minimum(np.searchsorted(unique_keys, twin_keys), max(len(unique_keys) - 1, 0))
+        has_twin = unique_keys[twin_positions] == twin_keys if len(listed) else np.empty(0, dtype=bool)
+
+        # half edges of unbounded face are created for edges without twins
+        n_listed, n_outer = len(listed), np.count_nonzero(~has_twin)
+        outer = np.arange(n_listed, n_listed + n_outer)
+        new_index = np.empty(len(keys), dtype=np.int64)
+        new_index[listed] = np.arange(n_listed)
+        new_index[hidden] = np.arange(n_listed + n_outer, n_listed + n_outer + len(hidden))
+        n_hedges = len(keys) + n_outer
+
+        mesh.origin = np.empty(n_hedges, dtype=np.int32)
+        mesh.origin[new_index] = origin
+        mesh.origin[outer] = dest[listed[~has_twin]]
+        mesh.face = np.full(n_hedges, UNBOUNDED, dtype=np.int32)
+        mesh.face[new_index] = face_index
+        mesh.next = np.full(n_hedges, NO_LINK, dtype=np.int32)
+        mesh.next[new_index] = new_index[next_created]
+        mesh.last = np.full(n_hedges, NO_LINK, dtype=np.int32)
+        mesh.last[new_index] = new_index[last_created]
+        mesh.twin = np.full(n_hedges, NO_LINK, dtype=np.int32)
+        twins = np.empty(n_listed, dtype=np.int64)
+        twins[has_twin] = new_index[last_occurrence[twin_positions[has_twin]]]
+        twins[~has_twin] = outer
+        mesh.twin[:n_listed] = twins
+        mesh.twin[outer] = np.flatnonzero(~has_twin)
+        mesh.listed = np.arange(n_hedges) < n_listed + n_outer
+        mesh._link_unbounded_loops(outer)
+
+        _, last_of_points = np.unique(origin[::-1], return_index=True)
+        last_of_points = len(origin) - 1 - last_of_points
+        mesh.point_hedge[origin[last_of_points]] = new_index[last_of_points]
+
+        mesh.outer = new_index[starts].astype(np.int32)
+        mesh.select = np.array([bool(fs) for fs in face_selection], dtype=bool) if face_selection \
+            else np.zeros(len(faces), dtype=bool)
+        if face_flag:
+            for i, flag in enumerate(face_flag):
+                if flag:
+                    mesh.face_flags.setdefault(flag, np.zeros(len(faces), dtype=bool))[i] = True
+        if face_data:
+            mesh.face_data = {name: list(values) for name, values in face_data.items()}
+        return mesh
+
+    def _link_unbounded_loops(self, outer):
+        # next half edge of a half edge of unbounded face is searched by walking around its destination point
+        found = self.twin[outer]
+        active = np.arange(len(outer))
+        count = 0
+        while len(active):
+            step = self.twin[self.last[found[active]]]
+            if np.any(step == NO_LINK):
+                raise AttributeError("Half edges of overlapping faces with equal direction does not have twins")
+            found[active] = step
+            active = active[self.face[step] != UNBOUNDED]
+            count += 1
+            if count > len(self.twin):
+                raise RecursionError("The hedge ({}) can't find next neighbour".format(outer[active[0]]))
+        self.next[outer] = found
+        found_reversed, i_reversed = np.unique(found[::-1], return_index=True)
+        self.last[found_reversed] = outer[::-1][i_reversed]
+        if len(found_reversed) != len(outer):
+            raise RecursionError("Hedges of unbounded face does not have loops")
+
+        # first half edges of loops become inner components of unbounded face
+        self.inners = np.unique(cycle_labels(self.next)[outer]).astype(np.int32)
+        self.inners_face = np.full(len(self.inners), UNBOUNDED, dtype=np.int32)
+
+    @classmethod
+    def from_sv_edges(cls, verts, edges, accuracy=None):
+        """
+        Does the same as from_sv_edges method of DCELMesh, half edges are linked around their origins
+        Edges with zero length are ignored
+        :param verts: list of SV points
+        :param edges: list of SV edges
+        :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+        :return: DCELArrays
+        """
+        accuracy = accuracy or cls.accuracy
+        mesh = cls(_as_points(verts))
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edges = edges[~np.all(np.abs(mesh.points[edges[:, 0]] - mesh.points[edges[:, 1]]) < accuracy, axis=1)]
+
+        n_hedges = 2 * len(edges)
+        hedges = np.arange(n_hedges)
+        mesh.origin = edges.reshape(-1).astype(np.int32)
+        mesh.twin = (hedges ^ 1).astype(np.int32)
+        mesh.next = np.full(n_hedges, NO_LINK, dtype=np.int32)
+        mesh.last = np.full(n_hedges, NO_LINK, dtype=np.int32)
+        mesh.face = np.full(n_hedges, NO_FACE, dtype=np.int32)
+        mesh.listed = np.ones(n_hedges, dtype=bool)
+        np.maximum.at(mesh.point_hedge, mesh.origin, hedges.astype(np.int32))
+
+        # link half edges around their origins in ccw order
+        mesh.slop = mesh.get_slops(accuracy)
+        order = np.lexsort((hedges, mesh.slop, mesh.origin))
+        origins = mesh.origin[order]
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = origins[1:] != origins[:-1]
+        group_starts = np.flatnonzero(is_first)
+        group_sizes = np.diff(np.append(group_starts, len(order)))
+        next_in_group = np.arange(1, len(order) + 1)
+        next_in_group[group_starts + group_sizes - 1] = group_starts
+        twin_of_next = mesh.twin[order[next_in_group]]
+        mesh.last[order] = twin_of_next
+        mesh.next[twin_of_next] = order
+        return mesh
+
+    def get_slops(self, accuracy=None):
+        """
+        Does the same as slop property of half edges of DCELMesh for all half edges
+        Slop of half edge is calculated from slop of its twin if origin of the twin has lower index
+        :return: array of floats
+        """
+        accuracy = accuracy or self.accuracy
+        origin, twin_origin = self.points[self.origin], self.points[self.origin[self.twin]]
+        direction = twin_origin - origin
+
+        # Python power gives another rounding than NumPy, it is used for getting the same values as Point.length
+        length = np.array([(dx ** 2 + dy ** 2 + dz ** 2) ** 0.5 for dx, dy, dz in direction.tolist()])
+        length[length == 0] = 1
+        product = direction[:, 0] / length
+        slops = np.where(direction[:, 1] < 0, product + 1, 3 - product)
+
+        is_horizontal = np.abs(origin[:, 1] - twin_origin[:, 1]) < accuracy
+        slops[is_horizontal] = np.where(origin[is_horizontal, 0] - twin_origin[is_horizontal, 0] > accuracy, 4., 2.)
+
+        twin_slops = slops[self.twin]
+        from_twin = (self.origin[self.twin] < self.origin) & (twin_slops != 0)
+        slops[from_twin] = np.where(twin_slops[from_twin] != 2, (twin_slops[from_twin] + 2) % 4, 4)
+        return slops
+
+    @classmethod
+    def from_dcel_mesh(cls, mesh):
+        """
+        Converts objects of DCELMesh into arrays. Links between points, half edges and faces,
+        flags of half edges and faces, selection and data of faces are kept.
+        Elements which are not in lists of the mesh but are linked to its elements are put to the end of arrays.
+        :param mesh: DCELMesh
+        :return: DCELArrays
+        """
+        points, hedges, faces = list(mesh.points), list(mesh.hedges), list(mesh.faces)
+        point_index = {id(point): i for i, point in enumerate(points)}
+        hedge_index = {id(hedge): i for i, hedge in enumerate(hedges)}
+        face_index = {id(face): i for i, face in enumerate(faces)}
+        face_index[id(mesh.unbounded)] = UNBOUNDED
+        n_listed = len(hedges)
+
+        def get_index(obj, objects, indexes, default=NO_LINK):
+            if obj is None:
+                return default
+            i = indexes.get(id(obj))
+            if i is None:
+                i = indexes[id(obj)] = len(objects)
+                objects.append(obj)
+            return i
+
+        origin, twin, next_hedge, last, hedge_face = [], [], [], [], []
+        point_hedge, outer, inners, inners_face = [], [], [], []
+        for hedge in mesh.unbounded.inners:
+            inners.append(get_index(hedge, hedges, hedge_index))
+            inners_face.append(UNBOUNDED)
+        i_hedge, i_point, i_face = 0, 0, 0
+        while True:
+            if i_hedge < len(hedges):
+                hedge = hedges[i_hedge]
+                origin.append(get_index(hedge.origin, points, point_index))
+                twin.append(get_index(hedge.twin, hedges, hedge_index))
+                next_hedge.append(get_index(hedge.next, hedges, hedge_index))
+                last.append(get_index(hedge.last, hedges, hedge_index))
+                hedge_face.append(get_index(hedge.face, faces, face_index, NO_FACE))
+                i_hedge += 1
+            elif i_face < len(faces):
+                face = faces[i_face]
+                outer.append(get_index(face.outer, hedges, hedge_index))
+                for hedge in face.inners:
+                    inners.append(get_index(hedge, hedges, hedge_index))
+                    inners_face.append(i_face)
+                i_face += 1
+            elif i_point < len(points):
+                point_hedge.append(get_index(points[i_point].hedge, hedges, hedge_index))
+                i_point += 1
+            else:
+                break
+
+        arrays = cls(_as_points([point.co for point in points]))
+        arrays.point_hedge = np.array(point_hedge, dtype=np.int32)
+        arrays.origin = np.array(origin, dtype=np.int32)
+        arrays.twin = np.array(twin, dtype=np.int32)
+        arrays.next = np.array(next_hedge, dtype=np.int32)
+        arrays.last = np.array(last, dtype=np.int32)
+        arrays.face = np.array(hedge_face, dtype=np.int32)
+        arrays.listed = np.arange(len(hedges)) < n_listed
+        arrays.slop = np.array([np.nan if hedge._slop is None else hedge._slop for hedge in hedges])
+        arrays.hedge_flags = _flag_masks(hedges)
+        arrays.outer = np.array(outer, dtype=np.int32)
+        arrays.select = np.array([face.select for face in faces], dtype=bool)
+        arrays.face_flags = _flag_masks(faces)
+        names = list(dict.fromkeys(chain.from_iterable(face.sv_data for face in faces)))
+        arrays.face_data = {name: [face.sv_data.get(name) for face in faces] for name in names}
+        arrays.inners = np.array(inners, dtype=np.int32)
+        arrays.inners_face = np.array(inners_face, dtype=np.int32)
+        return arrays
+
+    def to_dcel_mesh(self, mesh, points=None):
+        """
+        Creates objects of points, half edges and faces and adds them to given mesh
+        :param mesh: DCELMesh, classes of its points, half edges and faces are used
+        :param points: objects of points of the mesh which are given points of the arrays,
+        new points are created if they are not given
+        :return: mesh
+        """
+        if points is None:
+            points = [mesh.Point(mesh, co) for co in self.points.tolist()]
+            mesh.points.extend(points)
+        faces = [mesh.Face(mesh) for _ in range(len(self.outer))]
+
+        hedges = [mesh.HalfEdge(mesh, points[i_point], faces[i_face] if i_face >= 0 else None)
+                  for i_point, i_face in zip(self.origin.tolist(), self.face.tolist())]
+        for i in np.flatnonzero(self.face == UNBOUNDED).tolist():
+            hedges[i].face = mesh.unbounded
+        links = hedges + [None]  # NO_LINK index gives None
+        for hedge, twin, next_hedge, last in zip(hedges, self.twin.tolist(), self.next.tolist(), self.last.tolist()):
+            hedge.twin = links[twin]
+            hedge.next = links[next_hedge]
+            hedge.last = links[last]
+        if self.slop is not None:
+            for i in np.flatnonzero(~np.isnan(self.slop)).tolist():
+                hedges[i]._slop = self.slop[i].item()
+        for name, mask in self.hedge_flags.items():
+            for i in np.flatnonzero(mask).tolist():
+                hedges[i].flags.add(name)
+        for point, i_hedge in zip(points, self.point_hedge.tolist()):
+            if i_hedge != NO_LINK:
+                point.hedge = hedges[i_hedge]
+
+        for face, outer, select in zip(faces, self.outer.tolist(), self.select.tolist()):
+            face.select = select
+            if outer != NO_LINK:
+                face.outer = hedges[outer]
+        for name, mask in self.face_flags.items():
+            for i in np.flatnonzero(mask).tolist():
+                faces[i].flags.add(name)
+        for name, values in self.face_data.items():
+            for face, value in zip(faces, values):
+                face.sv_data[name] = value
+        inner_faces = faces + [mesh.unbounded]  # UNBOUNDED index gives boundless face
+        for i_hedge, i_face in zip(self.inners.tolist(), self.inners_face.tolist()):
+            inner_faces[i_face].inners.append(hedges[i_hedge])
+
+        mesh.hedges.extend(compress(hedges, self.listed.tolist()))
+        mesh.faces.extend(faces)
+        return mesh
+
+    def loops(self, start_hedges):
+        """
+        Returns half edges of loops started from given half edges in order of the loops
+        :param start_hedges: array of half edges, only one half edge per loop
+        :return: array of half edges, array of sizes of the loops
+        """
+        start_hedges = np.asarray(start_hedges, dtype=np.int64)
+        labels = cycle_labels(self.next)
+        is_start = np.zeros(len(self.next), dtype=bool)
+        is_start[start_hedges] = True
+        loop_order = np.full(len(self.next), -1)
+        loop_order[labels[start_hedges]] = np.arange(len(start_hedges))
+        in_loops = loop_order[labels] != -1
+
+        # distance from half edges to the end of their loops
+        hedges = np.arange(len(self.next))
+        next_hedges = np.where(self.next >= 0, self.next, hedges)
+        successors = np.where(in_loops & ~is_start[next_hedges], next_hedges, hedges)
+        distance = (successors != hedges).astype(np.int64)
+        for _ in range(_doubling_steps(len(hedges))):
+            distance = distance + distance[successors]
+            successors = successors[successors]
+
+        members = np.flatnonzero(in_loops)
+        members = members[np.lexsort((-distance[members], loop_order[labels[members]]))]
+        return members, distance[start_hedges] + 1
+
+    def to_sv_mesh(self, edges=True, faces=True, only_select=False, del_edge_flag=None, del_face_flag=None):
+        """
+        Does the same as to_sv_mesh method of DCELMesh
+        Points are given in order of first half edges of their stars in list of half edges
+        """
+        if del_edge_flag and del_face_flag:
+            raise ValueError('Not sure that both del flags can do the job')
+        hedges = np.flatnonzero(self.listed)
+        all_hedges = np.arange(len(self.twin))
+
+        # half edges around one point have equal labels
+        has_star = (self.last != NO_LINK) & (self.twin[self.last] != NO_LINK)
+        labels = cycle_labels(np.where(has_star, self.twin[self.last], all_hedges))
+        stars = hedges[np.sort(np.unique(labels[hedges], return_index=True)[1])]  # first hedges of stars
+        if del_face_flag or del_edge_flag:
+            if del_face_flag:
+                face_mask = self.face_flags.get(del_face_flag, np.zeros(len(self.outer), dtype=bool))
+                is_used_face = np.append((self.outer != NO_LINK) & ~face_mask, [False, False])  # for negative indexes
+                is_used = is_used_face[self.face]
+            else:
+                is_used = ~self.hedge_flags.get(del_edge_flag, np.zeros(len(self.twin), dtype=bool))
+            # a point is used if at least one of half edges of its star is used
+            stars = stars[np.bincount(labels, weights=is_used.astype(float), minlength=len(labels))[labels[stars]] > 0]
+        point_index = np.full(len(self.points), -1)
+        np.maximum.at(point_index, self.origin[stars], np.arange(len(stars)))
+        sv_verts = self.points[self.origin[stars]].tolist()
+        out = [sv_verts]
+
+        if edges:
+            is_deleted = self.hedge_flags.get(del_edge_flag, np.zeros(len(self.twin), dtype=bool)) \
+                if del_edge_flag else np.zeros(len(self.twin), dtype=bool)
+            position = np.full(len(self.twin), len(self.twin))
+            position[hedges] = np.arange(len(hedges))
+            twins = self.twin[hedges]
+            used_by_twin = (position[twins] < position[hedges]) & ~is_deleted[twins]
+            edge_hedges = hedges[~is_deleted[hedges] & ~used_by_twin]
+            out.append(np.stack([point_index[self.origin[edge_hedges]],
+                                 point_index[self.origin[self.twin[edge_hedges]]]], axis=1).tolist())
+
+        if faces:
+            is_face = self.outer != NO_LINK
+            if del_face_flag and del_face_flag in self.face_flags:
+                is_face &= ~self.face_flags[del_face_flag]
+            if only_select:
+                is_face &= self.select
+            loop_hedges, sizes = self.loops(self.outer[is_face])
+            loop_points = point_index[self.origin[loop_hedges]].tolist()
+            ends = np.cumsum(sizes).tolist()
+            out.append([loop_points[end - size: end] for end, size in zip(ends, sizes.tolist())])
+        return out
+
+
+def is_ccw_polygons(points, flat_faces, starts, sizes, accuracy=1e-6):
+    """
+    Does the same as is_ccw_polygon function of lin_alg module for all faces
+    :param points: array of points
+    :param flat_faces: array of indexes of points of all faces
+    :param starts: array of positions of first indexes of faces
+    :param sizes: array of numbers of points of faces
+    :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+    :return: array of bool values, True if order of points of a face is counterclockwise
+    """
+    if not len(sizes):
+        return np.empty(0, dtype=bool)
+    face_index = np.repeat(np.arange(len(sizes)), sizes)
+    xs = points[flat_faces, 0]
+    candidates = np.flatnonzero(xs == np.minimum.reduceat(xs, starts)[face_index])
+    most_left = candidates[np.unique(face_index[candidates], return_index=True)[1]]
+    local = most_left - starts
+    a = points[flat_faces[starts + (local - 1) % sizes]]
+    b = points[flat_faces[most_left]]
+    c = points[flat_faces[starts + (local + 1) % sizes]]
+    is_vertical = (np.abs(a[:, 0] - b[:, 0]) < accuracy) & (np.abs(a[:, 0] - c[:, 0]) < accuracy)
+    is_ccw = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) > (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    return np.where(is_vertical, a[:, 1] > b[:, 1], is_ccw)
+
+
+def cycle_labels(successors):
+    """
+    Labels elements of cycles of a permutation, elements of one cycle get the minimal index of the cycle
+    :param successors: array, index of next element of a cycle for each element
+    :return: array of labels
+    """
+    labels = np.arange(len(successors))
+    successors = np.where(successors >= 0, successors, labels)  # elements without links are cycles itself
+    for _ in range(_doubling_steps(len(successors))):
+        labels = np.minimum(labels, labels[successors])
+        successors = successors[successors]
+    return labels
+
+
+def _doubling_steps(length):
+    # number of steps of pointer jumping algorithm to walk over a list with given length
+    return int(np.ceil(np.log2(length))) if length > 1 else 0
+
+
+def _as_points(verts):
+    points = np.zeros((len(verts), 3))
+    if len(verts):
+        coords = np.asarray(verts, dtype=np.float64)
+        points[:, :min(coords.shape[1], 3)] = coords[:, :3]
+    return points
+
+
+def _flag_masks(elements):
+    masks = dict()
+    for i, element in enumerate(elements):
+        for flag in element.flags:
+            masks.setdefault(flag, np.zeros(len(elements), dtype=bool))[i] = True
+    return masks
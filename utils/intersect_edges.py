@@ -33,6 +33,139 @@ from sverchok.utils.math import np_dot
 
 import numpy as np
 
+PAIRS_CHUNK_SIZE = 1 << 20  # number of candidate pairs checked at once by a broadphase
+
+
+def _following_pairs(counts):
+    '''Yields arrays (p, q) of position pairs where each position p is paired
+    with counts[p] next positions. Pairs are generated by chunks to limit memory'''
+    ends = np.cumsum(counts)
+    start, n = 0, len(counts)
+    while start < n:
+        done = ends[start - 1] if start else 0
+        stop = min(max(np.searchsorted(ends, done + PAIRS_CHUNK_SIZE, side='right'), start + 1), n)
+        chunk_counts = counts[start: stop]
+        p = np.repeat(np.arange(start, stop), chunk_counts)
+        q = np.arange(len(p)) - np.repeat(ends[start: stop] - chunk_counts - done, chunk_counts) + p + 1
+        yield p, q
+        start = stop
+
+def _boxes_overlap(lo, hi, i, j):
+    return np.all((lo[i] <= hi[j]) & (lo[j] <= hi[i]), axis=1)
+
+def _sweep_and_prune(lo, hi):
+    '''Pairs of overlapping boxes. Boxes are sorted along the axis of the
+    biggest extent, each box is checked only with boxes which start inside it'''
+    axis = np.argmax(hi.max(axis=0) - lo.min(axis=0))
+    order = np.argsort(lo[:, axis], kind='stable')
+    starts = lo[order, axis]
+    counts = np.searchsorted(starts, hi[order, axis], side='right') - np.arange(len(order)) - 1
+    counts = np.maximum(counts, 0)
+    pairs = []
+    for p, q in _following_pairs(counts):
+        i, j = order[p], order[q]
+        overlap = _boxes_overlap(lo, hi, i, j)
+        pairs.append(np.stack((i[overlap], j[overlap]), axis=-1))
+    return pairs
+
+def _uniform_grid(lo, hi):
+    '''Pairs of overlapping boxes. Boxes are put into cells of a grid, only
+    boxes sharing a cell are checked. A pair is reported only by the first
+    cell they share so there is no need to remove duplicates'''
+    n, dims = lo.shape
+    origin = lo.min(axis=0)
+    extent = np.max(hi.max(axis=0) - origin)
+    # the cell is not smaller than an average box and the grid has not more cells than boxes
+    cell = max(np.mean(np.max(hi - lo, axis=1)), extent / n ** (1 / dims))
+    if cell == 0:
+        cell = 1.0
+    c_lo = np.floor((lo - origin) / cell).astype(np.int64)
+    c_hi = np.floor((hi - origin) / cell).astype(np.int64)
+    grid_shape = c_hi.max(axis=0) + 1
+    spans = c_hi - c_lo + 1
+
+    def cell_keys(cells):
+        keys = np.zeros(len(cells), dtype=np.int64)
+        for d in range(dims):
+            keys = keys * grid_shape[d] + cells[:, d]
+        return keys
+
+    # all cells of each box
+    box_counts = np.prod(spans, axis=1)
+    box = np.repeat(np.arange(n), box_counts)
+    local = np.arange(len(box)) - np.repeat(np.cumsum(box_counts) - box_counts, box_counts)
+    cells = np.empty((len(box), dims), dtype=np.int64)
+    for d in reversed(range(dims)):
+        cells[:, d] = c_lo[box, d] + local % spans[box, d]
+        local //= spans[box, d]
+    keys = cell_keys(cells)
+    order = np.lexsort((box, keys))
+    keys, box = keys[order], box[order]
+
+    group_ends = np.searchsorted(keys, keys, side='right')
+    counts = group_ends - np.arange(len(keys)) - 1
+    pairs = []
+    for p, q in _following_pairs(counts):
+        i, j = box[p], box[q]
+        first_cell = cell_keys(np.maximum(c_lo[i], c_lo[j])) == keys[p]
+        overlap = first_cell & _boxes_overlap(lo, hi, i, j)
+        pairs.append(np.stack((i[overlap], j[overlap]), axis=-1))
+    return pairs
+
+def edge_candidate_pairs(verts, edges, padding=0.0, dims=3, broadphase='SWEEP'):
+    '''
+    Broadphase of edges intersection. Returns array of pairs of indices of
+    edges which bounding boxes overlap, other edges can't intersect.
+    Pairs are in the same order as `cross_indices_np` gives them: [i, j], i < j.
+    padding: distance to enlarge bounding boxes, one value or one per edge
+    dims: 2 to use only XY coordinates
+    broadphase: 'SWEEP' (sweep and prune) or 'GRID' (uniform grid)
+    '''
+    np_edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if len(np_edges) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    segments = np.asarray(verts, dtype=float)[np_edges, :dims]
+    padding = np.asarray(padding, dtype=float)
+    if padding.ndim:
+        padding = padding[:, np.newaxis]
+    lo = segments.min(axis=1) - padding
+    hi = segments.max(axis=1) + padding
+
+    if broadphase == 'SWEEP':
+        pairs = _sweep_and_prune(lo, hi)
+    elif broadphase == 'GRID':
+        pairs = _uniform_grid(lo, hi)
+    else:
+        raise ValueError(f"Unknown broadphase: {broadphase}")
+
+    pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=np.int64)
+    pairs.sort(axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+def split_edges_by_points(np_edges, pairs, coefs, new_idx):
+    '''
+    Edges between ends of the edges and intersection points on them.
+    pairs: intersected edges, coefs: positions of intersections on the edges
+    (per item of flattened pairs), new_idx: indexes of the intersection points
+    (per item of flattened pairs). Points of each edge are sorted by their positions.
+    '''
+    n = len(np_edges)
+    edge_idx = pairs.ravel()
+    order = np.lexsort((coefs, edge_idx))
+    edge_idx, new_idx = edge_idx[order], new_idx[order]
+    counts = np.bincount(edge_idx, minlength=n)
+    # chain of each edge: first vertex, intersection points, last vertex
+    chain_starts = np.cumsum(counts + 2) - counts - 2
+    chains = np.empty(len(edge_idx) + 2 * n, dtype=np.int64)
+    chains[chain_starts] = np_edges[:, 0]
+    chains[chain_starts + counts + 1] = np_edges[:, 1]
+    inner_idx = np.arange(len(edge_idx)) - (np.cumsum(counts) - counts)[edge_idx]
+    chains[chain_starts[edge_idx] + inner_idx + 1] = new_idx
+    link = np.ones(max(len(chains) - 1, 0), dtype=bool)
+    link[(chain_starts + counts + 1)[:-1]] = False
+    link_idx = np.flatnonzero(link)
+    return np.stack((chains[link_idx], chains[link_idx + 1]), axis=-1)
+
 def order_points(edge, point_list):
     ''' order these edges from distance to v1, then
     sandwich the sorted list with v1, v2 '''
@@ -91,12 +224,30 @@ def can_skip(cm, closest_points, vert_vectors):
     cpa, cpb = closest_points
     return (cpa-cpb).length > cm.VTX_PRECISION
 
-def get_intersection_dictionary(cm, bm, edge_indices):
+def get_candidate_permutations(bm, edge_indices, broadphase):
+    '''The same as get_valid_permutations but only for edges which bounding
+    boxes overlap'''
+    edge_indices = np.array(edge_indices, dtype=np.int64)
+    verts = np.array([v.co for v in bm.verts])
+    edges = np.array([[v.index for v in bm.edges[e].verts] for e in edge_indices], dtype=np.int64).reshape(-1, 2)
+    pairs = edge_candidate_pairs(verts, edges, broadphase=broadphase)
+    eds = edges[pairs].reshape(-1, 4)
+    mask = np.invert(np.any([eds[:, 0] == eds[:, 2],
+                             eds[:, 0] == eds[:, 3],
+                             eds[:, 1] == eds[:, 2],
+                             eds[:, 1] == eds[:, 3]],
+                            axis=0))
+    return edge_indices[pairs[mask]].tolist()
+
+def get_intersection_dictionary(cm, bm, edge_indices, broadphase='NONE'):
 
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(cm, bm, edge_indices)
+    if broadphase == 'NONE':
+        permutations = get_valid_permutations(cm, bm, edge_indices)
+    else:
+        permutations = get_candidate_permutations(bm, edge_indices, broadphase)
 
     k = defaultdict(list)
     d = defaultdict(list)
@@ -162,7 +313,7 @@ def unselect_nonintersecting(bm, d_edges, edge_indices):
             bm.edges[edge].select = False
         # print("unselected {}, non intersecting edges".format(reserved_edges))
 
-def bmesh_intersect_edges_3d(bm, s_epsilon):
+def bmesh_intersect_edges_3d(bm, s_epsilon, broadphase='NONE'):
     edge_indices = [e.index for e in bm.edges]
     trim_indices = len(edge_indices)
     for edge in bm.edges:
@@ -170,7 +321,7 @@ def bmesh_intersect_edges_3d(bm, s_epsilon):
 
     cm = CAD_ops(epsilon=s_epsilon)
 
-    d = get_intersection_dictionary(cm, bm, edge_indices)
+    d = get_intersection_dictionary(cm, bm, edge_indices, broadphase)
     unselect_nonintersecting(bm, d.keys(), edge_indices)
 
     # store non_intersecting edge sequencer
@@ -179,12 +330,12 @@ def bmesh_intersect_edges_3d(bm, s_epsilon):
     update_mesh(bm, d)
     return add_back
 
-def intersect_edges_3d(verts_in, edges_in, s_epsilon):
+def intersect_edges_3d(verts_in, edges_in, s_epsilon, broadphase='NONE'):
     bm = bmesh_from_pydata(verts_in, edges_in, [])
 
     trim_indices = len(bm.edges[:])
 
-    add_back = bmesh_intersect_edges_3d(bm, s_epsilon)
+    add_back = bmesh_intersect_edges_3d(bm, s_epsilon, broadphase)
 
     verts_out = [v.co.to_tuple() for v in bm.verts]
     bm.verts.index_update()
@@ -198,11 +349,15 @@ def intersect_edges_3d(verts_in, edges_in, s_epsilon):
 # adapted from
 # https://stackoverflow.com/a/18994296
 # distance point line https://stackoverflow.com/a/39840218
-def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True):
-    '''Brute force Numpy implementation of edges intersections'''
-    indices = cross_indices_np(len(edges))
+def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True, broadphase='NONE'):
+    '''Numpy implementation of edges intersections. Pairs of edges are tested
+    by brute force or only pairs given by the broadphase ('SWEEP' or 'GRID')'''
     np_verts = verts if isinstance(verts, np.ndarray) else np.array(verts)
     np_edges = edges if isinstance(edges, np.ndarray) else np.array(edges)
+    if broadphase == 'NONE':
+        indices = cross_indices_np(len(edges))
+    else:
+        indices = edge_candidate_pairs(np_verts, np_edges, 2 * s_epsilon, broadphase=broadphase)
     eds = np_edges[indices].reshape(-1, 4)
     mask = np.invert(np.any([eds[:, 0] == eds[:, 2],
                              eds[:, 0] == eds[:, 3],
@@ -253,22 +408,11 @@ def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True):
     all_coefs = np.concatenate([[n_a_m], [n_b_m]], axis=0).T.ravel()
 
     indices_m2 = indices_m[non_parallel][co_planar][valid_inter]
-    i_ravel = indices_m2.ravel()
     new_idx = np.repeat(np.arange(len(inters)) + len(np_verts), 2)
 
-    new_edges = []
-    for i in range(len(edges)):
-        intersect_mask = i_ravel == i
-        coef = all_coefs[intersect_mask]
-        n_i = new_idx[intersect_mask]
-        iid = np.argsort(coef)
-        n_i_sorted = n_i[iid]
-        new_eds = np.concatenate([[np_edges[i, 0]],
-                                  np.repeat(n_i_sorted, 2),
-                                  [np_edges[i, 1]]]).reshape(-1,2)
-        new_edges.append(new_eds)
+    new_edges = split_edges_by_points(np_edges, indices_m2, all_coefs, new_idx)
 
-    return np.concatenate([np_verts, inters]).tolist(), np.concatenate(new_edges).tolist()
+    return np.concatenate([np_verts, inters]).tolist(), new_edges.tolist()
 
 def edges_from_ed_inter_double_removal(ed_inter):
     '''create edges from intersections library'''
@@ -294,8 +438,10 @@ def edges_from_ed_inter(ed_inter):
             edges_out.append((e_s[i-1][1], e_s[i][1]))
     return edges_out
 
-def intersect_edges_2d(verts, edges, epsilon):
-    '''Iterate through edges  and expose them to intersect_line_line_2d'''
+def intersect_edges_2d(verts, edges, epsilon, broadphase='NONE'):
+    '''Iterate through edges  and expose them to intersect_line_line_2d.
+    Each edge is tested with all previous edges or only with ones given by the
+    broadphase ('SWEEP' or 'GRID')'''
     verts_in = [Vector(v) for v in verts]
     ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
     verts_out = verts
@@ -306,41 +452,52 @@ def intersect_edges_2d(verts, edges, epsilon):
         # if there is no intersections this will create a normal edge
         ed_inter[i].append([0.0, e[0]])
         ed_inter[i].append([d, e[1]])
-        v1 = verts_in[e[0]]
-        v2 = verts_in[e[1]]
+
+    if broadphase == 'NONE':
+        pairs = ((i, j) for i in e_idx for j in e_idx[:i])
+    else:
+        # intersect_line_line_2d finds points slightly outside of segments
+        # and works with single precision
+        np_verts = np.array(verts_in)
+        padding = 1e-5 * (np.array(ed_lengths) + np.abs(np_verts).max(initial=0))
+        pairs = edge_candidate_pairs(np_verts, edges, padding, dims=2, broadphase=broadphase)
+        pairs = pairs[np.lexsort((pairs[:, 0], pairs[:, 1])), ::-1].tolist()
+
+    for i, j in pairs:
+        e, d = edges[i], ed_lengths[i]
         if d == 0:
             continue
+        e2, d2 = edges[j], ed_lengths[j]
+        if d2 < epsilon:
+            continue
+        if (e2[0] in e) or (e2[1] in e):
+            continue
 
-        for e2, d2, j in zip(edges[:i], ed_lengths[:i], e_idx[:i]):
-
-            if d2 < epsilon:
-                continue
-            if (e2[0] in e) or (e2[1] in e):
-                continue
-
-            v3 = verts_in[e2[0]]
-            v4 = verts_in[e2[1]]
-            vx = intersect_line_line_2d(v1, v2, v3, v4)
-            if vx:
-                d_to_1 = (vx - v1.to_2d()).length
-                d_to_2 = (vx - v3.to_2d()).length
-
-                new_id = len(verts_out)
-
-                if d_to_1 < epsilon:
-                    new_id = e[0]
-                elif d_to_1 > d - epsilon:
-                    new_id = e[1]
-                elif d_to_2 < epsilon:
-                    new_id = e2[0]
-                elif d_to_2 > d2 - epsilon:
-                    new_id = e2[1]
-                if new_id == len(verts_out):
-                    verts_out.append((vx.x, vx.y, v1.z))
-
-                # first item stores distance to origin, second the vertex id
-                ed_inter[i].append([d_to_1, new_id])
-                ed_inter[j].append([d_to_2, new_id])
+        v1 = verts_in[e[0]]
+        v2 = verts_in[e[1]]
+        v3 = verts_in[e2[0]]
+        v4 = verts_in[e2[1]]
+        vx = intersect_line_line_2d(v1, v2, v3, v4)
+        if vx:
+            d_to_1 = (vx - v1.to_2d()).length
+            d_to_2 = (vx - v3.to_2d()).length
+
+            new_id = len(verts_out)
+
+            if d_to_1 < epsilon:
+                new_id = e[0]
+            elif d_to_1 > d - epsilon:
+                new_id = e[1]
+            elif d_to_2 < epsilon:
+                new_id = e2[0]
+            elif d_to_2 > d2 - epsilon:
+                new_id = e2[1]
+            if new_id == len(verts_out):
+                verts_out.append((vx.x, vx.y, v1.z))
+
+            # first item stores distance to origin, second the vertex id
+            ed_inter[i].append([d_to_1, new_id])
+            ed_inter[j].append([d_to_2, new_id])
 
 
     edges_out = edges_from_ed_inter(ed_inter)
@@ -401,24 +558,34 @@ def intersect_edges_2d_double_removal(verts, edges, epsilon):
 
     return verts_out, edges_out
 
+def _padding_2d(np_verts, np_edges, epsilon):
+    '''Intersections are searched with tolerance relative to edge length'''
+    directions = np_verts[np_edges[:, 1], :2] - np_verts[np_edges[:, 0], :2]
+    return 2 * epsilon * np.linalg.norm(directions, axis=1)
+
 # adapted from https://stackoverflow.com/a/3252222/16039380
 def perp(a):
-    b = np.empty_like(a)
+    b = np.zeros_like(a)
     b[:, 0] = -a[:,1]
     b[:, 1] = a[:,0]
     return b
 
 def perp_single(a):
-    b = np.empty_like(a)
+    b = np.zeros_like(a)
     b[0] = -a[1]
     b[1] = a[0]
     return b
 
-def intersect_edges_2d_np(verts, edges, epsilon, only_touching=True):
-    '''Brute force Numpy implementation of edges intersections'''
-    indices = cross_indices_np(len(edges))
+def intersect_edges_2d_np(verts, edges, epsilon, only_touching=True, broadphase='NONE'):
+    '''Numpy implementation of edges intersections. Pairs of edges are tested
+    by brute force or only pairs given by the broadphase ('SWEEP' or 'GRID')'''
     np_verts = verts if isinstance(verts, np.ndarray) else np.array(verts)
     np_edges = edges if isinstance(edges, np.ndarray) else np.array(edges)
+    if broadphase == 'NONE':
+        indices = cross_indices_np(len(edges))
+    else:
+        indices = edge_candidate_pairs(np_verts, np_edges, _padding_2d(np_verts, np_edges, epsilon),
+                                       dims=2, broadphase=broadphase)
     eds = np_edges[indices].reshape(-1, 4)
     mask = np.invert(np.any([eds[:, 0] == eds[:, 2],
                              eds[:, 0] == eds[:, 3],
@@ -454,34 +621,32 @@ def intersect_edges_2d_np(verts, edges, epsilon, only_touching=True):
     all_coefs = np.concatenate([[n_b_m], [n_a_m]], axis=0).T.ravel()
 
     indices_m2 = indices_m[valid_inter]
-    i_ravel = indices_m2.ravel()
 
     inters = inter[valid_inter]
     new_idx = np.repeat(np.arange(len(inters)) + len(np_verts), 2)
 
-    new_edges = []
-    for i in range(len(edges)):
-        intersect_mask = i_ravel == i
-        coef = all_coefs[intersect_mask]
-        n_i = new_idx[intersect_mask]
-        iid = np.argsort(coef)
-        n_i_sorted = n_i[iid]
-        new_eds = np.concatenate([[np_edges[i, 0]],
-                                  np.repeat(n_i_sorted, 2),
-                                  [np_edges[i, 1]]]).reshape(-1, 2)
-        new_edges.append(new_eds)
-
-    return np.concatenate([np_verts, inters]).tolist(), np.concatenate(new_edges).tolist()
-
-def intersect_edges_2d_np_big(verts, edges, epsilon, only_touching=True):
-    '''Brute force Numpy implementation of edges intersections. Avoids to do to it all at once to prevent stack overflow'''
+    new_edges = split_edges_by_points(np_edges, indices_m2, all_coefs, new_idx)
+
+    return np.concatenate([np_verts, inters]).tolist(), new_edges.tolist()
+
+def intersect_edges_2d_np_big(verts, edges, epsilon, only_touching=True, broadphase='NONE'):
+    '''Numpy implementation of edges intersections. Avoids to do to it all at once to prevent stack overflow.
+    Each edge is tested with all next edges or only with ones given by the broadphase ('SWEEP' or 'GRID')'''
     np_verts = verts if isinstance(verts, np.ndarray) else np.array(verts)
     np_edges = edges if isinstance(edges, np.ndarray) else np.array(edges)
     n = len(edges)
-    n_as, n_bs, indices_m2s, inters_s = [], [], [], []
-    for i in range(n-1):
+    if broadphase == 'NONE':
+        rows = ((i, np.arange(i+1, n, dtype=np.int32)) for i in range(n-1))
+    else:
+        pairs = edge_candidate_pairs(np_verts, np_edges, _padding_2d(np_verts, np_edges, epsilon),
+                                     dims=2, broadphase=broadphase)
+        bounds = np.searchsorted(pairs[:, 0], np.arange(n + 1))
+        rows = ((i, pairs[bounds[i]: bounds[i+1], 1]) for i in np.flatnonzero(np.diff(bounds)))
+    # empty items keep concatenation valid when there are no pairs to test
+    n_as, n_bs = [np.empty(0)], [np.empty(0)]
+    indices_m2s, inters_s = [np.empty((0, 2), dtype=np.int64)], [np.empty((0, np_verts.shape[1]))]
+    for i, np_j in rows:
 
-        np_j = np.arange(i+1, n, dtype=np.int32)
         edgs_i = np_edges[i]
         eds_j = np_edges[np_j]
         mask = np.invert(np.any([edgs_i[np.newaxis, 0] == eds_j[:, 0],
@@ -538,23 +703,12 @@ def intersect_edges_2d_np_big(verts, edges, epsilon, only_touching=True):
     c_indices_m2s = np.concatenate(indices_m2s)
     c_inters_s = np.concatenate(inters_s)
     all_coefs = np.concatenate([[c_n_bs], [c_n_as]], axis=0).T.ravel()
-    i_ravel = c_indices_m2s.ravel()
 
     new_idx = np.repeat(np.arange(len(c_inters_s)) + len(np_verts), 2)
 
-    new_edges = []
-    for i in range(len(edges)):
-        intersect_mask = i_ravel == i
-        coef = all_coefs[intersect_mask]
-        n_i = new_idx[intersect_mask]
-        iid = np.argsort(coef)
-        n_i_sorted = n_i[iid]
-        new_eds = np.concatenate([[np_edges[i, 0]],
-                                  np.repeat(n_i_sorted, 2),
-                                  [np_edges[i, 1]]]).reshape(-1, 2)
-        new_edges.append(new_eds)
-
-    return np.concatenate([np_verts, c_inters_s]).tolist(), np.concatenate(new_edges).tolist()
+    new_edges = split_edges_by_points(np_edges, c_indices_m2s, all_coefs, new_idx)
+
+    return np.concatenate([np_verts, c_inters_s]).tolist(), new_edges.tolist()
 
 
 def remove_doubles_from_edgenet(verts_in, edges_in, distance):
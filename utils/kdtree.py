@@ -15,6 +15,14 @@ if scipy is not None:
     from scipy.spatial import cKDTree
 
 class SvKdTree(object):
+    """
+    Common interface of KD-tree implementations.
+
+    query and query_range methods search for one needle; query_array and
+    query_range_array methods are batched versions which search for many
+    needles at once. Batched methods should be preferred when many points are
+    to be processed, since implementations can do it without Python loops.
+    """
     SCIPY = 'SCIPY'
     BLENDER = 'BLENDER'
 
@@ -41,12 +49,40 @@ class SvKdTree(object):
     def query(self, needle, count=1):
         raise Exception("Not implemented")
 
-    def query_array(self, needle, count=1):
+    def query_array(self, needle, count=1, workers=-1):
+        """
+        Search for nearest points for each of needles.
+
+        Input:
+            * needle: np.array of shape (n, 3)
+            * count: number of nearest points to search for
+            * workers: number of threads to use, -1 means all processors.
+              It is taken into account only by implementations which
+              support it.
+
+        Output: tuple of
+            * locations: np.array of shape (n, 3) if count == 1, (n, count, 3) otherwise
+            * indices: np.array of shape (n,) or (n, count)
+            * distances: np.array of shape (n,) or (n, count)
+        """
         raise Exception("Not implemented")
 
     def query_range(self, needle, radius, **kwargs):
         raise Exception("Not implemented")
 
+    def query_range_array(self, needle, radius, workers=-1):
+        """
+        Search for points within the radius from each of needles.
+
+        Input:
+            * needle: np.array of shape (n, 3)
+            * radius: float
+            * workers: see query_array
+
+        Output: list of n np.arrays of indices of found points.
+        """
+        return [np.asarray(self.query_range(item, radius)[0], dtype=np.int64) for item in needle]
+
 class SvBlenderKdTree(SvKdTree):
     def __init__(self, points):
         self.kdtree = kdtree.KDTree(len(points))
@@ -70,12 +106,21 @@ class SvBlenderKdTree(SvKdTree):
             return locs, idxs, distances
 
     def query_array(self, needle, count=1, **kwargs):
-        res = [self.query(item, count) for item in needle]
-        locs = [loc for loc, idx, distance in res]
-        idxs = [idx for loc, idx, distance in res]
-        distances = [distance for loc, idx, distance in res]
-
-        return np.array(locs), np.array(idxs), np.array(distances)
+        # mathutils.kdtree can search only one point at once;
+        # at least do not create intermediate arrays for each point
+        if count == 1:
+            find = self.kdtree.find
+            res = [find(item) for item in needle]
+            locs = np.array([loc for loc, idx, distance in res])
+            idxs = np.array([idx for loc, idx, distance in res])
+            distances = np.array([distance for loc, idx, distance in res])
+        else:
+            find_n = self.kdtree.find_n
+            res = [find_n(item, count) for item in needle]
+            locs = np.array([[loc for loc, idx, distance in r] for r in res])
+            idxs = np.array([[idx for loc, idx, distance in r] for r in res])
+            distances = np.array([[distance for loc, idx, distance in r] for r in res])
+        return locs, idxs, distances
 
     def query_range(self, needle, radius, **kwargs):
         res = self.kdtree.find_range(needle, radius)
@@ -83,6 +128,11 @@ class SvBlenderKdTree(SvKdTree):
         res = [tuple(r[0]) for r in res]
         return  idxs, np.array(res)
 
+    def query_range_array(self, needle, radius, **kwargs):
+        find_range = self.kdtree.find_range
+        return [np.array([idx for loc, idx, distance in find_range(item, radius)], dtype=np.int64)
+                    for item in needle]
+
 class SvSciPyKdTree(SvKdTree):
     def __init__(self, points, power=2):
         self.points = np.asarray(points)
@@ -94,8 +144,8 @@ class SvSciPyKdTree(SvKdTree):
         loc = self.points[idx]
         return loc, idx, distance
 
-    def query_array(self, needle, count=1, **kwargs):
-        distances, idxs = self.kdtree.query(needle, k=count, p=self.power, **kwargs)
+    def query_array(self, needle, count=1, workers=-1, **kwargs):
+        distances, idxs = self.kdtree.query(needle, k=count, p=self.power, workers=workers, **kwargs)
         locs = self.points[idxs]
         return locs, idxs, distances
 
@@ -103,7 +153,14 @@ class SvSciPyKdTree(SvKdTree):
         idxs = self.kdtree.query_ball_point(needle, radius, p=self.power, **kwargs)
         return idxs, self.points[idxs]
 
+    def query_range_array(self, needle, radius, workers=-1):
+        idxs = self.kdtree.query_ball_point(needle, radius, p=self.power, workers=workers)
+        return [np.array(item, dtype=np.int64) for item in idxs]
+
 class SvBruteforceKdTree(SvKdTree):
+    # Maximum size of distances matrix calculated at once
+    CHUNK_SIZE = 2**22
+
     def __init__(self, points, power=2):
         self.points = np.asarray(points)
         self.power = power
@@ -122,10 +179,39 @@ class SvBruteforceKdTree(SvKdTree):
             distances = distances[idxs]
             return locs, idxs, distances
 
-    def query_array(self, needle, count=1):
+    def _distances(self, needle):
+        """Yields ranges of needles and matrices of distances from them to all points"""
+        step = max(1, self.CHUNK_SIZE // max(1, len(self.points)))
+        for start in range(0, len(needle), step):
+            dvs = self.points[np.newaxis, :, :] - needle[start : start+step, np.newaxis, :]
+            yield start, start + step, np.linalg.norm(dvs, axis=2, ord=self.power)
+
+    def query_array(self, needle, count=1, **kwargs):
+        needle = np.asarray(needle)
+        n = len(needle)
+        count = min(count, len(self.points))
+        idxs = np.empty((n, count), dtype=np.int64)
+        distances = np.empty((n, count))
+        for start, end, chunk in self._distances(needle):
+            if count < chunk.shape[1]:
+                nearest = np.argpartition(chunk, count-1, axis=1)[:, :count]
+            else:
+                nearest = np.broadcast_to(np.arange(chunk.shape[1]), chunk.shape)
+            chunk_distances = np.take_along_axis(chunk, nearest, axis=1)
+            order = np.argsort(chunk_distances, axis=1)
+            idxs[start:end] = np.take_along_axis(nearest, order, axis=1)
+            distances[start:end] = np.take_along_axis(chunk_distances, order, axis=1)
         if count == 1:
-            return np.vectorize(self.query, signature='(3)->(3),(),()')(needle)
-        else:
-            qry = lambda p: self.query(p, count=count)
-            return np.vectorize(qry, signature='(n,3)->(k,3),(k),(k)')(needle)
+            idxs, distances = idxs[:, 0], distances[:, 0]
+        return self.points[idxs], idxs, distances
+
+    def query_range(self, needle, radius, **kwargs):
+        distances = np.linalg.norm(self.points - needle, axis=1, ord=self.power)
+        idxs = np.flatnonzero(distances <= radius)
+        return idxs, self.points[idxs]
 
+    def query_range_array(self, needle, radius, **kwargs):
+        result = []
+        for start, end, chunk in self._distances(np.asarray(needle)):
+            result.extend(np.flatnonzero(row) for row in chunk <= radius)
+        return result
@@ -1,3 +1,4 @@
+from sverchok.core import lazy_nodes
 
 
 def objdata_macro_one(context, operator, term, nodes, links):
@@ -16,7 +17,7 @@ def objdata_macro_one(context, operator, term, nodes, links):
     # end early if we couldn't find an Objects socket.
     if idx < 0: return
 
-    B = nodes.new('SvGetObjectsData')
+    B = lazy_nodes.new_node(nodes, 'SvGetObjectsData')
     B.location = A.absolute_location[0] + 30 + A.width, A.absolute_location[1]
 
     links.new(A.outputs[idx], B.inputs[0])
\ No newline at end of file
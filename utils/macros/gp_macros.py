@@ -5,6 +5,9 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from sverchok.core import lazy_nodes
+
+
 class sv_sock(object):
     def __init__(self, socket):
         self.socket = socket
@@ -28,7 +31,7 @@ def gp_macro_one(context, operator, term, nodes, links):
     made_nodes = []
     x, y = context.space_data.cursor_location[:]
     for node_bl_idname, node_location in needed_nodes:
-        n = nodes.new(node_bl_idname)
+        n = lazy_nodes.new_node(nodes, node_bl_idname)
         n.location = node_location[0] + x, node_location[1] + y
         made_nodes.append(n)
 
@@ -87,7 +90,7 @@ def gp_macro_two(context, operator, term, nodes, links):
             # in this case pick up the active object id selector node.
             n = context.active_node
         else:
-            n = nodes.new(node_bl_idname)
+            n = lazy_nodes.new_node(nodes, node_bl_idname)
 
         n.location = node_location[0] + x, node_location[1] + y
         made_nodes.append(n)
@@ -1,6 +1,9 @@
 
 # hotswap_macros.py
 
+from sverchok.core import lazy_nodes
+
+
 def swap_vd_mv(context, operator, term, nodes, links):
     """ hotswap viewerdraw <---> meshview ///"""
     active_node = context.active_node
@@ -8,7 +11,7 @@ def swap_vd_mv(context, operator, term, nodes, links):
         loc = active_node.location[:]
         tree = context.space_data.edit_tree
         nodes, links = tree.nodes, tree.links
-        mv = tree.nodes.new('SvMeshViewer')
+        mv = lazy_nodes.new_node(tree.nodes, 'SvMeshViewer')
 
         frame = active_node.parent
         if frame:
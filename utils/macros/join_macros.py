@@ -18,6 +18,7 @@
 
 from sverchok.utils.sv_node_utils import framed_nodes_bounding_box as bounding_box
 from sverchok.utils.sv_node_utils import are_nodes_in_same_frame
+from sverchok.core import lazy_nodes
 
 
 def join_macros(context, operator, term, nodes, links):
@@ -47,7 +48,7 @@ def join_macros(context, operator, term, nodes, links):
         # Create List Join nodes
         join_nodes=[]
         for i, s in enumerate(socket_indices):
-            join_nodes.append(nodes.new('ListJoinNode'))
+            join_nodes.append(lazy_nodes.new_node(nodes, 'ListJoinNode'))
 
             join_nodes[i].location = maxx + 100, maxy - (180+(22*(len(selected_nodes)))) * i
             if framed:
@@ -63,7 +64,7 @@ def join_macros(context, operator, term, nodes, links):
                     links.new(node.outputs[n], join_nodes[j].inputs[i])
 
         if all(node.outputs[0].bl_idname == "SvVerticesSocket" for node in sorted_nodes):
-            viewer_node = nodes.new("SvViewerDrawMk4")
+            viewer_node = lazy_nodes.new_node(nodes, "SvViewerDrawMk4")
 
             viewer_node.location = join_nodes[0].absolute_location[0] + join_nodes[0].width + 100, maxy
             if framed:
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from sverchok.utils.sv_node_utils import nodes_bounding_box
+from sverchok.core import lazy_nodes
 
 
 def math_macros(context, operator, term, nodes, links):
@@ -43,28 +44,28 @@ def math_macros(context, operator, term, nodes, links):
 
     if operator == 'MUL':
         if is_vector:
-            math_node = nodes.new('SvVectorMathNodeMK3')
+            math_node = lazy_nodes.new_node(nodes, 'SvVectorMathNodeMK3')
             math_node.current_op = 'CROSS'
         else:
 
             if (sorted_nodes[0].outputs[0].bl_idname == "SvVerticesSocket"):
-                math_node = nodes.new('SvVectorMathNodeMK3')
+                math_node = lazy_nodes.new_node(nodes, 'SvVectorMathNodeMK3')
                 math_node.current_op = 'SCALAR'
 
             elif len(sorted_nodes) > 1 and (sorted_nodes[1].outputs[0].bl_idname == "SvVerticesSocket"):
-                math_node = nodes.new('SvVectorMathNodeMK3')
+                math_node = lazy_nodes.new_node(nodes, 'SvVectorMathNodeMK3')
                 math_node.current_op = 'SCALAR'
                 sorted_nodes = [sorted_nodes[1], sorted_nodes[0]]
 
             else:
-                math_node = nodes.new('SvScalarMathNodeMK4')
+                math_node = lazy_nodes.new_node(nodes, 'SvScalarMathNodeMK4')
                 math_node.current_op = operator
     else:
         if is_vector:
-            math_node = nodes.new('SvVectorMathNodeMK3')
+            math_node = lazy_nodes.new_node(nodes, 'SvVectorMathNodeMK3')
             math_node.current_op = operator
         else:
-            math_node = nodes.new('SvScalarMathNodeMK4')
+            math_node = lazy_nodes.new_node(nodes, 'SvScalarMathNodeMK4')
             math_node.current_op = operator
 
     math_node.location = maxx + 100, maxy
@@ -73,7 +74,7 @@ def math_macros(context, operator, term, nodes, links):
         links.new(node.outputs[0], math_node.inputs[i])
 
     if is_vector:
-        viewer_node = nodes.new("SvViewerDrawMk4")
+        viewer_node = lazy_nodes.new_node(nodes, "SvViewerDrawMk4")
         viewer_node.location = math_node.location.x + math_node.width + 100, maxy
 
         # link the output math node to the ViewerDraw node
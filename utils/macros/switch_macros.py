@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from sverchok.utils.sv_node_utils import nodes_bounding_box
+from sverchok.core import lazy_nodes
 
 
 def switch_macros(context, operator, term, nodes, links):
@@ -26,7 +27,7 @@ def switch_macros(context, operator, term, nodes, links):
 
     _, maxx, _, maxy = nodes_bounding_box(selected_nodes)
 
-    switch_node = nodes.new('SvInputSwitchNodeMOD')
+    switch_node = lazy_nodes.new_node(nodes, 'SvInputSwitchNodeMOD')
     switch_node.location = maxx + 100, maxy
 
     # find out which sockets to connect
@@ -50,7 +51,7 @@ def switch_macros(context, operator, term, nodes, links):
             links.new(node.outputs[n], switch_node.inputs[remapped_index])
 
     if all(node.outputs[0].bl_idname == "SvVerticesSocket" for node in sorted_nodes):
-        viewer_node = nodes.new("SvViewerDrawMk4")
+        viewer_node = lazy_nodes.new_node(nodes, "SvViewerDrawMk4")
         viewer_node.location = switch_node.location.x + switch_node.width + 100, maxy
 
         # link the input switch node to the ViewerDraw node
@@ -457,7 +457,11 @@ def cornerloop(x,y,z):
         for cy,cx in zip((0,y,y,0),(0,0,x,x)):
              yield cx,cy,cz
 
-def isosurface_np(data, isolevel):
+def isosurface_python(data, isolevel):
+    """
+    Reference implementation: walks the grid voxel by voxel with Polygoniser.
+    It is kept for comparison; isosurface_np gives the same surface much faster.
+    """
     triangles = []
     z_a = 0
     z_plane_a = data[:,:,z_a]
@@ -486,3 +490,80 @@ def isosurface_np(data, isolevel):
 
     return np.array(polygoniser.vertices), triangles
 
+
+# For each of 12 cube edges: offset of the edge start point from the cube
+# origin (x, y, z) and the axis the edge goes along. Edge numbering and
+# corner positions are the same as in Polygoniser.polygonise.
+cube_edges = np.array([
+        (0, 0, 0, 1), (0, 1, 0, 0), (1, 0, 0, 1), (0, 0, 0, 0),
+        (0, 0, 1, 1), (0, 1, 1, 0), (1, 0, 1, 1), (0, 0, 1, 0),
+        (0, 0, 0, 2), (0, 1, 0, 2), (1, 1, 0, 2), (1, 0, 0, 2)
+    ])
+
+# Offsets of cube corners from the cube origin, in Polygoniser order.
+cube_corners = np.array([
+        (0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+        (0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)
+    ])
+
+edgetable_np = np.array(edgetable)
+tritable_np = np.array(tritable)
+
+def isosurface_np(data, isolevel):
+    """
+    Vectorized marching cubes.
+
+    Cube indices are calculated for the whole grid at once; edge vertices are
+    shared between neighbouring cubes by integer edge IDs, so the resulting
+    mesh does not contain duplicated vertices.
+
+    Input:
+        * data: np.array of shape (sx, sy, sz), field values on the grid.
+        * isolevel: value of the field on the surface.
+
+    Output:
+        * vertices: np.array of shape (n, 3), in grid index coordinates.
+        * faces: np.array of shape (m, 3).
+    """
+    data = np.asarray(data, dtype=np.float64)
+    sx, sy, sz = data.shape
+    if sx < 2 or sy < 2 or sz < 2:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    inside = data < isolevel
+    cubeindex = np.zeros((sx-1, sy-1, sz-1), dtype=np.int64)
+    for i, (dx, dy, dz) in enumerate(cube_corners):
+        cubeindex |= inside[dx:sx-1+dx, dy:sy-1+dy, dz:sz-1+dz].astype(np.int64) << i
+
+    cube_xs, cube_ys, cube_zs = np.nonzero(edgetable_np[cubeindex])
+    tris = tritable_np[cubeindex[cube_xs, cube_ys, cube_zs]]
+    cube_idxs, tri_idxs = np.nonzero(tris != -1)
+    if len(cube_idxs) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    local_edges = cube_edges[tris[cube_idxs, tri_idxs]]
+
+    # Global ID of an edge: 3 * (index of the start point) + axis
+    xs = cube_xs[cube_idxs] + local_edges[:,0]
+    ys = cube_ys[cube_idxs] + local_edges[:,1]
+    zs = cube_zs[cube_idxs] + local_edges[:,2]
+    edge_ids = ((xs * sy + ys) * sz + zs) * 3 + local_edges[:,3]
+
+    edge_ids, faces = np.unique(edge_ids, return_inverse=True)
+    faces = faces.reshape((-1, 3))
+
+    axes = edge_ids % 3
+    p1 = np.stack(np.unravel_index(edge_ids // 3, (sx, sy, sz)), axis=-1)
+    p2 = p1 + np.eye(3, dtype=np.int64)[axes]
+    v1 = data[p1[:,0], p1[:,1], p1[:,2]]
+    v2 = data[p2[:,0], p2[:,1], p2[:,2]]
+
+    # Same special cases as in vertexinterp
+    dv = v2 - v1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu = (isolevel - v1) / dv
+    mu[abs(dv) < 0.00001] = 0.0
+    mu[abs(isolevel - v2) < 0.00001] = 1.0
+    mu[abs(isolevel - v1) < 0.00001] = 0.0
+
+    vertices = p1 + mu[:,np.newaxis] * (p2 - p1)
+    return vertices, faces
@@ -31,7 +31,7 @@ from sverchok.utils.geom import linear_approximation,calc_bounds
 from sverchok.utils.sv_mesh_utils import point_inside_mesh
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh
 from sverchok.utils.sv_logging import sv_logger
-from sverchok.utils.surface.populate import _check_min_radius, _check_min_distance
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
 from sverchok.utils.field.probe import field_random_probe
 from sverchok.utils.surface.primitives import SvPlane
 from sverchok.utils.surface.populate import populate_surface
@@ -209,6 +209,7 @@ def populate_mesh_surface(bm, weights, field,
     generated_pts = []
     generated_idxs = []
     generated_radiuses = []
+    grid = SvPoissonDiskGrid(min_r if min_r != 0 else None)
 
     if field is None and min_r == 0 and min_r_field is None and predicate is None:
         batch_size = total_count
@@ -253,34 +254,23 @@ def populate_mesh_surface(bm, weights, field,
                                 np.zeros((len(candidates),)),
                                 min_rs
                             )
-                good_pts = []
-                good_idxs = []
-                for candidate_idx, candidate, min_r in zip(candidate_idxs, candidates, min_rs):
-                    radius_ok = _check_min_radius(candidate,
-                                                  generated_pts + good_pts,
-                                                  generated_radiuses + good_radiuses,
-                                                  min_r)
-                    if radius_ok:
-                        good_pts.append(candidate)
-                        good_idxs.append(candidate_idx)
-                        good_radiuses.append(min_r)
+                good_mask = grid.check_min_radius(candidates, min_rs)
+                good_pts = list(candidates[good_mask])
+                good_idxs = list(candidate_idxs[good_mask])
+                good_radiuses = list(min_rs[good_mask])
             else: # min_r != 0:
-                good_pts = []
-                good_idxs = []
-                for candidate_idx, candidate in zip(candidate_idxs, candidates):
-                    distance_ok = _check_min_distance(candidate,
-                                                      generated_pts + good_pts,
-                                                      min_r)
-                    if distance_ok:
-                        good_pts.append(candidate)
-                        good_idxs.append(candidate_idx)
-                        good_radiuses.append(0)
+                good_mask = grid.check_min_distance(candidates, min_r)
+                good_pts = list(candidates[good_mask])
+                good_idxs = list(candidate_idxs[good_mask])
+                good_radiuses = [0 for pt in good_pts]
             if predicate is not None:
                 res = [(i, pt, radius) for i, pt, radius in zip(good_idxs, good_pts, good_radiuses) if predicate(pt)]
                 good_idxs = [r[0] for r in res]
                 good_pts = [r[1] for r in res]
                 good_radiuses = [r[2] for r in res]
 
+            if min_r != 0 or min_r_field is not None:
+                grid.add(good_pts, good_radiuses)
             generated_pts.extend(np.array(good_pts).tolist())
             generated_idxs.extend(good_idxs)
             generated_radiuses.extend(good_radiuses)
@@ -322,12 +312,9 @@ def populate_mesh_edges(verts, edges, weights,
     weights = get_weights(edges_dir, weights)
     indices = np.arange(len(edges))
 
+    grid = SvPoissonDiskGrid(min_r if min_r != 0 else None)
     if avoid_spheres is not None:
-        old_points = [s[0] for s in avoid_spheres]
-        old_radiuses = [s[1] for s in avoid_spheres]
-    else:
-        old_points = []
-        old_radiuses = []
+        grid.add([s[0] for s in avoid_spheres], [s[1] for s in avoid_spheres])
 
     def generate_batch(batch_size):
         ps = np.array(weights) / np.sum(weights)
@@ -394,34 +381,23 @@ def populate_mesh_edges(verts, edges, weights,
                                 np.zeros((len(candidates),)),
                                 min_rs
                             )
-                good_pts = []
-                good_idxs = []
-                for candidate_idx, candidate, min_r in zip(candidate_idxs, candidates, min_rs):
-                    radius_ok = _check_min_radius(candidate,
-                                                  old_points + generated_pts + good_pts,
-                                                  old_radiuses + generated_radiuses + good_radiuses,
-                                                  min_r)
-                    if radius_ok:
-                        good_pts.append(candidate)
-                        good_idxs.append(candidate_idx)
-                        good_radiuses.append(min_r)
+                good_mask = grid.check_min_radius(candidates, min_rs)
+                good_pts = list(candidates[good_mask])
+                good_idxs = list(candidate_idxs[good_mask])
+                good_radiuses = list(min_rs[good_mask])
             else: # min_r != 0:
-                good_pts = []
-                good_idxs = []
-                for candidate_idx, candidate in zip(candidate_idxs, candidates):
-                    distance_ok = _check_min_distance(candidate,
-                                                      old_points + generated_pts + good_pts,
-                                                      min_r)
-                    if distance_ok:
-                        good_pts.append(candidate)
-                        good_idxs.append(candidate_idx)
-                        good_radiuses.append(0)
+                good_mask = grid.check_min_distance(candidates, min_r)
+                good_pts = list(candidates[good_mask])
+                good_idxs = list(candidate_idxs[good_mask])
+                good_radiuses = [0 for pt in good_pts]
             if predicate is not None:
                 res = [(i, pt, radius) for i, pt, radius in zip(good_idxs, good_pts, good_radiuses) if predicate(pt)]
                 good_idxs = [r[0] for r in res]
                 good_pts = [r[1] for r in res]
                 good_radiuses = [r[2] for r in res]
 
+            if min_r != 0 or min_r_field is not None:
+                grid.add(good_pts, good_radiuses)
             generated_pts.extend(np.array(good_pts).tolist())
             generated_idxs.extend(good_idxs)
             generated_radiuses.extend(good_radiuses)
@@ -111,6 +111,153 @@ def get_variables(string):
     result = visitor.variables
     return result.difference(safe_names.keys())
 
+class FormulaVectorizeError(Exception):
+    """
+    Raised when a formula can not be converted into an expression
+    operating on NumPy arrays.
+    """
+    pass
+
+class NumpyFormulaTransformer(ast.NodeTransformer):
+    """
+    Transforms AST of a formula, so that it can be evaluated once for whole
+    NumPy arrays of variable values, instead of once per each value:
+
+        * `a if c else b` -> `np.where(c, a, b)`
+        * `a and b`, `a or b`, `not a` -> `np.logical_and(a, b)` etc
+        * `a < b < c` -> `np.logical_and(a < b, b < c)`
+        * `max(a, b)`, `min(a, b)`, `abs(a)`, `atan(a)`... -> `np.maximum(a, b)`...
+
+    Functions from `safe_names_np` are used as is, since they already accept
+    arrays. Constructions which have no array analogue (comprehensions,
+    lambdas, functions like `len` or `Vector`) raise FormulaVectorizeError.
+    """
+
+    # name in formula -> name of NumPy function
+    numpy_functions = {
+            'abs': 'abs', 'sign': 'sign', 'atan': 'arctan',
+            'int': 'trunc', 'float': 'float64', 'round': 'round',
+        }
+
+    # these are already vectorized in safe_names_np
+    array_functions = {
+            'ceil', 'copysign', 'cos', 'sin', 'cosh', 'sinh', 'degrees', 'radians',
+            'exp', 'expm1', 'fabs', 'floor', 'fmod', 'frexp', 'hypot',
+            'isfinite', 'isinf', 'isnan', 'ldexp', 'log10', 'log1p', 'log2',
+            'modf', 'sqrt', 'tan', 'tanh', 'trunc', 'acos', 'acosh', 'asin',
+            'asinh', 'atan2', 'atanh', 'pow', 'erf', 'erfc', 'gamma', 'lgamma',
+            'factorial'
+        }
+
+    allowed_nodes = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name,
+            ast.Constant, ast.Subscript, ast.Slice, ast.Tuple, ast.Load,
+            ast.operator, ast.unaryop, ast.cmpop)
+
+    def __init__(self, variables):
+        """
+        :variables: names which are allowed to be used in the formula
+        """
+        self.variables = set(variables)
+
+    @staticmethod
+    def _np(name, *args):
+        func = ast.Attribute(value=ast.Name(id='np', ctx=ast.Load()), attr=name, ctx=ast.Load())
+        return ast.Call(func=func, args=list(args), keywords=[])
+
+    def _reduce(self, name, values):
+        result = values[0]
+        for value in values[1:]:
+            result = self._np(name, result, value)
+        return result
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return self._np('where', node.test, node.body, node.orelse)
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        name = 'logical_and' if isinstance(node.op, ast.And) else 'logical_or'
+        return self._reduce(name, node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._np('logical_not', node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        for op in node.ops:
+            if isinstance(op, (ast.In, ast.NotIn, ast.Is, ast.IsNot)):
+                raise FormulaVectorizeError(f"Operator `{type(op).__name__}` can not be applied to arrays")
+        if len(node.ops) == 1:
+            return node
+        lefts = [node.left] + node.comparators[:-1]
+        pairs = [ast.Compare(left=left, ops=[op], comparators=[right])
+                    for left, op, right in zip(lefts, node.ops, node.comparators)]
+        return self._reduce('logical_and', pairs)
+
+    def visit_Call(self, node):
+        if node.keywords:
+            raise FormulaVectorizeError("Keyword arguments are not supported")
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == 'np':
+            node.args = [self.visit(arg) for arg in node.args]
+            return node
+        if not isinstance(func, ast.Name):
+            raise FormulaVectorizeError("Only calls of known functions are supported")
+        args = [self.visit(arg) for arg in node.args]
+        name = func.id
+        if name in ('max', 'min') and len(args) > 1:
+            return self._reduce('maximum' if name == 'max' else 'minimum', args)
+        if name == 'log':
+            if len(args) == 2:
+                return ast.BinOp(left=self._np('log', args[0]), op=ast.Div(), right=self._np('log', args[1]))
+            return self._np('log', *args)
+        if name in self.numpy_functions:
+            return self._np(self.numpy_functions[name], *args)
+        if name in self.array_functions:
+            node.args = args
+            return node
+        raise FormulaVectorizeError(f"Function `{name}` can not be applied to arrays")
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == 'np':
+            return node
+        raise FormulaVectorizeError("Attribute access is not supported")
+
+    def visit_Name(self, node):
+        if node.id in self.variables or node.id in ('e', 'pi', 'np'):
+            return node
+        raise FormulaVectorizeError(f"Name `{node.id}` can not be used in vectorized formula")
+
+    def generic_visit(self, node):
+        if not isinstance(node, self.allowed_nodes + (ast.IfExp, ast.BoolOp, ast.boolop, ast.Compare)):
+            raise FormulaVectorizeError(f"`{type(node).__name__}` expressions can not be applied to arrays")
+        return super().generic_visit(node)
+
+def sv_compile_numpy(string, variables):
+    """
+    Compile formula into an expression which is evaluated once for whole NumPy
+    arrays of variable values (see NumpyFormulaTransformer). The result should
+    be evaluated by safe_eval_compiled with safe_names_np as allowed names.
+
+    :variables: names of variables which can be used in the formula.
+    Raises FormulaVectorizeError if the formula can't be vectorized.
+    """
+    try:
+        root = ast.parse(string.strip(), mode='eval')
+    except SyntaxError as e:
+        sv_logging.sv_logger.exception(e)
+        raise Exception("Invalid expression syntax: " + str(e))
+    try:
+        root = NumpyFormulaTransformer(variables).visit(root)
+    except FormulaVectorizeError as e:
+        raise FormulaVectorizeError(f"Formula `{string}` can not be vectorized: {e}. "
+                                    f"Disable Vectorize option to evaluate it point by point") from e
+    root = ast.fix_missing_locations(root)
+    return compile(root, "<expression>", 'eval')
+
 def sv_compile(string):
     try:
         root = ast.parse(string, mode='eval')
@@ -138,15 +138,15 @@ def meshes_texture_diplace(params, constant, matching_f):
     for props in zip(*params):
         verts, pols, texture, scale_out, matrix, mid_level, strength, axis = props
         if mapping_mode == 'Texture Matrix':
-            if type(matrix) == list:
+            if isinstance(matrix, list):
                 matrix = [m.inverted() for m in matrix]
             else:
                 matrix = [matrix.inverted()]
         elif mapping_mode == 'Mesh Matrix':
-            if not type(matrix) == list:
+            if not isinstance(matrix, list):
                 matrix = [matrix]
 
-        if  not type(texture) == list:
+        if  not isinstance(texture, list):
             texture = [texture]
         if displace_mode == 'Custom Axis':
             axis_n = [Vector(v).normalized() for v in axis]
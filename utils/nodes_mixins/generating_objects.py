@@ -5,9 +5,10 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import hashlib
 import random
 import string
-from itertools import cycle
+from itertools import cycle, chain
 from typing import List, Union
 
 import numpy as np
@@ -18,7 +19,7 @@ from mathutils import Matrix
 
 from sverchok.data_structure import updateNode, update_with_kwargs, numpy_full_list, repeat_last
 from sverchok.utils.handle_blender_data import correct_collection_length, delete_data_block
-from sverchok.utils.sv_bmesh_utils import add_mesh_to_bmesh, bmesh_from_edit_mesh, EmptyBmesh
+from sverchok.utils.sv_bmesh_utils import add_mesh_to_bmesh, bmesh_from_edit_mesh
 
 
 class SvObjectData(bpy.types.PropertyGroup):
@@ -200,6 +201,90 @@ class BlenderObjects:
                     icon=f"RESTRICT_RENDER_{'OFF' if self.render_objects else 'ON'}")
 
 
+class MeshTopology:
+    """
+    Flat buffers with topology of a mesh in the format which is expected by foreach_set methods
+    and the fingerprint of the topology. Two topologies with equal fingerprints can be considered as equal.
+    """
+    def __init__(self, verts_number: int, edges, faces):
+        self.verts_number = verts_number
+        self.edges = self._flat_edges(edges)
+        self.loop_totals, self.loop_vertices = self._flat_faces(faces)
+        self.loop_starts = np.cumsum(self.loop_totals, dtype=np.int32) - self.loop_totals
+
+        fingerprint = hashlib.blake2b(digest_size=16)
+        fingerprint.update(np.array([verts_number, len(self.edges), len(self.loop_totals)], dtype=np.int64))
+        fingerprint.update(self.edges)
+        fingerprint.update(self.loop_totals)
+        fingerprint.update(self.loop_vertices)
+        self.fingerprint = fingerprint.digest()
+
+    @staticmethod
+    def _flat_edges(edges) -> np.ndarray:
+        if isinstance(edges, np.ndarray):
+            return np.ascontiguousarray(edges.reshape(-1), dtype=np.int32)
+        return np.fromiter(chain.from_iterable(edges), dtype=np.int32, count=len(edges) * 2)
+
+    @staticmethod
+    def _flat_faces(faces) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            loop_totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+            return loop_totals, np.ascontiguousarray(faces.reshape(-1), dtype=np.int32)
+        loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+        loop_vertices = np.fromiter(chain.from_iterable(faces), dtype=np.int32, count=int(loop_totals.sum()))
+        return loop_totals, loop_vertices
+
+    def is_written_to(self, mesh: bpy.types.Mesh) -> bool:
+        """Cheap test that the mesh was not changed by somebody else after the topology was written to it"""
+        return (len(mesh.vertices) == self.verts_number
+                and len(mesh.polygons) == len(self.loop_totals)
+                and len(mesh.loops) == len(self.loop_vertices))
+
+    def write(self, mesh: bpy.types.Mesh):
+        """Replace geometry of the mesh, position of vertices should be set afterwards"""
+        mesh.clear_geometry()
+        mesh.vertices.add(self.verts_number)
+        mesh.edges.add(len(self.edges) // 2)
+        mesh.loops.add(len(self.loop_vertices))
+        mesh.polygons.add(len(self.loop_totals))
+        mesh.edges.foreach_set('vertices', self.edges)
+        mesh.loops.foreach_set('vertex_index', self.loop_vertices)
+        mesh.polygons.foreach_set('loop_start', self.loop_starts)
+        if not mesh.polygons.bl_rna.properties['loop_total'].is_readonly:
+            mesh.polygons.foreach_set('loop_total', self.loop_totals)  # before Blender 3.6
+
+
+class MeshBuffers:
+    """Data which is kept between updates of a mesh to avoid rebuilding its topology and reallocating arrays"""
+    def __init__(self, mesh_name: str):
+        self.mesh_name = mesh_name  # to detect that the pointer of the mesh was reused by another mesh
+        self.topology: MeshTopology = None
+        self.coordinates: np.ndarray = np.empty(0, dtype=np.float32)
+
+    def flat_coordinates(self, verts, matrix: Matrix = None) -> np.ndarray:
+        """Flat float32 array of vertices coordinates, matrix is applied if given"""
+        verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+        if self.coordinates.size != verts.size:
+            self.coordinates = np.empty(verts.size, dtype=np.float32)
+        coordinates = self.coordinates.reshape(-1, 3)
+        if matrix:
+            matrix = np.array(matrix, dtype=np.float32)
+            np.matmul(verts, matrix[:3, :3].T, out=coordinates)
+            coordinates += matrix[:3, 3]
+        else:
+            coordinates[:] = verts
+        return self.coordinates
+
+
+# buffers of meshes generated by viewer nodes, key is the pointer of a mesh
+_mesh_buffers: dict[int, MeshBuffers] = dict()
+
+
+def clear_mesh_buffers():
+    """Pointers of meshes are not valid after loading a file or undo"""
+    _mesh_buffers.clear()
+
+
 class SvMeshData(bpy.types.PropertyGroup):
     mesh: bpy.props.PointerProperty(type=bpy.types.Mesh, options={'SKIP_SAVE'})
 
@@ -207,8 +292,9 @@ class SvMeshData(bpy.types.PropertyGroup):
                         make_changes_test=True):
         """
         It takes vertices, edges and faces and updates mesh data block
-        If it assume that topology is unchanged only position of vertices will be changed
-        In this case it will be more efficient if vertices are given in np.array float32 format
+        If fingerprint of the topology is unchanged since last update only position of vertices will be changed
+        otherwise the mesh is rebuilt from flat arrays without bmesh
+        In both cases it will be more efficient if vertices are given in np.array float32 format
         Can apply matrix to mesh optionally
         """
         if edges is None:
@@ -220,36 +306,48 @@ class SvMeshData(bpy.types.PropertyGroup):
             # new mesh should be created
             self.mesh = bpy.data.meshes.new(name=mesh_name)
 
-        if not make_changes_test or self.is_topology_changed(verts, edges, faces):
-
-            if self.mesh.is_editmode:
-                with bmesh_from_edit_mesh(self.mesh) as bm:
-                    bm.clear()
-                    add_mesh_to_bmesh(bm, verts, edges, faces, update_indexes=False, update_normals=False)
-                    bm.normal_update()
-                    if matrix:
-                        bm.transform(matrix)
-            else:
-                with EmptyBmesh(False) as bm:
-                    add_mesh_to_bmesh(bm, verts, edges, faces, update_indexes=False, update_normals=False)
-                    if matrix:
-                        bm.transform(matrix)
-                    bm.to_mesh(self.mesh)
-
+        if self.mesh.is_editmode:
+            self._regenerate_edit_mesh(verts, edges, faces, matrix, make_changes_test)
+            self.mesh.update()
+            return
+
+        buffers = _mesh_buffers.get(self.mesh.as_pointer())
+        if buffers is None or buffers.mesh_name != self.mesh.name:
+            buffers = _mesh_buffers[self.mesh.as_pointer()] = MeshBuffers(self.mesh.name)
+        topology = MeshTopology(len(verts), edges, faces)
+        is_changed = (not make_changes_test
+                      or buffers.topology is None
+                      or buffers.topology.fingerprint != topology.fingerprint
+                      or not buffers.topology.is_written_to(self.mesh))
+        if is_changed:
+            topology.write(self.mesh)
+            buffers.topology = topology
+
+        self.mesh.vertices.foreach_set('co', buffers.flat_coordinates(verts, matrix))
+
+        if is_changed:
+            # add edges of polygons which are not given explicitly,
+            # remove double faces and faces with wrong indexes like bmesh would do
+            self.mesh.update(calc_edges=True)
+            if self.mesh.validate(clean_customdata=False):
+                buffers.topology = None  # the mesh does not match the given topology any more
         else:
+            self.mesh.update()
 
-            if self.mesh.is_editmode:
-                with bmesh_from_edit_mesh(self.mesh) as bm:
-                    for bv, v in zip(bm.verts, verts):
-                        bv.co = v
-                    if matrix:
-                        bm.transform(matrix)
-            else:
-                self.update_vertices(verts)
+    def _regenerate_edit_mesh(self, verts, edges, faces, matrix, make_changes_test):
+        if not make_changes_test or self.is_topology_changed(verts, edges, faces):
+            with bmesh_from_edit_mesh(self.mesh) as bm:
+                bm.clear()
+                add_mesh_to_bmesh(bm, verts, edges, faces, update_indexes=False, update_normals=False)
+                bm.normal_update()
                 if matrix:
-                    self.mesh.transform(matrix)
-
-        self.mesh.update()
+                    bm.transform(matrix)
+        else:
+            with bmesh_from_edit_mesh(self.mesh) as bm:
+                for bv, v in zip(bm.verts, verts):
+                    bv.co = v
+                if matrix:
+                    bm.transform(matrix)
 
     def set_smooth(self, is_smooth_mesh):
         """Make mesh smooth or flat"""
@@ -276,14 +374,6 @@ class SvMeshData(bpy.types.PropertyGroup):
             are_polygons_changed = any([list(p.vertices) != f for _, p, f in zip(range(5), self.mesh.polygons, faces)])
             return number_is_changed or are_polygons_changed
 
-    def update_vertices(self, verts: Union[list, np.ndarray]):
-        """
-        Just update position of mesh vertices, order and number of given vertices should be the same as mesh
-        numpy array with float32 type will be 10 times faster than any other input data
-        """
-        verts = np.array(verts, dtype=np.float32)  # todo will be this fast if it is already array float 32?
-        self.mesh.vertices.foreach_set('co', np.ravel(verts))
-
     def copy(self) -> bpy.types.Mesh:
         return self.mesh.copy()
 
@@ -293,6 +383,7 @@ class SvMeshData(bpy.types.PropertyGroup):
         The mesh is belonged only to this property and should be deleted with it
         """
         if self.mesh:
+            _mesh_buffers.pop(self.mesh.as_pointer(), None)
             delete_data_block(self.mesh)
 
 
@@ -314,6 +314,110 @@ class SvNurbsBasisFunctions(object):
         return calc
 
 
+def find_spans(knotvector, ts):
+    """
+    Vectorized search of knot spans. For each t it returns index i, such that
+    knotvector[i] <= t < knotvector[i+1]. For t equal to the last knot the last
+    non-empty span is returned. Knotvector is supposed to be sorted.
+    """
+    u = np.asarray(knotvector)
+    ts = np.asarray(ts)
+    spans = np.searchsorted(u, ts, side='right') - 1
+    last_span = np.searchsorted(u, u[-1], side='left') - 1
+    return np.clip(spans, 0, last_span)
+
+def span_basis_functions(knotvector, degree, ts, n_derivs=0):
+    """
+    Calculate values of all non-zero basis functions and their derivatives
+    for all ts at once. Only p+1 functions (p = degree) are not zero at any
+    point of the curve domain, so the result is a sparse representation of
+    (n_control_points, len(ts)) matrix of basis function values.
+    "The NURBS book", 2nd edition, algorithms A2.2 and A2.3.
+
+    Outside of the knotvector domain all values are zeros, the same as in
+    SvNurbsBasisFunctions.
+
+    Returns:
+        * indices of control points, np.array of shape (len(ts), p+1);
+        * values, np.array of shape (n_derivs+1, len(ts), p+1); values[k]
+          contains k-th derivatives of basis functions.
+    """
+    p = degree
+    u = np.asarray(knotvector, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    n = len(ts)
+    n_cpts = len(u) - p - 1
+    outside = (ts < u[0]) | (ts > u[-1])
+    ts = np.clip(ts, u[0], u[-1])
+    spans = find_spans(u, ts)
+    # indexes like span-p or span+p can go out of the knotvector for
+    # not clamped knotvectors; corresponding functions are dropped below
+    u_pad = np.concatenate((np.full(p, u[0]), u, np.full(p, u[-1])))
+    pspans = spans + p
+
+    left = np.empty((p+1, n))
+    right = np.empty((p+1, n))
+    ndu = np.empty((p+1, p+1, n))
+    ndu[0,0] = 1.0
+    for j in range(1, p+1):
+        left[j] = ts - u_pad[pspans+1-j]
+        right[j] = u_pad[pspans+j] - ts
+        saved = 0.0
+        for r in range(j):
+            ndu[j,r] = right[r+1] + left[j-r]
+            temp = ndu[r,j-1] / ndu[j,r]
+            ndu[r,j] = saved + right[r+1]*temp
+            saved = left[j-r]*temp
+        ndu[j,j] = saved
+
+    ders = np.zeros((n_derivs+1, p+1, n))
+    ders[0] = ndu[:,p]
+    a = np.empty((2, p+1, n))
+    for r in range(p+1):
+        s1, s2 = 0, 1
+        a[0,0] = 1.0
+        for k in range(1, min(n_derivs, p)+1):
+            d = np.zeros(n)
+            rk, pk = r-k, p-k
+            if r >= k:
+                a[s2,0] = a[s1,0] / ndu[pk+1,rk]
+                d = a[s2,0] * ndu[rk,pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k-1 if r-1 <= pk else p-r
+            for j in range(j1, j2+1):
+                a[s2,j] = (a[s1,j] - a[s1,j-1]) / ndu[pk+1,rk+j]
+                d = d + a[s2,j] * ndu[rk+j,pk]
+            if r <= pk:
+                a[s2,k] = -a[s1,k-1] / ndu[pk+1,r]
+                d = d + a[s2,k] * ndu[r,pk]
+            ders[k,r] = d
+            s1, s2 = s2, s1
+    factor = p
+    for k in range(1, min(n_derivs, p)+1):
+        ders[k] *= factor
+        factor *= (p-k)
+
+    ders = np.transpose(ders, axes=(0,2,1)) # (n_derivs+1, n, p+1)
+    idxs = spans[np.newaxis].T - p + np.arange(p+1)[np.newaxis] # (n, p+1)
+    valid = (idxs >= 0) & (idxs < n_cpts)
+    valid[outside] = False
+    ders = np.where(valid[np.newaxis], ders, 0.0)
+    idxs = np.clip(idxs, 0, n_cpts-1)
+    return idxs, ders
+
+def span_basis_matrix(knotvector, degree, ts, deriv_order=0):
+    """
+    Dense version of span_basis_functions: returns matrix of
+    (deriv_order)-th derivatives of all basis functions, of shape
+    (len(ts), n_control_points).
+    """
+    n_cpts = len(knotvector) - degree - 1
+    idxs, values = span_basis_functions(knotvector, degree, ts, deriv_order)
+    n = len(idxs)
+    matrix = np.zeros((n, n_cpts))
+    np.add.at(matrix, (np.arange(n)[np.newaxis].T, idxs), values[deriv_order])
+    return matrix
+
 class CantInsertKnotException(Exception):
     pass
 
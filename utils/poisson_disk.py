@@ -0,0 +1,148 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Checks of minimal distance between random points for Poisson-disk like
+population of surfaces, meshes and fields.
+
+Generated points are kept in a uniform grid which is updated with each
+accepted batch of points, so a candidate is compared only with points of
+nearby cells instead of all generated points.
+"""
+
+import numpy as np
+
+
+class SvPoissonDiskGrid:
+    """
+    Incremental uniform grid of points with radiuses.
+
+    Candidates are checked by batches. Candidates of a batch are accepted in
+    their order: a candidate should be far enough from all points of the grid
+    and from previous accepted candidates of the same batch, so results are
+    the same as checking candidates one by one. Accepted candidates are not
+    added to the grid automatically, call `add` with points which should be
+    kept (e.g. after checking them with a predicate).
+    """
+    # big primes to get keys of cells
+    HASH_FACTORS = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+    def __init__(self, cell_size=None):
+        """
+        cell_size: size of grid cells. It is better to be about minimal
+        distance between points. If not given it is chosen by the first
+        added or checked points.
+        """
+        self.cell_size = cell_size
+        self.points = np.empty((0, 3))
+        self.radiuses = np.empty((0,))
+        self._keys = np.empty((0,), dtype=np.int64)  # sorted keys of cells of points
+        self._order = np.empty((0,), dtype=np.int64)  # indexes of points sorted by keys
+
+    def __len__(self):
+        return len(self.points)
+
+    def _init_cell_size(self, size):
+        if self.cell_size is None:
+            self.cell_size = size if size > 0 else 1.0
+
+    def _cells(self, points):
+        return np.floor(points / self.cell_size).astype(np.int64)
+
+    def _cell_keys(self, cells):
+        return np.bitwise_xor.reduce(cells * self.HASH_FACTORS, axis=1)
+
+    def add(self, points, radiuses=None):
+        """Adds points to the grid, radiuses are used by check_min_radius"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if radiuses is None:
+            radiuses = np.zeros(len(points))
+        radiuses = np.asarray(radiuses, dtype=np.float64).reshape(-1)
+        self._init_cell_size(2 * np.max(radiuses, initial=0))
+
+        keys = self._cell_keys(self._cells(points))
+        new_order = np.argsort(keys, kind='stable')
+        keys = keys[new_order]
+        positions = np.searchsorted(self._keys, keys, side='right')
+        self._keys = np.insert(self._keys, positions, keys)
+        self._order = np.insert(self._order, positions, new_order + len(self.points))
+        self.points = np.concatenate([self.points, points])
+        self.radiuses = np.concatenate([self.radiuses, radiuses])
+
+    def _neighbours(self, candidates, reach):
+        """Pairs (candidate index, point index) of points of the grid which
+        can be closer to candidates than reach distances"""
+        n = len(candidates)
+        spans = 2 * np.ceil(reach / self.cell_size).astype(np.int64) + 1
+        counts = spans ** 3
+        if counts.sum() > n * len(self.points):
+            # radiuses are big for the grid, it's faster to compare with all points
+            return np.repeat(np.arange(n), len(self.points)), np.tile(np.arange(len(self.points)), n)
+
+        candidate_idx = np.repeat(np.arange(n), counts)
+        local = np.arange(len(candidate_idx)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_spans = spans[candidate_idx]
+        cells = self._cells(candidates)[candidate_idx] - (cell_spans[:, np.newaxis] // 2)
+        for axis in range(3):
+            cells[:, axis] += local % cell_spans
+            local //= cell_spans
+        keys = self._cell_keys(cells)
+
+        starts = np.searchsorted(self._keys, keys, side='left')
+        found = np.searchsorted(self._keys, keys, side='right') - starts
+        candidate_idx = np.repeat(candidate_idx, found)
+        positions = np.arange(len(candidate_idx)) - np.repeat(np.cumsum(found) - found - starts, found)
+        return candidate_idx, self._order[positions]
+
+    @staticmethod
+    def _accept_in_order(conflicts):
+        """Candidate is accepted if it has no conflicts with previous accepted ones"""
+        accepted = np.zeros(len(conflicts), dtype=bool)
+        for i in range(len(conflicts)):
+            accepted[i] = not np.any(conflicts[i, :i] & accepted[:i])
+        return accepted
+
+    def check_min_distance(self, candidates, min_r):
+        """
+        Returns mask of candidates which are not closer than min_r to points
+        of the grid and to previous accepted candidates.
+        """
+        self._init_cell_size(min_r)
+        candidates = np.asarray(candidates, dtype=np.float64).reshape(-1, 3)
+        good = np.ones(len(candidates), dtype=bool)
+        if len(self.points):
+            candidate_idx, point_idx = self._neighbours(candidates, np.full(len(candidates), min_r))
+            distances = np.linalg.norm(self.points[point_idx] - candidates[candidate_idx], axis=1)
+            good[candidate_idx[distances < min_r]] = False
+
+        good_idx = np.flatnonzero(good)
+        points = candidates[good_idx]
+        distances = np.linalg.norm(points[np.newaxis, :] - points[:, np.newaxis], axis=2)
+        good[good_idx[~self._accept_in_order(distances < min_r)]] = False
+        return good
+
+    def check_min_radius(self, candidates, min_rs):
+        """
+        Returns mask of candidates which spheres of min_rs radiuses do not
+        touch spheres of points of the grid and of previous accepted candidates.
+        """
+        min_rs = np.asarray(min_rs, dtype=np.float64).reshape(-1)
+        self._init_cell_size(2 * np.max(min_rs, initial=0))
+        candidates = np.asarray(candidates, dtype=np.float64).reshape(-1, 3)
+        good = np.ones(len(candidates), dtype=bool)
+        if len(self.points):
+            candidate_idx, point_idx = self._neighbours(candidates, min_rs + self.radiuses.max())
+            distances = np.linalg.norm(self.points[point_idx] - candidates[candidate_idx], axis=1)
+            far = self.radiuses[point_idx] + min_rs[candidate_idx] < distances
+            good[candidate_idx[~far]] = False
+
+        good_idx = np.flatnonzero(good)
+        points, radiuses = candidates[good_idx], min_rs[good_idx]
+        distances = np.linalg.norm(points[np.newaxis, :] - points[:, np.newaxis], axis=2)
+        far = radiuses[np.newaxis, :] + radiuses[:, np.newaxis] < distances
+        good[good_idx[~self._accept_in_order(~far)]] = False
+        return good
@@ -17,8 +17,11 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import cProfile
+import json
 import pstats
+import threading
 from io import StringIO
+from time import perf_counter
 
 from sverchok.utils.sv_logging import sv_logger
 from sverchok.utils.context_managers import sv_preferences
@@ -29,6 +32,8 @@ _global_profile = None
 _profile_nesting = 0
 # Whether the profiling is enabled by "Start profiling" toggle
 is_currently_enabled = False
+# Global NodeProfile singleton
+_node_profile = None
 
 def get_global_profile():
     """
@@ -144,6 +149,8 @@ def save_stats(path):
 
 def have_gathered_stats():
     global _global_profile
+    if have_node_stats():
+        return True
     if _global_profile is None:
         return False
     if _global_profile.getstats():
@@ -152,5 +159,158 @@ def have_gathered_stats():
         return False
 
 def reset_stats():
-    global _global_profile
+    global _global_profile, _node_profile
     _global_profile = None
+    _node_profile = None
+
+
+class NodeProfile:
+    """
+    Per node statistics of node tree updates, it is collected in NODES
+    profiling mode. For each node it keeps number of calls (nodes inside loops
+    and group trees can be called many times per update), wall time, time of
+    moving data into input sockets and sizes of input and output data. Also
+    it keeps all calls as a time line which can be saved in Chrome trace format.
+    """
+    def __init__(self):
+        """:nodes: statistics of nodes, keys are (tree name, node name)
+        :events: calls of nodes in Chrome trace format
+        :_active: stack of nodes being updated, the last one is updating now"""
+        self.nodes: dict[tuple[str, str], dict] = dict()
+        self.events: list[dict] = []
+        self._origin = perf_counter()
+        self._active: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def node_key(node) -> tuple[str, str]:
+        return node.id_data.name, node.name
+
+    def start(self, node):
+        """Should be called before a node update, in the main thread"""
+        self._active.append(self.node_key(node))
+
+    def stop(self, node, start, duration, input_bytes=None, output_bytes=None, error=None):
+        """Should be called after a node update, in the main thread"""
+        if self._active:
+            self._active.pop()
+        self.add(node, start, duration, input_bytes, output_bytes, error)
+
+    def add_copy_time(self, duration):
+        """Adds time of preparing input data to the node which is updating now"""
+        if self._active:
+            stats = self._get_stats(self._active[-1])
+            stats['copy_time'] += duration
+
+    def add(self, node, start, duration, input_bytes=None, output_bytes=None,
+            error=None, count_call=True, thread_id=None):
+        """Records execution of a node
+        :start: perf_counter value when execution was started
+        :count_call: False if the execution is a continuation of previous
+        call, for example processing in another thread
+        :thread_id: thread which executed the node, current one by default"""
+        key = self.node_key(node)
+        with self._lock:
+            stats = self._get_stats(key)
+            stats['bl_idname'] = node.bl_idname
+            stats['calls'] += int(count_call)
+            stats['time'] += duration
+            stats['max_time'] = max(stats['max_time'], duration)
+            if input_bytes is not None:
+                stats['input_bytes'] = input_bytes
+            if output_bytes is not None:
+                stats['output_bytes'] = output_bytes
+            if error is not None:
+                stats['errors'] += 1
+            self.events.append({
+                'name': key[1],
+                'cat': node.bl_idname,
+                'ph': 'X',
+                'ts': (start - self._origin) * 1e6,
+                'dur': duration * 1e6,
+                'pid': 0,
+                'tid': thread_id or threading.get_ident(),
+                'args': {'tree': key[0]} if error is None else {'tree': key[0], 'error': repr(error)},
+            })
+
+    def add_event(self, node, name, start, duration):
+        """Adds a part of node execution to the time line without changing
+        the node statistics, for example an iteration of a loop"""
+        with self._lock:
+            self.events.append({
+                'name': name,
+                'cat': node.bl_idname,
+                'ph': 'X',
+                'ts': (start - self._origin) * 1e6,
+                'dur': duration * 1e6,
+                'pid': 0,
+                'tid': threading.get_ident(),
+                'args': {'tree': node.id_data.name},
+            })
+
+    def _get_stats(self, key):
+        if key not in self.nodes:
+            self.nodes[key] = dict(bl_idname='', calls=0, time=0., max_time=0., copy_time=0.,
+                                   input_bytes=0, output_bytes=0, errors=0)
+        return self.nodes[key]
+
+    def sorted_nodes(self) -> list[dict]:
+        """Statistics of all nodes, the slowest nodes go first"""
+        nodes = [dict(tree=tree, node=node, **stats) for (tree, node), stats in self.nodes.items()]
+        nodes.sort(key=lambda n: n['time'], reverse=True)
+        return nodes
+
+    def to_json(self) -> dict:
+        return {'nodes': self.sorted_nodes()}
+
+    def to_chrome_trace(self) -> dict:
+        """The result can be opened in chrome://tracing or https://ui.perfetto.dev"""
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+
+    def report(self, limit=30) -> str:
+        lines = [f"{'Tree':<20} {'Node':<30} {'Calls':>6} {'Time, ms':>10} "
+                 f"{'Copy, ms':>9} {'In, KB':>9} {'Out, KB':>9}"]
+        for n in self.sorted_nodes()[:limit]:
+            lines.append(f"{n['tree'][:20]:<20} {n['node'][:30]:<30} {n['calls']:>6} "
+                         f"{n['time'] * 1e3:>10.2f} {n['copy_time'] * 1e3:>9.2f} "
+                         f"{n['input_bytes'] / 1024:>9.1f} {n['output_bytes'] / 1024:>9.1f}")
+        return "\n".join(lines)
+
+
+def get_node_profile():
+    """
+    Get NodeProfile singleton if profiling of nodes is currently enabled,
+    otherwise returns None
+    """
+    global _node_profile
+    if not is_profiling_enabled("NODES"):
+        return None
+    if _node_profile is None:
+        _node_profile = NodeProfile()
+    return _node_profile
+
+def have_node_stats():
+    return _node_profile is not None and bool(_node_profile.nodes)
+
+def dump_node_stats(limit=30):
+    """
+    Dump statistics of the slowest nodes to the log.
+    """
+    if not have_node_stats():
+        sv_logger.info("There are no node profiling results yet")
+        return
+    sv_logger.info("Node profiling results:\n" + _node_profile.report(limit))
+
+def save_node_stats(path, format="JSON"):
+    """
+    Save per node statistics to a file.
+    format can be JSON (statistics of each node, the slowest nodes go first)
+    or CHROME (time line of nodes calls in Chrome trace format).
+    """
+    if not have_node_stats():
+        sv_logger.info("There are no node profiling results yet")
+        return
+    data = _node_profile.to_chrome_trace() if format == "CHROME" else _node_profile.to_json()
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=1)
+    sv_logger.info("Node profiling statistics saved to %s.", path)
@@ -677,7 +677,7 @@ class PulgaSystem():
     def hard_update_list(self, cache, size_change, pins_gates):
         '''replace verts, rads and velocity'''
         verts, rads, vel, react = cache
-        if type(verts) == list:
+        if isinstance(verts, list):
             if len(verts) == self.v_len:
                 if pins_gates[0] and pins_gates[1]:
                     unpinned = self.params['unpinned']
@@ -1513,7 +1513,7 @@ class PulgaSystem():
         '''replace verts, rads and velocity'''
         size_change = self.size_change
         verts, rads, vel, react = cache
-        if type(verts) == list:
+        if isinstance(verts, list):
             if len(verts) == self.v_len:
                 if self.pinned and self.goal_pins:
                     unpinned = self.params['unpinned']
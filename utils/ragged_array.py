@@ -0,0 +1,168 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compact representation of nested lists of socket data. Instead of Python
+lists of lists of tuples the data is kept in one flat array of values and in
+one array of offsets per nesting level, so changing the nesting of the data
+is an array operation instead of recursion over all its items.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+
+class SvRaggedArray:
+    """
+    Read only nested list which items are stored in flat arrays.
+
+    `values` keeps items of the deepest lists one after another. The items can
+    be numbers or regular arrays, e.g. vertices. `offsets` is a list of arrays,
+    one per nesting level starting from the outermost one. Items of i-th list
+    of a level are in the range offsets[i]:offsets[i+1] of the next level or
+    of the values for the last level. Indexes are absolute, so items of the
+    array are views of the same buffers.
+
+    [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]] ->
+        values = [[0, 0, 0], [1, 0, 0], [0, 1, 0]], offsets = [[0, 2, 3]]
+
+    It supports the sequence protocol, so nodes iterating over objects of
+    socket data get arrays (or nested ragged arrays) without conversion.
+    """
+    __slots__ = ('values', 'offsets')
+
+    def __init__(self, values, offsets):
+        self.values = np.asarray(values)
+        self.offsets = [np.asarray(o, dtype=np.int64) for o in offsets]
+        if not self.offsets:
+            raise ValueError("Ragged array should have at least one level of offsets")
+
+    @classmethod
+    def from_list(cls, data, depth=1, dtype=None):
+        """
+        Packs nested lists. `depth` is number of irregular levels, items of
+        the deepest of them should have the same shape.
+
+        SvRaggedArray.from_list([[(0, 0, 0)], [(1, 0, 0), (0, 1, 0)]])
+        SvRaggedArray.from_list([[[1, 2], [3]], [[4]]], depth=2)
+        """
+        if depth < 1:
+            raise ValueError(f"Depth should be at least 1, {depth} is given")
+        offsets = []
+        items = data
+        for level in range(depth):
+            lengths = np.fromiter((len(i) for i in items), dtype=np.int64, count=len(items))
+            offsets.append(np.concatenate(([0], np.cumsum(lengths))))
+            if level < depth - 1:
+                items = list(chain.from_iterable(items))
+        if items and all(isinstance(i, np.ndarray) for i in items):
+            values = np.concatenate(items)
+        else:
+            values = np.array(list(chain.from_iterable(items)), dtype=dtype)
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return cls(values, offsets)
+
+    def to_list(self):
+        """Returns the data as nested Python lists"""
+        items = self.values.tolist()
+        for offsets in reversed(self.offsets):
+            items = [items[s: e] for s, e in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        return items
+
+    @property
+    def depth(self) -> int:
+        """Number of irregular levels"""
+        return len(self.offsets)
+
+    @property
+    def nesting_level(self) -> int:
+        """The same as `get_data_nesting_level` of the data as lists"""
+        return len(self.offsets) + self.values.ndim
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + sum(o.nbytes for o in self.offsets)
+
+    def __len__(self):
+        return len(self.offsets[0]) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(start, stop)
+            return SvRaggedArray(self.values, [self.offsets[0][start: stop + 1]] + self.offsets[1:])
+        start, end = self.offsets[0][range(len(self))[index]: ][:2]
+        if len(self.offsets) == 1:
+            return self.values[start: end]
+        return SvRaggedArray(self.values, [self.offsets[1][start: end + 1]] + self.offsets[2:])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"<SvRaggedArray depth={self.depth} len={len(self)} values={self.values.shape}>"
+
+    def copy(self):
+        """Copy of only used part of the buffers"""
+        levels = []
+        offsets = self.offsets[0]
+        for next_offsets in self.offsets[1:]:
+            levels.append(offsets - offsets[0])
+            offsets = next_offsets[offsets[0]: offsets[-1] + 1]
+        levels.append(offsets - offsets[0])
+        start, end = offsets[[0, -1]]
+        return SvRaggedArray(self.values[start: end].copy(), levels)
+
+    def wrap(self, wrap_level=1):
+        """The same as `wrap_data`"""
+        offsets = self.offsets
+        for _ in range(wrap_level):
+            offsets = [np.array([0, len(offsets[0]) - 1])] + offsets
+        return SvRaggedArray(self.values, offsets)
+
+    def flatten(self, target_level=1):
+        """
+        The same as `flatten_data`. Outer levels are dropped by slicing
+        offsets, when all of them are dropped the values array is returned.
+        """
+        current_level = self.nesting_level
+        if current_level < target_level:
+            raise TypeError(f"Can't flatten data to level {target_level}: data already have level {current_level}")
+        offsets = self.offsets
+        for _ in range(min(current_level - target_level, len(offsets))):
+            start, end = offsets[0][[0, -1]]
+            if len(offsets) == 1:
+                values = self.values[start: end]
+                return values.reshape((-1,) + values.shape[values.ndim - target_level + 1:])
+            offsets = [offsets[1][start: end + 1]] + offsets[2:]
+        return SvRaggedArray(self.values, offsets)
+
+    def graft(self, item_level=1, wrap_level=1):
+        """
+        The same as `graft_data`. Items of regular values are wrapped by
+        adding axes to the values array, irregular levels are wrapped by
+        inserting offsets where each list has one item.
+        """
+        if item_level < self.values.ndim:
+            axis = self.values.ndim - item_level
+            values = self.values.reshape(self.values.shape[:axis] + (1,) * wrap_level + self.values.shape[axis:])
+            return SvRaggedArray(values, self.offsets)
+        if item_level == self.nesting_level:
+            return self.wrap(wrap_level)
+        if item_level > self.nesting_level:
+            raise TypeError(f"Can't graft items of level {item_level}: data have level {self.nesting_level}")
+        level = self.nesting_level - 1 - item_level
+        items_number = len(self.offsets[level]) - 1
+        offsets = list(self.offsets)
+        for _ in range(wrap_level):
+            offsets.insert(level, np.arange(items_number + 1))
+        return SvRaggedArray(self.values, offsets)
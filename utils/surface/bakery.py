@@ -39,10 +39,7 @@ def surface_to_meshdata(surface, resolution_u, resolution_v):
     v_min, v_max = surface.get_v_bounds()
     us = np.linspace(u_min, u_max, num=resolution_u)
     vs = np.linspace(v_min, v_max, num=resolution_v)
-    us, vs = np.meshgrid(us, vs)
-    us = us.flatten()
-    vs = vs.flatten()
-    points = surface.evaluate_array(us, vs).tolist()
+    points = surface.evaluate_grid(us, vs).reshape((-1, 3)).tolist()
     edges = make_quad_edges(resolution_u, resolution_v)
     faces = make_quad_faces(resolution_u, resolution_v)
     return points, edges, faces
@@ -109,10 +106,10 @@ class SurfaceData(object):
         v_min, v_max = surface.get_v_bounds()
         us = np.linspace(u_min, u_max, num=resolution_u)
         vs = np.linspace(v_min, v_max, num=resolution_v)
+        self.points = surface.evaluate_grid(us, vs).reshape((-1, 3))
         us, vs = np.meshgrid(us, vs)
         us = us.flatten()
         vs = vs.flatten()
-        self.points = surface.evaluate_array(us, vs)#.tolist()
         self.points_list = self.points.reshape((resolution_u*resolution_v, 3)).tolist()
 
         main_color = np.array(node.surface_color)
@@ -25,6 +25,22 @@ class SvSurface(object):
     def evaluate_array(self, us, vs):
         raise Exception("not implemented!")
 
+    def evaluate_grid(self, us, vs):
+        """
+        Evaluate the surface on a regular grid.
+
+        Args:
+            us, vs: one-dimensional arrays of U and V parameter values.
+
+        Returns:
+            np.array of shape (len(vs), len(us), 3). Reshaped to (-1, 3) it
+            gives points in the same order as np.meshgrid(us, vs). Some
+            surface types (NURBS) implement faster calculation for grids.
+        """
+        us, vs = np.meshgrid(us, vs)
+        points = self.evaluate_array(us.flatten(), vs.flatten())
+        return points.reshape(us.shape + (3,))
+
     def normal(self, u, v):
         h = self.normal_delta
         p = self.evaluate(u, v)
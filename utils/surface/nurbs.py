@@ -5,6 +5,7 @@ from collections import defaultdict
 from sverchok.utils.geom import Spline
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths, SvNurbsBasisFunctions,
+        span_basis_functions, span_basis_matrix,
         nurbs_divide, from_homogenous,
         CantRemoveKnotException, CantReduceDegreeException
     )
@@ -1019,22 +1020,18 @@ class SvNativeNurbsSurface(SvNurbsSurface):
         return self.evaluate_array(np.array([u]), np.array([v]))[0]
 
     def fraction(self, deriv_order_u, deriv_order_v, us, vs):
-        pu = self.degree_u
-        pv = self.degree_v
-        ku, kv, _ = self.control_points.shape
-        nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
-        nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
-        nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
-        nsv = nsv[np.newaxis] # (1, kv, n)
-        ns = nsu * nsv # (ku, kv, n)
-        weights = np.transpose(self.weights[np.newaxis], axes=(1,2,0)) # (ku, kv, 1)
-        coeffs = ns * weights # (ku, kv, n)
-        coeffs = np.transpose(coeffs[np.newaxis], axes=(3,1,2,0)) # (n,ku,kv,1)
-        controls = self.control_points # (ku,kv,3)
-
-        numerator = coeffs * controls # (n,ku,kv,3)
+        # only (pu+1)*(pv+1) basis functions are non-zero at each point
+        idxs_u, nsu = span_basis_functions(self.knotvector_u, self.degree_u, us, deriv_order_u) # (n, pu+1)
+        idxs_v, nsv = span_basis_functions(self.knotvector_v, self.degree_v, vs, deriv_order_v) # (n, pv+1)
+        ns = nsu[deriv_order_u][:,:,np.newaxis] * nsv[deriv_order_v][:,np.newaxis,:] # (n, pu+1, pv+1)
+        idxs_u = idxs_u[:,:,np.newaxis] # (n, pu+1, 1)
+        idxs_v = idxs_v[:,np.newaxis,:] # (n, 1, pv+1)
+        coeffs = ns * self.weights[idxs_u, idxs_v] # (n, pu+1, pv+1)
+        controls = self.control_points[idxs_u, idxs_v] # (n, pu+1, pv+1, 3)
+
+        numerator = coeffs[:,:,:,np.newaxis] * controls # (n, pu+1, pv+1, 3)
         numerator = numerator.sum(axis=1).sum(axis=1) # (n,3)
-        denominator = coeffs.sum(axis=1).sum(axis=1)
+        denominator = coeffs.sum(axis=1).sum(axis=1)[np.newaxis].T # (n,1)
 
         return numerator, denominator
 
@@ -1042,6 +1039,18 @@ class SvNativeNurbsSurface(SvNurbsSurface):
         numerator, denominator = self.fraction(0, 0, us, vs)
         return nurbs_divide(numerator, denominator)
 
+    def evaluate_grid(self, us, vs):
+        # basis matrices are calculated once per direction and then
+        # contracted with homogeneous control net
+        nsu = span_basis_matrix(self.knotvector_u, self.degree_u, us) # (n_u, ku)
+        nsv = span_basis_matrix(self.knotvector_v, self.degree_v, vs) # (n_v, kv)
+        weights = self.weights[:,:,np.newaxis] # (ku, kv, 1)
+        controls = np.concatenate((self.control_points * weights, weights), axis=2) # (ku, kv, 4)
+        controls = np.einsum('ui,ijc->ujc', nsu, controls) # (n_u, kv, 4)
+        points = np.einsum('vj,ujc->vuc', nsv, controls) # (n_v, n_u, 4)
+        numerator, denominator = points[:,:,:3], points[:,:,3:]
+        return nurbs_divide(numerator.reshape((-1, 3)), denominator.reshape((-1, 1))).reshape(numerator.shape)
+
     def normal(self, u, v):
         return self.normal_array(np.array([u]), np.array([v]))[0]
 
@@ -8,9 +8,8 @@
 import numpy as np
 import random
 
-from mathutils.kdtree import KDTree
-
 from sverchok.utils.sv_logging import sv_logger
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
 
 
 def random_point(min_x, max_x, min_y, max_y):
@@ -18,32 +17,6 @@ def random_point(min_x, max_x, min_y, max_y):
     y = random.uniform(min_y, max_y)
     return x,y
 
-def _check_min_distance(v_new, vs_old, min_r):
-    kdt = KDTree(len(vs_old))
-    for i, v in enumerate(vs_old):
-        kdt.insert(v, i)
-    kdt.balance()
-    nearest, idx, dist = kdt.find(v_new)
-    if dist is None:
-        return True
-    return (dist >= min_r)
-
-#     for v_old in vs_old:
-#         distance = np.linalg.norm(v_new - v_old)
-#         if distance < min_r:
-#             return False
-#    return True
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
-
 BATCH_SIZE = 100
 MAX_ITERATIONS = 1000
 
@@ -84,12 +57,9 @@ def populate_surface(surface, field, count, threshold,
     u_min, u_max = surface.get_u_min(), surface.get_u_max()
     v_min, v_max = surface.get_v_min(), surface.get_v_max()
 
+    grid = SvPoissonDiskGrid(min_r if min_r != 0 else None)
     if avoid_spheres is not None:
-        old_points = [s[0] for s in avoid_spheres]
-        old_radiuses = [s[1] for s in avoid_spheres]
-    else:
-        old_points = []
-        old_radiuses = []
+        grid.add([s[0] for s in avoid_spheres], [s[1] for s in avoid_spheres])
 
     if seed == 0:
         seed = 12345
@@ -154,24 +124,17 @@ def populate_surface(surface, field, count, threshold,
                 ys = np.array([p[1] for p in candidates])
                 zs = np.array([p[2] for p in candidates])
                 min_rs = min_r_field.evaluate_grid(xs, ys, zs).tolist()
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate, min_r in zip(candidate_uvs, candidates, min_rs):
-                    if random_radius:
-                        min_r = random.uniform(0, min_r)
-                    if _check_min_radius(candidate, old_points + generated_verts + good_verts, old_radiuses + generated_radiuses + good_radiuses, min_r):
-                        good_verts.append(tuple(candidate))
-                        good_uvs.append(tuple(candidate_uv))
-                        good_radiuses.append(min_r)
+                if random_radius:
+                    min_rs = [random.uniform(0, min_r) for min_r in min_rs]
+                good_idxs = grid.check_min_radius(candidates, min_rs)
+                good_verts = [tuple(v) for v in candidates[good_idxs].tolist()]
+                good_uvs = [tuple(uv) for uv in candidate_uvs[good_idxs].tolist()]
+                good_radiuses = np.array(min_rs)[good_idxs].tolist()
             else: # min_r != 0
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate in zip(candidate_uvs, candidates):
-                    distance_ok = _check_min_distance(candidate, old_points + generated_verts + good_verts, min_r)
-                    if distance_ok:
-                        good_verts.append(tuple(candidate))
-                        good_uvs.append(tuple(candidate_uv))
-                        good_radiuses.append(0)
+                good_idxs = grid.check_min_distance(candidates, min_r)
+                good_verts = [tuple(v) for v in candidates[good_idxs].tolist()]
+                good_uvs = [tuple(uv) for uv in candidate_uvs[good_idxs].tolist()]
+                good_radiuses = [0 for i in range(len(good_verts))]
 
             if predicate is not None:
                 results = [(uv, vert, radius) for uv, vert, radius in zip(good_uvs, good_verts, good_radiuses) if predicate(uv, vert)]
@@ -179,6 +142,8 @@ def populate_surface(surface, field, count, threshold,
                 good_verts = [r[1] for r in results]
                 good_radiuses = [r[2] for r in results]
 
+            if min_r != 0 or min_r_field is not None:
+                grid.add(good_verts, good_radiuses)
             generated_verts.extend(good_verts)
             generated_uv.extend(good_uvs)
             generated_radiuses.extend(good_radiuses)
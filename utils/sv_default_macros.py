@@ -26,6 +26,7 @@ import tempfile
 import bpy
 
 from sverchok.utils.sv_update_utils import sv_get_local_path
+from sverchok.core import lazy_nodes
 from sverchok.utils.macros.math_macros import math_macros
 from sverchok.utils.macros.join_macros import join_macros
 from sverchok.utils.macros.switch_macros import switch_macros
@@ -118,9 +119,9 @@ class DefaultMacros():
         nodes, links = tree.nodes, tree.links
 
         if term == 'obj vd':
-            obj_in_node = nodes.new('SvObjInLite')
+            obj_in_node = lazy_nodes.new_node(nodes, 'SvObjInLite')
             obj_in_node.dget()
-            vd_node = nodes.new('SvViewerDrawMk4')
+            vd_node = lazy_nodes.new_node(nodes, 'SvViewerDrawMk4')
             vd_node.location = obj_in_node.location.x + 180, obj_in_node.location.y
 
             links.new(obj_in_node.outputs[0], vd_node.inputs[0])
@@ -128,9 +129,9 @@ class DefaultMacros():
             links.new(obj_in_node.outputs[4], vd_node.inputs[3])
 
         elif term == 'objs vd':
-            obj_in_node = nodes.new('SvGetObjectsData')
+            obj_in_node = lazy_nodes.new_node(nodes, 'SvGetObjectsData')
             obj_in_node.get_objects_from_scene(operator)
-            vd_node = nodes.new('SvViewerDrawMk4')
+            vd_node = lazy_nodes.new_node(nodes, 'SvViewerDrawMk4')
             vd_node.location = obj_in_node.location.x + 180, obj_in_node.location.y
 
             # this macro could detect specifically if the node found edges or faces or both... 
@@ -146,7 +147,7 @@ class DefaultMacros():
             MOUSE_X, MOUSE_Y = context.space_data.cursor_location
             cursor = context.scene.cursor.location
 
-            node = nodes.new("GenVectorsNode")
+            node = lazy_nodes.new_node(nodes, "GenVectorsNode")
             node.location = MOUSE_X, MOUSE_Y
             node.x_, node.y_, node.z_ = tuple(cursor)
 
@@ -158,7 +159,7 @@ class DefaultMacros():
             MOUSE_X, MOUSE_Y = context.space_data.cursor_location
             matrix = context.scene.cursor.matrix
 
-            node = nodes.new("SvMatrixValueIn") # "SvMatrixInNodeMK4")
+            node = lazy_nodes.new_node(nodes, "SvMatrixValueIn") # "SvMatrixInNodeMK4")
             node.location = MOUSE_X, MOUSE_Y
             node.matrix = flattened(matrix.transposed())
 
@@ -168,12 +169,12 @@ class DefaultMacros():
             MOUSE_X, MOUSE_Y = context.space_data.cursor_location
 
             # add nodes to layout
-            NUM = nodes.new("SvNumberNode")
+            NUM = lazy_nodes.new_node(nodes, "SvNumberNode")
             RR = nodes.new('NodeReroute')
-            RND_0 = nodes.new('SvRndNumGen')
-            RND_1 = nodes.new('SvRndNumGen')
-            RND_2 = nodes.new('SvRndNumGen')
-            COL = nodes.new('SvColorsInNodeMK1')
+            RND_0 = lazy_nodes.new_node(nodes, 'SvRndNumGen')
+            RND_1 = lazy_nodes.new_node(nodes, 'SvRndNumGen')
+            RND_2 = lazy_nodes.new_node(nodes, 'SvRndNumGen')
+            COL = lazy_nodes.new_node(nodes, 'SvColorsInNodeMK1')
 
             # set locations
             COL.location = MOUSE_X + 140, MOUSE_Y + 40
@@ -224,7 +225,7 @@ class DefaultMacros():
 
         elif 'snl' in term:
             file = term.split(' ')[1]
-            snlite = nodes.new('SvScriptNodeLite')
+            snlite = lazy_nodes.new_node(nodes, 'SvScriptNodeLite')
             snlite.location = context.space_data.cursor_location
             sn_loader(snlite, script_name=file)
 
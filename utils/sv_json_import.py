@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Union, Generator, ContextManager
 
 import bpy
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_IO_panel_tools import get_file_obj_from_zip
 from sverchok.utils.sv_logging import sv_logger, get_logger, logging
 from sverchok.utils.handle_blender_data import BPYProperty, BlNode
@@ -265,7 +266,7 @@ class TreeGenerator:
             if old_nodes.is_old(bl_type):  # old node classes are registered only by request
                 old_nodes.register_old(bl_type)
             # import only here to do not create a cyclic import
-            node = self._tree.nodes.new(bl_type)
+            node = lazy_nodes.new_node(self._tree.nodes, bl_type)
             node.name = node_name
             return node
 
@@ -16,6 +16,7 @@ from typing import Type, Generator, TYPE_CHECKING, Dict, Tuple, Optional, List,
 
 import bpy
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok.utils.handle_blender_data import BPYPointers, BPYProperty
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
 
@@ -365,7 +366,7 @@ class FileStruct(Struct):
                         old_nodes.register_old(node_struct.read_bl_type())
 
                     # add node an save its new name
-                    node = tree.nodes.new(node_struct.read_bl_type())
+                    node = lazy_nodes.new_node(tree.nodes, node_struct.read_bl_type())
                     node.name = node_name
                     imported_structs[(StrTypes.NODE, tree.name, node_name)] = node.name
                     node_structs.append(node_struct)
@@ -458,7 +459,7 @@ class NodePresetFileStruct(Struct):
             node_struct = factories.node(node_name, self.logger, raw_struct)
             location = node.location[:]  # without copying it looks like gives straight references to memory
             tree.nodes.remove(node)
-            node = tree.nodes.new(node_struct.read_bl_type())
+            node = lazy_nodes.new_node(tree.nodes, node_struct.read_bl_type())
             node.name = node_name
             node.select = True
             tree.nodes.active = node
@@ -560,7 +561,7 @@ class TreeStruct(Struct):
                         old_nodes.register_old(node_struct.read_bl_type())
 
                     # add node an save its new name
-                    node = tree.nodes.new(node_struct.read_bl_type())
+                    node = lazy_nodes.new_node(tree.nodes, node_struct.read_bl_type())
                     node.name = node_name
                     imported_structs[(StrTypes.NODE, tree.name, node_name)] = node.name
                     node_structs.append(node_struct)
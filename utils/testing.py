@@ -15,6 +15,7 @@ import ast
 
 import sverchok
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok.data_structure import get_data_nesting_level
 from sverchok.core.socket_data import get_output_socket_data
 from sverchok.core.sv_custom_exceptions import SvNoDataError
@@ -201,7 +202,7 @@ def create_node(node_type, tree_name=None):
     if tree_name is None:
         tree_name = "TestingTree"
     sv_logger.debug("Creating node of type %s", node_type)
-    return bpy.data.node_groups[tree_name].nodes.new(type=node_type)
+    return lazy_nodes.new_node(bpy.data.node_groups[tree_name].nodes, node_type)
 
 def get_node(node_name, tree_name=None):
     """
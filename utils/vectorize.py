@@ -37,13 +37,21 @@ def match_sockets(*sockets_data):
         yield layer_data
 
 
-def vectorize(func=None, *, match_mode="REPEAT"):
+def vectorize(func=None, *, match_mode="REPEAT", batched=False):
     """
     If there is function which takes some values
     with this decorator it's possible to call the function by passing list of values of any shape
     Take care of properly annotating of decorated function
     Use Tuple[] in return annotation only if you want the decorator splits the return values into different lists
 
+    If batched is True the function promises to work with NumPy arrays which
+    have one extra leading axis in each numeric (float, int, bool and lists
+    of them) argument, and to return arrays with the same leading axis.
+    Then, if all numeric inputs can be converted into arrays and broadcast
+    to each other, the function is called only once for all values and its
+    result is split back into objects (views of the result arrays). Otherwise
+    the function is called per value as usual.
+
     ++ Example ++
 
     from sverchok.utils import vectorize
@@ -67,7 +75,7 @@ def vectorize(func=None, *, match_mode="REPEAT"):
 
     # this condition only works when used via "@" syntax
     if func is None:
-        return lambda f: vectorize(f, match_mode=match_mode)
+        return lambda f: vectorize(f, match_mode=match_mode, batched=batched)
 
     @wraps(func)
     def wrap(*args, **kwargs):
@@ -77,6 +85,11 @@ def vectorize(func=None, *, match_mode="REPEAT"):
         if args:
             raise TypeError(f'Vectorized function {func.__name__} should not have positional arguments')
 
+        if batched and match_mode == "REPEAT":
+            batch = _stack_batch(func, kwargs)
+            if batch is not None:
+                return _call_batched(func, *batch)
+
         walkers = []
         for key, data in zip(kwargs, kwargs.values()):
             if data is None or data == []:
@@ -124,6 +137,84 @@ def vectorize(func=None, *, match_mode="REPEAT"):
     return wrap
 
 
+def _stack_batch(func, kwargs):
+    """Converts numeric arguments into arrays which have the same batch shape
+    (all leading axes which are not part of a value of the argument). Other
+    arguments should be single values. Lengths are matched in REPEAT mode
+    which is the same as broadcasting only if all lengths are equal or 1, in
+    other cases None is returned
+    :return: arguments with flattened batch axis and the batch shape"""
+    batch_args, batch_shapes = dict(), []
+    for key, data in kwargs.items():
+        if data is None or (isinstance(data, list) and not data):
+            batch_args[key] = data
+            continue
+        annotation = func.__annotations__.get(key)
+        if annotation is None or not _is_numeric_annotation(annotation):
+            if isinstance(data, (list, tuple, np.ndarray)):
+                return None
+            batch_args[key] = data  # single value like mode of the function
+            continue
+        nesting = _get_nesting_level(annotation)
+        try:
+            array = np.asarray(data)
+        except ValueError:  # ragged lists
+            return None
+        if array.dtype.kind not in 'biuf' or array.ndim < nesting:
+            return None
+        if array.ndim == nesting:
+            batch_args[key] = data  # single value
+            continue
+        batch_args[key] = (array, nesting)
+        batch_shapes.append(array.shape[:array.ndim - nesting])
+
+    if not batch_shapes:
+        return None
+    # a value which is less nested than others is repeated for their items
+    batch_ndim = max(len(s) for s in batch_shapes)
+    try:
+        batch_shape = np.broadcast_shapes(*[s + (1,) * (batch_ndim - len(s)) for s in batch_shapes])
+    except ValueError:
+        return None
+
+    size = int(np.prod(batch_shape))
+    for key, arg in batch_args.items():
+        if isinstance(arg, tuple):
+            array, nesting = arg
+            own_ndim = array.ndim - nesting
+            value_shape = array.shape[own_ndim:]
+            array = array.reshape(array.shape[:own_ndim] + (1,) * (batch_ndim - own_ndim) + value_shape)
+            array = np.broadcast_to(array, batch_shape + value_shape)
+            batch_args[key] = array.reshape((size,) + value_shape)
+    return batch_args, batch_shape
+
+
+def _call_batched(func, batch_args: dict, batch_shape: tuple):
+    """Calls the function once with stacked arguments and splits the result
+    into objects of the given batch shape"""
+    size = int(np.prod(batch_shape))
+    out_number = _get_output_number(func)
+    results = func(**batch_args)
+    if out_number == 1:
+        results = [results]
+
+    out_lists = []
+    for result in results:
+        result = np.asarray(result)
+        if result.ndim == 0 or result.shape[0] != size:
+            raise ValueError(f"Batched function {func.__name__} should return arrays with {size} items "
+                             f"in the first axis, {result.shape} is given")
+        out_lists.append(list(result.reshape(batch_shape + result.shape[1:])))
+    return out_lists[0] if out_number == 1 else out_lists
+
+
+def _is_numeric_annotation(annotation) -> bool:
+    """Annotations which values can be stacked into numeric arrays"""
+    if hasattr(annotation, '__origin__'):
+        return all(_is_numeric_annotation(arg) for arg in getattr(annotation, '__args__', ()))
+    return annotation in [float, int, bool, list, tuple]
+
+
 def devectorize(func=None, *, match_mode="REPEAT"):
     """It takes list of values of arbitrary shape, flatten it
     and call the decorated function once with flattened data